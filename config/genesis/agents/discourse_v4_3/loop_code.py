@@ -12,6 +12,7 @@ def run():
     state_id = f"{agent_prefix}_state"
     strategy_id = f"{agent_prefix}_strategy"
     notebook_id = f"{agent_prefix}_notebook"
+    journal_id = f"{agent_prefix}_journal"
 
     # --- Read current state ---
     state_raw = kernel_state.read_artifact(state_id, caller_id)
@@ -35,11 +36,20 @@ def run():
     try:
         notebook = json.loads(notebook_raw) if isinstance(notebook_raw, str) else notebook_raw
     except (json.JSONDecodeError, TypeError):
-        notebook = {"key_facts": {}, "journal": []}
+        notebook = {"key_facts": {}}
     if not isinstance(notebook, dict):
-        notebook = {"key_facts": {}, "journal": []}
+        notebook = {"key_facts": {}}
     key_facts = notebook.get("key_facts", {})
-    journal = notebook.get("journal", [])
+
+    # --- Read journal tail (append-only text artifact, one entry per line) ---
+    journal_tail = kernel_state.read_artifact_range(journal_id, caller_id, -JOURNAL_TAIL_CHARS)
+    if isinstance(journal_tail, str):
+        journal_lines = journal_tail.splitlines()
+        if len(journal_tail) >= JOURNAL_TAIL_CHARS and journal_lines:
+            journal_lines = journal_lines[1:]  # drop the partial first line
+    else:
+        journal_lines = notebook.get("journal", [])
+    journal = []  # entries added this iteration
 
     model = state.get("model", "gemini/gemini-2.0-flash")
 
@@ -68,7 +78,7 @@ def run():
     recent_text = "\n".join(recent_lines) if recent_lines else "(first iteration)"
 
     key_facts_text = json.dumps(key_facts, indent=2) if key_facts else "(empty)"
-    journal_recent = journal[-20:]
+    journal_recent = journal_lines[-20:]
     journal_text = "\n".join(journal_recent) if journal_recent else "(empty)"
 
     # Query scrip balance
@@ -174,9 +184,18 @@ When done acting, call think_and_plan to record your reasoning and manage tasks.
 
     # Save notebook
     notebook["key_facts"] = key_facts
-    notebook["journal"] = journal[-50:]
+    notebook.pop("journal", None)
     kernel_actions.write_artifact(caller_id, notebook_id, json.dumps(notebook, indent=2))
 
+    # Append this iteration's journal entries; compact to the last 50 if refused
+    if journal:
+        entries = [e.replace("\n", " ") for e in journal]
+        try:
+            kernel_actions.append_to_artifact(caller_id, journal_id, "\n".join(entries) + "\n")
+        except ValueError:
+            kept = (journal_lines + entries)[-50:]
+            kernel_actions.write_artifact(caller_id, journal_id, "\n".join(kept) + "\n")
+
     # Save state
     kernel_actions.write_artifact(caller_id, state_id, json.dumps(state, indent=2))
 
@@ -184,6 +203,10 @@ When done acting, call think_and_plan to record your reasoning and manage tasks.
     return {"success": True, "action_result": last_result}
 
 
+# Journal entries are capped at ~220 chars, so this covers the last 20+
+JOURNAL_TAIL_CHARS = 8000
+
+
 # --- Tool definitions (OpenAI format) ---
 
 TOOLS = [
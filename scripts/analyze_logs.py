@@ -17,6 +17,7 @@ If LOG_DIR is omitted, uses the most recent run in logs/.
 
 import argparse
 import json
+import re
 import sys
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
@@ -43,6 +44,21 @@ class AgentStats:
     queries_without_results: int = 0
 
 
+def log_files(events_file: Path) -> list[Path]:
+    """Return the files holding a run's events, oldest first.
+
+    With logging.segments enabled, older events live in sealed segments
+    (events.000000.jsonl, ...) next to the active events.jsonl.
+    """
+    pattern = re.compile(rf"^{re.escape(events_file.stem)}\.(\d+){re.escape(events_file.suffix)}$")
+    sealed = sorted(
+        (int(m.group(1)), p)
+        for p in events_file.parent.glob(f"{events_file.stem}.*{events_file.suffix}")
+        if (m := pattern.match(p.name))
+    )
+    return [p for _, p in sealed] + [events_file]
+
+
 @dataclass
 class SimulationAnalysis:
     """Full analysis of a simulation run."""
@@ -56,11 +72,12 @@ class SimulationAnalysis:
 
     def load(self) -> None:
         """Load and parse the log file."""
-        with open(self.log_file) as f:
-            for line in f:
-                event = json.loads(line)
-                self.events.append(event)
-                self._process_event(event)
+        for path in log_files(self.log_file):
+            with open(path) as f:
+                for line in f:
+                    event = json.loads(line)
+                    self.events.append(event)
+                    self._process_event(event)
 
     def _process_event(self, e: dict[str, Any]) -> None:
         """Process a single event."""
@@ -19,12 +19,28 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 import sys
 from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
 
 
+def log_files(events_file: Path) -> list[Path]:
+    """Return the files holding a run's events, oldest first.
+
+    With logging.segments enabled, older events live in sealed segments
+    (events.000000.jsonl, ...) next to the active events.jsonl.
+    """
+    pattern = re.compile(rf"^{re.escape(events_file.stem)}\.(\d+){re.escape(events_file.suffix)}$")
+    sealed = sorted(
+        (int(m.group(1)), p)
+        for p in events_file.parent.glob(f"{events_file.stem}.*{events_file.suffix}")
+        if (m := pattern.match(p.name))
+    )
+    return [p for _, p in sealed] + [events_file]
+
+
 def load_events(run_dir: Path) -> list[dict]:
     """Load events from events.jsonl."""
     events_file = run_dir / "events.jsonl"
@@ -33,10 +49,11 @@ def load_events(run_dir: Path) -> list[dict]:
         sys.exit(1)
 
     events = []
-    with open(events_file) as f:
-        for line in f:
-            if line.strip():
-                events.append(json.loads(line))
+    for path in log_files(events_file):
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    events.append(json.loads(line))
     return events
 
 
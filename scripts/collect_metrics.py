@@ -15,12 +15,13 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 import sys
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 
 @dataclass
@@ -145,6 +146,23 @@ class AggregateMetrics:
         }
 
 
+def iter_log_lines(events_file: Path) -> Iterator[str]:
+    """Yield a run's event lines across all log files, oldest first.
+
+    With logging.segments enabled, older events live in sealed segments
+    (events.000000.jsonl, ...) next to the active events.jsonl.
+    """
+    pattern = re.compile(rf"^{re.escape(events_file.stem)}\.(\d+){re.escape(events_file.suffix)}$")
+    sealed = sorted(
+        (int(m.group(1)), p)
+        for p in events_file.parent.glob(f"{events_file.stem}.*{events_file.suffix}")
+        if (m := pattern.match(p.name))
+    )
+    for _, path in sealed + [(0, events_file)]:
+        with open(path) as f:
+            yield from f
+
+
 def collect_metrics(log_path: Path) -> tuple[dict[str, AgentMetrics], AggregateMetrics]:
     """Collect metrics from an events.jsonl file.
 
@@ -163,52 +181,51 @@ def collect_metrics(log_path: Path) -> tuple[dict[str, AgentMetrics], AggregateM
     # Track scrip changes for economic velocity
     scrip_transfers: list[float] = []
 
-    with open(log_path) as f:
-        for line in f:
-            if not line.strip():
-                continue
-
-            event = json.loads(line)
-            aggregate.total_events += 1
-
-            etype = event.get("event_type", "")
-            aggregate.event_counts[etype] += 1
-
-            # Track timestamps for duration
-            ts = event.get("timestamp", "")
-            if ts:
-                if first_timestamp is None:
-                    first_timestamp = ts
-                last_timestamp = ts
-
-            # Get agent ID from various places
-            agent_id = (
-                event.get("principal_id")
-                or event.get("agent_id")
-                or event.get("intent", {}).get("principal_id")
-            )
-
-            # Skip kernel/system agents for per-agent stats
-            if agent_id and "alpha_prime" not in agent_id and agent_id not in ["SYSTEM", "kernel_mint_agent"]:
-                if agent_id not in agents:
-                    agents[agent_id] = AgentMetrics(agent_id=agent_id)
-
-            # Process by event type
-            if etype == "thinking":
-                _process_thinking(event, agents, aggregate)
-            elif etype == "action":
-                _process_action(event, agents, aggregate)
-            elif etype == "workflow_state_changed":
-                _process_state_change(event, agents)
-            elif etype == "artifact_written":
-                _process_artifact_written(event, agents, aggregate)
-            elif etype == "mint_task_created":
-                aggregate.mint_tasks_created += 1
-            elif etype == "mint_task_completed":
-                aggregate.mint_tasks_completed += 1
-                _process_mint_completed(event, agents, scrip_transfers)
-            elif etype == "mint_task_submission":
-                _process_mint_submission(event, agents)
+    for line in iter_log_lines(log_path):
+        if not line.strip():
+            continue
+
+        event = json.loads(line)
+        aggregate.total_events += 1
+
+        etype = event.get("event_type", "")
+        aggregate.event_counts[etype] += 1
+
+        # Track timestamps for duration
+        ts = event.get("timestamp", "")
+        if ts:
+            if first_timestamp is None:
+                first_timestamp = ts
+            last_timestamp = ts
+
+        # Get agent ID from various places
+        agent_id = (
+            event.get("principal_id")
+            or event.get("agent_id")
+            or event.get("intent", {}).get("principal_id")
+        )
+
+        # Skip kernel/system agents for per-agent stats
+        if agent_id and "alpha_prime" not in agent_id and agent_id not in ["SYSTEM", "kernel_mint_agent"]:
+            if agent_id not in agents:
+                agents[agent_id] = AgentMetrics(agent_id=agent_id)
+
+        # Process by event type
+        if etype == "thinking":
+            _process_thinking(event, agents, aggregate)
+        elif etype == "action":
+            _process_action(event, agents, aggregate)
+        elif etype == "workflow_state_changed":
+            _process_state_change(event, agents)
+        elif etype == "artifact_written":
+            _process_artifact_written(event, agents, aggregate)
+        elif etype == "mint_task_created":
+            aggregate.mint_tasks_created += 1
+        elif etype == "mint_task_completed":
+            aggregate.mint_tasks_completed += 1
+            _process_mint_completed(event, agents, scrip_transfers)
+        elif etype == "mint_task_submission":
+            _process_mint_submission(event, agents)
 
     # Calculate duration
     if first_timestamp and last_timestamp:
@@ -821,6 +821,26 @@ class ExecutorConfig(StrictModel):
         gt=0,
         description="Timeout for contracts with call_llm capability (Plan #100)"
     )
+    contract_workers: int = Field(
+        default=4,
+        gt=0,
+        description="Worker threads evaluating executable contract permission checks"
+    )
+    contract_namespace_cache_size: int = Field(
+        default=256,
+        ge=0,
+        description="Initialized contract namespaces kept per (contract, code hash), LRU (0 disables caching)"
+    )
+    code_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Compiled code objects kept in the content-hash LRU cache (0 disables caching)"
+    )
+    permission_cache_size: int = Field(
+        default=10000,
+        ge=0,
+        description="Contract permission results kept in the LRU permission cache (0 disables caching)"
+    )
     interface_validation: str = Field(
         default="warn",
         pattern="^(none|warn|strict)$",
@@ -887,7 +907,7 @@ class AgentLoopExecutionConfig(StrictModel):
     resource_check_interval: float = Field(
         default=1.0,
         gt=0,
-        description="Seconds between resource checks when paused"
+        description="Re-check interval for event wake conditions; resource waits are event-driven"
     )
     max_consecutive_errors: int = Field(
         default=5,
@@ -910,11 +930,30 @@ class WorkerPoolConfig(StrictModel):
     num_workers: int = Field(
         default=4,
         gt=0,
-        description="Number of worker threads for parallel execution"
+        description="Number of worker processes for parallel artifact execution"
     )
     state_db_path: str = Field(
         default="agent_state.db",
-        description="Path to SQLite database for agent state persistence"
+        description="Reserved: SQLite path for worker-side state (unused; state stays in the kernel)"
+    )
+
+
+class IterationPoolConfig(StrictModel):
+    """Configuration for running artifact loop iterations off the event loop."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Run artifact iterations (and their _syscall_llm calls) in a thread pool"
+    )
+    max_workers: int = Field(
+        default=8,
+        gt=0,
+        description="Maximum concurrent artifact iterations across all principals"
+    )
+    max_per_principal: int = Field(
+        default=1,
+        gt=0,
+        description="Maximum concurrent artifact iterations per principal"
     )
 
 
@@ -931,6 +970,9 @@ class ExecutionConfig(StrictModel):
     worker_pool: WorkerPoolConfig = Field(
         default_factory=WorkerPoolConfig
     )
+    iteration_pool: IterationPoolConfig = Field(
+        default_factory=IterationPoolConfig
+    )
     agent_loop: AgentLoopExecutionConfig = Field(
         default_factory=AgentLoopExecutionConfig
     )
@@ -1037,9 +1079,14 @@ class MintScorerConfig(StrictModel):
         description="Score clamping bounds"
     )
     thread_pool_workers: int = Field(
-        default=1,
+        default=4,
         gt=0,
-        description="Thread pool size for scoring"
+        description="Long-lived thread pool size (concurrent scoring calls)"
+    )
+    result_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds to wait for a scoring call before reporting failure"
     )
 
 
@@ -1110,6 +1157,58 @@ class LoggingTruncationConfig(StrictModel):
     )
 
 
+class EventLogWriterConfig(StrictModel):
+    """Event log (events.jsonl) writer configuration."""
+
+    durability: Literal["event", "batch", "fsync"] = Field(
+        default="event",
+        description="'event' flushes each event to the OS, 'batch' buffers and flushes "
+                    "on size/time thresholds, 'fsync' also fsyncs each event"
+    )
+    flush_max_events: int = Field(
+        default=256,
+        gt=0,
+        description="Batch mode: flush after this many buffered events"
+    )
+    flush_max_bytes: int = Field(
+        default=1_048_576,
+        gt=0,
+        description="Batch mode: flush after this many buffered bytes"
+    )
+    flush_interval_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="Batch mode: flush buffered events at least this often"
+    )
+    background_thread: bool = Field(
+        default=False,
+        description="Write on a background thread; log() only serializes and enqueues"
+    )
+    serializer: Literal["json", "orjson"] = Field(
+        default="json",
+        description="Event serializer ('orjson' falls back to json if not installed)"
+    )
+
+
+class EventLogSegmentsConfig(StrictModel):
+    """Event log segment rotation and offset index configuration."""
+
+    enabled: bool = Field(
+        default=False,
+        description="Rotate events.jsonl into numbered segments with a sidecar offset index"
+    )
+    max_segment_bytes: int = Field(
+        default=67_108_864,
+        gt=0,
+        description="Seal the active segment before it grows past this size"
+    )
+    index_interval: int = Field(
+        default=64,
+        gt=0,
+        description="Record a sequence -> byte offset index entry every N events"
+    )
+
+
 class LoggingConfig(StrictModel):
     """Logging configuration."""
 
@@ -1130,10 +1229,23 @@ class LoggingConfig(StrictModel):
         gt=0,
         description="Default number of recent events to return"
     )
+    recent_buffer_size: int = Field(
+        default=1000,
+        ge=0,
+        description="Recent events kept in memory for read_recent/query_kernel('events')"
+    )
     truncation: LoggingTruncationConfig = Field(
         default_factory=LoggingTruncationConfig,
         description="Log message truncation limits"
     )
+    writer: EventLogWriterConfig = Field(
+        default_factory=EventLogWriterConfig,
+        description="Event log writer buffering and durability"
+    )
+    segments: EventLogSegmentsConfig = Field(
+        default_factory=EventLogSegmentsConfig,
+        description="Event log segment rotation and offset index"
+    )
 
 
 # =============================================================================
@@ -1319,6 +1431,41 @@ class DashboardConfig(StrictModel):
         default=False,
         description="Use polling instead of watchdog for file changes (WSL compatibility)"
     )
+    hot_history_items: int = Field(
+        default=0,
+        ge=0,
+        description="Per history list (events, interactions, chart points, ...), items kept "
+                    "in memory before older ones spill to a SQLite file (0 = keep all in memory)"
+    )
+    history_spill_dir: str | None = Field(
+        default=None,
+        description="Directory for the history spill file (None = system temp directory)"
+    )
+    ws_queue_depth: int = Field(
+        default=64,
+        gt=0,
+        description="Max queued WebSocket messages per client before old deltas are dropped"
+    )
+    ws_max_batch_events: int = Field(
+        default=500,
+        gt=0,
+        description="Max events in one WebSocket delta frame (older ones are reported as dropped)"
+    )
+    ws_send_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds a send to one client may take before it is disconnected"
+    )
+    ingest_batch_events: int = Field(
+        default=1000,
+        gt=0,
+        description="Events decoded off the event loop per ingestion step"
+    )
+    ingest_wait_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        description="Seconds a request waits for a background log load before serving the previous state"
+    )
 
 
 
@@ -1963,6 +2110,41 @@ class SeedTaskConfig(StrictModel):
     )
 
 
+class TaskEvaluationConfig(StrictModel):
+    """How mint task submissions are tested."""
+
+    use_subprocesses: bool = Field(
+        default=True,
+        description="Run tests in parallel sandboxed worker processes (Unix only; "
+        "falls back to in-process execution elsewhere)"
+    )
+    num_workers: int = Field(
+        default=4,
+        gt=0,
+        description="Maximum number of test worker processes"
+    )
+    cpu_limit_seconds: int = Field(
+        default=5,
+        gt=0,
+        description="CPU time limit per test case in a worker"
+    )
+    memory_limit_mb: int = Field(
+        default=256,
+        ge=0,
+        description="Address space a test worker may use beyond its startup size (0 = unlimited)"
+    )
+    short_circuit: bool = Field(
+        default=True,
+        description="Stop running hidden tests at the first failure"
+    )
+    cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Evaluations remembered per (code, task) so unchanged resubmissions "
+        "are not retested (0 = disabled)"
+    )
+
+
 class MintTasksConfig(StrictModel):
     """Task-based mint configuration (Plan #269)."""
 
@@ -1974,6 +2156,10 @@ class MintTasksConfig(StrictModel):
         default_factory=list,
         description="Tasks to seed on world initialization"
     )
+    evaluation: TaskEvaluationConfig = Field(
+        default_factory=TaskEvaluationConfig,
+        description="Test execution for submissions"
+    )
 
 
 class DelegationConfig(StrictModel):
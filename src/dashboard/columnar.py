@@ -0,0 +1,308 @@
+"""Columnar export of event logs for vectorized analysis.
+
+Converts a run's events.jsonl (including rotated segments) into typed
+per-event-type tables once, so analysis across many runs works on NumPy /
+pandas columns instead of re-parsing JSON line by line.
+
+Tables:
+    events       every event: sequence, timestamp, event_type
+    actions      "action" events: principal, action type, success, error code
+    thinking     "thinking" events: model, tokens, API cost
+    transfers    "transfer" events: sender, recipient, amount, balances
+    invocations  "invoke_success" / "invoke_failure" events
+
+Storage lives next to the log in {run_dir}/columns/: one Parquet file per
+table when pyarrow is installed, otherwise one NumPy .npz per table. A
+manifest records the source log's size and mtime so stale exports are
+rebuilt automatically by the loader.
+
+Usage:
+    from src.dashboard.columnar import load_table, load_runs
+
+    actions = load_table("logs/run_20260115_120000", "actions")
+    actions.groupby("action_type")["success"].mean()
+
+    thinking = load_runs(sorted(Path("logs").glob("run_*")), "thinking")
+    thinking.groupby("run_id")["api_cost"].sum()
+
+CLI:
+    python -m src.dashboard.columnar logs/run_20260115_120000 [more runs...]
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Literal
+
+import numpy as np
+import pandas as pd
+
+from ..world.event_segments import iter_event_log, iter_log_files
+
+logger = logging.getLogger(__name__)
+
+COLUMNS_DIR = "columns"
+MANIFEST_FILE = "manifest.json"
+# Bump when table schemas change so old exports are rebuilt
+SCHEMA_VERSION = 1
+
+ColumnKind = Literal["int", "float", "bool", "str", "timestamp"]
+StorageFormat = Literal["parquet", "npz"]
+
+
+@dataclass(frozen=True)
+class Column:
+    """One typed column and how to pull it out of an event."""
+
+    name: str
+    kind: ColumnKind
+    extract: Callable[[dict[str, Any]], Any]
+
+
+def _field(*path: str) -> Callable[[dict[str, Any]], Any]:
+    """Extractor for a (possibly nested) event field."""
+    def extract(event: dict[str, Any]) -> Any:
+        value: Any = event
+        for key in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+    return extract
+
+
+_COMMON = (
+    Column("sequence", "int", _field("sequence")),
+    Column("timestamp", "timestamp", _field("timestamp")),
+)
+
+# table name -> (event types, columns)
+TABLES: dict[str, tuple[frozenset[str] | None, tuple[Column, ...]]] = {
+    "events": (None, _COMMON + (
+        Column("event_type", "str", _field("event_type")),
+    )),
+    "actions": (frozenset({"action"}), _COMMON + (
+        Column("event_number", "int", _field("event_number")),
+        Column("principal_id", "str", _field("intent", "principal_id")),
+        Column("action_type", "str", _field("intent", "action_type")),
+        Column("artifact_id", "str", _field("intent", "artifact_id")),
+        Column("success", "bool", _field("result", "success")),
+        Column("error_code", "str", _field("result", "error_code")),
+        Column("scrip_after", "float", _field("scrip_after")),
+    )),
+    "thinking": (frozenset({"thinking"}), _COMMON + (
+        Column("principal_id", "str", _field("principal_id")),
+        Column("model", "str", _field("model")),
+        Column("input_tokens", "int", _field("input_tokens")),
+        Column("output_tokens", "int", _field("output_tokens")),
+        Column("api_cost", "float", _field("api_cost")),
+        Column("llm_budget_after", "float", _field("llm_budget_after")),
+    )),
+    "transfers": (frozenset({"transfer"}), _COMMON + (
+        Column("sender", "str", _field("sender")),
+        Column("recipient", "str", _field("recipient")),
+        Column("amount", "float", _field("amount")),
+        Column("sender_balance_after", "float", _field("sender_balance_after")),
+        Column("recipient_balance_after", "float", _field("recipient_balance_after")),
+    )),
+    "invocations": (frozenset({"invoke_success", "invoke_failure"}), _COMMON + (
+        Column("event_number", "int", _field("event_number")),
+        Column("invoker_id", "str", _field("invoker_id")),
+        Column("artifact_id", "str", _field("artifact_id")),
+        Column("method", "str", _field("method")),
+        Column("success", "bool", lambda e: e.get("event_type") == "invoke_success"),
+        Column("duration_ms", "float", _field("duration_ms")),
+        Column("error_type", "str", _field("error_type")),
+    )),
+}
+
+
+def _typed_array(values: list[Any], kind: ColumnKind) -> np.ndarray:
+    """Convert raw column values to a typed NumPy array (missing -> 0/NaN/False/"")."""
+    if kind == "int":
+        return np.array(
+            [v if isinstance(v, int) and not isinstance(v, bool) else 0 for v in values],
+            dtype=np.int64,
+        )
+    if kind == "float":
+        return np.array(
+            [float(v) if isinstance(v, (int, float)) and not isinstance(v, bool) else np.nan
+             for v in values],
+            dtype=np.float64,
+        )
+    if kind == "bool":
+        return np.array([bool(v) for v in values], dtype=np.bool_)
+    if kind == "timestamp":
+        parsed = pd.to_datetime(pd.Series(values, dtype="object"), utc=True, errors="coerce")
+        return parsed.dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+    return np.array(["" if v is None else str(v) for v in values], dtype=np.str_)
+
+
+def _columns_dir(run_dir: Path) -> Path:
+    return run_dir / COLUMNS_DIR
+
+
+def _resolve_log(path: str | Path) -> tuple[Path, Path]:
+    """Return (run_dir, events.jsonl path) for a run dir or log path."""
+    path = Path(path)
+    if path.is_dir():
+        return path, path / "events.jsonl"
+    return path.parent, path
+
+
+def _source_stamp(log_path: Path) -> list[list[Any]]:
+    """Identify the source log files so stale exports can be detected."""
+    stamp = []
+    for file in iter_log_files(log_path):
+        stat = file.stat()
+        stamp.append([file.name, stat.st_size, stat.st_mtime_ns])
+    return stamp
+
+
+def default_format() -> StorageFormat:
+    """Parquet when pyarrow is installed, otherwise NumPy .npz."""
+    try:
+        import pyarrow  # noqa: F401
+        return "parquet"
+    except ImportError:
+        return "npz"
+
+
+def export_run(
+    path: str | Path,
+    storage_format: StorageFormat | None = None,
+) -> dict[str, int]:
+    """Convert a run's event log into columnar tables.
+
+    Reads the log (all segments) once and writes every table in TABLES.
+
+    Args:
+        path: Run directory or path to its events.jsonl
+        storage_format: "parquet" or "npz" (default: parquet if available)
+
+    Returns:
+        Row count per table
+    """
+    run_dir, log_path = _resolve_log(path)
+    if not log_path.exists():
+        raise FileNotFoundError(f"Event log not found: {log_path}")
+    fmt = storage_format or default_format()
+
+    stamp = _source_stamp(log_path)
+    raw: dict[str, dict[str, list[Any]]] = {
+        table: {col.name: [] for col in columns}
+        for table, (_, columns) in TABLES.items()
+    }
+    for event in iter_event_log(log_path):
+        event_type = event.get("event_type")
+        for table, (event_types, columns) in TABLES.items():
+            if event_types is not None and event_type not in event_types:
+                continue
+            for col in columns:
+                raw[table][col.name].append(col.extract(event))
+
+    out_dir = _columns_dir(run_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rows: dict[str, int] = {}
+    for table, (_, columns) in TABLES.items():
+        arrays = {col.name: _typed_array(raw[table][col.name], col.kind) for col in columns}
+        rows[table] = len(arrays["sequence"])
+        if fmt == "parquet":
+            pd.DataFrame(arrays).to_parquet(out_dir / f"{table}.parquet", index=False)
+        else:
+            np.savez(out_dir / f"{table}.npz", **arrays)  # type: ignore[arg-type]
+
+    manifest = {
+        "schema_version": SCHEMA_VERSION,
+        "format": fmt,
+        "source": stamp,
+        "rows": rows,
+    }
+    (out_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+    return rows
+
+
+def _read_manifest(run_dir: Path) -> dict[str, Any] | None:
+    try:
+        manifest: dict[str, Any] = json.loads((_columns_dir(run_dir) / MANIFEST_FILE).read_text())
+        return manifest
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def is_current(path: str | Path) -> bool:
+    """Whether the columnar export of a run matches its event log."""
+    run_dir, log_path = _resolve_log(path)
+    manifest = _read_manifest(run_dir)
+    return (
+        manifest is not None
+        and manifest.get("schema_version") == SCHEMA_VERSION
+        and manifest.get("source") == _source_stamp(log_path)
+    )
+
+
+def load_table(path: str | Path, table: str, refresh: bool = True) -> pd.DataFrame:
+    """Load one table of a run as a DataFrame, exporting first if needed.
+
+    Args:
+        path: Run directory or path to its events.jsonl
+        table: Table name (see TABLES)
+        refresh: Re-export when the log changed since the last export
+
+    Returns:
+        DataFrame with the table's typed columns
+    """
+    if table not in TABLES:
+        raise ValueError(f"Unknown table {table!r}; expected one of {sorted(TABLES)}")
+    run_dir, _ = _resolve_log(path)
+    manifest = _read_manifest(run_dir)
+    if manifest is None or (refresh and not is_current(path)):
+        export_run(path, manifest["format"] if manifest else None)
+        manifest = _read_manifest(run_dir)
+        assert manifest is not None
+
+    out_dir = _columns_dir(run_dir)
+    if manifest["format"] == "parquet":
+        return pd.read_parquet(out_dir / f"{table}.parquet")
+    with np.load(out_dir / f"{table}.npz", allow_pickle=False) as data:
+        return pd.DataFrame({name: data[name] for name in data.files})
+
+
+def load_runs(paths: Iterable[str | Path], table: str) -> pd.DataFrame:
+    """Load one table from many runs into a single DataFrame with a run_id column."""
+    frames = []
+    for path in paths:
+        run_dir, _ = _resolve_log(path)
+        frame = load_table(path, table)
+        frame.insert(0, "run_id", run_dir.name)
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+__all__ = [
+    "TABLES",
+    "default_format",
+    "export_run",
+    "is_current",
+    "load_runs",
+    "load_table",
+]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export event logs to columnar tables")
+    parser.add_argument("runs", nargs="+", help="Run directories or events.jsonl paths")
+    parser.add_argument("--format", choices=["parquet", "npz"], default=None,
+                        help="Storage format (default: parquet if pyarrow is installed)")
+    args = parser.parse_args()
+
+    for run in args.runs:
+        counts = export_run(run, args.format)
+        print(f"{run}: " + ", ".join(f"{t}={n}" for t, n in counts.items()))
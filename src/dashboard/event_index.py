@@ -0,0 +1,375 @@
+"""Secondary indexes over the dashboard's append-only record lists.
+
+JSONLParser appends to state.all_events, state.activity_items and
+state.invocation_events and never rewrites them. RecordIndex keeps, for each
+indexed field, a posting list of record positions per value, filled as
+records are appended. Queries intersect the posting lists of the requested
+filters instead of running one list comprehension per filter over the whole
+history, and stop as soon as the requested page is full.
+
+Positions are ingest ordinals (0 = first record), so they double as stable
+pagination cursors: the cursor for the next page is the position of the
+first match not returned, and stays valid however many records arrive
+between requests.
+
+TimeIndex does the same for timestamp windows: it keeps each record's time
+by position, so a time-filtered view reads only the records inside the
+window. When the list is a SpillList, records read from spilled positions
+are copies.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+from datetime import datetime, timezone
+from typing import (
+    Any, Callable, Generic, Hashable, Iterable, Iterator, Mapping, Sequence, TypeVar,
+)
+
+T = TypeVar("T")
+
+# field name -> value(s) a record is indexed under
+FieldExtractor = Callable[[Any], Mapping[str, Iterable[Hashable]]]
+
+
+def _contains(positions: Sequence[int], position: int) -> bool:
+    i = bisect.bisect_left(positions, position)
+    return i < len(positions) and positions[i] == position
+
+
+def posix_seconds(timestamp: str | None) -> float | None:
+    """POSIX time of an ISO timestamp (naive ones read as UTC), None if unparseable."""
+    if not timestamp:
+        return None
+    try:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def read_positions(records: Sequence[T], positions: Sequence[int]) -> list[T]:
+    """Records at ascending positions, reading each run of consecutive positions as one slice."""
+    items: list[T] = []
+    start = 0
+    while start < len(positions):
+        stop = start + 1
+        while stop < len(positions) and positions[stop] == positions[stop - 1] + 1:
+            stop += 1
+        items.extend(records[positions[start]:positions[stop - 1] + 1])
+        start = stop
+    return items
+
+
+class RecordIndex(Generic[T]):
+    """Posting-list indexes over a list that is only ever appended to.
+
+    Args:
+        records: The list being indexed (read, never modified)
+        fields: Returns {field: values} to index a record under
+        order_key: Sort key of the "most recent first" views; records
+            appended in non-decreasing key order are served without sorting
+        tick_of: Numeric tick of a record, or None, for tick range queries
+
+    Usage:
+        index = RecordIndex(state.all_events, lambda e: {"type": [e.event_type]})
+        state.all_events.append(event)
+        index.add(event)
+        page, next_cursor = index.query({"type": ["action"]}, limit=50)
+    """
+
+    def __init__(
+        self,
+        records: list[T],
+        fields: FieldExtractor,
+        order_key: Callable[[T], Any] | None = None,
+        tick_of: Callable[[T], float | None] | None = None,
+    ) -> None:
+        self.records = records
+        self._fields = fields
+        self._order_key = order_key
+        self._tick_of = tick_of
+        self._postings: dict[str, dict[Hashable, list[int]]] = {}
+        self._count = 0
+        # Whether records arrived in order_key order (enables sort-free views)
+        self._ordered = True
+        self._last_key: Any = None
+        # Positions of records with a tick, and those ticks, in position order
+        self._tick_positions: list[int] = []
+        self._tick_values: list[float] = []
+        self._ticks_sorted = True
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, record: T) -> None:
+        """Index a record just appended to the list."""
+        position = self._count
+        self._count += 1
+        for field_name, values in self._fields(record).items():
+            postings = self._postings.setdefault(field_name, {})
+            for value in set(values):
+                if value is not None:
+                    postings.setdefault(value, []).append(position)
+
+        if self._order_key is not None and self._ordered:
+            key = self._order_key(record)
+            try:
+                if position and key < self._last_key:
+                    self._ordered = False
+            except TypeError:
+                self._ordered = False
+            self._last_key = key
+
+        if self._tick_of is not None:
+            tick = self._tick_of(record)
+            if tick is not None:
+                if self._tick_values and tick < self._tick_values[-1]:
+                    self._ticks_sorted = False
+                self._tick_positions.append(position)
+                self._tick_values.append(tick)
+
+    def values(self, field_name: str) -> list[Hashable]:
+        """Distinct values seen for a field."""
+        return list(self._postings.get(field_name, {}))
+
+    def _positions(self, field_name: str, values: Iterable[Hashable]) -> list[int]:
+        """Ascending positions of records with any of the values for a field."""
+        postings = self._postings.get(field_name, {})
+        lists = [postings[v] for v in dict.fromkeys(values) if v in postings]
+        if not lists:
+            return []
+        if len(lists) == 1:
+            return lists[0]
+        return list(dict.fromkeys(heapq.merge(*lists)))
+
+    def tick_positions(self, tick_min: float | None, tick_max: float | None) -> list[int]:
+        """Ascending positions of records whose tick lies in [tick_min, tick_max]."""
+        low = float("-inf") if tick_min is None else tick_min
+        high = float("inf") if tick_max is None else tick_max
+        if self._ticks_sorted:
+            start = bisect.bisect_left(self._tick_values, low)
+            end = bisect.bisect_right(self._tick_values, high)
+            return self._tick_positions[start:end]
+        return [
+            p for p, t in zip(self._tick_positions, self._tick_values) if low <= t <= high
+        ]
+
+    def _sources(
+        self,
+        filters: dict[str, Iterable[Hashable] | None],
+        extra: Sequence[Sequence[int]] = (),
+    ) -> list[Sequence[int]]:
+        sources: list[Sequence[int]] = [
+            self._positions(name, values)
+            for name, values in filters.items()
+            if values is not None
+        ]
+        sources.extend(extra)
+        return sources
+
+    def _iter_matches(
+        self,
+        sources: list[Sequence[int]],
+        predicate: Callable[[T], bool] | None,
+        after: int | None,
+        reverse: bool,
+    ) -> Iterator[int]:
+        """Positions in every source (all positions if none) that pass predicate."""
+        driver: Sequence[int] = min(sources, key=len) if sources else range(self._count)
+        others = [s for s in sources if s is not driver]
+        if reverse:
+            iterable: Iterable[int] = reversed(driver)
+        else:
+            iterable = driver[bisect.bisect_left(driver, after):] if after else driver
+        records = self.records
+        for position in iterable:
+            if others and not all(_contains(o, position) for o in others):
+                continue
+            if predicate is not None and not predicate(records[position]):
+                continue
+            yield position
+
+    def query(
+        self,
+        filters: dict[str, Iterable[Hashable] | None],
+        predicate: Callable[[T], bool] | None = None,
+        extra: Sequence[Sequence[int]] = (),
+        after: int | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[T], int | None]:
+        """Matching records in append order, one page at a time.
+
+        Args:
+            filters: {field: acceptable values}; None means no filter
+            predicate: Extra per-record check on candidates
+            extra: Further ascending position lists a record must be in
+            after: Cursor from a previous page (position to resume at)
+            offset: Matches to skip before the page
+            limit: Page size
+
+        Returns:
+            (records, next cursor or None when there are no further matches);
+            records from spilled positions of a SpillList are copies
+        """
+        page: list[T] = []
+        records = self.records
+        skipped = 0
+        for position in self._iter_matches(
+            self._sources(filters, extra), predicate, after, reverse=False
+        ):
+            if skipped < offset:
+                skipped += 1
+                continue
+            if len(page) == limit:
+                return page, position
+            page.append(records[position])
+        return page, None
+
+    def recent(
+        self,
+        filters: dict[str, Iterable[Hashable] | None],
+        predicate: Callable[[T], bool] | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[T], int]:
+        """Matching records ordered by order_key descending, plus the total match count.
+
+        Same order as sorted(matches, key=order_key, reverse=True): ties keep
+        append order. Records from spilled positions of a SpillList are copies.
+        """
+        assert self._order_key is not None, "recent() needs an order_key"
+        sources = self._sources(filters)
+        records = self.records
+        key = self._order_key
+
+        if not self._ordered:
+            matches = [records[p] for p in self._iter_matches(sources, predicate, None, False)]
+            matches.sort(key=key, reverse=True)
+            return matches[offset:offset + limit], len(matches)
+
+        page: list[T] = []
+        group: list[int] = []
+        group_key: Any = None
+        seen = 0
+
+        def flush() -> None:
+            nonlocal seen
+            for p in reversed(group):
+                if seen >= offset:
+                    page.append(records[p])
+                seen += 1
+            group.clear()
+
+        for position in self._iter_matches(sources, predicate, None, reverse=True):
+            position_key = key(records[position])
+            if group and position_key != group_key:
+                flush()
+                if len(page) >= limit:
+                    break
+            group.append(position)
+            group_key = position_key
+        else:
+            flush()
+        return page[:limit], self.count(filters, predicate)
+
+    def count(
+        self,
+        filters: dict[str, Iterable[Hashable] | None],
+        predicate: Callable[[T], bool] | None = None,
+    ) -> int:
+        """Number of matching records."""
+        sources = self._sources(filters)
+        if predicate is None and len(sources) <= 1:
+            return len(sources[0]) if sources else self._count
+        return sum(1 for _ in self._iter_matches(sources, predicate, None, False))
+
+
+class TimeIndex(Generic[T]):
+    """Record positions by timestamp over a list that is only ever appended to.
+
+    Args:
+        records: The list being indexed (read, never modified)
+        timestamp_of: ISO timestamp of a record; records whose timestamp is
+            empty or unparseable are "untimed"
+
+    Usage:
+        index = TimeIndex(state.ledger_transfers, lambda t: t.timestamp)
+        state.ledger_transfers.append(transfer)
+        index.add(transfer)
+        in_window = index.window("2025-01-01T00:00:00", None)
+    """
+
+    def __init__(self, records: list[T], timestamp_of: Callable[[T], str]) -> None:
+        self.records = records
+        self._timestamp_of = timestamp_of
+        self._count = 0
+        # Positions of timed records, and their POSIX times, in position order
+        self._timed_positions: list[int] = []
+        self._times: list[float] = []
+        self._times_sorted = True
+        self._untimed_positions: list[int] = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, record: T) -> None:
+        """Index a record just appended to the list."""
+        position = self._count
+        self._count += 1
+        seconds = posix_seconds(self._timestamp_of(record))
+        if seconds is None:
+            self._untimed_positions.append(position)
+            return
+        if self._times and seconds < self._times[-1]:
+            self._times_sorted = False
+        self._timed_positions.append(position)
+        self._times.append(seconds)
+
+    def positions(
+        self,
+        time_min: str | None,
+        time_max: str | None,
+        include_untimed: bool = False,
+    ) -> list[int]:
+        """Ascending positions of records timed within [time_min, time_max].
+
+        A bound that is None or unparseable is not applied.
+        """
+        low = posix_seconds(time_min)
+        high = posix_seconds(time_max)
+        low = float("-inf") if low is None else low
+        high = float("inf") if high is None else high
+        if self._times_sorted:
+            start = bisect.bisect_left(self._times, low)
+            end = bisect.bisect_right(self._times, high)
+            timed = self._timed_positions[start:end]
+        else:
+            timed = [
+                p for p, t in zip(self._timed_positions, self._times) if low <= t <= high
+            ]
+        if include_untimed and self._untimed_positions:
+            return list(heapq.merge(timed, self._untimed_positions))
+        return timed
+
+    def window(
+        self,
+        time_min: str | None,
+        time_max: str | None,
+        include_untimed: bool = False,
+    ) -> list[T]:
+        """Records timed within [time_min, time_max], in append order.
+
+        Consecutive positions are read as one slice, so a window over
+        spilled history costs one store query per run of records.
+        """
+        return read_positions(
+            self.records, self.positions(time_min, time_max, include_untimed)
+        )
+
+
+__all__ = ["RecordIndex", "TimeIndex", "posix_seconds", "read_positions"]
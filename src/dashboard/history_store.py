@@ -0,0 +1,225 @@
+"""Spill-to-disk history lists for the dashboard parser.
+
+SimulationState keeps every event, interaction, activity item, transfer and
+chart point of a run in Python lists, so following a multi-day run grows the
+dashboard without bound. With dashboard.hot_history_items > 0, JSONLParser
+creates those lists as SpillList instead: the newest items stay in memory and
+older ones are moved, in batches, to a SQLite file shared by all lists of the
+state (HistoryStore).
+
+SpillList is an append-only sequence. Positions never change when items
+spill, so len(), indexing, negative indexing, slicing and iteration behave
+exactly like the list they replace; only reads of spilled positions go to
+disk. Iteration pages through the spilled range in chunks, so walking the
+whole history does not load it into memory at once.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import weakref
+from collections.abc import MutableSequence
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TypeVar, overload
+
+T = TypeVar("T")
+
+# Items fetched per query when iterating spilled history
+_PAGE_SIZE = 1000
+
+
+def _close_store(connection: sqlite3.Connection, path: str) -> None:
+    connection.close()
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+class HistoryStore:
+    """SQLite file holding the spilled part of a parser's history lists.
+
+    One store backs one SimulationState. The file is temporary: it is
+    deleted when the store is closed or garbage collected. Access is
+    serialized with a lock so the parser can be driven from a worker thread.
+    """
+
+    def __init__(self, spill_dir: str | Path | None = None) -> None:
+        if spill_dir is not None:
+            Path(spill_dir).mkdir(parents=True, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(
+            prefix="dashboard_history_", suffix=".sqlite",
+            dir=str(spill_dir) if spill_dir is not None else None,
+        )
+        os.close(fd)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=OFF")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(
+            "CREATE TABLE items ("
+            " list_id INTEGER NOT NULL, position INTEGER NOT NULL, payload BLOB NOT NULL,"
+            " PRIMARY KEY (list_id, position)) WITHOUT ROWID"
+        )
+        self._next_list_id = 0
+        self._finalizer = weakref.finalize(self, _close_store, self._connection, self.path)
+
+    def new_list_id(self) -> int:
+        """Allocate an id for a new SpillList."""
+        self._next_list_id += 1
+        return self._next_list_id
+
+    def put_many(self, list_id: int, start: int, items: Iterable[Any]) -> None:
+        """Store items at consecutive positions starting at start."""
+        rows = [
+            (list_id, start + i, pickle.dumps(item, pickle.HIGHEST_PROTOCOL))
+            for i, item in enumerate(items)
+        ]
+        with self._lock:
+            self._connection.executemany("INSERT INTO items VALUES (?, ?, ?)", rows)
+            self._connection.commit()
+
+    def get_range(self, list_id: int, start: int, stop: int) -> list[Any]:
+        """Items at positions [start, stop)."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT payload FROM items WHERE list_id = ? AND position >= ? AND position < ?"
+                " ORDER BY position",
+                (list_id, start, stop),
+            ).fetchall()
+        return [pickle.loads(row[0]) for row in rows]
+
+    def replace(self, list_id: int, position: int, item: Any) -> None:
+        """Overwrite the item at a spilled position."""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE items SET payload = ? WHERE list_id = ? AND position = ?",
+                (pickle.dumps(item, pickle.HIGHEST_PROTOCOL), list_id, position),
+            )
+            self._connection.commit()
+
+    def size_bytes(self) -> int:
+        """Current size of the spill file."""
+        return os.path.getsize(self.path)
+
+    def close(self) -> None:
+        """Close the connection and delete the spill file."""
+        self._finalizer()
+
+
+class SpillList(MutableSequence[T]):
+    """Append-only list whose oldest items live in a HistoryStore.
+
+    At most 2 * hot_items items are held in memory: once the in-memory tail
+    reaches that size, all but the newest hot_items are written to the
+    store in one batch. Items that were spilled are read back as copies, so
+    mutating an object obtained from a spilled position does not change the
+    stored history; assign it back (lst[i] = item) to persist a change.
+    """
+
+    def __init__(self, store: HistoryStore, hot_items: int) -> None:
+        if hot_items <= 0:
+            raise ValueError(f"hot_items must be positive, got {hot_items}")
+        self._store = store
+        self._list_id = store.new_list_id()
+        self._hot_items = hot_items
+        self._hot: list[T] = []
+        self._spilled = 0
+
+    @property
+    def spilled(self) -> int:
+        """Number of items currently on disk."""
+        return self._spilled
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._hot)
+
+    def append(self, item: T) -> None:
+        self._hot.append(item)
+        if len(self._hot) >= 2 * self._hot_items:
+            count = len(self._hot) - self._hot_items
+            self._store.put_many(self._list_id, self._spilled, self._hot[:count])
+            del self._hot[:count]
+            self._spilled += count
+
+    def _read(self, start: int, stop: int) -> list[T]:
+        """Items at positions [start, stop), 0 <= start <= stop <= len."""
+        items: list[T] = []
+        if start < self._spilled:
+            items = self._store.get_range(self._list_id, start, min(stop, self._spilled))
+        if stop > self._spilled:
+            items.extend(self._hot[max(start - self._spilled, 0):stop - self._spilled])
+        return items
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._read(start, max(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("history index out of range")
+        if index >= self._spilled:
+            return self._hot[index - self._spilled]
+        item: T = self._store.get_range(self._list_id, index, index + 1)[0]
+        return item
+
+    @overload
+    def __setitem__(self, index: int, value: T) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[T]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            raise TypeError("history does not support slice assignment")
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        if index >= self._spilled:
+            self._hot[index - self._spilled] = value
+        else:
+            self._store.replace(self._list_id, index, value)
+
+    def __delitem__(self, index: int | slice) -> None:
+        raise TypeError("history is append-only")
+
+    def insert(self, index: int, value: T) -> None:
+        if index < len(self):
+            raise TypeError("history is append-only")
+        self.append(value)
+
+    def __iter__(self) -> Iterator[T]:
+        length = len(self)
+        for start in range(0, length, _PAGE_SIZE):
+            yield from self._read(start, min(start + _PAGE_SIZE, length))
+
+    def __reversed__(self) -> Iterator[T]:
+        length = len(self)
+        for stop in range(length, 0, -_PAGE_SIZE):
+            yield from reversed(self._read(max(stop - _PAGE_SIZE, 0), stop))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, SpillList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SpillList(len={len(self)}, spilled={self._spilled})"
+
+
+__all__ = ["HistoryStore", "SpillList"]
@@ -0,0 +1,183 @@
+"""Event log ingestion off the dashboard's event loop.
+
+File I/O and JSON decoding of the event log run on a single ingestion
+thread, so a large catch-up never stalls HTTP or WebSocket clients:
+
+- Full loads (startup, switching runs) parse a fresh JSONLParser entirely on
+  the ingestion thread. Handlers keep reading the previously published
+  parser until the load finishes, then the new one is published with a
+  single reference swap.
+- Incremental catch-up reads and decodes new events on the ingestion
+  thread in batches, and applies each batch to the published parser on the
+  event loop. State is only mutated on the loop, so handlers always see a
+  consistent snapshot between awaits. The read position is committed with
+  each applied batch, so a batch that is never applied is read again.
+
+Usage:
+    ingestor = EventIngestor(parser)
+    ingestor.load(JSONLParser(path))   # background full load
+    await ingestor.catch_up()          # before reading ingestor.parser
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .parser import JSONLParser
+
+logger = logging.getLogger(__name__)
+
+# Defaults, mirroring DashboardConfig
+DEFAULT_INGEST_BATCH_EVENTS = 1000
+DEFAULT_INGEST_WAIT_SECONDS = 1.0
+
+
+class EventIngestor:
+    """Owns the ingestion thread and the published parser.
+
+    All methods are called from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        parser: JSONLParser,
+        batch_events: int = DEFAULT_INGEST_BATCH_EVENTS,
+        wait_seconds: float = DEFAULT_INGEST_WAIT_SECONDS,
+    ) -> None:
+        """Create an ingestor publishing parser.
+
+        Args:
+            parser: Initially published parser (read incrementally)
+            batch_events: Events decoded per ingestion step
+            wait_seconds: How long catch_up() waits for a full load before
+                returning with the previously published state
+        """
+        self.parser = parser
+        self.batch_events = batch_events
+        self.wait_seconds = wait_seconds
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dashboard-ingest")
+        self._loading: JSONLParser | None = None
+        self._load_task: asyncio.Task[None] | None = None
+        self._cancel_load = threading.Event()
+        self._catch_up_task: asyncio.Task[None] | None = None
+
+    @property
+    def loading(self) -> bool:
+        """Whether a full load is in progress (or pending a running loop)."""
+        return self._loading is not None
+
+    def load(self, parser: JSONLParser) -> None:
+        """Parse parser's log from the start off the loop, then publish it.
+
+        Supersedes any load in progress. Starts immediately if an event
+        loop is running, else on the next catch_up().
+        """
+        self._cancel_load.set()
+        self._cancel_load = threading.Event()
+        self._loading = parser
+        self._load_task = None
+        self._start_load()
+
+    def _start_load(self) -> None:
+        if self._loading is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop yet (constructed outside the server)
+        if self._load_task is not None:
+            if self._load_task.get_loop() is loop:
+                return
+            # Started on a loop that has since gone away: start over
+            self._cancel_load.set()
+            self._cancel_load = threading.Event()
+        self._load_task = loop.create_task(self._run_load(self._loading, self._cancel_load))
+
+    async def _run_load(self, parser: JSONLParser, cancel: threading.Event) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, self._load_blocking, parser, cancel)
+        except Exception:  # exception-ok: a failed load keeps the last published state
+            logger.exception("Failed to load event log %s", parser.jsonl_path)
+            if not cancel.is_set():
+                self._loading = None
+                self._load_task = None
+            return
+        if cancel.is_set():
+            return
+        self.parser = parser
+        self._loading = None
+        self._load_task = None
+
+    def _load_blocking(self, parser: JSONLParser, cancel: threading.Event) -> None:
+        """Ingestion thread: parse an unpublished parser to the end of its log."""
+        while not cancel.is_set():
+            batch = parser.read_events(self.batch_events)
+            parser.apply_events(batch)
+            if len(batch.events) < self.batch_events:
+                return
+
+    async def catch_up(self) -> None:
+        """Bring the published parser up to date with its log.
+
+        While a full load is running this waits at most wait_seconds for it
+        and, if it is still running, returns leaving the previous state
+        published. Concurrent callers share one catch-up.
+        """
+        self._start_load()
+        if self._load_task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(self._load_task), self.wait_seconds)
+            except asyncio.TimeoutError:
+                return
+            if self.loading:
+                return
+        task = self._catch_up_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._catch_up_task = asyncio.create_task(self._run_catch_up())
+        await asyncio.shield(task)
+
+    async def _run_catch_up(self) -> None:
+        loop = asyncio.get_running_loop()
+        parser = self.parser
+        while True:
+            batch = await loop.run_in_executor(
+                self._executor, parser.read_events, self.batch_events
+            )
+            if parser is not self.parser:
+                return  # Replaced by a full load meanwhile
+            parser.apply_events(batch)
+            if len(batch.events) < self.batch_events:
+                return
+
+    def progress(self) -> dict[str, Any]:
+        """Ingestion progress of the log being loaded (or the published one)."""
+        parser = self._loading or self.parser
+        try:
+            bytes_read, bytes_total = parser.read_progress()
+        except OSError:
+            bytes_read, bytes_total = 0, 0
+        return {
+            "loading": self.loading,
+            "jsonl_path": str(parser.jsonl_path),
+            "bytes_read": bytes_read,
+            "bytes_total": bytes_total,
+            "fraction": bytes_read / bytes_total if bytes_total else 1.0,
+            "events_parsed": len(parser.state.all_events),
+        }
+
+    def shutdown(self) -> None:
+        """Cancel any load and stop the ingestion thread."""
+        self._cancel_load.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "DEFAULT_INGEST_BATCH_EVENTS",
+    "DEFAULT_INGEST_WAIT_SECONDS",
+    "EventIngestor",
+]
@@ -0,0 +1,352 @@
+"""Incremental KPI and emergence-metric aggregation.
+
+calculate_kpis() and calculate_emergence_metrics() walk every interaction,
+action and thinking record on each call, so a dashboard refresh late in a
+long run costs O(run length). KPIAggregator is fed by JSONLParser as events
+are processed and keeps the same metrics as running state:
+
+- running sums and counters for transfers, escrow volume, thinking cost,
+  coordination events and genesis / non-genesis invocations
+- a sorted list of scrip balances (bisect) for median and Gini
+- union-find over agents for coalitions, plus the set of interacting agent
+  pairs for coordination density
+- per-agent action type counters for specialization
+- per-artifact invoker sets for the reuse ratio
+
+kpis() and emergence() return exactly what the full calculators return for
+the same state. Agent fields (scrip, quotas, last action) are set by many
+handlers, so they are synced in one pass over the agents at read time; that
+pass is O(agents), independent of how many events the run has produced.
+Capital depth is recomputed only when an artifact's dependencies change.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from .kpis import (
+    EcosystemKPIs,
+    calculate_capital_depth,
+    calculate_genesis_independence,
+    calculate_scrip_velocity,
+    calculate_specialization_index,
+)
+from .models import EmergenceMetrics
+
+if TYPE_CHECKING:
+    from .models import ActionEvent, Interaction, LedgerTransfer, ThinkingEvent
+    from .parser import AgentState, ArtifactState, SimulationState
+
+# Same window as calculate_active_agent_ratio's default
+_ACTIVE_THRESHOLD_EVENTS = 5
+
+
+class KPIAggregator:
+    """Running KPI state for one SimulationState.
+
+    Owned by JSONLParser and recreated whenever the parser starts a fresh
+    state. Every record_* call must be made right after the matching change
+    to the state it mirrors.
+    """
+
+    def __init__(self, state: SimulationState) -> None:
+        self.state = state
+
+        # Running sums and counters
+        self._transfer_total = 0
+        self._escrow_volume = 0
+        self._thinking_cost = 0.0
+        self._interaction_count = 0
+        self._coordination_events = 0
+        self._genesis_invocations = 0
+        self._non_genesis_invocations = 0
+
+        # Scrip order statistics
+        self._scrip: dict[str, Any] = {}
+        self._sorted_scrip: list[Any] = []
+        self._gini: float | None = None
+
+        # Agent graph: union-find over agents, unique interacting pairs, and
+        # edges waiting for an endpoint to become an agent
+        self._parent: dict[str, str] = {}
+        self._merges = 0
+        self._pairs: set[tuple[str, str]] = set()
+        self._pending_edges: dict[str, set[str]] = {}
+
+        # Specialization
+        self._action_types: dict[str, Counter[str]] = {}
+
+        # Artifacts: (type, creator, depends_on) as last recorded
+        self._artifacts: dict[str, tuple[str, str, tuple[str, ...]]] = {}
+        self._artifact_types: Counter[str] = Counter()
+        self._invokers: dict[str, set[str]] = {}
+        self._reused: set[str] = set()
+        self._capital_depth: int | None = 0
+
+    # Event hooks (called by JSONLParser)
+
+    def record_thinking(self, thinking: ThinkingEvent) -> None:
+        """Account for a thinking record appended to an agent's history."""
+        self._thinking_cost += thinking.thinking_cost
+
+    def record_action(self, action: ActionEvent) -> None:
+        """Account for an action appended to an agent's history."""
+        if action.action_type:
+            counts = self._action_types.setdefault(action.agent_id, Counter())
+            counts[action.action_type] += 1
+
+    def record_agent_replaced(self, agent: AgentState) -> None:
+        """Drop the histories of an AgentState that is being replaced."""
+        for thinking in agent.thinking_history:
+            self._thinking_cost -= thinking.thinking_cost
+        counts = self._action_types.get(agent.agent_id)
+        if counts is not None:
+            counts.subtract(a.action_type for a in agent.actions if a.action_type)
+            self._action_types[agent.agent_id] = +counts
+
+    def record_transfer(self, transfer: LedgerTransfer) -> None:
+        """Account for a ledger transfer."""
+        self._transfer_total += transfer.amount
+
+    def record_escrow_trade(self, trade: dict[str, Any]) -> None:
+        """Account for a completed escrow trade."""
+        self._escrow_volume += trade.get("price", 0)
+
+    def record_interaction(self, interaction: Interaction) -> None:
+        """Account for an interaction appended to state.interactions."""
+        self._interaction_count += 1
+        kind = interaction.interaction_type
+        artifact_id = interaction.artifact_id
+
+        if kind == "genesis_invoke":
+            self._genesis_invocations += 1
+        elif kind == "artifact_invoke":
+            self._coordination_events += 1
+            if artifact_id and artifact_id.startswith("genesis_"):
+                self._genesis_invocations += 1
+            else:
+                self._non_genesis_invocations += 1
+
+        if kind in ("artifact_invoke", "genesis_invoke") and artifact_id:
+            self._invokers.setdefault(artifact_id, set()).add(interaction.from_id)
+            self._check_reuse(artifact_id)
+
+        from_id, to_id = interaction.from_id, interaction.to_id
+        if from_id != to_id:
+            self._add_edge(from_id, to_id)
+
+    def record_artifact(self, artifact: ArtifactState) -> None:
+        """Account for an artifact written or changing owner."""
+        artifact_id = artifact.artifact_id
+        current = (artifact.artifact_type, artifact.created_by, tuple(artifact.depends_on))
+        previous = self._artifacts.get(artifact_id)
+        if previous == current:
+            return
+        self._artifacts[artifact_id] = current
+
+        if previous is not None:
+            self._artifact_types[previous[0]] -= 1
+            if not self._artifact_types[previous[0]]:
+                del self._artifact_types[previous[0]]
+        self._artifact_types[current[0]] += 1
+
+        self._check_reuse(artifact_id)
+        if (previous[2] if previous else ()) != current[2]:
+            self._capital_depth = None
+
+    # Results
+
+    def kpis(self) -> EcosystemKPIs:
+        """Return the same EcosystemKPIs as calculate_kpis(self.state)."""
+        state = self.state
+        kpis = EcosystemKPIs()
+        if not state.agents:
+            return kpis
+
+        total_scrip, active, frozen, total_actions = self._sync_agents()
+        agent_count = len(state.agents)
+
+        kpis.total_scrip = total_scrip
+        kpis.median_scrip = self._median()
+        kpis.gini_coefficient = self._gini_coefficient()
+
+        elapsed_seconds = 0.0
+        if state.start_time:
+            try:
+                start = datetime.fromisoformat(state.start_time)
+                elapsed_seconds = (datetime.now() - start).total_seconds()
+            except (ValueError, TypeError):
+                pass
+
+        kpis.scrip_velocity = calculate_scrip_velocity(
+            self._transfer_total, kpis.total_scrip, elapsed_seconds
+        )
+        kpis.active_agent_ratio = active / agent_count
+        kpis.frozen_agent_count = frozen
+
+        if elapsed_seconds > 0:
+            kpis.actions_per_second = total_actions / elapsed_seconds
+            kpis.thinking_cost_rate = self._thinking_cost / elapsed_seconds
+            kpis.mint_scrip_rate = state.total_scrip_minted / elapsed_seconds
+            kpis.llm_budget_burn_rate = state.api_cost_spent / elapsed_seconds
+            kpis.agent_spawn_rate = len(state.ledger_spawns) / elapsed_seconds
+
+        kpis.escrow_active_listings = len(state.escrow_listings)
+        kpis.escrow_volume = self._escrow_volume
+        if state.current_tick > 0:
+            kpis.artifact_creation_rate = len(state.artifacts) / state.current_tick
+        kpis.llm_budget_remaining = state.api_cost_limit - state.api_cost_spent
+        kpis.coordination_events = self._coordination_events
+        kpis.artifact_diversity = len(self._artifact_types)
+
+        recent_summaries = state.tick_summaries[-30:]
+        if recent_summaries:
+            kpis.activity_trend = [float(s.action_count) for s in recent_summaries]
+            kpis.scrip_velocity_trend = [
+                float(s.total_scrip_transferred) for s in recent_summaries
+            ]
+
+        return kpis
+
+    def emergence(self) -> EmergenceMetrics:
+        """Return the same EmergenceMetrics as calculate_emergence_metrics(self.state)."""
+        state = self.state
+        self._sync_agents()
+        agent_count = len(state.agents)
+
+        agent_action_counts = {
+            agent_id: dict(self._action_types[agent_id])
+            for agent_id in state.agents
+            if self._action_types.get(agent_id)
+        }
+
+        coordination_density = 0.0
+        if agent_count >= 2:
+            coordination_density = len(self._pairs) / (agent_count * (agent_count - 1) // 2)
+
+        reuse_ratio = 0.0
+        if state.artifacts:
+            reuse_ratio = len(self._reused) / len(state.artifacts)
+
+        if self._capital_depth is None:
+            self._capital_depth = calculate_capital_depth(state)
+
+        return EmergenceMetrics(
+            coordination_density=coordination_density,
+            coalition_count=agent_count - self._merges,
+            specialization_index=calculate_specialization_index(agent_action_counts),
+            reuse_ratio=reuse_ratio,
+            genesis_independence=calculate_genesis_independence(state),
+            capital_depth=self._capital_depth,
+            agent_count=agent_count,
+            total_interactions=self._interaction_count,
+            total_artifacts=len(state.artifacts),
+            genesis_invocations=self._genesis_invocations,
+            non_genesis_invocations=self._non_genesis_invocations,
+            agent_specializations=agent_action_counts,
+        )
+
+    # Internals
+
+    def _sync_agents(self) -> tuple[Any, int, int, int]:
+        """Fold agent field changes in; return (total scrip, active, frozen, actions)."""
+        state = self.state
+        total_scrip: Any = 0
+        active = frozen = total_actions = 0
+        for agent_id, agent in state.agents.items():
+            scrip = agent.scrip
+            if agent_id not in self._scrip:
+                self._scrip[agent_id] = scrip
+                bisect.insort(self._sorted_scrip, scrip)
+                self._gini = None
+                self._add_agent(agent_id)
+            elif self._scrip[agent_id] != scrip:
+                old = self._scrip[agent_id]
+                del self._sorted_scrip[bisect.bisect_left(self._sorted_scrip, old)]
+                bisect.insort(self._sorted_scrip, scrip)
+                self._scrip[agent_id] = scrip
+                self._gini = None
+
+            total_scrip += scrip
+            last_action = agent.last_action_tick
+            if last_action is not None and (
+                state.current_tick - last_action
+            ) <= _ACTIVE_THRESHOLD_EVENTS:
+                active += 1
+            if agent.llm_tokens_used >= agent.llm_tokens_quota:
+                frozen += 1
+            total_actions += agent.action_count
+        return total_scrip, active, frozen, total_actions
+
+    def _median(self) -> Any:
+        balances = self._sorted_scrip
+        n = len(balances)
+        if n == 0:
+            return 0
+        if n % 2 == 1:
+            return balances[n // 2]
+        mid = n // 2
+        return (balances[mid - 1] + balances[mid]) // 2
+
+    def _gini_coefficient(self) -> float:
+        """Gini over the sorted balances, cached until a balance changes."""
+        if self._gini is None:
+            balances = self._sorted_scrip
+            n = len(balances)
+            total = sum(balances)
+            if n <= 1 or total == 0:
+                self._gini = 0.0
+            else:
+                weighted_sum = sum((i + 1) * y for i, y in enumerate(balances))
+                gini = (2 * weighted_sum) / (n * total) - (n + 1) / n
+                self._gini = max(0.0, min(1.0, gini))
+        return self._gini
+
+    def _check_reuse(self, artifact_id: str) -> None:
+        """Re-evaluate whether someone other than the owner invoked an artifact."""
+        artifact = self.state.artifacts.get(artifact_id)
+        invokers = self._invokers.get(artifact_id)
+        if artifact is not None and invokers and (
+            len(invokers) > 1 or artifact.created_by not in invokers
+        ):
+            self._reused.add(artifact_id)
+        else:
+            self._reused.discard(artifact_id)
+
+    def _find(self, node: str) -> str:
+        parent = self._parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    def _add_agent(self, agent_id: str) -> None:
+        """Add a new agent to the graph and resolve edges that waited for it."""
+        self._parent[agent_id] = agent_id
+        for other in self._pending_edges.pop(agent_id, ()):
+            self._add_edge(agent_id, other)
+
+    def _add_edge(self, a: str, b: str) -> None:
+        """Link two endpoints, or park the edge until both are agents."""
+        if a not in self._parent:
+            self._pending_edges.setdefault(a, set()).add(b)
+            return
+        if b not in self._parent:
+            self._pending_edges.setdefault(b, set()).add(a)
+            return
+        pair = (a, b) if a < b else (b, a)
+        if pair in self._pairs:
+            return
+        self._pairs.add(pair)
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a != root_b:
+            self._parent[root_a] = root_b
+            self._merges += 1
+
+
+__all__ = ["KPIAggregator"]
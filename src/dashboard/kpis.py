@@ -496,10 +496,9 @@ def calculate_capital_depth(state: SimulationState) -> int:
     dependencies: dict[str, set[str]] = defaultdict(set)
 
     for artifact_id, artifact in state.artifacts.items():
-        # Check if artifact has dependency metadata
-        if hasattr(artifact, "dependencies") and artifact.dependencies:
-            for dep_id in artifact.dependencies:
-                dependencies[artifact_id].add(dep_id)
+        # Plan #63: dependencies recorded on write_artifact
+        for dep_id in artifact.depends_on:
+            dependencies[artifact_id].add(dep_id)
 
     if not dependencies:
         return 0
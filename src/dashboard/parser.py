@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Literal, cast
 
+from ..world.event_segments import list_sealed_segments
+from .event_index import RecordIndex, TimeIndex
+from .history_store import HistoryStore, SpillList
+from .kpi_aggregator import KPIAggregator
 from .models import (
     AgentSummary,
     ArtifactInfo,
@@ -151,13 +157,149 @@ class SimulationState:
     invocation_events: list[InvocationEvent] = field(default_factory=list)
 
 
+def _event_fields(event: RawEvent) -> dict[str, list[Any]]:
+    """Index keys of a raw event: type, principal and artifact (top level or intent)."""
+    data = event.data
+    intent = data.get("intent")
+    if not isinstance(intent, dict):
+        intent = {}
+    return {
+        "event_type": [event.event_type],
+        "principal": [
+            v for v in (data.get("principal_id"), intent.get("principal_id"))
+            if isinstance(v, str)
+        ],
+        "artifact": [
+            v for v in (data.get("artifact_id"), intent.get("artifact_id"))
+            if isinstance(v, str)
+        ],
+    }
+
+
+def _event_tick(event: RawEvent) -> float | None:
+    """Numeric tick of a raw event, if it carries one."""
+    tick = event.data.get("tick")
+    if isinstance(tick, (int, float)) and not isinstance(tick, bool):
+        return tick
+    return None
+
+
+def _bucket_timestamp(timestamp: str, bucket_seconds: int) -> str:
+    """Truncate a timestamp to a bucket of seconds within its minute."""
+    try:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        second = (dt.second // bucket_seconds) * bucket_seconds
+        return dt.replace(second=second, microsecond=0).isoformat()
+    except (ValueError, TypeError):
+        return timestamp
+
+
+@dataclass
+class _TransferFlows:
+    """Totals of ledger transfers per (from, to) pair.
+
+    The parser keeps one over the whole run, updated as transfers arrive,
+    so the flow views cost one entry per pair rather than a walk over the
+    (possibly spilled) transfer history.
+    """
+
+    # (from_id, to_id) -> [total amount, transfer count, latest tick]
+    links: dict[tuple[str, str], list[int]] = field(default_factory=dict)
+    # Senders and recipients in first-seen order
+    participants: dict[str, None] = field(default_factory=dict)
+    first_timestamp: str = ""
+    last_timestamp: str = ""
+    total: int = 0
+
+    def add(self, transfer: LedgerTransfer) -> None:
+        key = (transfer.from_id, transfer.to_id)
+        link = self.links.get(key)
+        if link is None:
+            if not self.links:
+                self.first_timestamp = self.last_timestamp = transfer.timestamp
+            link = self.links[key] = [0, 0, transfer.tick]
+        link[0] += transfer.amount
+        link[1] += 1
+        link[2] = max(link[2], transfer.tick)
+        self.participants.setdefault(transfer.from_id)
+        self.participants.setdefault(transfer.to_id)
+        self.first_timestamp = min(self.first_timestamp, transfer.timestamp)
+        self.last_timestamp = max(self.last_timestamp, transfer.timestamp)
+        self.total += transfer.amount
+
+
+@dataclass
+class _InvocationGraph:
+    """Invocation counts per (invoker, artifact) pair and per second.
+
+    Like _TransferFlows, the parser keeps one over the whole run so the
+    temporal network and Lindy views never walk the invocation history.
+    """
+
+    counts: dict[tuple[str, str], int] = field(default_factory=dict)
+    # Invokers and invoked artifacts in first-seen order
+    node_ids: dict[str, None] = field(default_factory=dict)
+    # One-second activity buckets, regrouped into larger buckets on request
+    per_second: dict[str, int] = field(default_factory=dict)
+    first_timestamp: str = ""
+    last_timestamp: str = ""
+
+    def add(self, invocation: InvocationEvent) -> None:
+        timestamp = invocation.timestamp
+        if not self.counts:
+            self.first_timestamp = self.last_timestamp = timestamp
+        key = (invocation.invoker_id, invocation.artifact_id)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.node_ids.setdefault(invocation.invoker_id)
+        self.node_ids.setdefault(invocation.artifact_id)
+        bucket = _bucket_timestamp(timestamp, 1)
+        self.per_second[bucket] = self.per_second.get(bucket, 0) + 1
+        self.first_timestamp = min(self.first_timestamp, timestamp)
+        self.last_timestamp = max(self.last_timestamp, timestamp)
+
+
+@dataclass
+class EventBatch:
+    """Decoded events read from the log, not yet applied to parser state."""
+
+    events: list[dict[str, Any]] = field(default_factory=list)
+    # The log was restarted; state must be cleared before applying events
+    reset: bool = False
+    # Read position after these events, committed by apply_events()
+    segments_read: int = 0
+    file_position: int = 0
+
+
 class JSONLParser:
-    """Parser for JSONL event log with incremental updates."""
+    """Parser for JSONL event log with incremental updates.
+
+    Parsing is split into read_events() (file I/O and JSON decoding, which
+    only touches the read position) and apply_events() (state updates).
+    parse_incremental() runs both; the dashboard server runs them on
+    different threads (see ingest.py).
+    """
+
+    def __init__(
+        self,
+        jsonl_path: str | Path,
+        hot_history_items: int = 0,
+        spill_dir: str | Path | None = None,
+    ) -> None:
+        """Create a parser for an event log.
 
-    def __init__(self, jsonl_path: str | Path) -> None:
+        Args:
+            jsonl_path: Path to events.jsonl
+            hot_history_items: Per history list, items kept in memory before
+                older ones spill to disk (0 = keep everything in memory)
+            spill_dir: Directory for the spill file (default: system temp)
+        """
         self.jsonl_path = Path(jsonl_path)
+        self.hot_history_items = hot_history_items
+        self.spill_dir = spill_dir
         self.file_position: int = 0
-        self.state = SimulationState()
+        # Sealed segments consumed so far (logging.segments rotation)
+        self._segments_read: int = 0
+        self._new_state()
         self._current_tick_actions: int = 0
         self._current_tick_llm_tokens: float = 0
         self._current_tick_scrip_transfers: int = 0
@@ -170,6 +312,73 @@ class JSONLParser:
         # Plan #254: Genesis artifacts removed - kernel actions replace them
         pass
 
+    def _new_state(self) -> None:
+        """Start a fresh SimulationState with its KPI aggregator and indexes."""
+        self._history_store = (
+            HistoryStore(self.spill_dir) if self.hot_history_items > 0 else None
+        )
+        self.state = SimulationState(
+            all_events=self._new_history(),
+            tick_summaries=self._new_history(),
+            ledger_transfers=self._new_history(),
+            scrip_flows=self._new_history(),
+            escrow_trades=self._new_history(),
+            interactions=self._new_history(),
+            activity_items=self._new_history(),
+            invocation_events=self._new_history(),
+        )
+        self.kpi_aggregator = KPIAggregator(self.state)
+        self.event_index: RecordIndex[RawEvent] = RecordIndex(
+            self.state.all_events, _event_fields, tick_of=_event_tick,
+        )
+        self.activity_index: RecordIndex[ActivityItem] = RecordIndex(
+            self.state.activity_items,
+            lambda i: {
+                "activity_type": [i.activity_type],
+                "agent": [i.agent_id, i.target_id],
+                "artifact": [i.artifact_id],
+            },
+            order_key=lambda i: (i.tick, i.timestamp),
+        )
+        self.invocation_index: RecordIndex[InvocationEvent] = RecordIndex(
+            self.state.invocation_events,
+            lambda i: {
+                "artifact": [i.artifact_id],
+                "invoker": [i.invoker_id],
+                "success": [i.success],
+            },
+            order_key=lambda i: (i.tick, i.timestamp),
+        )
+        self.interaction_index: RecordIndex[Interaction] = RecordIndex(
+            self.state.interactions,
+            lambda i: {"pair": [frozenset((i.from_id, i.to_id))]},
+        )
+        # Time-window views read only the records inside the window
+        self.transfer_times: TimeIndex[LedgerTransfer] = TimeIndex(
+            self.state.ledger_transfers, lambda t: t.timestamp,
+        )
+        self.invocation_times: TimeIndex[InvocationEvent] = TimeIndex(
+            self.state.invocation_events, lambda i: i.timestamp,
+        )
+        self.transfer_flows = _TransferFlows()
+        self.invocation_graph = _InvocationGraph()
+
+    def _new_history(self) -> list[Any]:
+        """An empty history list, spilling to disk when a memory budget is set."""
+        if self._history_store is None:
+            return []
+        # SpillList supports every list operation used on state histories
+        return cast(list[Any], SpillList(self._history_store, self.hot_history_items))
+
+    def _new_agent(self, agent_id: str, **fields: Any) -> AgentState:
+        """Create an AgentState whose action and thinking histories may spill."""
+        return AgentState(
+            agent_id=agent_id,
+            actions=self._new_history(),
+            thinking_history=self._new_history(),
+            **fields,
+        )
+
     def _init_genesis_artifacts(self) -> None:
         """No-op: Plan #254 removed genesis artifacts.
 
@@ -180,41 +389,124 @@ class JSONLParser:
     def parse_full(self) -> SimulationState:
         """Parse the entire file from the beginning."""
         self.file_position = 0
-        self.state = SimulationState()
+        self._segments_read = 0
+        self._new_state()
         return self.parse_incremental()
 
-    def parse_incremental(self) -> SimulationState:
-        """Parse only new events since last parse."""
-        if not self.jsonl_path.exists():
-            return self.state
-
-        # Check for file truncation (simulation restart)
-        file_size = self.jsonl_path.stat().st_size
-        if file_size < self.file_position:
-            # File was truncated, reset state and parse from beginning
-            self.file_position = 0
-            self.state = SimulationState()
-            self._current_tick_actions = 0
-            self._current_tick_llm_tokens = 0
-            self._current_tick_scrip_transfers = 0
-            self._current_tick_artifacts = 0
-            self._current_tick_mints = 0
-            self._init_genesis_artifacts()  # Re-add genesis artifacts
-
-        with open(self.jsonl_path, 'r') as f:
-            f.seek(self.file_position)
-            for line in f:
-                line = line.strip()
-                if line:
+    def _reset(self) -> None:
+        """Reset parse state after the log was restarted."""
+        self.file_position = 0
+        self._segments_read = 0
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        """Clear derived state (read position is handled by read_events)."""
+        self._new_state()
+        self._current_tick_actions = 0
+        self._current_tick_llm_tokens = 0
+        self._current_tick_scrip_transfers = 0
+        self._current_tick_artifacts = 0
+        self._current_tick_mints = 0
+        self._init_genesis_artifacts()  # Re-add genesis artifacts
+
+    def _read_file(
+        self, path: Path, position: int, events: list[dict[str, Any]], limit: int | None
+    ) -> tuple[int, bool]:
+        """Decode events in path from position into events.
+
+        Returns the position after the last consumed line and whether the
+        end of the file was reached. An undecodable line without a trailing
+        newline is a partial write of a live log: it is left for next time.
+        """
+        with open(path, "rb") as f:
+            f.seek(position)
+            while limit is None or len(events) < limit:
+                line = f.readline()
+                if not line:
+                    return position, True
+                stripped = line.strip()
+                if stripped:
                     try:
-                        event = json.loads(line)
-                        self._process_event(event)
-                    except json.JSONDecodeError:
-                        continue
-            self.file_position = f.tell()
+                        events.append(json.loads(stripped))
+                    except ValueError:
+                        if not line.endswith(b"\n"):
+                            return position, True
+                position += len(line)
+        return position, False
+
+    def read_events(self, max_events: int | None = None) -> EventBatch:
+        """Read and decode events since the last applied batch.
+
+        Touches neither state nor the read position: the position is
+        committed when the batch is applied, so a batch that is dropped is
+        simply read again.
+
+        Args:
+            max_events: Stop after this many events (None = read to the end)
+
+        Returns:
+            EventBatch to pass to apply_events()
+        """
+        batch = EventBatch(segments_read=self._segments_read, file_position=self.file_position)
+        sealed = list_sealed_segments(self.jsonl_path)
+        try:
+            active_size: int | None = os.stat(self.jsonl_path).st_size
+        except FileNotFoundError:
+            active_size = None
+        # Segments removed, or the active file truncated: a new run started
+        if len(sealed) < batch.segments_read or (
+            len(sealed) == batch.segments_read
+            and active_size is not None
+            and active_size < batch.file_position
+        ):
+            batch.segments_read = 0
+            batch.file_position = 0
+            batch.reset = True
+
+        # Segment rotation: the active file was sealed since the last read.
+        # Finish it from our position, read any later sealed segments, then
+        # continue with the new active file from the start.
+        while batch.segments_read < len(sealed):
+            position, at_end = self._read_file(
+                sealed[batch.segments_read], batch.file_position, batch.events, max_events
+            )
+            if not at_end:
+                batch.file_position = position
+                return batch
+            batch.file_position = 0
+            batch.segments_read += 1
+
+        if active_size is not None:
+            batch.file_position, _ = self._read_file(
+                self.jsonl_path, batch.file_position, batch.events, max_events
+            )
+        return batch
 
+    def apply_events(self, batch: EventBatch) -> None:
+        """Apply events from read_events() and commit the read position."""
+        if batch.reset:
+            self._reset_state()
+        for event in batch.events:
+            self._process_event(event)
+        self._segments_read = batch.segments_read
+        self.file_position = batch.file_position
+
+    def parse_incremental(self) -> SimulationState:
+        """Parse only new events since last parse."""
+        self.apply_events(self.read_events())
         return self.state
 
+    def read_progress(self) -> tuple[int, int]:
+        """Bytes of the log read so far and its current total size."""
+        sealed = list_sealed_segments(self.jsonl_path)
+        sizes = [os.stat(segment).st_size for segment in sealed]
+        try:
+            sizes.append(os.stat(self.jsonl_path).st_size)
+        except FileNotFoundError:
+            pass
+        done = sum(sizes[: self._segments_read]) + self.file_position
+        return min(done, sum(sizes)), sum(sizes)
+
     def get_new_events(self) -> list[RawEvent]:
         """Get only the events added since last call."""
         start_count = len(self.state.all_events)
@@ -233,12 +525,31 @@ class JSONLParser:
             data=event
         )
         self.state.all_events.append(raw_event)
+        self.event_index.add(raw_event)
 
         # Process by type
         handler = getattr(self, f"_handle_{event_type}", None)
         if handler:
             handler(event, timestamp)
 
+    def _add_interaction(self, interaction: Interaction) -> None:
+        """Record an interaction for the network graph and the KPI aggregator."""
+        self.state.interactions.append(interaction)
+        self.interaction_index.add(interaction)
+        self.kpi_aggregator.record_interaction(interaction)
+
+    def _add_invocation(self, invocation: InvocationEvent) -> None:
+        """Record an invocation and update its indexes and running counts."""
+        self.state.invocation_events.append(invocation)
+        self.invocation_index.add(invocation)
+        self.invocation_times.add(invocation)
+        self.invocation_graph.add(invocation)
+
+    def _add_activity(self, item: ActivityItem) -> None:
+        """Record an activity feed item and index it."""
+        self.state.activity_items.append(item)
+        self.activity_index.add(item)
+
     def _handle_world_init(self, event: dict[str, Any], timestamp: str) -> None:
         """Handle world initialization event."""
         self.state.start_time = timestamp
@@ -261,8 +572,10 @@ class JSONLParser:
             if agent_id:
                 # Get existing agent if quota_set events already created it
                 existing = self.state.agents.get(agent_id)
-                self.state.agents[agent_id] = AgentState(
-                    agent_id=agent_id,
+                if existing is not None:
+                    self.kpi_aggregator.record_agent_replaced(existing)
+                self.state.agents[agent_id] = self._new_agent(
+                    agent_id,
                     scrip=p.get("starting_scrip", 0),
                     # Use existing quota if set by quota_set, else use world_init value
                     llm_tokens_quota=existing.llm_tokens_quota if existing and existing.llm_tokens_quota > 0 else p.get("llm_tokens_quota", p.get("compute_quota", 0)),
@@ -285,7 +598,7 @@ class JSONLParser:
 
         # Create agent if not exists
         if principal_id not in self.state.agents:
-            self.state.agents[principal_id] = AgentState(agent_id=principal_id)
+            self.state.agents[principal_id] = self._new_agent(principal_id)
 
         if resource == "disk":
             self.state.agents[principal_id].disk_quota = amount
@@ -332,7 +645,7 @@ class JSONLParser:
 
             # Record history for charts (include timestamp for time-based display)
             if agent_id not in self.state.llm_tokens_history:
-                self.state.llm_tokens_history[agent_id] = []
+                self.state.llm_tokens_history[agent_id] = self._new_history()
             self.state.llm_tokens_history[agent_id].append(
                 ChartDataPoint(
                     tick=tick,
@@ -343,7 +656,7 @@ class JSONLParser:
             )
 
             if agent_id not in self.state.scrip_history:
-                self.state.scrip_history[agent_id] = []
+                self.state.scrip_history[agent_id] = self._new_history()
             self.state.scrip_history[agent_id].append(
                 ChartDataPoint(
                     tick=tick,
@@ -357,7 +670,7 @@ class JSONLParser:
         """Handle agent thinking event."""
         agent_id = event.get("principal_id", "")
         if agent_id not in self.state.agents:
-            self.state.agents[agent_id] = AgentState(agent_id=agent_id)
+            self.state.agents[agent_id] = self._new_agent(agent_id)
 
         reasoning = event.get("reasoning", "")
         input_tokens = event.get("input_tokens", 0)
@@ -380,6 +693,7 @@ class JSONLParser:
             reasoning=reasoning if reasoning else None,
         )
         self.state.agents[agent_id].thinking_history.append(thinking)
+        self.kpi_aggregator.record_thinking(thinking)
         # Plan #139: Convert tokens to compute units using world_init costs
         # compute_cost = (input_tokens / 1000 * per_1k_input) + (output_tokens / 1000 * per_1k_output)
         compute_cost = (input_tokens / 1000 * self._per_1k_input_cost) + \
@@ -402,7 +716,7 @@ class JSONLParser:
 
         # Record chart history for autonomous mode (time-based instead of tick-based)
         if agent_id not in self.state.llm_tokens_history:
-            self.state.llm_tokens_history[agent_id] = []
+            self.state.llm_tokens_history[agent_id] = self._new_history()
         self.state.llm_tokens_history[agent_id].append(
             ChartDataPoint(
                 tick=self.state.current_tick,
@@ -416,7 +730,7 @@ class JSONLParser:
         """Handle failed thinking event."""
         agent_id = event.get("principal_id", "")
         if agent_id not in self.state.agents:
-            self.state.agents[agent_id] = AgentState(agent_id=agent_id)
+            self.state.agents[agent_id] = self._new_agent(agent_id)
 
         thinking = ThinkingEvent(
             tick=self.state.current_tick,
@@ -427,6 +741,7 @@ class JSONLParser:
             error=event.get("reason", ""),
         )
         self.state.agents[agent_id].thinking_history.append(thinking)
+        self.kpi_aggregator.record_thinking(thinking)
         # Failed thinking may still have API costs
         self.state.api_cost_spent += event.get("api_cost", 0.0)
 
@@ -437,7 +752,7 @@ class JSONLParser:
         action_type = intent.get("action_type", "unknown")
 
         if agent_id not in self.state.agents:
-            self.state.agents[agent_id] = AgentState(agent_id=agent_id)
+            self.state.agents[agent_id] = self._new_agent(agent_id)
 
         # Determine target
         target = None
@@ -467,11 +782,12 @@ class JSONLParser:
                     depends_on=intent.get("depends_on", []),  # Plan #63: Artifact dependencies
                     access_contract_id=intent.get("access_contract_id", "kernel_contract_freeware"),  # Plan #133
                 )
+                self.kpi_aggregator.record_artifact(self.state.artifacts[artifact_id])
                 if artifact_id not in self.state.agents[agent_id].artifacts_owned:
                     self.state.agents[agent_id].artifacts_owned.append(artifact_id)
 
                 # Add activity item
-                self.state.activity_items.append(ActivityItem(
+                self._add_activity(ActivityItem(
                     tick=self.state.current_tick,
                     timestamp=timestamp,
                     activity_type="artifact_created" if is_new else "artifact_updated",
@@ -488,7 +804,7 @@ class JSONLParser:
                 art.invocation_count += 1
                 # Track interaction if invoking another agent's artifact (including genesis)
                 if art.created_by != agent_id:
-                    self.state.interactions.append(Interaction(
+                    self._add_interaction(Interaction(
                         tick=self.state.current_tick,
                         timestamp=timestamp,
                         from_id=agent_id,
@@ -499,7 +815,7 @@ class JSONLParser:
                     ))
             # Also track direct invocations of genesis artifacts (they may not be in artifacts dict)
             elif invoked_artifact_id and invoked_artifact_id.startswith("genesis_"):
-                self.state.interactions.append(Interaction(
+                self._add_interaction(Interaction(
                     tick=self.state.current_tick,
                     timestamp=timestamp,
                     from_id=agent_id,
@@ -521,6 +837,7 @@ class JSONLParser:
         )
 
         self.state.agents[agent_id].actions.append(action)
+        self.kpi_aggregator.record_action(action)
         self.state.agents[agent_id].action_count += 1
         self.state.agents[agent_id].last_action_tick = self.state.current_tick
 
@@ -532,7 +849,7 @@ class JSONLParser:
             self.state.agents[agent_id].scrip = event.get("scrip_after", 0)
             # Record scrip history for charts (time-based for autonomous mode)
             if agent_id not in self.state.scrip_history:
-                self.state.scrip_history[agent_id] = []
+                self.state.scrip_history[agent_id] = self._new_history()
             self.state.scrip_history[agent_id].append(
                 ChartDataPoint(
                     tick=self.state.current_tick,
@@ -587,6 +904,9 @@ class JSONLParser:
                     tick=self.state.current_tick,
                 )
                 self.state.ledger_transfers.append(transfer)
+                self.transfer_times.add(transfer)
+                self.transfer_flows.add(transfer)
+                self.kpi_aggregator.record_transfer(transfer)
                 self._current_tick_scrip_transfers += amount
 
                 # Add flow link
@@ -598,7 +918,7 @@ class JSONLParser:
                 ))
 
                 # Track interaction
-                self.state.interactions.append(Interaction(
+                self._add_interaction(Interaction(
                     tick=self.state.current_tick,
                     timestamp=timestamp,
                     from_id=from_id,
@@ -609,7 +929,7 @@ class JSONLParser:
                 ))
 
                 # Add activity item
-                self.state.activity_items.append(ActivityItem(
+                self._add_activity(ActivityItem(
                     tick=self.state.current_tick,
                     timestamp=timestamp,
                     activity_type="scrip_transfer",
@@ -625,9 +945,9 @@ class JSONLParser:
             if new_id:
                 self.state.ledger_spawns.append(new_id)
                 if new_id not in self.state.agents:
-                    self.state.agents[new_id] = AgentState(agent_id=new_id)
+                    self.state.agents[new_id] = self._new_agent(new_id)
                 # Add activity item
-                self.state.activity_items.append(ActivityItem(
+                self._add_activity(ActivityItem(
                     tick=self.state.current_tick,
                     timestamp=timestamp,
                     activity_type="principal_spawned",
@@ -653,9 +973,10 @@ class JSONLParser:
                 if transferred_artifact in self.state.artifacts:
                     self.state.artifacts[transferred_artifact].created_by = to_id
                     self.state.artifacts[transferred_artifact].ownership_history.append(ownership_transfer)
+                    self.kpi_aggregator.record_artifact(self.state.artifacts[transferred_artifact])
 
                 # Track interaction
-                self.state.interactions.append(Interaction(
+                self._add_interaction(Interaction(
                     tick=self.state.current_tick,
                     timestamp=timestamp,
                     from_id=agent_id,
@@ -666,7 +987,7 @@ class JSONLParser:
                 ))
 
                 # Add activity item
-                self.state.activity_items.append(ActivityItem(
+                self._add_activity(ActivityItem(
                     tick=self.state.current_tick,
                     timestamp=timestamp,
                     activity_type="ownership_transfer",
@@ -701,7 +1022,7 @@ class JSONLParser:
                 )
                 self.state.escrow_listings[listed_artifact] = listing
                 # Add activity item
-                self.state.activity_items.append(ActivityItem(
+                self._add_activity(ActivityItem(
                     tick=self.state.current_tick,
                     timestamp=timestamp,
                     activity_type="escrow_listed",
@@ -718,16 +1039,18 @@ class JSONLParser:
                 art_id = str(args[0])
                 if art_id in self.state.escrow_listings:
                     listing = self.state.escrow_listings[art_id]
-                    self.state.escrow_trades.append({
+                    trade = {
                         "artifact_id": art_id,
                         "seller_id": listing.seller_id,
                         "buyer_id": agent_id,
                         "price": listing.price,
                         "timestamp": timestamp,
-                    })
+                    }
+                    self.state.escrow_trades.append(trade)
+                    self.kpi_aggregator.record_escrow_trade(trade)
 
                     # Track interaction (trade between buyer and seller)
-                    self.state.interactions.append(Interaction(
+                    self._add_interaction(Interaction(
                         tick=self.state.current_tick,
                         timestamp=timestamp,
                         from_id=agent_id,  # buyer
@@ -739,7 +1062,7 @@ class JSONLParser:
                     ))
 
                     # Add activity item
-                    self.state.activity_items.append(ActivityItem(
+                    self._add_activity(ActivityItem(
                         tick=self.state.current_tick,
                         timestamp=timestamp,
                         activity_type="escrow_purchased",
@@ -758,7 +1081,7 @@ class JSONLParser:
             if args and str(args[0]) in self.state.escrow_listings:
                 cancelled_artifact = str(args[0])
                 # Add activity item
-                self.state.activity_items.append(ActivityItem(
+                self._add_activity(ActivityItem(
                     tick=self.state.current_tick,
                     timestamp=timestamp,
                     activity_type="escrow_cancelled",
@@ -796,7 +1119,7 @@ class JSONLParser:
             self.state.mint_pending.remove(artifact_id)
 
         # Add activity item
-        self.state.activity_items.append(ActivityItem(
+        self._add_activity(ActivityItem(
             tick=self.state.current_tick,
             timestamp=timestamp,
             activity_type="mint_result",
@@ -819,7 +1142,7 @@ class JSONLParser:
             duration_ms=event.get("duration_ms", 0.0),
             result_type=event.get("result_type"),
         )
-        self.state.invocation_events.append(invocation)
+        self._add_invocation(invocation)
 
         # Update artifact invocation count
         artifact_id = event.get("artifact_id", "")
@@ -839,7 +1162,7 @@ class JSONLParser:
             error_type=event.get("error_type"),
             error_message=event.get("error_message"),
         )
-        self.state.invocation_events.append(invocation)
+        self._add_invocation(invocation)
 
         # Update artifact invocation count (even for failures)
         artifact_id = event.get("artifact_id", "")
@@ -850,7 +1173,7 @@ class JSONLParser:
         """Handle rejected intent event."""
         agent_id = event.get("principal_id", "")
         if agent_id not in self.state.agents:
-            self.state.agents[agent_id] = AgentState(agent_id=agent_id)
+            self.state.agents[agent_id] = self._new_agent(agent_id)
 
         action = ActionEvent(
             tick=self.state.current_tick,
@@ -861,6 +1184,7 @@ class JSONLParser:
             error=event.get("error", ""),
         )
         self.state.agents[agent_id].actions.append(action)
+        self.kpi_aggregator.record_action(action)
 
     def _handle_budget_pause(self, event: dict[str, Any], timestamp: str) -> None:
         """Handle budget pause event."""
@@ -894,7 +1218,7 @@ class JSONLParser:
 
         # Create agent if not exists
         if principal_id not in self.state.agents:
-            self.state.agents[principal_id] = AgentState(agent_id=principal_id)
+            self.state.agents[principal_id] = self._new_agent(principal_id)
 
         if resource == "disk":
             self.state.agents[principal_id].disk_used = used_after
@@ -917,7 +1241,7 @@ class JSONLParser:
 
         # Create agent if not exists
         if principal_id not in self.state.agents:
-            self.state.agents[principal_id] = AgentState(agent_id=principal_id)
+            self.state.agents[principal_id] = self._new_agent(principal_id)
 
         if resource in ("llm_tokens", "compute"):
             # Used = quota - remaining balance
@@ -937,7 +1261,7 @@ class JSONLParser:
             return
 
         if agent_id not in self.state.agents:
-            self.state.agents[agent_id] = AgentState(agent_id=agent_id)
+            self.state.agents[agent_id] = self._new_agent(agent_id)
 
         agent = self.state.agents[agent_id]
 
@@ -1176,16 +1500,16 @@ class JSONLParser:
         )
 
     def get_economic_flow_data(self) -> EconomicFlowData:
-        """Get data for economic flow visualization."""
-        # Collect all unique node IDs
-        node_ids: set[str] = set()
-        for flow in self.state.scrip_flows:
-            node_ids.add(flow.source)
-            node_ids.add(flow.target)
+        """Get data for economic flow visualization.
+
+        Links are aggregated: one per (source, target) pair, carrying the
+        summed value and the latest tick of its transfers.
+        """
+        flows = self.transfer_flows
 
         # Create nodes
         nodes = []
-        for node_id in node_ids:
+        for node_id in flows.participants:
             node_type: Literal["agent", "artifact", "genesis"] = "agent"
             if node_id.startswith("genesis_"):
                 node_type = "genesis"
@@ -1195,7 +1519,10 @@ class JSONLParser:
 
         return EconomicFlowData(
             nodes=nodes,
-            links=self.state.scrip_flows,
+            links=[
+                FlowLink(source=source, target=target, value=value, tick=tick)
+                for (source, target), (value, _, tick) in flows.links.items()
+            ],
         )
 
     def filter_events(
@@ -1209,39 +1536,65 @@ class JSONLParser:
         offset: int = 0,
     ) -> list[RawEvent]:
         """Filter and paginate events."""
-        events = self.state.all_events
-
-        if event_types:
-            events = [e for e in events if e.event_type in event_types]
-
-        if agent_id:
-            events = [
-                e for e in events
-                if e.data.get("principal_id") == agent_id
-                or e.data.get("intent", {}).get("principal_id") == agent_id
-            ]
-
-        if artifact_id:
-            events = [
-                e for e in events
-                if e.data.get("artifact_id") == artifact_id
-                or e.data.get("intent", {}).get("artifact_id") == artifact_id
-            ]
-
-        if tick_min is not None:
-            events = [
-                e for e in events
-                if e.data.get("tick", 0) >= tick_min
-            ]
+        events, _ = self.query_events(
+            event_types=event_types,
+            agent_id=agent_id,
+            artifact_id=artifact_id,
+            tick_min=tick_min,
+            tick_max=tick_max,
+            limit=limit,
+            offset=offset,
+        )
+        return events
 
-        if tick_max is not None:
-            events = [
-                e for e in events
-                if e.data.get("tick", float('inf')) <= tick_max
-            ]
+    def query_events(
+        self,
+        event_types: list[str] | None = None,
+        agent_id: str | None = None,
+        artifact_id: str | None = None,
+        tick_min: int | None = None,
+        tick_max: int | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: int | None = None,
+    ) -> tuple[list[RawEvent], int | None]:
+        """Filter events through the event index, one page at a time.
 
-        # Apply pagination
-        return events[offset:offset + limit]
+        Events without a tick count as tick 0 for tick_min and never satisfy
+        tick_max, as they always have.
+
+        Args:
+            cursor: Cursor returned with the previous page; resumes after it
+
+        Returns:
+            (events, cursor for the next page or None when exhausted);
+            events read back from spilled history are copies
+        """
+        extra: list[list[int]] = []
+        predicate: Callable[[RawEvent], bool] | None = None
+        if tick_max is not None or (tick_min is not None and tick_min > 0):
+            # Only events carrying a tick can satisfy these bounds
+            extra.append(self.event_index.tick_positions(tick_min, tick_max))
+        elif tick_min is not None:
+            low = tick_min
+
+            def at_or_after(event: RawEvent) -> bool:
+                tick = _event_tick(event)
+                return tick is None or tick >= low
+            predicate = at_or_after
+
+        return self.event_index.query(
+            {
+                "event_type": event_types or None,
+                "principal": [agent_id] if agent_id else None,
+                "artifact": [artifact_id] if artifact_id else None,
+            },
+            predicate=predicate,
+            extra=extra,
+            after=cursor,
+            offset=offset,
+            limit=limit,
+        )
 
     def get_network_graph_data(self, tick_max: int | None = None) -> NetworkGraphData:
         """Get network graph data for visualization."""
@@ -1335,42 +1688,14 @@ class JSONLParser:
             time_min: ISO timestamp for earliest events (inclusive)
             time_max: ISO timestamp for latest events (inclusive)
             time_bucket_seconds: Size of time buckets for activity grouping
-        """
-        from datetime import datetime
 
+        Invocations without a parseable timestamp match any time range.
+        Without a range, edges come from the running invocation counts;
+        with one, only the invocations inside it are read.
+        """
         nodes: list[ArtifactNode] = []
         edges: list[ArtifactEdge] = []
         activity_by_time: dict[str, dict[str, int]] = {}
-        all_timestamps: list[str] = []
-
-        def bucket_timestamp(ts: str) -> str:
-            """Convert a timestamp to a bucket key."""
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                # Truncate to bucket size
-                bucket_seconds = (dt.second // time_bucket_seconds) * time_bucket_seconds
-                bucketed = dt.replace(second=bucket_seconds, microsecond=0)
-                return bucketed.isoformat()
-            except (ValueError, TypeError):
-                return ts
-
-        def in_time_range(ts: str) -> bool:
-            """Check if timestamp is within the specified range."""
-            if not ts:
-                return True
-            try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                if time_min:
-                    min_dt = datetime.fromisoformat(time_min.replace("Z", "+00:00"))
-                    if dt < min_dt:
-                        return False
-                if time_max:
-                    max_dt = datetime.fromisoformat(time_max.replace("Z", "+00:00"))
-                    if dt > max_dt:
-                        return False
-                return True
-            except (ValueError, TypeError):
-                return True
 
         def get_artifact_type(
             artifact_id: str, artifact_state: ArtifactState | None
@@ -1429,45 +1754,35 @@ class JSONLParser:
 
         # Plan #254: Genesis artifacts removed - kernel actions replace them
 
-        # Build invocation edges from invocation_events
-        invocation_counts: dict[tuple[str, str], int] = {}
-        for inv in self.state.invocation_events:
-            if not in_time_range(inv.timestamp):
-                continue
+        # Invocation counts for the whole run, or for the requested window
+        graph = self.invocation_graph
+        if time_min or time_max:
+            graph = _InvocationGraph()
+            for inv in self.invocation_times.window(time_min, time_max, include_untimed=True):
+                graph.add(inv)
 
-            # Track for activity heatmap
-            bucket = bucket_timestamp(inv.timestamp)
+        # Track for activity heatmap
+        for second, count in graph.per_second.items():
+            bucket = _bucket_timestamp(second, time_bucket_seconds)
             if bucket not in activity_by_time:
                 activity_by_time[bucket] = {"invocations": 0, "total": 0}
-            activity_by_time[bucket]["invocations"] += 1
-            activity_by_time[bucket]["total"] += 1
-            all_timestamps.append(inv.timestamp)
-
-            # Aggregate invocations by (invoker, artifact)
-            key = (inv.invoker_id, inv.artifact_id)
-            invocation_counts[key] = invocation_counts.get(key, 0) + 1
+            activity_by_time[bucket]["invocations"] += count
+            activity_by_time[bucket]["total"] += count
 
-            # Ensure both nodes exist
-            if inv.invoker_id not in seen_nodes:
-                seen_nodes.add(inv.invoker_id)
+        # Ensure invokers and invoked artifacts have nodes
+        for node_id in graph.node_ids:
+            if node_id not in seen_nodes:
+                seen_nodes.add(node_id)
                 nodes.append(ArtifactNode(
-                    id=inv.invoker_id,
-                    label=inv.invoker_id,
-                    artifact_type=get_artifact_type(inv.invoker_id, None),
-                ))
-            if inv.artifact_id not in seen_nodes:
-                seen_nodes.add(inv.artifact_id)
-                nodes.append(ArtifactNode(
-                    id=inv.artifact_id,
-                    label=inv.artifact_id,
+                    id=node_id,
+                    label=node_id,
                     artifact_type=get_artifact_type(
-                        inv.artifact_id,
-                        self.state.artifacts.get(inv.artifact_id)
+                        node_id, self.state.artifacts.get(node_id)
                     ),
                 ))
 
         # Create aggregated invocation edges
-        for (invoker, target_artifact_id), count in invocation_counts.items():
+        for (invoker, target_artifact_id), count in graph.counts.items():
             edges.append(ArtifactEdge(
                 from_id=invoker,
                 to_id=target_artifact_id,
@@ -1489,16 +1804,10 @@ class JSONLParser:
                     details=f"{artifact.created_by} owns {artifact_id}",
                 ))
 
-        # Calculate time range
-        time_range = ("", "")
-        if all_timestamps:
-            sorted_ts = sorted(all_timestamps)
-            time_range = (sorted_ts[0], sorted_ts[-1])
-
         return TemporalNetworkData(
             nodes=nodes,
             edges=edges,
-            time_range=time_range,
+            time_range=(graph.first_timestamp, graph.last_timestamp),
             activity_by_time=activity_by_time,
             total_artifacts=len(nodes),
             total_interactions=len(edges),
@@ -1522,28 +1831,15 @@ class JSONLParser:
             agent_id: Filter by agent (includes target_id matches)
             artifact_id: Filter by artifact (Plan #144)
         """
-        items = self.state.activity_items
-
-        # Filter by type
-        if activity_types:
-            items = [i for i in items if i.activity_type in activity_types]
-
-        # Filter by agent
-        if agent_id:
-            items = [
-                i for i in items
-                if i.agent_id == agent_id or i.target_id == agent_id
-            ]
-
-        # Filter by artifact (Plan #144)
-        if artifact_id:
-            items = [i for i in items if i.artifact_id == artifact_id]
-
-        # Sort by tick descending (most recent first)
-        items = sorted(items, key=lambda x: (x.tick, x.timestamp), reverse=True)
-
-        total = len(items)
-        items = items[offset:offset + limit]
+        items, total = self.activity_index.recent(
+            {
+                "activity_type": activity_types or None,
+                "agent": [agent_id] if agent_id else None,
+                "artifact": [artifact_id] if artifact_id else None,
+            },
+            offset=offset,
+            limit=limit,
+        )
 
         return ActivityFeed(items=items, total_count=total)
 
@@ -1593,21 +1889,23 @@ class JSONLParser:
         Returns:
             List of InvocationEvent objects
         """
-        results = self.state.invocation_events
-
-        if artifact_id is not None:
-            results = [r for r in results if r.artifact_id == artifact_id]
-
-        if invoker_id is not None:
-            results = [r for r in results if r.invoker_id == invoker_id]
-
-        if success is not None:
-            results = [r for r in results if r.success == success]
-
-        # Sort by tick descending (most recent first)
-        results = sorted(results, key=lambda x: (x.tick, x.timestamp), reverse=True)
+        results, _ = self.invocation_index.recent(
+            {
+                "artifact": None if artifact_id is None else [artifact_id],
+                "invoker": None if invoker_id is None else [invoker_id],
+                "success": None if success is None else [success],
+            },
+            offset=offset,
+            limit=limit,
+        )
+        return results
 
-        return results[offset:offset + limit]
+    def get_artifact_invocations(self, artifact_id: str) -> list[InvocationEvent]:
+        """All invocation events for an artifact, oldest first."""
+        events, _ = self.invocation_index.query(
+            {"artifact": [artifact_id]}, limit=len(self.invocation_index)
+        )
+        return events
 
     def get_invocation_stats(self, artifact_id: str) -> InvocationStatsResponse:
         """Get invocation statistics for an artifact (Gap #27).
@@ -1618,10 +1916,7 @@ class JSONLParser:
         Returns:
             InvocationStatsResponse with success rate, duration, failure types
         """
-        relevant = [
-            e for e in self.state.invocation_events
-            if e.artifact_id == artifact_id
-        ]
+        relevant = self.get_artifact_invocations(artifact_id)
 
         if not relevant:
             return InvocationStatsResponse(artifact_id=artifact_id)
@@ -1662,14 +1957,14 @@ class JSONLParser:
             to_agent: The target agent ID
 
         Returns:
-            PairwiseInteractionSummary with all interactions and breakdown
+            PairwiseInteractionSummary with all interactions and breakdown;
+            interactions read back from spilled history are copies
         """
-        # Filter interactions for this pair (either direction)
-        pair_interactions = [
-            i for i in self.state.interactions
-            if (i.from_id == from_agent and i.to_id == to_agent) or
-               (i.from_id == to_agent and i.to_id == from_agent)
-        ]
+        # Interactions for this pair (either direction), from the pair index
+        pair_interactions, _ = self.interaction_index.query(
+            {"pair": [frozenset((from_agent, to_agent))]},
+            limit=len(self.interaction_index),
+        )
 
         # Sort by timestamp
         pair_interactions.sort(key=lambda x: (x.tick, x.timestamp))
@@ -1726,6 +2021,9 @@ class JSONLParser:
         """Get capital flow data for sankey diagram (Plan #110 Phase 3.4).
 
         Aggregates scrip transfers between agents for visualization.
+        Without a time filter the running per-pair totals are used; with
+        one, only the transfers inside the window are read. Transfers
+        without a parseable timestamp are left out of filtered views.
 
         Args:
             time_min: Optional ISO timestamp filter (inclusive)
@@ -1734,41 +2032,15 @@ class JSONLParser:
         Returns:
             CapitalFlowData with nodes and aggregated links
         """
-        from datetime import datetime
-
-        # Filter transfers by time
-        transfers = [
-            t for t in self.state.ledger_transfers
-        ]
-
-        if time_min:
-            try:
-                min_dt = datetime.fromisoformat(time_min)
-                transfers = [
-                    t for t in transfers
-                    if datetime.fromisoformat(t.timestamp) >= min_dt
-                ]
-            except ValueError:
-                pass
-
-        if time_max:
-            try:
-                max_dt = datetime.fromisoformat(time_max)
-                transfers = [
-                    t for t in transfers
-                    if datetime.fromisoformat(t.timestamp) <= max_dt
-                ]
-            except ValueError:
-                pass
+        flows = self.transfer_flows
+        if time_min or time_max:
+            flows = _TransferFlows()
+            for transfer in self.transfer_times.window(time_min, time_max):
+                flows.add(transfer)
 
         # Build nodes from unique participants
-        node_ids: set[str] = set()
-        for t in transfers:
-            node_ids.add(t.from_id)
-            node_ids.add(t.to_id)
-
         nodes: list[CapitalFlowNode] = []
-        for node_id in node_ids:
+        for node_id in flows.participants:
             node_type: Literal["agent", "genesis", "artifact"] = "agent"
             if node_id.startswith("genesis_"):
                 node_type = "genesis"
@@ -1781,15 +2053,9 @@ class JSONLParser:
                 node_type=node_type,
             ))
 
-        # Aggregate links (source -> target -> total value)
-        link_aggregates: dict[tuple[str, str], tuple[int, int]] = {}  # (value, count)
-        for t in transfers:
-            key = (t.from_id, t.to_id)
-            current_value, current_count = link_aggregates.get(key, (0, 0))
-            link_aggregates[key] = (current_value + t.amount, current_count + 1)
-
+        # Aggregated links (source -> target -> total value)
         links: list[CapitalFlowLink] = []
-        for (source, target), (value, count) in link_aggregates.items():
+        for (source, target), (value, count, _) in flows.links.items():
             links.append(CapitalFlowLink(
                 source=source,
                 target=target,
@@ -1797,19 +2063,11 @@ class JSONLParser:
                 count=count,
             ))
 
-        # Calculate time range
-        time_range = ("", "")
-        if transfers:
-            timestamps = [t.timestamp for t in transfers]
-            time_range = (min(timestamps), max(timestamps))
-
-        total_flow = sum(t.amount for t in transfers)
-
         return CapitalFlowData(
             nodes=nodes,
             links=links,
-            time_range=time_range,
-            total_flow=total_flow,
+            time_range=(flows.first_timestamp, flows.last_timestamp),
+            total_flow=flows.total,
         )
 
     def get_standard_artifacts(
@@ -1830,11 +2088,20 @@ class JSONLParser:
         Returns:
             List of StandardArtifact sorted by Lindy score descending
         """
-        from datetime import datetime
-
         now = datetime.now()
         results: list[StandardArtifact] = []
 
+        # Unique invokers and invocations per artifact, from the running counts
+        unique_invokers_by_artifact: dict[str, int] = {}
+        invocations_by_artifact: dict[str, int] = {}
+        for (_, invoked_id), count in self.invocation_graph.counts.items():
+            unique_invokers_by_artifact[invoked_id] = (
+                unique_invokers_by_artifact.get(invoked_id, 0) + 1
+            )
+            invocations_by_artifact[invoked_id] = (
+                invocations_by_artifact.get(invoked_id, 0) + count
+            )
+
         for artifact_id, artifact in self.state.artifacts.items():
             # Calculate age in days
             try:
@@ -1843,15 +2110,8 @@ class JSONLParser:
             except (ValueError, TypeError):
                 age_days = 0.0
 
-            # Count unique invokers
-            invokers: set[str] = set()
-            total_invocations = 0
-            for inv in self.state.invocation_events:
-                if inv.artifact_id == artifact_id:
-                    invokers.add(inv.invoker_id)
-                    total_invocations += 1
-
-            unique_invokers = len(invokers)
+            unique_invokers = unique_invokers_by_artifact.get(artifact_id, 0)
+            total_invocations = invocations_by_artifact.get(artifact_id, 0)
 
             # Calculate Lindy score
             lindy_score = age_days * unique_invokers
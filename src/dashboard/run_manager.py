@@ -1,17 +1,25 @@
 """Run management for discovering and switching between simulation runs.
 
 Plan #224: Enables dashboard to list, select, and resume historical simulation runs.
+
+Run metadata comes from a run catalog: each run's RunSummary (see
+src/world/run_catalog.py) is loaded from the events.meta.json sidecar
+EventLogger writes, or built by a raw-bytes scan for runs without one,
+then kept in memory keyed by events path. Listing only scans bytes
+appended since the summary's recorded log position, so repeat calls cost
+a stat per run.
 """
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
+from ..world.run_catalog import RunSummary, load_run_summary, write_run_summary
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +75,8 @@ class RunManager:
         self.logs_dir = Path(logs_dir)
         self._current_run_id: str | None = None
         self._current_jsonl = Path(current_jsonl) if current_jsonl else None
+        # Run catalog: events path -> summary of that log
+        self._summaries: dict[Path, RunSummary] = {}
 
     @property
     def current_run_id(self) -> str | None:
@@ -177,106 +187,49 @@ class RunManager:
         run_id: str,
         has_checkpoint: bool = False,
     ) -> RunInfo:
-        """Extract metadata by parsing the events file.
+        """Build RunInfo from the run catalog entry for an events file.
 
-        Reads first and last events for timing, and scans for agent IDs.
-        Uses efficient sampling for large files.
+        The summary comes from memory, else from the sidecar, else from an
+        empty summary; catch_up() then scans only the bytes it does not
+        cover yet. Summaries that needed a scan are written back to the
+        sidecar of run_* directories so the next dashboard start is fast.
         """
-        start_time: datetime | None = None
-        end_time: datetime | None = None
-        agent_ids: set[str] = set()
-        event_count = 0
-        status: Literal["running", "completed", "stopped"] = "stopped"
+        summary = self._summaries.get(jsonl_path)
+        if summary is None:
+            summary = load_run_summary(jsonl_path) or RunSummary()
+            self._summaries[jsonl_path] = summary
 
-        # Read the file efficiently
         try:
-            with open(jsonl_path, "r") as f:
-                first_event = None
-                last_event = None
-
-                for line in f:
-                    if not line.strip():
-                        continue
-                    event_count += 1
-
-                    try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    # Save first event
-                    if first_event is None:
-                        first_event = event
-
-                    # Always update last_event
-                    last_event = event
-
-                    # Extract agent IDs from relevant events
-                    event_type = event.get("event_type", "")
-
-                    # From world_init principals
-                    if event_type == "world_init":
-                        for p in event.get("principals", []):
-                            if p.get("id"):
-                                agent_ids.add(p["id"])
-
-                    # From thinking events
-                    if event_type == "thinking":
-                        pid = event.get("principal_id")
-                        if pid:
-                            agent_ids.add(pid)
-
-                    # From action events
-                    if event_type == "action":
-                        intent = event.get("intent", {})
-                        pid = intent.get("principal_id")
-                        if pid:
-                            agent_ids.add(pid)
-
-                    # Check for simulation end
-                    if event_type == "simulation_complete":
-                        status = "completed"
-                    elif event_type == "budget_pause":
-                        status = "completed"
-
-                # Extract timestamps
-                if first_event:
-                    ts = first_event.get("timestamp")
-                    if ts:
-                        try:
-                            start_time = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                        except ValueError:
-                            pass
-
-                if last_event:
-                    ts = last_event.get("timestamp")
-                    if ts:
-                        try:
-                            end_time = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                        except ValueError:
-                            pass
-
+            scanned = summary.catch_up(jsonl_path)
         except OSError as e:
             logger.warning(f"Failed to read {jsonl_path}: {e}")
+            scanned = 0
+        if scanned and run_id != "legacy":
+            try:
+                write_run_summary(jsonl_path, summary)
+            except OSError as e:  # exception-ok: the sidecar is only a cache
+                logger.debug(f"Could not write run summary for {jsonl_path}: {e}")
+
+        start_time = _parse_timestamp(summary.start_time)
+        end_time = _parse_timestamp(summary.end_time)
 
         # Calculate duration
         duration_seconds = 0.0
         if start_time and end_time:
             duration_seconds = (end_time - start_time).total_seconds()
 
-        # Determine run directory
-        run_dir = jsonl_path.parent
-        if run_id == "legacy":
-            run_dir = jsonl_path.parent  # Root directory for legacy run.jsonl
+        status: Literal["running", "completed", "stopped"] = (
+            "completed" if summary.completed else "stopped"
+        )
 
         return RunInfo(
             run_id=run_id,
-            run_dir=run_dir,
+            run_dir=jsonl_path.parent,
             start_time=start_time,
             end_time=end_time,
             duration_seconds=duration_seconds,
-            event_count=event_count,
-            agent_ids=sorted(agent_ids),
+            event_count=summary.event_count,
+            agent_ids=sorted(summary.agent_ids),
             has_checkpoint=has_checkpoint,
             status=status,
             jsonl_path=jsonl_path,
@@ -296,3 +249,13 @@ class RunManager:
                 self._current_jsonl = target / "events.jsonl"
                 return self._current_run_id
         return None
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 event timestamp, or None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
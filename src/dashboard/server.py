@@ -7,8 +7,10 @@ from __future__ import annotations
 from dataclasses import asdict
 
 import asyncio
+import itertools
 import json
 import logging
+from collections import deque
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -17,13 +19,14 @@ from typing import Any, TYPE_CHECKING
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, HTTPException, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from .parser import JSONLParser
-from .kpis import calculate_kpis, EcosystemKPIs, compute_agent_metrics, AgentMetrics, calculate_emergence_metrics
+from .ingest import EventIngestor
+from .kpis import EcosystemKPIs, compute_agent_metrics, AgentMetrics
 from .auditor import assess_health, AuditorThresholds, HealthReport
 from .dependency_graph import build_dependency_graph
 from ..config import get_validated_config
@@ -62,39 +65,236 @@ DEFAULT_STATIC_DIR = Path(__file__).parent / "static"
 DEFAULT_CONFIG_PATH = "config/config.yaml"
 
 
+def _merge_delta(pending: dict[str, Any], newer: dict[str, Any], max_events: int) -> None:
+    """Fold a newer delta frame's data into a pending (unsent) one, in place."""
+    pending["events"].extend(newer["events"])
+    pending["dropped_events"] += newer["dropped_events"]
+    for key, id_field in (("agents", "agent_id"), ("artifacts", "artifact_id")):
+        by_id = {item[id_field]: item for item in pending[key]}
+        by_id.update((item[id_field], item) for item in newer[key])
+        pending[key] = list(by_id.values())
+    pending["state"] = newer["state"]
+    pending["kpis"] = newer["kpis"] or pending["kpis"]
+    _trim_events(pending, max_events)
+
+
+def _trim_events(data: dict[str, Any], max_events: int) -> None:
+    """Keep the newest max_events events of a delta, counting the rest as dropped."""
+    excess = len(data["events"]) - max_events
+    if excess > 0:
+        del data["events"][:excess]
+        data["dropped_events"] += excess
+
+
+def _empty_delta(dropped_events: int = 0) -> dict[str, Any]:
+    """Data of a delta frame with nothing in it yet."""
+    return {
+        "events": [],
+        "dropped_events": dropped_events,
+        "agents": [],
+        "artifacts": [],
+        "state": None,
+        "kpis": None,
+    }
+
+
+def _changed_items(
+    sent: dict[str, dict[str, Any]], items: list[Any], id_field: str
+) -> list[dict[str, Any]]:
+    """Dumps of items that differ from what was last sent, updating sent."""
+    changed: list[dict[str, Any]] = []
+    for item in items:
+        dumped = item.model_dump()
+        item_id = dumped[id_field]
+        if sent.get(item_id) != dumped:
+            sent[item_id] = dumped
+            changed.append(dumped)
+    return changed
+
+
+class _ClientChannel:
+    """Outgoing queue and sender task for one WebSocket client.
+
+    Messages are queued without waiting for the socket, and a dedicated
+    task sends them in order, so a slow client only delays itself. While a
+    delta frame is still queued, later deltas are merged into it (events
+    appended, agent/artifact diffs merged by id, state and KPIs replaced),
+    so a client that falls behind receives fewer, larger frames rather than
+    a growing backlog. A frame never carries more than max_batch_events
+    events: the oldest are dropped and counted in dropped_events, telling
+    the client to reload from the REST API. When the queue still holds
+    max_queue messages, the oldest queued delta is discarded (its events
+    counted as dropped); a client that cannot be kept within bounds, or
+    whose send does not complete within send_timeout, is disconnected.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue: int,
+        max_batch_events: int,
+        send_timeout: float,
+    ) -> None:
+        self.websocket = websocket
+        self._queue: deque[dict[str, Any] | str] = deque()
+        self._max_queue = max_queue
+        self._max_batch_events = max_batch_events
+        self._send_timeout = send_timeout
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.closed = False
+        # Events this client never received (dropped or trimmed)
+        self.dropped_events = 0
+        # Drops not yet reported in any queued delta
+        self._unreported_drops = 0
+        self._task = asyncio.create_task(self._run())
+
+    def offer(self, message: dict[str, Any] | str) -> bool:
+        """Queue a message; returns False if the client has to be dropped."""
+        if self.closed:
+            return False
+        delta = message["data"] if isinstance(message, dict) and message.get("type") == "delta" else None
+        last = self._queue[-1] if self._queue else None
+        if delta is not None and isinstance(last, dict) and last.get("type") == "delta":
+            self._add_delta(last["data"], delta)
+            return True
+        if len(self._queue) >= self._max_queue and not self._discard_oldest_delta():
+            self.abort()
+            return False
+        if delta is not None:
+            data = _empty_delta(self._unreported_drops)
+            self._unreported_drops = 0
+            self._add_delta(data, delta)
+            message = {"type": "delta", "data": data}
+        self._queue.append(message)
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    def _add_delta(self, pending: dict[str, Any], newer: dict[str, Any]) -> None:
+        before = pending["dropped_events"] + newer["dropped_events"]
+        _merge_delta(pending, newer, self._max_batch_events)
+        self.dropped_events += pending["dropped_events"] - before
+
+    def _discard_oldest_delta(self) -> bool:
+        """Drop the oldest queued delta; the next delta reports its events as dropped."""
+        for i, queued in enumerate(self._queue):
+            if isinstance(queued, dict) and queued.get("type") == "delta":
+                del self._queue[i]
+                data = queued["data"]
+                self.dropped_events += len(data["events"])
+                lost = len(data["events"]) + data["dropped_events"]
+                for later in itertools.islice(self._queue, i, None):
+                    if isinstance(later, dict) and later.get("type") == "delta":
+                        later["data"]["dropped_events"] += lost
+                        break
+                else:
+                    self._unreported_drops += lost
+                return True
+        return False
+
+    async def _run(self) -> None:
+        try:
+            while not self.closed:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._queue and not self.closed:
+                    message = self._queue.popleft()
+                    if isinstance(message, str):
+                        send = self.websocket.send_text(message)
+                    else:
+                        send = self.websocket.send_json(message)
+                    await asyncio.wait_for(send, timeout=self._send_timeout)
+                self._idle.set()
+        except Exception:  # exception-ok: slow or disconnected client, closed below
+            pass
+        self.abort()
+        try:
+            # 1013 = try again later; the browser reconnects and reloads state
+            await asyncio.wait_for(self.websocket.close(code=1013), timeout=self._send_timeout)
+        except Exception:  # exception-ok: socket already closed
+            pass
+
+    async def wait_idle(self) -> None:
+        """Wait until everything queued so far has been sent (or the client failed)."""
+        await self._idle.wait()
+
+    def abort(self) -> None:
+        """Give up on this client: drop the queue and let the sender task close the socket."""
+        self.closed = True
+        self._queue.clear()
+        self._idle.set()
+        self._wakeup.set()
+
+    def close(self) -> None:
+        """Stop the sender task (the client already disconnected)."""
+        self.abort()
+        self._task.cancel()
+
+
 class ConnectionManager:
-    """Manages WebSocket connections for real-time updates."""
+    """Manages WebSocket connections for real-time updates.
+
+    Each client gets a bounded send queue drained by its own task
+    (_ClientChannel), so broadcast() only enqueues and returns; fan-out to
+    clients happens concurrently and a slow browser cannot hold up the
+    others.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 64,
+        max_batch_events: int = 500,
+        send_timeout: float = 10.0,
+    ) -> None:
+        self._channels: dict[WebSocket, _ClientChannel] = {}
+        self._max_queue = max_queue
+        self._max_batch_events = max_batch_events
+        self._send_timeout = send_timeout
 
-    def __init__(self) -> None:
-        self.active_connections: list[WebSocket] = []
+    @property
+    def active_connections(self) -> list[WebSocket]:
+        """Connected WebSockets."""
+        return list(self._channels)
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and store a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self._channels[websocket] = _ClientChannel(
+            websocket, self._max_queue, self._max_batch_events, self._send_timeout
+        )
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        channel = self._channels.pop(websocket, None)
+        if channel is not None:
+            channel.close()
+
+    def send(self, websocket: WebSocket, message: dict[str, Any] | str) -> None:
+        """Queue a message (JSON dict or text frame) for one client."""
+        channel = self._channels.get(websocket)
+        if channel is not None and not channel.offer(message):
+            # The channel's sender task closes the socket
+            del self._channels[websocket]
 
     async def broadcast(self, message: dict[str, Any]) -> None:
-        """Broadcast a message to all connected clients."""
-        disconnected: list[WebSocket] = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:  # exception-ok: disconnected client, will be cleaned up
-                disconnected.append(connection)
-
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        """Queue a message for all connected clients."""
+        for websocket, channel in list(self._channels.items()):
+            if not channel.offer(message):
+                del self._channels[websocket]
+
+    async def flush(self) -> None:
+        """Wait until every client has been sent everything queued so far."""
+        await asyncio.gather(*(c.wait_idle() for c in list(self._channels.values())))
+        for websocket, channel in list(self._channels.items()):
+            if channel.closed:
+                del self._channels[websocket]
 
     @property
     def connection_count(self) -> int:
         """Get the number of active connections."""
-        return len(self.active_connections)
+        return len(self._channels)
 
 
 class DashboardApp:
@@ -122,11 +322,27 @@ class DashboardApp:
         self.config_path = Path(config_path)
         self.live_mode = live_mode
 
-        self.parser = JSONLParser(self.jsonl_path)
+        dashboard_config = get_validated_config().dashboard
+        # Event log parsing runs on the ingestor's thread, off the event loop
+        self.ingestor = EventIngestor(
+            self._make_parser(),
+            batch_events=dashboard_config.ingest_batch_events,
+            wait_seconds=dashboard_config.ingest_wait_seconds,
+        )
         # Plan #133: Use polling watcher for WSL compatibility
         # Watchdog-based file watching is unreliable on WSL2
         self.watcher = PollingWatcher(self.jsonl_path)
-        self.connection_manager = ConnectionManager()
+        self.connection_manager = ConnectionManager(
+            max_queue=dashboard_config.ws_queue_depth,
+            max_batch_events=dashboard_config.ws_max_batch_events,
+            send_timeout=dashboard_config.ws_send_timeout,
+        )
+        # Last agent / artifact summaries sent in a delta frame, by id
+        self._sent_agents: dict[str, dict[str, Any]] = {}
+        self._sent_artifacts: dict[str, dict[str, Any]] = {}
+        # Parser and number of its events covered by delta frames so far
+        self._sent_parser = self.parser
+        self._sent_event_count = 0
 
         # Plan #125: Moved from create_app() nonlocal for cleaner state management
         self.prev_kpis: EcosystemKPIs | None = None
@@ -148,46 +364,82 @@ class DashboardApp:
 
         # Only parse existing logs if not in live mode (viewing old runs)
         if not live_mode and self.jsonl_path.exists():
-            self.parser.parse_full()
+            self.ingestor.load(self._make_parser())
+
+    @property
+    def parser(self) -> JSONLParser:
+        """Currently published parser (replaced when a full load finishes)."""
+        return self.ingestor.parser
+
+    async def refresh(self) -> None:
+        """Apply new log events to the published parser before reading it."""
+        await self.ingestor.catch_up()
+
+    def _make_parser(self) -> JSONLParser:
+        """Parser for the current log, with the configured history memory budget."""
+        dashboard_config = get_validated_config().dashboard
+        return JSONLParser(
+            self.jsonl_path,
+            hot_history_items=dashboard_config.hot_history_items,
+            spill_dir=dashboard_config.history_spill_dir,
+        )
 
     async def on_file_change(self) -> None:
-        """Handle file change events."""
-        new_events = self.parser.get_new_events()
-        if new_events:
-            # Broadcast new events to all connected clients
-            for event in new_events:
-                await self.connection_manager.broadcast({
-                    "type": "event",
-                    "data": event.model_dump(),
-                })
-
-
-            # Also broadcast updated state summary
-            await self.connection_manager.broadcast({
-                "type": "state_update",
-                "data": {
+        """Handle file change events.
+
+        Sends one coalesced delta frame per change: the new events, the agent
+        and artifact summaries that changed since the previous frame, the
+        state summary and the KPI update (Plan #142).
+
+        Events are tracked by position in the parser's event list, so events
+        applied by a request handler's refresh() are still sent. A newly
+        published parser (run switch, finished load) starts a new baseline.
+        """
+        await self.refresh()
+        parser = self.parser
+        all_events = parser.state.all_events
+        if parser is not self._sent_parser:
+            self._sent_parser = parser
+            self._sent_event_count = len(all_events)
+            self._sent_agents.clear()
+            self._sent_artifacts.clear()
+            return
+        if len(all_events) < self._sent_event_count:
+            self._sent_event_count = 0  # Log restarted
+        new_events = all_events[self._sent_event_count:]
+        self._sent_event_count = len(all_events)
+        if not new_events:
+            return
+
+        kpis = self.parser.kpi_aggregator.kpis()
+        emergence = self.parser.kpi_aggregator.emergence()
+        total_agents = len(self.parser.state.agents)
+        health = assess_health(kpis, self.prev_kpis, self.thresholds, total_agents=max(1, total_agents))
+        self.prev_kpis = kpis
+
+        await self.connection_manager.broadcast({
+            "type": "delta",
+            "data": {
+                "events": [event.model_dump() for event in new_events],
+                "dropped_events": 0,
+                "agents": _changed_items(
+                    self._sent_agents, self.parser.get_all_agent_summaries(), "agent_id"
+                ),
+                "artifacts": _changed_items(
+                    self._sent_artifacts, self.parser.get_all_artifacts(), "artifact_id"
+                ),
+                "state": {
                     "progress": self.parser.get_progress().model_dump(),
-                    "agent_count": len(self.parser.state.agents),
+                    "agent_count": total_agents,
                     "artifact_count": len(self.parser.state.artifacts),
                 },
-            })
-
-
-
-            # Broadcast KPI update (Plan #142)
-            kpis = calculate_kpis(self.parser.state)
-            emergence = calculate_emergence_metrics(self.parser.state)
-            total_agents = len(self.parser.state.agents)
-            health = assess_health(kpis, self.prev_kpis, self.thresholds, total_agents=max(1, total_agents))
-            self.prev_kpis = kpis
-            await self.connection_manager.broadcast({
-                "type": "kpi_update",
-                "data": {
+                "kpis": {
                     "kpis": asdict(kpis),
-                    "emergence": asdict(emergence),
+                    "emergence": emergence.model_dump(),
                     "health": asdict(health),
                 },
-            })
+            },
+        })
 
     async def start(self) -> None:
         """Start the file watcher."""
@@ -195,8 +447,9 @@ class DashboardApp:
         await self.watcher.start()
 
     def stop(self) -> None:
-        """Stop the file watcher."""
+        """Stop the file watcher and the ingestion thread."""
         self.watcher.stop()
+        self.ingestor.shutdown()
 
     def get_config(self) -> dict[str, Any]:
         """Load and return config file."""
@@ -213,7 +466,9 @@ class DashboardApp:
     def switch_run(self, run_id: str) -> bool:
         """Switch to viewing a different run.
 
-        Plan #224: Updates parser source and resets state.
+        Plan #224: Updates parser source and resets state. The new run's log
+        is loaded in the background; endpoints serve the previous run until
+        the load finishes (see /api/ingest for progress).
 
         Args:
             run_id: The run ID to switch to
@@ -227,8 +482,7 @@ class DashboardApp:
 
         # Update jsonl path and reset parser
         self.jsonl_path = run.jsonl_path
-        self.parser = JSONLParser(self.jsonl_path)
-        self.parser.parse_full()
+        self.ingestor.load(self._make_parser())
 
         # Update watcher to new file
         self.watcher.stop()
@@ -412,23 +666,24 @@ def _register_websocket_routes(app: FastAPI, dashboard: DashboardApp) -> None:
         """WebSocket endpoint for real-time updates."""
         await dashboard.connection_manager.connect(websocket)
 
-        # Send initial state
-        dashboard.parser.parse_incremental()
+        # Send initial state (queued ahead of any later broadcast)
+        await dashboard.refresh()
+        manager = dashboard.connection_manager
+        manager.send(websocket, {
+            "type": "initial_state",
+            "data": {
+                "progress": dashboard.parser.get_progress().model_dump(),
+                "agents": [a.model_dump() for a in dashboard.parser.get_all_agent_summaries()],
+                "artifacts": [a.model_dump() for a in dashboard.parser.get_all_artifacts()],
+            },
+        })
         try:
-            await websocket.send_json({
-                "type": "initial_state",
-                "data": {
-                    "progress": dashboard.parser.get_progress().model_dump(),
-                    "agents": [a.model_dump() for a in dashboard.parser.get_all_agent_summaries()],
-                    "artifacts": [a.model_dump() for a in dashboard.parser.get_all_artifacts()],
-                },
-            })
-
-
             # Keep connection alive and wait for messages
             # Note: This is NOT a busy loop. The await asyncio.wait_for() below
             # suspends this coroutine until data arrives or timeout, yielding
             # control to the event loop. This is standard async WebSocket pattern.
+            # Replies go through the client's send queue so they never
+            # interleave with a frame being sent by its sender task.
             dashboard_timeout = get_validated_config().timeouts.dashboard_server
             while True:
                 try:
@@ -438,10 +693,10 @@ def _register_websocket_routes(app: FastAPI, dashboard: DashboardApp) -> None:
                     )
                     # Handle ping/pong for keepalive
                     if data == "ping":
-                        await websocket.send_text("pong")
+                        manager.send(websocket, "pong")
                 except asyncio.TimeoutError:
                     # Send keepalive ping
-                    await websocket.send_text("ping")
+                    manager.send(websocket, "ping")
 
         except WebSocketDisconnect:
             pass
@@ -624,7 +879,7 @@ def create_app(
     @app.get("/api/state")
     async def get_state() -> dict[str, Any]:
         """Get complete simulation state."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         return {
             "progress": dashboard.parser.get_progress().model_dump(),
             "agents": [a.model_dump() for a in dashboard.parser.get_all_agent_summaries()],
@@ -639,16 +894,21 @@ def create_app(
     @app.get("/api/progress")
     async def get_progress() -> dict[str, Any]:
         """Get simulation progress only."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         return dashboard.parser.get_progress().model_dump()
 
+    @app.get("/api/ingest")
+    async def get_ingest_progress() -> dict[str, Any]:
+        """Get event log ingestion progress (background loads)."""
+        return dashboard.ingestor.progress()
+
     @app.get("/api/search")
     async def search(
         q: str = Query("", min_length=1, description="Search query"),
         limit: int = Query(10, ge=1, le=50, description="Max results per category"),
     ) -> dict[str, Any]:
         """Global search across agents and artifacts (Plan #190)."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         query = q.lower()
 
         # Search agents
@@ -679,7 +939,7 @@ def create_app(
         offset: int = Query(0, ge=0),
     ) -> dict[str, Any]:
         """Get agent summaries with pagination (Plan #142)."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         all_agents = dashboard.parser.get_all_agent_summaries()
         total = len(all_agents)
         paginated = all_agents[offset:offset + limit]
@@ -693,7 +953,7 @@ def create_app(
     @app.get("/api/agents/{agent_id}")
     async def get_agent(agent_id: str) -> dict[str, Any]:
         """Get detailed info for a single agent."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         detail = dashboard.parser.get_agent_detail(agent_id)
         if detail:
             return detail.model_dump()
@@ -710,7 +970,7 @@ def create_app(
         - is_frozen: Whether agent exhausted LLM tokens
         - scrip_balance: Current scrip balance
         """
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         metrics = compute_agent_metrics(dashboard.parser.state, agent_id)
         if metrics is None:
             return {"error": f"Agent {agent_id} not found"}
@@ -781,7 +1041,7 @@ def create_app(
         search: str | None = Query(None, description="Search by artifact ID"),
     ) -> dict[str, Any]:
         """Get artifacts with pagination and search (Plan #142)."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         all_artifacts = dashboard.parser.get_all_artifacts()
         
         # Apply search filter if provided
@@ -799,6 +1059,7 @@ def create_app(
 
     @app.get("/api/events")
     async def get_events(
+        response: Response,
         event_types: str | None = Query(None, description="Comma-separated event types"),
         agent_id: str | None = Query(None),
         artifact_id: str | None = Query(None),
@@ -806,12 +1067,17 @@ def create_app(
         tick_max: int | None = Query(None),
         limit: int = Query(100, ge=1, le=1000),
         offset: int = Query(0, ge=0),
+        cursor: int | None = Query(None, ge=0, description="X-Next-Cursor from the previous page"),
     ) -> list[dict[str, Any]]:
-        """Get filtered events."""
-        dashboard.parser.parse_incremental()
+        """Get filtered events.
+
+        The X-Next-Cursor response header, when present, resumes the same
+        query after this page via ?cursor=.
+        """
+        await dashboard.refresh()
 
         types_list = event_types.split(",") if event_types else None
-        events = dashboard.parser.filter_events(
+        events, next_cursor = dashboard.parser.query_events(
             event_types=types_list,
             agent_id=agent_id,
             artifact_id=artifact_id,
@@ -819,31 +1085,34 @@ def create_app(
             tick_max=tick_max,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = str(next_cursor)
         return [e.model_dump() for e in events]
 
     @app.get("/api/genesis")
     async def get_genesis() -> dict[str, Any]:
         """Get genesis artifact activity summary."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         return dashboard.parser.get_genesis_activity().model_dump()
 
     @app.get("/api/charts/llm_tokens")
     async def get_llm_tokens_chart() -> dict[str, Any]:
         """Get LLM token utilization chart data."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         return dashboard.parser.get_llm_tokens_chart_data().model_dump()
 
     @app.get("/api/charts/scrip")
     async def get_scrip_chart() -> dict[str, Any]:
         """Get scrip balance chart data."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         return dashboard.parser.get_scrip_chart_data().model_dump()
 
     @app.get("/api/charts/flow")
     async def get_flow_chart() -> dict[str, Any]:
         """Get economic flow visualization data."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         return dashboard.parser.get_economic_flow_data().model_dump()
 
     @app.get("/api/kpis")
@@ -853,8 +1122,8 @@ def create_app(
         Returns computed metrics indicating overall ecosystem health,
         capital flow, and emergence patterns.
         """
-        dashboard.parser.parse_incremental()
-        kpis = calculate_kpis(dashboard.parser.state)
+        await dashboard.refresh()
+        kpis = dashboard.parser.kpi_aggregator.kpis()
 
         # Convert dataclass to dict for response
         return {
@@ -895,8 +1164,8 @@ def create_app(
         - capital_depth: Max dependency chain length
         - coalition_count: Number of distinct agent clusters
         """
-        dashboard.parser.parse_incremental()
-        metrics = calculate_emergence_metrics(dashboard.parser.state)
+        await dashboard.refresh()
+        metrics = dashboard.parser.kpi_aggregator.emergence()
         return metrics.model_dump()
 
     @app.get("/api/health")
@@ -906,8 +1175,8 @@ def create_app(
         Returns health assessment based on KPIs with threshold-based
         status (healthy/warning/critical), concerns, and trends.
         """
-        dashboard.parser.parse_incremental()
-        kpis = calculate_kpis(dashboard.parser.state)
+        await dashboard.refresh()
+        kpis = dashboard.parser.kpi_aggregator.kpis()
 
         # Get default thresholds (could be made configurable via config.yaml)
         thresholds = AuditorThresholds()
@@ -964,7 +1233,7 @@ def create_app(
     @app.get("/api/ticks")
     async def get_tick_summaries() -> list[dict[str, Any]]:
         """Get tick summary history."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         return [t.model_dump() for t in dashboard.parser.state.tick_summaries]
 
     @app.get("/api/summary")
@@ -1047,7 +1316,7 @@ def create_app(
         tick_max: int | None = Query(None, description="Max tick to include"),
     ) -> dict[str, Any]:
         """Get network graph data for agent interactions."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         return dashboard.parser.get_network_graph_data(tick_max).model_dump()
 
     @app.get("/api/temporal-network")
@@ -1065,7 +1334,7 @@ def create_app(
         - Ownership relationships
         - Activity heatmap data by time bucket
         """
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         return dashboard.parser.get_temporal_network_data(
             time_min=time_min,
             time_max=time_max,
@@ -1081,7 +1350,7 @@ def create_app(
         artifact_id: str | None = Query(None, description="Filter by artifact ID (Plan #144)"),
     ) -> dict[str, Any]:
         """Get activity feed with filtering."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         types_list = types.split(",") if types else None
         return dashboard.parser.get_activity_feed(
             limit=limit,
@@ -1094,7 +1363,7 @@ def create_app(
     @app.get("/api/artifacts/{artifact_id}/detail")
     async def get_artifact_detail(artifact_id: str) -> dict[str, Any]:
         """Get detailed info for a single artifact including content."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         detail = dashboard.parser.get_artifact_detail(artifact_id)
         if detail:
             return detail.model_dump()
@@ -1106,7 +1375,7 @@ def create_app(
 
         Returns success rate, average duration, and failure type breakdown.
         """
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         stats = dashboard.parser.get_invocation_stats(artifact_id)
         return stats.model_dump()
 
@@ -1122,7 +1391,7 @@ def create_app(
 
         Returns list of invocations with filtering options.
         """
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         invocations = dashboard.parser.get_invocations(
             artifact_id=artifact_id,
             invoker_id=invoker_id,
@@ -1144,16 +1413,13 @@ def create_app(
         This is pure observability - we don't define "good" structure,
         just make the emergent capital structure visible.
         """
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
 
         # Extract artifact data for graph construction
         artifacts = []
         for artifact_id, artifact_state in dashboard.parser.state.artifacts.items():
             # Get invocation count (unique invokers for Lindy score)
-            invocations = [
-                e for e in dashboard.parser.state.invocation_events
-                if e.artifact_id == artifact_id
-            ]
+            invocations = dashboard.parser.get_artifact_invocations(artifact_id)
             unique_invokers = len({inv.invoker_id for inv in invocations})
 
             artifacts.append({
@@ -1180,7 +1446,7 @@ def create_app(
         Returns all interactions between the specified agents in either direction,
         with a breakdown by interaction type.
         """
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         summary = dashboard.parser.get_pairwise_interactions(from_agent, to_agent)
         return summary.model_dump()
 
@@ -1194,7 +1460,7 @@ def create_app(
         Lindy score = age_days × unique_invokers
         Higher scores suggest artifacts emerging as 'standard library' components.
         """
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         artifacts = dashboard.parser.get_standard_artifacts(
             min_lindy_score=min_score,
             limit=limit,
@@ -1210,7 +1476,7 @@ def create_app(
 
         Returns aggregated scrip transfers between agents for visualization.
         """
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
         return dashboard.parser.get_capital_flow_data(
             time_min=time_min,
             time_max=time_max,
@@ -1224,7 +1490,7 @@ def create_app(
         limit: int = Query(100, ge=1, le=500),
     ) -> dict[str, Any]:
         """Get agent thinking history with reasoning content."""
-        dashboard.parser.parse_incremental()
+        await dashboard.refresh()
 
         all_thinking: list[dict[str, Any]] = []
         for agent_state in dashboard.parser.state.agents.values():
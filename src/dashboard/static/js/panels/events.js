@@ -52,6 +52,10 @@ const EventsPanel = {
         window.wsManager.on('initial_state', () => {
             this.load();
         });
+
+        window.wsManager.on('events_dropped', () => {
+            this.load();
+        });
     },
 
     /**
@@ -36,6 +36,10 @@ const TimelinePanel = {
             // Load from API for initial state
             this.load();
         });
+
+        window.wsManager.on('events_dropped', () => {
+            this.load();
+        });
     },
 
     /**
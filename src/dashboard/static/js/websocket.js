@@ -83,6 +83,11 @@ class WebSocketManager {
             const message = JSON.parse(data);
             const type = message.type;
 
+            if (type === 'delta') {
+                this.handleDelta(message.data);
+                return;
+            }
+
             if (this.listeners[type]) {
                 this.listeners[type].forEach(callback => {
                     try {
@@ -97,6 +102,24 @@ class WebSocketManager {
         }
     }
 
+    /**
+     * Expand a coalesced delta frame into the per-message events panels listen to
+     */
+    handleDelta(data) {
+        data.events.forEach(event => this.emit('event', event));
+        if (data.dropped_events > 0) {
+            // Some events were never sent (slow connection): panels reload from the API
+            this.emit('events_dropped', data.dropped_events);
+        }
+        if (data.state) {
+            this.emit('state_update', data.state);
+        }
+        if (data.kpis) {
+            this.emit('kpi_update', data.kpis);
+        }
+        this.emit('delta', data);
+    }
+
     /**
      * Add event listener
      */
@@ -14,6 +14,7 @@ from .agent_loop import (
 from .artifact_loop import (  # Plan #255
     ArtifactLoop, ArtifactLoopManager, ArtifactLoopConfig, ArtifactState
 )
+from .iteration_pool import IterationPool
 
 __all__ = [
     "SimulationRunner",
@@ -33,4 +34,5 @@ __all__ = [
     "ArtifactLoopManager",
     "ArtifactLoopConfig",
     "ArtifactState",
+    "IterationPool",
 ]
@@ -78,11 +78,13 @@ class AgentLoopConfig:
     Attributes:
         min_loop_delay: Minimum seconds between actions (default: 0.1)
         max_loop_delay: Maximum backoff delay on errors (default: 10.0)
-        resource_check_interval: How often to check resources when paused (default: 1.0)
+        resource_check_interval: Re-check interval for wake conditions that
+            cannot be awaited directly (default: 1.0). Resource waits are woken
+            by the RateTracker scheduler and do not poll.
         max_consecutive_errors: Errors before forced pause (default: 5)
         resources_to_check: List of resource types to check capacity for
         resource_exhaustion_policy: Policy when resources exhausted - "skip" or "block"
-            - "skip": Skip action, sleep briefly, try again next iteration (default)
+            - "skip": Skip action, pause until capacity frees up, try again (default)
             - "block": Block until capacity available using wait_for_capacity
     """
 
@@ -186,6 +188,7 @@ class AgentLoop:
     _consecutive_errors: int = field(default=0, init=False)
     _wake_condition: WakeCondition | None = field(default=None, init=False)
     _wake_event: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    _stop_event: asyncio.Event = field(default_factory=asyncio.Event, init=False)
     _iteration_count: int = field(default=0, init=False)
     _crash_reason: str | None = field(default=None, init=False)
     _voluntary_shutdown: bool = field(default=False, init=False)
@@ -256,6 +259,7 @@ class AgentLoop:
         self._consecutive_errors = 0
         self._iteration_count = 0
         self._wake_event.clear()
+        self._stop_event.clear()
         self._task = asyncio.create_task(self._run_loop())
         logger.info(f"Agent {self.agent_id} loop started")
 
@@ -275,8 +279,9 @@ class AgentLoop:
             return
 
         self._state = AgentState.STOPPING
-        # Wake up any sleeping agent so it can exit
+        # Wake up any sleeping or resource-blocked agent so it can exit
         self._wake_event.set()
+        self._stop_event.set()
 
         if self._task:
             try:
@@ -341,14 +346,7 @@ class AgentLoop:
                     if await self._check_wake_condition():
                         self.wake()
                     else:
-                        # Wait for wake event or timeout
-                        try:
-                            await asyncio.wait_for(
-                                self._wake_event.wait(),
-                                timeout=self.config.resource_check_interval,
-                            )
-                        except asyncio.TimeoutError:
-                            pass
+                        await self._wait_for_wake_condition()
                         continue
 
                 # Check resource capacity
@@ -364,11 +362,11 @@ class AgentLoop:
                             continue
                         logger.debug(f"Agent {self.agent_id} resources acquired, continuing")
                     else:
-                        # Skip: pause and try again next iteration
+                        # Skip: pause until capacity frees up, then try again
                         if self._state != AgentState.PAUSED:
                             self._state = AgentState.PAUSED
                             logger.debug(f"Agent {self.agent_id} paused (no resources)")
-                        await asyncio.sleep(self.config.resource_check_interval)
+                        await self._wait_any(self._resources_available())
                         continue
 
                 # Unpause if we were paused and now have resources
@@ -429,10 +427,11 @@ class AgentLoop:
         """Wait until all required resources have capacity.
 
         Used when resource_exhaustion_policy is "block".
-        Waits for each resource in sequence using wait_for_capacity.
+        Waits for each resource in sequence using wait_for_capacity, which
+        wakes exactly when capacity frees up; stop() interrupts the wait.
 
         Returns:
-            True if all resources acquired, False if timeout or stop requested.
+            True if all resources acquired, False if stop requested.
         """
         for resource in self.config.resources_to_check:
             if not self.rate_tracker.has_capacity(self.agent_id, resource):
@@ -440,18 +439,64 @@ class AgentLoop:
                 if self._state in (AgentState.STOPPING, AgentState.STOPPED):
                     return False
 
-                # Wait for this resource with a periodic check interval
-                acquired = await self.rate_tracker.wait_for_capacity(
-                    self.agent_id,
-                    resource,
-                    amount=1.0,
-                    timeout=self.config.resource_check_interval,
+                acquired = await self._wait_any(
+                    self.rate_tracker.wait_for_capacity(self.agent_id, resource, amount=1.0)
                 )
                 if not acquired:
-                    # Timeout - let loop check state and try again
                     return False
         return True
 
+    async def _resources_available(self) -> bool:
+        """Wait (without consuming) until all required resources have capacity."""
+        for resource in self.config.resources_to_check:
+            await self.rate_tracker.wait_for_available(self.agent_id, resource)
+        return True
+
+    async def _wait_for_wake_condition(self) -> None:
+        """Block until the wake condition may have become true.
+
+        Time conditions sleep until their deadline and resource conditions
+        wait on the RateTracker scheduler. Event conditions have nothing to
+        await and fall back to re-checking every resource_check_interval.
+        wake() and stop() interrupt all of them.
+        """
+        cond = self._wake_condition
+        waits: list[Awaitable[Any]] = [self._wake_event.wait()]
+        timeout: float | None = self.config.resource_check_interval
+        if cond is not None and cond.condition_type == "time":
+            timeout = max(0.0, float(cond.value) - time.time())
+        elif cond is not None and cond.condition_type == "resource":
+            resource, threshold = cond.value
+            waits.append(
+                self.rate_tracker.wait_for_available(self.agent_id, resource, threshold)
+            )
+            timeout = None
+        await self._wait_any(*waits, timeout=timeout)
+
+    async def _wait_any(self, *aws: Awaitable[Any], timeout: float | None = None) -> bool:
+        """Wait for the first of aws to finish, stop() to be called, or timeout.
+
+        Unfinished awaitables are cancelled.
+
+        Returns:
+            The first finished awaitable's result as a bool, or False if
+            interrupted by stop() or the timeout.
+        """
+        tasks = [asyncio.ensure_future(aw) for aw in aws]
+        stopper = asyncio.ensure_future(self._stop_event.wait())
+        try:
+            done, _ = await asyncio.wait(
+                [*tasks, stopper], timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for task in (*tasks, stopper):
+                if not task.done():
+                    task.cancel()
+        for task in tasks:
+            if task in done:
+                return bool(task.result())
+        return False
+
     async def _check_wake_condition(self) -> bool:
         """Check if wake condition is satisfied.
 
@@ -31,6 +31,8 @@ from ..config import get_validated_config
 if TYPE_CHECKING:
     from ..world.rate_tracker import RateTracker
     from ..world.world import World
+    from ..world.worker_pool import WorkerPool
+    from .iteration_pool import IterationPool
 
 
 logger = logging.getLogger(__name__)
@@ -99,6 +101,10 @@ class ArtifactLoop:
         world: World instance for execution context
         rate_tracker: Rate tracker for resource checking
         config: Loop configuration
+        iteration_pool: Runs iterations off the event loop when set
+            (execution.iteration_pool); None executes inline
+        worker_pool: Runs iterations in worker processes when set
+            (execution.use_worker_pool); takes precedence over iteration_pool
     """
 
     artifact_id: str
@@ -106,6 +112,8 @@ class ArtifactLoop:
     rate_tracker: "RateTracker"
     config: ArtifactLoopConfig = field(default_factory=ArtifactLoopConfig)
     on_error: Callable[[str, str, str], None] | None = None
+    iteration_pool: "IterationPool | None" = None
+    worker_pool: "WorkerPool | None" = None
 
     _state: ArtifactState = field(default=ArtifactState.STOPPED, init=False)
     _task: asyncio.Task[None] | None = field(default=None, init=False)
@@ -283,7 +291,9 @@ class ArtifactLoop:
     async def _execute_iteration(self) -> dict[str, Any]:
         """Execute one iteration of the artifact loop.
 
-        Executes the artifact's code via the sandbox executor.
+        Executes the artifact's code via the sandbox executor. With an
+        iteration pool, the (blocking) execution runs in a worker thread so
+        other loops keep making progress while this one waits on an LLM.
 
         Returns:
             Result dict with success, result, and optional error fields.
@@ -306,14 +316,28 @@ class ArtifactLoop:
 
             executor = SafeExecutor()
             # Use execute_with_invoke which supports world, kernel interfaces, and syscalls
-            result = executor.execute_with_invoke(
-                code=code,
-                world=self.world,
-                caller_id=self.artifact_id,
-                artifact_id=self.artifact_id,
-                artifact_store=self.world.artifacts,
-                ledger=self.world.ledger,
-            )
+            execute_kwargs: dict[str, Any] = {
+                "code": code,
+                "world": self.world,
+                "caller_id": self.artifact_id,
+                "artifact_id": self.artifact_id,
+                "artifact_store": self.world.artifacts,
+                "ledger": self.world.ledger,
+            }
+            if self.worker_pool is not None:
+                result = await self.worker_pool.execute(
+                    executor,
+                    self.world,
+                    code=code,
+                    caller_id=self.artifact_id,
+                    artifact_id=self.artifact_id,
+                )
+            elif self.iteration_pool is not None:
+                result = await self.iteration_pool.run(
+                    self.artifact_id, executor.execute_with_invoke, **execute_kwargs
+                )
+            else:
+                result = executor.execute_with_invoke(**execute_kwargs)
 
             return {
                 "success": True,
@@ -339,17 +363,31 @@ class ArtifactLoopManager:
     Attributes:
         world: World instance for artifact access
         rate_tracker: Rate tracker for resource checking
+        iteration_pool: Shared off-loop executor for all loops (optional)
+        worker_pool: Shared process pool for all loops (optional)
     """
 
-    def __init__(self, world: "World", rate_tracker: "RateTracker") -> None:
+    def __init__(
+        self,
+        world: "World",
+        rate_tracker: "RateTracker",
+        iteration_pool: "IterationPool | None" = None,
+        worker_pool: "WorkerPool | None" = None,
+    ) -> None:
         """Initialize the manager.
 
         Args:
             world: World instance for artifact access
             rate_tracker: Rate tracker for resource checking
+            iteration_pool: Run iterations off the event loop (optional).
+                None executes iterations inline on the event loop.
+            worker_pool: Run iterations in worker processes (optional).
+                Takes precedence over iteration_pool.
         """
         self.world = world
         self.rate_tracker = rate_tracker
+        self.iteration_pool = iteration_pool
+        self.worker_pool = worker_pool
         self._loops: dict[str, ArtifactLoop] = {}
         self.on_error: Callable[[str, str, str], None] | None = None
 
@@ -407,6 +445,8 @@ class ArtifactLoopManager:
             rate_tracker=self.rate_tracker,
             config=config or ArtifactLoopConfig(),
             on_error=self.on_error,
+            iteration_pool=self.iteration_pool,
+            worker_pool=self.worker_pool,
         )
         self._loops[artifact_id] = loop
         return loop
@@ -432,6 +472,10 @@ class ArtifactLoopManager:
         await asyncio.gather(
             *[loop.stop(timeout) for loop in self._loops.values()]
         )
+        if self.iteration_pool is not None:
+            self.iteration_pool.shutdown()
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown()
 
     def get_loop(self, artifact_id: str) -> ArtifactLoop | None:
         """Get loop by artifact ID.
@@ -55,6 +55,9 @@ def save_checkpoint(
         "checkpoint_file", "checkpoint.json"
     )
 
+    # Buffered events must be on disk before the checkpoint claims this point
+    world.logger.flush()
+
     # Build agent states for behavioral continuity (Plan #163)
     agent_states: dict[str, AgentCheckpointState] = {}
     for agent in agents:
@@ -0,0 +1,159 @@
+"""Off-loop execution of artifact loop iterations.
+
+Artifact iterations run synchronous sandbox code, and that code frequently
+blocks for seconds inside ``_syscall_llm`` waiting on a provider. Running it
+directly on the event loop serializes every loop, the mint update task and
+the supervisor behind the slowest LLM call.
+
+IterationPool runs those iterations in a bounded thread pool instead:
+- ``max_workers`` bounds total concurrent iterations across all principals
+- ``max_per_principal`` bounds concurrent iterations charged to one principal,
+  so a single principal cannot monopolize the pool (or race its own
+  budget checks in ``_syscall_llm``)
+
+Usage:
+    pool = IterationPool(max_workers=8, max_per_principal=1)
+    result = await pool.run("alice", executor.execute_with_invoke, code=code)
+    pool.shutdown()
+
+Kernel calls made from pool threads are safe: Ledger and ArtifactStore
+serialize their mutations with a threading lock. ``executor.timeout_seconds``
+is enforced off the main thread by a per-thread trace deadline on agent code
+(see ``_timeout_context`` in executor.py); LLM calls keep their own request
+timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from ..config import get_validated_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class IterationPool:
+    """Bounded thread pool with per-principal concurrency limits.
+
+    Attributes:
+        max_workers: Maximum concurrent iterations across all principals
+        max_per_principal: Maximum concurrent iterations per principal
+    """
+
+    def __init__(self, max_workers: int, max_per_principal: int = 1) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_workers: Maximum worker threads (must be positive)
+            max_per_principal: Concurrent iterations allowed per principal
+
+        Raises:
+            ValueError: If either limit is not positive
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive: {max_workers}")
+        if max_per_principal < 1:
+            raise ValueError(f"max_per_principal must be positive: {max_per_principal}")
+        self.max_workers = max_workers
+        self.max_per_principal = max_per_principal
+        self._executor: ThreadPoolExecutor | None = None
+        self._principal_limits: dict[str, asyncio.Semaphore] = {}
+        self._in_flight: dict[str, int] = {}
+
+    @classmethod
+    def from_config(cls) -> "IterationPool | None":
+        """Create a pool from execution.iteration_pool config.
+
+        Returns:
+            IterationPool if the mode is enabled, None otherwise.
+        """
+        pool_config = get_validated_config().execution.iteration_pool
+        if not pool_config.enabled:
+            return None
+        return cls(
+            max_workers=pool_config.max_workers,
+            max_per_principal=pool_config.max_per_principal,
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool (so unused pools cost nothing)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="artifact-iteration",
+            )
+        return self._executor
+
+    def _get_limit(self, principal_id: str) -> asyncio.Semaphore:
+        """Get or create the semaphore for a principal."""
+        limit = self._principal_limits.get(principal_id)
+        if limit is None:
+            limit = asyncio.Semaphore(self.max_per_principal)
+            self._principal_limits[principal_id] = limit
+        return limit
+
+    async def run(
+        self,
+        principal_id: str,
+        func: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run a blocking callable off the event loop.
+
+        Waits (without blocking the loop) for a per-principal slot, then
+        dispatches to the thread pool.
+
+        Args:
+            principal_id: Principal the work is charged to
+            func: Blocking callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The return value of func
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_limit(principal_id):
+            self._in_flight[principal_id] = self._in_flight.get(principal_id, 0) + 1
+            try:
+                return await loop.run_in_executor(
+                    self._get_executor(), functools.partial(func, *args, **kwargs)
+                )
+            finally:
+                self._in_flight[principal_id] -= 1
+                if self._in_flight[principal_id] == 0:
+                    del self._in_flight[principal_id]
+
+    def in_flight(self, principal_id: str | None = None) -> int:
+        """Count iterations currently executing.
+
+        Args:
+            principal_id: Count only this principal's iterations (optional)
+
+        Returns:
+            Number of in-flight iterations
+        """
+        if principal_id is not None:
+            return self._in_flight.get(principal_id, 0)
+        return sum(self._in_flight.values())
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down the thread pool.
+
+        Args:
+            wait: Block until running iterations finish (default False)
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+            logger.debug("Iteration pool shut down")
+        # Semaphores bind to the running event loop; drop them so a restarted
+        # simulation gets fresh ones
+        self._principal_limits.clear()
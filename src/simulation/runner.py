@@ -16,6 +16,7 @@ from typing import Any
 
 from ..world import World
 from ..world.simulation_engine import SimulationEngine
+from ..world.worker_pool import WorkerPool
 from ..world.mint_auction import KernelMintResult
 from ..world.logger import SummaryCollector
 from ..config import get_validated_config
@@ -26,6 +27,7 @@ from .types import (
 )
 from .agent_loop import AgentLoopManager, AgentLoopConfig
 from .artifact_loop import ArtifactLoopManager  # Plan #255: V4 artifact loops
+from .iteration_pool import IterationPool
 
 
 def _derive_provider(model: str) -> str:
@@ -136,7 +138,14 @@ class SimulationRunner:
         self.world.loop_manager = AgentLoopManager(rate_tracker)
 
         # Plan #255: Create ArtifactLoopManager for V4 has_loop artifacts
-        self.artifact_loop_manager = ArtifactLoopManager(self.world, rate_tracker)
+        # Iterations run in worker processes when execution.use_worker_pool is
+        # enabled (Plan #53), or off the event loop when execution.iteration_pool is
+        self.artifact_loop_manager = ArtifactLoopManager(
+            self.world,
+            rate_tracker,
+            iteration_pool=IterationPool.from_config(),
+            worker_pool=WorkerPool.from_config(),
+        )
 
         # Plan #308: Wire error tracking callbacks so _record_error() is called
         self.world.loop_manager.on_error = self._record_error
@@ -226,7 +235,7 @@ class SimulationRunner:
             print(f"Restored artifacts: {len(checkpoint['artifacts'])}")
             print()
 
-    def _handle_mint_update(self) -> KernelMintResult | None:
+    async def _handle_mint_update(self) -> KernelMintResult | None:
         """Handle mint auction update (Plan #83 - time-based).
 
         Calls the kernel mint auction's update method to check if auctions need to:
@@ -234,11 +243,14 @@ class SimulationRunner:
         - Resolve completed auctions
         - Distribute UBI from winning bids
 
+        Scoring is awaited on the scorer's thread pool, so agent loops keep
+        running while an auction resolves.
+
         Returns:
             KernelMintResult dict if an auction was resolved, None otherwise.
         """
         # Plan #254: Use kernel mint_auction directly
-        result = self.world.mint_auction.update()
+        result = await self.world.mint_auction.update_async()
 
         self._log_mint_result(result)
         return result
@@ -353,6 +365,7 @@ class SimulationRunner:
             return
 
         # Count actual events from the log file
+        self.world.logger.flush()
         log_path = self.world.logger.output_path
         try:
             with open(log_path) as f:
@@ -545,6 +558,10 @@ class SimulationRunner:
             # Plan #255: Stop artifact loops
             if self.artifact_loop_manager.loop_count > 0:
                 await self.artifact_loop_manager.stop_all()
+            if self.world.mint_task_manager is not None:
+                self.world.mint_task_manager.shutdown()
+            # Write out any buffered events (logging.writer durability)
+            self.world.logger.flush()
             if self.verbose:
                 print(f"  [AUTONOMOUS] All loops stopped.")
 
@@ -562,7 +579,7 @@ class SimulationRunner:
                     continue
 
                 # Check for auction state changes
-                result = self._handle_mint_update()
+                result = await self._handle_mint_update()
 
                 # Log if an auction was resolved
                 if result and self.verbose:
@@ -596,6 +613,7 @@ class SimulationRunner:
         # Plan #255: Stop artifact loops
         if self.artifact_loop_manager.loop_count > 0:
             await self.artifact_loop_manager.stop_all(timeout=timeout)
+        self.world.logger.flush()
         self._running = False
 
     def run_sync(self, duration: float | None = None) -> World:
@@ -1,35 +1,89 @@
 # World kernel package
-from .world import World
-from .actions import (
-    ActionIntent, NoopIntent, ReadArtifactIntent, WriteArtifactIntent,
-    EditArtifactIntent, InvokeArtifactIntent, DeleteArtifactIntent,
-    TransferIntent, MintIntent,  # Plan #254: Kernel value actions
-    UpdateMetadataIntent,  # Plan #308
-)
-from .ledger import Ledger
-from .artifacts import ArtifactStore, Artifact, WriteResult
-from .logger import EventLogger
-# Plan #254: Genesis exports removed - use kernel actions instead
-# Transfer: TransferIntent or transfer action
-# Mint: MintIntent or mint action (requires can_mint capability)
-# Balances: query_kernel("balances", ...)
-# Events: query_kernel("events", ...)
-from .constants import SYSTEM_OWNER  # Re-exported from constants.py
-from .executor import SafeExecutor, get_executor
-from .simulation_engine import SimulationEngine, ThinkingCostResult, BudgetCheckResult
-from .rate_tracker import RateTracker, UsageRecord
-from .invocation_registry import InvocationRegistry, InvocationRecord, InvocationStats
-from .contracts import PermissionAction, PermissionResult, AccessContract
-from .kernel_contracts import (
-    FreewareContract, SelfOwnedContract, PrivateContract, PublicContract,
-    TransferableFreewareContract,
-    KERNEL_CONTRACTS, get_kernel_contract, get_contract_by_id, list_kernel_contracts,
-)
-from .mint_auction import MintAuction, KernelMintSubmission, KernelMintResult
-from .resources import (
-    RESOURCE_LLM_BUDGET, RESOURCE_DISK, RESOURCE_LLM_TOKENS, RESOURCE_CPU,
-    ALL_RESOURCES, DEPLETABLE_RESOURCES, ALLOCATABLE_RESOURCES, RENEWABLE_RESOURCES
-)
+#
+# Exports are resolved on first access (PEP 562), so importing a submodule
+# such as src.world.task_runner does not load World and litellm. Spawned
+# sandbox workers import this package to reach their entry points.
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .world import World
+    from .actions import (
+        ActionIntent, NoopIntent, ReadArtifactIntent, WriteArtifactIntent,
+        EditArtifactIntent, InvokeArtifactIntent, DeleteArtifactIntent,
+        TransferIntent, MintIntent,  # Plan #254: Kernel value actions
+        UpdateMetadataIntent,  # Plan #308
+    )
+    from .ledger import Ledger
+    from .artifacts import ArtifactStore, Artifact, WriteResult
+    from .logger import EventLogger
+    # Plan #254: Genesis exports removed - use kernel actions instead
+    # Transfer: TransferIntent or transfer action
+    # Mint: MintIntent or mint action (requires can_mint capability)
+    # Balances: query_kernel("balances", ...)
+    # Events: query_kernel("events", ...)
+    from .constants import SYSTEM_OWNER  # Re-exported from constants.py
+    from .executor import SafeExecutor, get_executor
+    from .simulation_engine import SimulationEngine, ThinkingCostResult, BudgetCheckResult
+    from .rate_tracker import RateTracker, UsageRecord
+    from .invocation_registry import InvocationRegistry, InvocationRecord, InvocationStats
+    from .contracts import PermissionAction, PermissionResult, AccessContract
+    from .kernel_contracts import (
+        FreewareContract, SelfOwnedContract, PrivateContract, PublicContract,
+        TransferableFreewareContract,
+        KERNEL_CONTRACTS, get_kernel_contract, get_contract_by_id, list_kernel_contracts,
+    )
+    from .mint_auction import MintAuction, KernelMintSubmission, KernelMintResult
+    from .resources import (
+        RESOURCE_LLM_BUDGET, RESOURCE_DISK, RESOURCE_LLM_TOKENS, RESOURCE_CPU,
+        ALL_RESOURCES, DEPLETABLE_RESOURCES, ALLOCATABLE_RESOURCES, RENEWABLE_RESOURCES
+    )
+
+# Export name -> submodule that defines it
+_EXPORTS: dict[str, str] = {
+    "World": ".world",
+    **dict.fromkeys([
+        "ActionIntent", "NoopIntent", "ReadArtifactIntent", "WriteArtifactIntent",
+        "EditArtifactIntent", "InvokeArtifactIntent", "DeleteArtifactIntent",
+        "TransferIntent", "MintIntent", "UpdateMetadataIntent",
+    ], ".actions"),
+    "Ledger": ".ledger",
+    **dict.fromkeys(["ArtifactStore", "Artifact", "WriteResult"], ".artifacts"),
+    "EventLogger": ".logger",
+    "SYSTEM_OWNER": ".constants",
+    **dict.fromkeys(["SafeExecutor", "get_executor"], ".executor"),
+    **dict.fromkeys(
+        ["SimulationEngine", "ThinkingCostResult", "BudgetCheckResult"], ".simulation_engine"
+    ),
+    **dict.fromkeys(["RateTracker", "UsageRecord"], ".rate_tracker"),
+    **dict.fromkeys(
+        ["InvocationRegistry", "InvocationRecord", "InvocationStats"], ".invocation_registry"
+    ),
+    **dict.fromkeys(["PermissionAction", "PermissionResult", "AccessContract"], ".contracts"),
+    **dict.fromkeys([
+        "FreewareContract", "SelfOwnedContract", "PrivateContract", "PublicContract",
+        "TransferableFreewareContract",
+        "KERNEL_CONTRACTS", "get_kernel_contract", "get_contract_by_id", "list_kernel_contracts",
+    ], ".kernel_contracts"),
+    **dict.fromkeys(["MintAuction", "KernelMintSubmission", "KernelMintResult"], ".mint_auction"),
+    **dict.fromkeys([
+        "RESOURCE_LLM_BUDGET", "RESOURCE_DISK", "RESOURCE_LLM_TOKENS", "RESOURCE_CPU",
+        "ALL_RESOURCES", "DEPLETABLE_RESOURCES", "ALLOCATABLE_RESOURCES", "RENEWABLE_RESOURCES",
+    ], ".resources"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an export's submodule on first access and cache the value."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "World",
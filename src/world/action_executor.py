@@ -8,7 +8,6 @@ delegating state access back to World.
 
 from __future__ import annotations
 
-import json
 import time
 from typing import Any, TYPE_CHECKING
 
@@ -251,11 +250,9 @@ class ActionExecutor:
             }
             w._emit_event(event)
 
-            # Refresh triggers if a trigger artifact was modified
-            if isinstance(intent, (WriteArtifactIntent, EditArtifactIntent)):
-                artifact = w.artifacts.get(intent.artifact_id)
-                if artifact and artifact.type == "trigger":
-                    w.refresh_triggers()
+            # Re-register triggers affected by a changed trigger or callback artifact
+            if isinstance(intent, (WriteArtifactIntent, EditArtifactIntent, DeleteArtifactIntent)):
+                w.update_trigger(intent.artifact_id)
 
     def _execute_write(self, intent: WriteArtifactIntent) -> ActionResult:
         """Execute a write_artifact action.
@@ -418,9 +415,7 @@ class ActionExecutor:
         # Calculate size delta (if updating, we reclaim old space)
         size_delta = total_size
         if existing:
-            old_content_size = len(existing.content.encode("utf-8"))
-            old_code_size = len(existing.code.encode("utf-8"))
-            size_delta = total_size - old_content_size - old_code_size
+            size_delta = total_size - w.artifacts.get_artifact_size(intent.artifact_id)
 
         # Check disk quota if size_delta > 0 (writing more than reclaiming)
         # Quota of 0 means unconfigured — skip enforcement (scarcity is opt-in)
@@ -496,6 +491,7 @@ class ActionExecutor:
             has_standing=intent.has_standing,
             has_loop=intent.has_loop,
         )
+        get_executor().invalidate_permissions(intent.artifact_id)
 
         # Plan #254: Auto-create principal if has_standing=True on NEW artifacts
         # This enables write_artifact to spawn principals (replacing genesis_ledger.spawn_principal)
@@ -565,6 +561,9 @@ class ActionExecutor:
         Applies a surgical string replacement to an artifact's content using
         old_string/new_string (Claude Code-style editing). Delegates to
         ArtifactStore.edit_artifact() for the actual replacement logic.
+
+        The append, range and json_patch operations delegate to the matching
+        ArtifactStore method, so growing artifacts are not rewritten in full.
         """
         w = self.world
         # Check if artifact exists
@@ -605,38 +604,69 @@ class ActionExecutor:
                 retriable=False,
             )
 
-        # Calculate size delta for quota check
-        old_size = len(intent.old_string.encode("utf-8"))
-        new_size = len(intent.new_string.encode("utf-8"))
-        size_delta = new_size - old_size
+        if intent.operation == "replace":
+            # Calculate size delta for quota check
+            old_size = len(intent.old_string.encode("utf-8"))
+            new_size = len(intent.new_string.encode("utf-8"))
+            size_delta = new_size - old_size
 
-        # Check disk quota if content is growing
-        if size_delta > 0:
+            # Check disk quota if content is growing
+            if size_delta > 0:
+                available = w.get_available_capacity(intent.principal_id, "disk")
+                if available < size_delta:
+                    return ActionResult(
+                        success=False,
+                        message=f"Disk quota exceeded: need {size_delta} bytes, have {available} available",
+                        error_code=ErrorCode.QUOTA_EXCEEDED.value,
+                        error_category=ErrorCategory.RESOURCE.value,
+                        retriable=True,
+                        error_details={"required": size_delta, "available": available},
+                    )
+
+            # Delegate to ArtifactStore.edit_artifact for the string replacement
+            result = w.artifacts.edit_artifact(
+                intent.artifact_id, intent.old_string, intent.new_string
+            )
+        else:
+            # Incremental operations: the store computes the size delta and
+            # refuses growth beyond the caller's available disk quota
             available = w.get_available_capacity(intent.principal_id, "disk")
-            if available < size_delta:
+            if intent.operation == "append":
+                result = w.artifacts.append_artifact(
+                    intent.artifact_id, intent.new_string, max_size_delta=available
+                )
+            elif intent.operation == "range":
+                result = w.artifacts.write_artifact_range(
+                    intent.artifact_id, intent.start or 0, intent.end or 0,
+                    intent.new_string, max_size_delta=available,
+                )
+            else:
+                result = w.artifacts.json_patch_artifact(
+                    intent.artifact_id, intent.patch or [], max_size_delta=available
+                )
+            size_delta = (result.get("data") or {}).get("size_delta", 0)
+
+        if not result["success"]:
+            # Map edit_artifact error codes to ActionResult error codes
+            error = (result.get("data") or {}).get("error", "unknown")
+            if error == "quota_exceeded":
                 return ActionResult(
                     success=False,
-                    message=f"Disk quota exceeded: need {size_delta} bytes, have {available} available",
+                    message=result["message"],
                     error_code=ErrorCode.QUOTA_EXCEEDED.value,
                     error_category=ErrorCategory.RESOURCE.value,
                     retriable=True,
-                    error_details={"required": size_delta, "available": available},
+                    error_details=result.get("data"),
                 )
-
-        # Delegate to ArtifactStore.edit_artifact for the string replacement
-        result = w.artifacts.edit_artifact(
-            intent.artifact_id, intent.old_string, intent.new_string
-        )
-
-        if not result["success"]:
-            # Map edit_artifact error codes to ActionResult error codes
-            error = (result.get("data") or {}).get("error", "unknown")
             error_code_map = {
                 "not_found": ErrorCode.NOT_FOUND,
                 "deleted": ErrorCode.NOT_FOUND,
                 "not_found_in_content": ErrorCode.INVALID_ARGUMENT,
                 "not_unique": ErrorCode.INVALID_ARGUMENT,
                 "no_change": ErrorCode.INVALID_ARGUMENT,
+                "invalid_range": ErrorCode.INVALID_ARGUMENT,
+                "invalid_json": ErrorCode.INVALID_ARGUMENT,
+                "invalid_patch": ErrorCode.INVALID_ARGUMENT,
             }
             mapped_code = error_code_map.get(error, ErrorCode.INTERNAL_ERROR)
             return ActionResult(
@@ -648,6 +678,8 @@ class ActionExecutor:
                 error_details=result.get("data"),
             )
 
+        executor.invalidate_permissions(intent.artifact_id)
+
         # Update disk quota if content grew
         if size_delta > 0:
             w.consume_quota(intent.principal_id, "disk", float(size_delta))
@@ -657,6 +689,7 @@ class ActionExecutor:
             "event_number": w.event_number,
             "artifact_id": intent.artifact_id,
             "edited_by": intent.principal_id,
+            "operation": intent.operation,
             "size_delta": size_delta,
         })
 
@@ -910,7 +943,8 @@ class ActionExecutor:
                 retriable=False,
             )
 
-        config_data: dict[str, Any] = json.loads(artifact.content) if artifact.content else {}
+        parsed_config = w.artifacts.get_json_content(artifact_id)
+        config_data: dict[str, Any] = parsed_config if isinstance(parsed_config, dict) else {}
 
         if method_name == "get":
             key = args.get("key") if isinstance(args, dict) else (args[0] if args else None)
@@ -955,10 +989,7 @@ class ActionExecutor:
                     retriable=False,
                 )
             old_value = config_data.get(key)
-            config_data[key] = value
-            artifact.content = json.dumps(config_data)
-            from datetime import datetime, timezone
-            artifact.updated_at = datetime.now(timezone.utc).isoformat()
+            w.artifacts.patch_json_content(artifact_id, {key: value}, indent=None)
             duration_ms = (time.perf_counter() - start_time) * 1000
             self._log_invoke_success(
                 intent.principal_id, artifact_id, method_name, duration_ms, "bool"
@@ -978,7 +1009,7 @@ class ActionExecutor:
             return ActionResult(
                 success=True,
                 message=f"Config keys: {keys}",
-                data={"keys": keys, "config": config_data},
+                data={"keys": keys, "config": dict(config_data)},
             )
 
         else:
@@ -1052,14 +1083,11 @@ class ActionExecutor:
             )
 
         # Calculate freed disk space before deletion
-        freed_bytes = len(artifact.content.encode("utf-8")) + len(artifact.code.encode("utf-8"))
+        freed_bytes = w.artifacts.get_artifact_size(intent.artifact_id)
 
         # Perform soft delete
-        from datetime import datetime, timezone
-        artifact.deleted = True
-        artifact.deleted_at = datetime.now(timezone.utc).isoformat()
-        artifact.deleted_by = intent.principal_id
-        w.artifacts._remove_from_index(artifact)
+        w.artifacts.mark_deleted(artifact, intent.principal_id)
+        executor.invalidate_permissions(intent.artifact_id)
 
         # Log the deletion
         w.logger.log("artifact_deleted", {
@@ -1144,16 +1172,10 @@ class ActionExecutor:
                 retriable=False,
             )
 
-        # Parse current agent config
-        try:
-            config = json.loads(agent_artifact.content) if agent_artifact.content else {}
-        except (json.JSONDecodeError, TypeError):
-            config = {}
-
-        # Get or initialize subscribed_artifacts list
-        subscribed: list[str] = config.get("subscribed_artifacts", [])
-        if not isinstance(subscribed, list):
-            subscribed = []
+        # Get or initialize subscribed_artifacts list (cached parse of agent config)
+        subscribed: list[str] = w.artifacts.get_json_field(
+            agent_id, "subscribed_artifacts", list, []
+        )
 
         # Check if already subscribed
         if artifact_id in subscribed:
@@ -1174,24 +1196,9 @@ class ActionExecutor:
                 retriable=False,
             )
 
-        # Add subscription
-        subscribed.append(artifact_id)
-        config["subscribed_artifacts"] = subscribed
-
-        # Update agent artifact content
-        new_content = json.dumps(config, indent=2)
-        w.artifacts.write(
-            artifact_id=agent_id,
-            type=agent_artifact.type,
-            content=new_content,
-            created_by=agent_artifact.created_by,
-            executable=agent_artifact.executable,
-            price=agent_artifact.price,
-            code=agent_artifact.code,
-            interface=agent_artifact.interface,
-            access_contract_id=agent_artifact.access_contract_id,
-            metadata=agent_artifact.metadata,
-        )
+        # Add subscription (new list - the parsed config is shared with the cache)
+        subscribed = [*subscribed, artifact_id]
+        w.artifacts.patch_json_content(agent_id, {"subscribed_artifacts": subscribed})
 
         return ActionResult(
             success=True,
@@ -1219,16 +1226,10 @@ class ActionExecutor:
                 retriable=False,
             )
 
-        # Parse current agent config
-        try:
-            config = json.loads(agent_artifact.content) if agent_artifact.content else {}
-        except (json.JSONDecodeError, TypeError):
-            config = {}
-
-        # Get subscribed_artifacts list
-        subscribed: list[str] = config.get("subscribed_artifacts", [])
-        if not isinstance(subscribed, list):
-            subscribed = []
+        # Get subscribed_artifacts list (cached parse of agent config)
+        subscribed: list[str] = w.artifacts.get_json_field(
+            agent_id, "subscribed_artifacts", list, []
+        )
 
         # Check if subscribed
         if artifact_id not in subscribed:
@@ -1238,24 +1239,9 @@ class ActionExecutor:
                 data={"subscribed_artifacts": subscribed},
             )
 
-        # Remove subscription
-        subscribed.remove(artifact_id)
-        config["subscribed_artifacts"] = subscribed
-
-        # Update agent artifact content
-        new_content = json.dumps(config, indent=2)
-        w.artifacts.write(
-            artifact_id=agent_id,
-            type=agent_artifact.type,
-            content=new_content,
-            created_by=agent_artifact.created_by,
-            executable=agent_artifact.executable,
-            price=agent_artifact.price,
-            code=agent_artifact.code,
-            interface=agent_artifact.interface,
-            access_contract_id=agent_artifact.access_contract_id,
-            metadata=agent_artifact.metadata,
-        )
+        # Remove subscription (new list - the parsed config is shared with the cache)
+        subscribed = [sub for sub in subscribed if sub != artifact_id]
+        w.artifacts.patch_json_content(agent_id, {"subscribed_artifacts": subscribed})
 
         return ActionResult(
             success=True,
@@ -1644,28 +1630,23 @@ class ActionExecutor:
                 retriable=False,
             )
 
-        # Parse current agent config
-        try:
-            config = json.loads(agent_artifact.content) if agent_artifact.content else {}
-        except (json.JSONDecodeError, TypeError):
-            config = {}
-
-        # Get or initialize context_sections
-        current_sections: dict[str, bool] = config.get("context_sections", {})
-        if not isinstance(current_sections, dict):
-            current_sections = {}
+        # Get or initialize context_sections (copied - the parsed config is
+        # shared with the store's cache)
+        current_sections: dict[str, bool] = dict(
+            w.artifacts.get_json_field(agent_id, "context_sections", dict, {})
+        )
 
         # Merge new section settings
         for section, enabled in sections.items():
             if isinstance(enabled, bool):
                 current_sections[section] = enabled
 
-        config["context_sections"] = current_sections
+        patch: dict[str, Any] = {"context_sections": current_sections}
 
         # Plan #193: Get or initialize context_section_priorities
-        current_priorities: dict[str, int] = config.get("context_section_priorities", {})
-        if not isinstance(current_priorities, dict):
-            current_priorities = {}
+        current_priorities: dict[str, int] = dict(
+            w.artifacts.get_json_field(agent_id, "context_section_priorities", dict, {})
+        )
 
         # Merge new priority settings
         if priorities is not None:
@@ -1673,22 +1654,10 @@ class ActionExecutor:
                 if isinstance(priority, int):
                     current_priorities[section] = priority
 
-            config["context_section_priorities"] = current_priorities
+            patch["context_section_priorities"] = current_priorities
 
         # Update agent artifact content
-        new_content = json.dumps(config, indent=2)
-        w.artifacts.write(
-            artifact_id=agent_id,
-            type=agent_artifact.type,
-            content=new_content,
-            created_by=agent_artifact.created_by,
-            executable=agent_artifact.executable,
-            price=agent_artifact.price,
-            code=agent_artifact.code,
-            interface=agent_artifact.interface,
-            access_contract_id=agent_artifact.access_contract_id,
-            metadata=agent_artifact.metadata,
-        )
+        w.artifacts.patch_json_content(agent_id, patch)
 
         # Build response message
         changes: list[str] = []
@@ -1726,16 +1695,11 @@ class ActionExecutor:
                 retriable=False,
             )
 
-        # Parse current agent config
-        try:
-            config = json.loads(agent_artifact.content) if agent_artifact.content else {}
-        except (json.JSONDecodeError, TypeError):
-            config = {}
-
-        # Get or initialize system_prompt_modifications
-        modifications: dict[str, Any] = config.get("system_prompt_modifications", {})
-        if not isinstance(modifications, dict):
-            modifications = {}
+        # Get or initialize system_prompt_modifications (copied - the parsed
+        # config is shared with the store's cache)
+        modifications: dict[str, Any] = dict(
+            w.artifacts.get_json_field(agent_id, "system_prompt_modifications", dict, {})
+        )
 
         # Track what changed
         changes: list[str] = []
@@ -1796,8 +1760,6 @@ class ActionExecutor:
                 retriable=True,
             )
 
-        config["system_prompt_modifications"] = modifications
-
         # Check size limits
         total_size = sum(len(str(v)) for v in modifications.values())
         max_size: int = config_get("agent.system_prompt.max_modification_size") or 4000
@@ -1812,19 +1774,7 @@ class ActionExecutor:
             )
 
         # Update agent artifact content
-        new_content = json.dumps(config, indent=2)
-        w.artifacts.write(
-            artifact_id=agent_id,
-            type=agent_artifact.type,
-            content=new_content,
-            created_by=agent_artifact.created_by,
-            executable=agent_artifact.executable,
-            price=agent_artifact.price,
-            code=agent_artifact.code,
-            interface=agent_artifact.interface,
-            access_contract_id=agent_artifact.access_contract_id,
-            metadata=agent_artifact.metadata,
-        )
+        w.artifacts.patch_json_content(agent_id, {"system_prompt_modifications": modifications})
 
         return ActionResult(
             success=True,
@@ -28,6 +28,11 @@ ActionTypeLiteral = Literal[
 ]
 
 
+# Content operations of edit_artifact
+EditOperation = Literal["replace", "append", "range", "json_patch"]
+EDIT_OPERATIONS: tuple[str, ...] = ("replace", "append", "range", "json_patch")
+
+
 class ActionType(str, Enum):
     """The narrow waist - 11 physics primitives + 2 deprecated (Plan #254: V4 architecture)
 
@@ -197,25 +202,55 @@ class EditArtifactIntent(ActionIntent):
 
     Plan #131: Enables precise, surgical edits without rewriting entire content.
     Uses old_string/new_string approach where old_string must be unique in the artifact.
+
+    Incremental operations (operation field) for growing artifacts:
+    - "replace" (default): old_string -> new_string
+    - "append": append new_string to the content
+    - "range": replace content[start:end] with new_string
+    - "json_patch": apply patch (RFC 6902 add/remove/replace/test) to JSON content
     """
 
     artifact_id: str
     old_string: str
     new_string: str
+    operation: EditOperation
+    start: int | None
+    end: int | None
+    patch: list[dict[str, Any]] | None
 
     def __init__(
-        self, principal_id: str, artifact_id: str, old_string: str, new_string: str, reasoning: str = ""
+        self,
+        principal_id: str,
+        artifact_id: str,
+        old_string: str,
+        new_string: str,
+        reasoning: str = "",
+        operation: EditOperation = "replace",
+        start: int | None = None,
+        end: int | None = None,
+        patch: list[dict[str, Any]] | None = None,
     ) -> None:
         super().__init__(ActionType.EDIT_ARTIFACT, principal_id, reasoning=reasoning)
         self.artifact_id = artifact_id
         self.old_string = old_string
         self.new_string = new_string
+        self.operation = operation
+        self.start = start
+        self.end = end
+        self.patch = patch
 
     def to_dict(self) -> dict[str, Any]:
         d = super().to_dict()
         d["artifact_id"] = self.artifact_id
         d["old_string"] = self.old_string[:100] + "..." if len(self.old_string) > 100 else self.old_string
         d["new_string"] = self.new_string[:100] + "..." if len(self.new_string) > 100 else self.new_string
+        if self.operation != "replace":
+            d["operation"] = self.operation
+        if self.operation == "range":
+            d["start"] = self.start
+            d["end"] = self.end
+        if self.patch is not None:
+            d["patch_ops"] = len(self.patch)
         return d
 
 
@@ -750,10 +785,37 @@ def parse_intent_from_json(principal_id: str, json_str: str) -> ActionIntent | s
         artifact_id = data.get("artifact_id")
         old_string = data.get("old_string")
         new_string = data.get("new_string")
+        operation = data.get("operation", "replace")
         if not artifact_id:
             return "edit_artifact requires 'artifact_id'"
         if not isinstance(artifact_id, str):
             return "artifact_id must be a string"
+        if operation not in EDIT_OPERATIONS:
+            return f"edit_artifact: unknown operation '{operation}'. Valid: {', '.join(EDIT_OPERATIONS)}"
+        if operation == "json_patch":
+            patch = data.get("patch")
+            if not isinstance(patch, list):
+                return "edit_artifact json_patch requires 'patch' (list of operations)"
+            return EditArtifactIntent(
+                principal_id, artifact_id, "", "", reasoning=reasoning,
+                operation="json_patch", patch=patch,
+            )
+        if operation in ("append", "range"):
+            if not isinstance(new_string, str):
+                return f"edit_artifact {operation} requires 'new_string' (string)"
+            if operation == "append":
+                return EditArtifactIntent(
+                    principal_id, artifact_id, "", new_string, reasoning=reasoning,
+                    operation="append",
+                )
+            start = data.get("start")
+            end = data.get("end")
+            if not isinstance(start, int) or not isinstance(end, int):
+                return "edit_artifact range requires integer 'start' and 'end'"
+            return EditArtifactIntent(
+                principal_id, artifact_id, "", new_string, reasoning=reasoning,
+                operation="range", start=start, end=end,
+            )
         if old_string is None:
             return "edit_artifact requires 'old_string'"
         if not isinstance(old_string, str):
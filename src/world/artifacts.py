@@ -8,13 +8,16 @@
 # --- GOVERNANCE END ---
 from __future__ import annotations
 
+import bisect
+import functools
 import logging
 import json
 import re
+import threading
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, TypedDict, TYPE_CHECKING
+from typing import Any, Callable, Iterable, TypedDict, TypeVar, TYPE_CHECKING, cast
 
 from src.world.constants import (
     KERNEL_CONTRACT_FREEWARE,
@@ -26,6 +29,9 @@ from src.world.constants import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 def extract_invoke_targets(code: str) -> list[str]:
     """Extract artifact IDs from invoke() calls in code (Plan #170).
@@ -384,6 +390,21 @@ def create_agent_artifact(
     )
 
 
+def _encoded_size(value: Any) -> int:
+    """UTF-8 byte size of artifact content or code (str() of non-strings)."""
+    text = value if isinstance(value, str) else str(value)
+    return len(text.encode("utf-8"))
+
+
+def _locked(method: F) -> F:
+    """Run an ArtifactStore method under the store's lock."""
+    @functools.wraps(method)
+    def wrapper(self: "ArtifactStore", *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return cast(F, wrapper)
+
+
 class ArtifactStore:
     """In-memory artifact storage with O(1) index lookups (Plan #182)
 
@@ -402,6 +423,20 @@ class ArtifactStore:
     _index_by_creator: dict[str, set[str]]  # creator -> {artifact_ids}
     _index_by_metadata: dict[str, dict[Any, set[str]]]  # field -> {value -> {artifact_ids}}
     _indexed_metadata_fields: set[str]  # Which metadata fields to index
+    # Indexes for filtered discovery queries (find_ids)
+    _index_executable: set[str]  # live executable artifact_ids
+    _index_deleted: set[str]  # soft-deleted artifact_ids
+    _creation_order: dict[str, int]  # artifact_id -> position in self.artifacts
+    _sorted_ids: list[str]  # all artifact_ids, sorted, for prefix range lookups
+    _unsorted_ids: list[str]  # new ids not yet merged into _sorted_ids
+    # Parsed JSON content: artifact_id -> (content string it was parsed from, parsed value)
+    _parsed_content: dict[str, tuple[str, Any]]
+    # Disk accounting: artifact_id -> (content, code, size in bytes, creator, bytes counted)
+    _sizes: dict[str, tuple[str, str, int, str, int]]
+    _usage_by_creator: dict[str, int]  # creator -> bytes of live artifacts
+    # Held by every @_locked method: iteration-pool threads write and query
+    # the store concurrently with the event loop
+    _lock: threading.RLock
 
     def __init__(
         self,
@@ -415,6 +450,15 @@ class ArtifactStore:
         self._index_by_creator = defaultdict(set)
         self._index_by_metadata = {}
         self._indexed_metadata_fields = set(indexed_metadata_fields or [])
+        self._index_executable = set()
+        self._index_deleted = set()
+        self._creation_order = {}
+        self._sorted_ids = []
+        self._unsorted_ids = []
+        self._parsed_content = {}
+        self._sizes = {}
+        self._usage_by_creator = defaultdict(int)
+        self._lock = threading.RLock()
 
     # Plan #182: Index maintenance methods
     def _get_nested_value(self, data: dict[str, Any] | None, path: str) -> Any:
@@ -434,8 +478,21 @@ class ArtifactStore:
         return value
 
     def _add_to_index(self, artifact: Artifact) -> None:
-        """Add artifact to all indexes."""
+        """Add artifact to all indexes.
+
+        Deleted artifacts are only recorded as deleted, matching the state
+        mark_deleted() leaves a live artifact in.
+        """
         artifact_id = artifact.id
+        if artifact_id not in self._creation_order:
+            self._creation_order[artifact_id] = len(self._creation_order)
+            self._unsorted_ids.append(artifact_id)
+        self._track_size(artifact)
+        if artifact.deleted:
+            self._index_deleted.add(artifact_id)
+            return
+        if artifact.executable:
+            self._index_executable.add(artifact_id)
         # Index by type
         self._index_by_type[artifact.type].add(artifact_id)
         # Index by owner
@@ -451,6 +508,8 @@ class ArtifactStore:
     def _remove_from_index(self, artifact: Artifact) -> None:
         """Remove artifact from all indexes."""
         artifact_id = artifact.id
+        self._track_size(artifact)
+        self._index_executable.discard(artifact_id)
         # Remove from type index
         self._index_by_type[artifact.type].discard(artifact_id)
         # Remove from owner index
@@ -464,6 +523,11 @@ class ArtifactStore:
     def _update_index(self, old_artifact: Artifact, new_artifact: Artifact) -> None:
         """Update indexes when artifact changes."""
         artifact_id = old_artifact.id
+        self._track_size(new_artifact)
+        if new_artifact.executable and not new_artifact.deleted:
+            self._index_executable.add(artifact_id)
+        else:
+            self._index_executable.discard(artifact_id)
         # Update type index if changed
         if old_artifact.type != new_artifact.type:
             self._index_by_type[old_artifact.type].discard(artifact_id)
@@ -486,11 +550,44 @@ class ArtifactStore:
                         self._index_by_metadata[field] = defaultdict(set)
                     self._index_by_metadata[field][new_value].add(artifact_id)
 
+    def _track_size(self, artifact: Artifact) -> int:
+        """Refresh an artifact's byte size and its creator's running total.
+
+        The size is only re-encoded when content or code is a different
+        string object than the one last measured. Non-string content (e.g. a
+        dict written directly by kernel code) is measured by its str() form
+        and re-measured every time, since it may have been mutated in place.
+        Deleted artifacts count zero bytes toward their creator (Plan #57).
+        Returns the size.
+        """
+        artifact_id = artifact.id
+        content, code = artifact.content, artifact.code
+        entry = self._sizes.get(artifact_id)
+        if (
+            entry is not None
+            and entry[0] is content
+            and entry[1] is code
+            and isinstance(content, str)
+            and isinstance(code, str)
+        ):
+            size = entry[2]
+        else:
+            size = _encoded_size(content) + _encoded_size(code)
+        counted = 0 if artifact.deleted else size
+        creator = artifact.created_by
+        if entry is not None:
+            self._usage_by_creator[entry[3]] -= entry[4]
+        self._usage_by_creator[creator] += counted
+        self._sizes[artifact_id] = (content, code, size, creator, counted)
+        return size
+
+    @_locked
     def query_by_type(self, artifact_type: str) -> list[Artifact]:
         """Query artifacts by type using O(1) index lookup (Plan #182)."""
         ids = self._index_by_type.get(artifact_type, set())
         return [self.artifacts[id] for id in ids if id in self.artifacts]
 
+    @_locked
     def query_by_creator(self, creator: str) -> list[Artifact]:
         """Query artifacts by creator using O(1) index lookup (Plan #182).
 
@@ -505,6 +602,7 @@ class ArtifactStore:
         """Deprecated: Use query_by_creator() instead."""
         return self.query_by_creator(owner)
 
+    @_locked
     def query_by_metadata(self, field: str, value: Any) -> list[Artifact]:
         """Query artifacts by metadata field using O(1) index lookup (Plan #182).
 
@@ -519,6 +617,7 @@ class ArtifactStore:
         """Check if a metadata field is indexed (Plan #182)."""
         return field in self._indexed_metadata_fields
 
+    @_locked
     def add_indexed_field(self, field: str) -> None:
         """Add a metadata field to the index (Plan #182).
 
@@ -538,6 +637,7 @@ class ArtifactStore:
         """Get the set of indexed metadata fields (Plan #182)."""
         return self._indexed_metadata_fields.copy()
 
+    @_locked
     def rebuild_indexes(self) -> None:
         """Rebuild all indexes from existing artifacts (Plan #182).
 
@@ -548,11 +648,90 @@ class ArtifactStore:
         self._index_by_type.clear()
         self._index_by_creator.clear()
         self._index_by_metadata.clear()
+        self._index_executable.clear()
+        self._index_deleted.clear()
+        self._creation_order.clear()
+        self._sorted_ids.clear()
+        self._unsorted_ids.clear()
+        self._sizes.clear()
+        self._usage_by_creator.clear()
+        self._parsed_content.clear()
 
         # Rebuild from all artifacts
         for artifact in self.artifacts.values():
             self._add_to_index(artifact)
 
+    @_locked
+    def mark_deleted(self, artifact: Artifact, deleted_by: str) -> None:
+        """Soft-delete an artifact: set tombstone fields and drop it from indexes."""
+        artifact.deleted = True
+        artifact.deleted_at = datetime.now(timezone.utc).isoformat()
+        artifact.deleted_by = deleted_by
+        self._remove_from_index(artifact)
+        self._index_deleted.add(artifact.id)
+        self._parsed_content.pop(artifact.id, None)
+
+    def _ids_with_prefix(self, prefix: str) -> list[str]:
+        """All artifact IDs starting with prefix (including deleted), via binary search."""
+        if self._unsorted_ids:
+            # Appends are O(1); merge lazily (timsort is ~linear on two sorted runs)
+            self._sorted_ids.extend(sorted(self._unsorted_ids))
+            self._sorted_ids.sort()
+            self._unsorted_ids.clear()
+        lo = bisect.bisect_left(self._sorted_ids, prefix)
+        hi = bisect.bisect_left(self._sorted_ids, prefix + "\U0010ffff", lo)
+        return self._sorted_ids[lo:hi]
+
+    @_locked
+    def find_ids(
+        self,
+        *,
+        artifact_type: str | None = None,
+        creator: str | None = None,
+        executable: bool | None = None,
+        id_prefix: str | None = None,
+    ) -> list[str]:
+        """IDs of live (not deleted) artifacts matching every filter, in creation order.
+
+        Drives the lookup from the most selective index (type, creator,
+        executable or ID prefix) and checks the remaining filters by set
+        membership, so cost scales with the smallest candidate set rather
+        than the whole store. With no filters this is a scan of live IDs.
+        """
+        deleted = self._index_deleted
+        executables = self._index_executable
+        # (size, candidate ids, membership check) for each indexed filter
+        sources: list[tuple[int, Iterable[str], Callable[[str], bool]]] = []
+        if artifact_type is not None:
+            by_type = self._index_by_type.get(artifact_type, set())
+            sources.append((len(by_type), by_type, by_type.__contains__))
+        if creator is not None:
+            by_creator = self._index_by_creator.get(creator, set())
+            sources.append((len(by_creator), by_creator, by_creator.__contains__))
+        if executable is True:
+            sources.append((len(executables), executables, executables.__contains__))
+        if id_prefix:
+            with_prefix = self._ids_with_prefix(id_prefix)
+            sources.append((len(with_prefix), with_prefix, lambda aid: aid.startswith(id_prefix)))
+
+        if not sources:
+            if executable is False:
+                return [aid for aid in self.artifacts if aid not in deleted and aid not in executables]
+            return [aid for aid in self.artifacts if aid not in deleted]
+
+        sources.sort(key=lambda source: source[0])
+        driver = sources[0][1]
+        checks = [check for _, _, check in sources[1:]]
+        matched = [
+            aid for aid in driver
+            if aid not in deleted
+            and aid in self.artifacts
+            and (executable is not False or aid not in executables)
+            and all(check(aid) for check in checks)
+        ]
+        matched.sort(key=lambda aid: self._creation_order.get(aid, len(self._creation_order)))
+        return matched
+
     def exists(self, artifact_id: str) -> bool:
         """Check if artifact exists"""
         return artifact_id in self.artifacts
@@ -561,6 +740,103 @@ class ArtifactStore:
         """Get an artifact by ID"""
         return self.artifacts.get(artifact_id)
 
+    # Structured content: agent config, subscriptions and other JSON-in-content
+    # artifacts are read and patched through these instead of json.loads/dumps
+    @_locked
+    def get_json_content(self, artifact_id: str) -> Any:
+        """Get an artifact's content parsed as JSON, cached per content version.
+
+        The cache entry is tied to the content string it was parsed from, so
+        any rewrite of artifact.content (through the store or directly) is
+        re-parsed on the next call. Deleted artifacts are parsed but not
+        cached, so tombstones do not hold parsed documents.
+
+        The returned value is shared with the cache - do not mutate it;
+        change content with patch_json_content().
+
+        Returns:
+            Parsed value, or None if the artifact doesn't exist, has empty
+            content, or its content is not valid JSON
+        """
+        artifact = self.artifacts.get(artifact_id)
+        if artifact is None:
+            return None
+        content = artifact.content
+        cached = self._parsed_content.get(artifact_id)
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        parsed: Any = None
+        if content:
+            try:
+                parsed = json.loads(content)
+            except (json.JSONDecodeError, TypeError):
+                parsed = None
+        if not artifact.deleted:
+            self._parsed_content[artifact_id] = (content, parsed)
+        return parsed
+
+    def get_json_field(self, artifact_id: str, key: str, expected: type[T], default: T) -> T:
+        """Get a top-level field of an artifact's JSON object content.
+
+        Returns default if the content is not a JSON object or the field is
+        missing or not an instance of expected. Like get_json_content(), the
+        value is shared with the cache - copy it before mutating.
+        """
+        data = self.get_json_content(artifact_id)
+        if isinstance(data, dict):
+            value = data.get(key)
+            if isinstance(value, expected):
+                return value
+        return default
+
+    @_locked
+    def patch_json_content(
+        self,
+        artifact_id: str,
+        set_fields: dict[str, Any] | None = None,
+        remove_fields: Iterable[str] = (),
+        indent: int | None = 2,
+    ) -> dict[str, Any]:
+        """Apply field-level changes to an artifact's JSON object content.
+
+        Starts from the cached parsed content (empty or non-object content is
+        treated as {}), so the artifact is not re-parsed. Only content and
+        updated_at change; policy, metadata, state and dependencies are kept.
+
+        Args:
+            artifact_id: Artifact whose content to patch
+            set_fields: Top-level fields to set (values are stored as given)
+            remove_fields: Top-level fields to remove (missing ones are ignored)
+            indent: json.dumps indent for the new content
+
+        Returns:
+            The patched object (shared with the cache - do not mutate)
+
+        Raises:
+            KeyError: If artifact doesn't exist
+            PermissionError: If artifact is kernel_protected
+        """
+        artifact = self.artifacts[artifact_id]
+        if artifact.kernel_protected:
+            raise PermissionError(
+                f"Artifact '{artifact_id}' is kernel_protected: "
+                "modification only via kernel primitives"
+            )
+        current = self.get_json_content(artifact_id)
+        patched: dict[str, Any] = dict(current) if isinstance(current, dict) else {}
+        if set_fields:
+            patched.update(set_fields)
+        for key in remove_fields:
+            patched.pop(key, None)
+
+        content = json.dumps(patched, indent=indent)
+        artifact.content = content
+        artifact.updated_at = datetime.now(timezone.utc).isoformat()
+        self._parsed_content[artifact_id] = (content, patched)
+        self._track_size(artifact)
+        return patched
+
+    @_locked
     def write(
         self,
         artifact_id: str,
@@ -752,6 +1028,7 @@ class ArtifactStore:
 
         return artifact
 
+    @_locked
     def modify_protected_content(
         self,
         artifact_id: str,
@@ -787,6 +1064,7 @@ class ArtifactStore:
         if metadata is not None:
             artifact.metadata = metadata
         artifact.updated_at = now
+        self._track_size(artifact)
         return artifact
 
     def _validate_dependencies(
@@ -904,6 +1182,7 @@ class ArtifactStore:
         artifact = self.get(artifact_id)
         return artifact.created_by if artifact else None
 
+    @_locked
     def list_all(self, include_deleted: bool = False) -> list[dict[str, Any]]:
         """List all artifacts.
 
@@ -918,37 +1197,39 @@ class ArtifactStore:
         """Count total artifacts"""
         return len(self.artifacts)
 
+    @_locked
     def get_artifact_size(self, artifact_id: str) -> int:
-        """Get size of an artifact in bytes (content + code)"""
+        """Get size of an artifact in bytes (content + code).
+
+        Served from the size recorded when the store last changed the
+        artifact; content or code assigned directly is re-measured here.
+        """
         artifact = self.get(artifact_id)
         if not artifact:
             return 0
-        return len(artifact.content.encode("utf-8")) + len(
-            artifact.code.encode("utf-8")
-        )
+        return self._track_size(artifact)
 
+    @_locked
     def get_creator_usage(self, creator: str) -> int:
         """Get total disk usage for artifacts created by a principal.
 
-        Plan #182: Uses O(1) index lookup instead of O(n) scan.
+        O(1): reads a running total kept up to date by every store method
+        that changes content, code or deleted status.
         Deleted artifacts do not count toward disk usage (Plan #57).
 
         Note: This queries by created_by (immutable creator), not
-        current controller.
+        current controller, so transfer_ownership() does not move usage.
+        Artifacts inserted into self.artifacts directly are counted after
+        rebuild_indexes().
         """
-        total = 0
-        artifact_ids = self._index_by_creator.get(creator, set())
-        for artifact_id in artifact_ids:
-            artifact = self.artifacts.get(artifact_id)
-            if artifact and not artifact.deleted:
-                total += self.get_artifact_size(artifact_id)
-        return total
+        return self._usage_by_creator.get(creator, 0)
 
     # Backwards compatibility alias (deprecated)
     def get_owner_usage(self, created_by: str) -> int:
         """Deprecated: Use get_creator_usage() instead."""
         return self.get_creator_usage(created_by)
 
+    @_locked
     def list_by_creator(self, creator: str) -> list[dict[str, Any]]:
         """List all artifacts created by a principal.
 
@@ -969,6 +1250,7 @@ class ArtifactStore:
         """Deprecated: Use list_by_creator() instead."""
         return self.list_by_creator(created_by)
 
+    @_locked
     def get_artifacts_by_creator(
         self, creator: str, include_deleted: bool = False
     ) -> list[str]:
@@ -1002,6 +1284,7 @@ class ArtifactStore:
         """Deprecated: Use get_artifacts_by_creator() instead."""
         return self.get_artifacts_by_creator(created_by, include_deleted)
 
+    @_locked
     def transfer_ownership(
         self, artifact_id: str, from_id: str, to_id: str
     ) -> bool:
@@ -1041,6 +1324,7 @@ class ArtifactStore:
         )
         return True
 
+    @_locked
     def write_artifact(
         self,
         artifact_id: str,
@@ -1122,6 +1406,7 @@ class ArtifactStore:
                 "data": {"artifact_id": artifact_id, "size": content_size, "type": artifact_type},
             }
 
+    @_locked
     def edit_artifact(
         self,
         artifact_id: str,
@@ -1173,28 +1458,206 @@ class ArtifactStore:
                 "data": {"artifact_id": artifact_id, "error": "no_change"},
             }
 
-        # Check for old_string in content
-        count = artifact.content.count(old_string)
-        if count == 0:
+        # Check for old_string in content. Two find() calls establish
+        # uniqueness without scanning the whole content for a full count;
+        # the count is only computed for the error message.
+        content = artifact.content
+        index = content.find(old_string)
+        if index == -1:
             return {
                 "success": False,
                 "message": f"old_string not found in artifact '{artifact_id}'",
                 "data": {"artifact_id": artifact_id, "error": "not_found_in_content"},
             }
 
-        if count > 1:
+        if content.find(old_string, index + 1) != -1:
+            count = content.count(old_string)
             return {
                 "success": False,
                 "message": f"old_string appears {count} times in artifact '{artifact_id}' (must be unique)",
                 "data": {"artifact_id": artifact_id, "error": "not_unique", "count": count},
             }
 
-        # Apply the edit
-        artifact.content = artifact.content.replace(old_string, new_string, 1)
+        # Apply the edit at the found position
+        artifact.content = content[:index] + new_string + content[index + len(old_string):]
         artifact.updated_at = datetime.now(timezone.utc).isoformat()
+        self._track_size(artifact)
 
         return {
             "success": True,
             "message": f"Edited artifact '{artifact_id}'",
             "data": {"artifact_id": artifact_id},
         }
+
+    # Incremental content operations: append, ranged write and JSON patch.
+    # Each checks the artifact like edit_artifact() and, when max_size_delta
+    # is given, refuses to grow content by more bytes than that.
+    def _get_editable(self, artifact_id: str) -> Artifact | WriteResult:
+        """Return the artifact if it can be edited, else an error result."""
+        artifact = self.get(artifact_id)
+        if artifact is None:
+            return {
+                "success": False,
+                "message": f"Artifact '{artifact_id}' not found",
+                "data": {"artifact_id": artifact_id, "error": "not_found"},
+            }
+        if artifact.deleted:
+            return {
+                "success": False,
+                "message": f"Artifact '{artifact_id}' has been deleted",
+                "data": {"artifact_id": artifact_id, "error": "deleted"},
+            }
+        return artifact
+
+    @staticmethod
+    def _size_delta_error(
+        artifact_id: str, size_delta: int, max_size_delta: int | float | None
+    ) -> WriteResult | None:
+        """Error result if size_delta exceeds max_size_delta, else None."""
+        if max_size_delta is None or size_delta <= 0 or size_delta <= max_size_delta:
+            return None
+        return {
+            "success": False,
+            "message": f"Disk quota exceeded: need {size_delta} bytes, have {max_size_delta} available",
+            "data": {
+                "artifact_id": artifact_id,
+                "error": "quota_exceeded",
+                "required": size_delta,
+                "available": max_size_delta,
+            },
+        }
+
+    def _set_content(self, artifact: Artifact, content: str, size_delta: int) -> WriteResult:
+        """Store new content for an incremental edit and build the success result.
+
+        The byte size and the creator's running total are shifted by
+        size_delta rather than re-encoded, so accounting costs O(change).
+        Falls back to _track_size() when the cached entry no longer matches
+        the artifact (content or code replaced behind the store's back).
+        """
+        entry = self._sizes.get(artifact.id)
+        old_content = artifact.content
+        artifact.content = content
+        artifact.updated_at = datetime.now(timezone.utc).isoformat()
+        if (
+            entry is not None
+            and entry[0] is old_content
+            and entry[1] is artifact.code
+            and isinstance(old_content, str)
+            and isinstance(artifact.code, str)
+            and entry[3] == artifact.created_by
+        ):
+            size = entry[2] + size_delta
+            counted = 0 if artifact.deleted else size
+            self._usage_by_creator[entry[3]] += counted - entry[4]
+            self._sizes[artifact.id] = (content, artifact.code, size, entry[3], counted)
+        else:
+            self._track_size(artifact)
+        return {
+            "success": True,
+            "message": f"Edited artifact '{artifact.id}'",
+            "data": {"artifact_id": artifact.id, "size_delta": size_delta},
+        }
+
+    @_locked
+    def append_artifact(
+        self,
+        artifact_id: str,
+        text: str,
+        max_size_delta: int | float | None = None,
+    ) -> WriteResult:
+        """Append text to an artifact's content.
+
+        Quota and size accounting cost O(len(text)) instead of a read and
+        full rewrite by the caller. Content is a plain str, so the store
+        still pays one O(len(content)) concatenation per append.
+
+        Errors: not_found, deleted, quota_exceeded
+        """
+        artifact = self._get_editable(artifact_id)
+        if not isinstance(artifact, Artifact):
+            return artifact
+        size_delta = len(text.encode("utf-8"))
+        error = self._size_delta_error(artifact_id, size_delta, max_size_delta)
+        if error is not None:
+            return error
+        return self._set_content(artifact, artifact.content + text, size_delta)
+
+    @_locked
+    def write_artifact_range(
+        self,
+        artifact_id: str,
+        start: int,
+        end: int,
+        text: str,
+        max_size_delta: int | float | None = None,
+    ) -> WriteResult:
+        """Replace content[start:end] (character offsets) with text.
+
+        start == end inserts; start == end == len(content) appends.
+
+        Errors: not_found, deleted, invalid_range, quota_exceeded
+        """
+        artifact = self._get_editable(artifact_id)
+        if not isinstance(artifact, Artifact):
+            return artifact
+        content = artifact.content
+        if not (isinstance(start, int) and isinstance(end, int) and 0 <= start <= end <= len(content)):
+            return {
+                "success": False,
+                "message": (
+                    f"Invalid range [{start}, {end}) for artifact '{artifact_id}' "
+                    f"(content length {len(content)})"
+                ),
+                "data": {"artifact_id": artifact_id, "error": "invalid_range", "length": len(content)},
+            }
+        size_delta = len(text.encode("utf-8")) - len(content[start:end].encode("utf-8"))
+        error = self._size_delta_error(artifact_id, size_delta, max_size_delta)
+        if error is not None:
+            return error
+        return self._set_content(artifact, content[:start] + text + content[end:], size_delta)
+
+    @_locked
+    def json_patch_artifact(
+        self,
+        artifact_id: str,
+        operations: list[dict[str, Any]],
+        max_size_delta: int | float | None = None,
+    ) -> WriteResult:
+        """Apply a JSON Patch (add/remove/replace/test) to JSON content.
+
+        Starts from the cached parse (see get_json_content()) and copies only
+        the containers on each operation's path. The patch is atomic.
+
+        Errors: not_found, deleted, invalid_json, invalid_patch, quota_exceeded
+        """
+        from .json_patch import JsonPatchError, apply_json_patch
+
+        artifact = self._get_editable(artifact_id)
+        if not isinstance(artifact, Artifact):
+            return artifact
+        old_content = artifact.content
+        document = self.get_json_content(artifact_id)
+        if document is None and old_content.strip() not in ("", "null"):
+            return {
+                "success": False,
+                "message": f"Artifact '{artifact_id}' content is not valid JSON",
+                "data": {"artifact_id": artifact_id, "error": "invalid_json"},
+            }
+        try:
+            patched = apply_json_patch(document, operations)
+        except JsonPatchError as e:
+            return {
+                "success": False,
+                "message": f"JSON patch failed for artifact '{artifact_id}': {e}",
+                "data": {"artifact_id": artifact_id, "error": "invalid_patch"},
+            }
+
+        new_content = json.dumps(patched, indent=2)
+        size_delta = len(new_content.encode("utf-8")) - len(old_content.encode("utf-8"))
+        error = self._size_delta_error(artifact_id, size_delta, max_size_delta)
+        if error is not None:
+            return error
+        result = self._set_content(artifact, new_content, size_delta)
+        self._parsed_content[artifact_id] = (new_content, patched)
+        return result
@@ -0,0 +1,178 @@
+"""Compiled-code cache shared by the executor, contracts and mint tasks.
+
+Hot artifacts and contracts are executed thousands of times per run, and
+every execution used to re-parse and re-compile the same source. This module
+keeps validated code objects in a content-hash-keyed LRU so repeat executions
+skip straight to exec().
+
+It also holds the frozen builtins templates used to build sandbox namespaces.
+Callers copy a template per execution (code may mutate its own builtins) but no
+longer rebuild it from vars(builtins) and re-filter it every time.
+
+Usage:
+    compiled = get_code_cache().compile(code, AGENT_CODE_FILENAME)
+    namespace = {"__builtins__": dict(AGENT_BUILTINS)}
+"""
+
+from __future__ import annotations
+
+import builtins
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from types import CodeType, MappingProxyType
+from typing import Any, Mapping
+
+logger = logging.getLogger(__name__)
+
+AGENT_CODE_FILENAME = "<agent_code>"
+CONTRACT_CODE_FILENAME = "<contract_code>"
+
+DEFAULT_CODE_CACHE_SIZE = 1024
+
+# Builtins removed from contract namespaces (contracts are permission logic,
+# not general-purpose code).
+CONTRACT_DANGEROUS_BUILTINS: frozenset[str] = frozenset({
+    'open', 'exec', 'eval', 'compile', '__import__',
+    'input', 'breakpoint', 'exit', 'quit',
+})
+
+# Frozen templates - copy with dict() before handing to executed code
+AGENT_BUILTINS: Mapping[str, Any] = MappingProxyType(dict(vars(builtins)))
+CONTRACT_BUILTINS: Mapping[str, Any] = MappingProxyType({
+    name: value
+    for name, value in vars(builtins).items()
+    if name not in CONTRACT_DANGEROUS_BUILTINS
+})
+
+# Cache key: (sha256 of source, filename)
+CodeKey = tuple[str, str]
+
+
+class CompiledCodeCache:
+    """Thread-safe LRU of compiled code objects keyed by source content hash.
+
+    Only successful compilations are cached; source that fails to compile
+    raises on every call, exactly as compile() does.
+
+    Thread safety: artifact iterations may run on the iteration pool's
+    threads, so the LRU bookkeeping is guarded by a lock. Compilation itself
+    happens outside the lock - two threads racing on the same new source may
+    both compile it, which is harmless.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CODE_CACHE_SIZE) -> None:
+        if max_entries < 0:
+            raise ValueError(f"max_entries must be non-negative, got {max_entries}")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CodeKey, CodeType] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key_for(code: str, filename: str) -> CodeKey:
+        """Return the cache key for a piece of source."""
+        return hashlib.sha256(code.encode("utf-8", "surrogatepass")).hexdigest(), filename
+
+    def compile(self, code: str, filename: str = AGENT_CODE_FILENAME) -> CodeType:
+        """Return a code object for source, compiling it on a cache miss.
+
+        Args:
+            code: Python source to compile in 'exec' mode
+            filename: Filename recorded in the code object (and tracebacks)
+
+        Returns:
+            Compiled code object (shared - code objects are immutable)
+
+        Raises:
+            SyntaxError, ValueError: Whatever compile() raises for bad source
+        """
+        key = self.key_for(code, filename)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = compile(code, filename, 'exec')
+
+        if self.max_entries == 0:
+            return compiled
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return compiled
+
+    def clear(self) -> None:
+        """Drop all cached code objects (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+_code_cache: CompiledCodeCache | None = None
+_code_cache_lock = threading.Lock()
+
+
+def _get_code_cache_size_from_config() -> int:
+    """Get code cache size from config, falling back to the default."""
+    try:
+        from src.config import get_validated_config
+        return get_validated_config().executor.code_cache_size
+    except Exception:  # exception-ok: config may be unavailable during startup/tests
+        logger.warning(
+            "Failed to load code_cache_size from config, using default %d",
+            DEFAULT_CODE_CACHE_SIZE,
+            exc_info=True,
+        )
+        return DEFAULT_CODE_CACHE_SIZE
+
+
+def get_code_cache() -> CompiledCodeCache:
+    """Return the process-wide compiled-code cache, creating it on first use."""
+    global _code_cache
+    if _code_cache is None:
+        with _code_cache_lock:
+            if _code_cache is None:
+                _code_cache = CompiledCodeCache(_get_code_cache_size_from_config())
+    return _code_cache
+
+
+def reset_code_cache() -> None:
+    """Discard the process-wide cache (next get_code_cache() re-reads config)."""
+    global _code_cache
+    with _code_cache_lock:
+        _code_cache = None
+
+
+__all__ = [
+    "AGENT_BUILTINS",
+    "AGENT_CODE_FILENAME",
+    "CONTRACT_BUILTINS",
+    "CONTRACT_CODE_FILENAME",
+    "CONTRACT_DANGEROUS_BUILTINS",
+    "CompiledCodeCache",
+    "get_code_cache",
+    "reset_code_cache",
+]
@@ -0,0 +1,432 @@
+"""Contract evaluation pool for executable contracts.
+
+Every permission check on an artifact guarded by an ExecutableContract used
+to compile the contract, build a fresh builtins dict and exec the module body
+before calling check_permission(), all under a SIGALRM timeout that only
+works on the main thread. Dynamic-access artifacts turned every read into a
+compile-and-exec, and checks from iteration-pool threads ran unbounded.
+
+ContractEvaluator instead:
+
+- Keeps the initialized namespace of each contract in an LRU keyed by
+  (contract_id, code hash). The module body runs once per contract version,
+  like an import; later checks call the already-defined check_permission().
+- Runs checks on a small set of daemon worker threads. The timeout is a
+  per-thread trace function that raises ContractTimeoutError inside runaway
+  contract code, backed by a bounded wait in the calling thread, so it works
+  from any thread.
+- Batches checks: concurrent checks for the same contract version that
+  arrive while a batch is still queued join it and run back to back on one
+  worker, behind a single namespace lookup.
+
+Limitations: module-level state in contract code persists between checks of
+the same contract version (as it would for an imported module). The trace
+function only fires on Python line and call events, so code that blocks in C
+(time.sleep), loops within a single line, or swallows the timeout exception
+is not interrupted; the caller still gets a timeout at its deadline, and the
+worker thread stays busy until the code returns.
+
+Usage:
+    result = get_contract_evaluator().call(contract_id, code, timeout, args)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from queue import SimpleQueue
+from types import FrameType
+from typing import Any, Callable, cast
+
+from .code_cache import CONTRACT_BUILTINS, CONTRACT_CODE_FILENAME, get_code_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTRACT_WORKERS = 4
+
+DEFAULT_CONTRACT_NAMESPACE_CACHE_SIZE = 256
+
+# Largest number of checks run back to back in one batch
+MAX_CONTRACT_BATCH_SIZE = 64
+
+# Modules available to contract code
+CONTRACT_ALLOWED_MODULES: dict[str, Any] = {
+    "math": math,
+    "json": json,
+    "random": random,
+    "time": time,
+}
+
+# Namespace key: (contract_id, sha256 of contract code)
+NamespaceKey = tuple[str, str]
+
+TraceFunc = Callable[[FrameType, str, Any], Any]
+
+
+class ContractExecutionError(Exception):
+    """Error during contract code execution."""
+    pass
+
+
+class ContractTimeoutError(Exception):
+    """Contract code execution timed out."""
+    pass
+
+
+def deadline_tracer(
+    deadline: float,
+    error: type[Exception] = ContractTimeoutError,
+    message: str = "Contract execution timed out",
+    filename: str | None = None,
+) -> TraceFunc:
+    """Trace function that raises error(message) once deadline passes.
+
+    Installed with sys.settrace() on one thread only, so it never affects
+    other threads (unlike SIGALRM, which is process-wide). With filename,
+    only frames of code compiled under that name are traced and interrupted;
+    the executor uses this to bound agent code off the main thread without
+    raising inside the kernel code it calls.
+    """
+    def trace(frame: FrameType, event: str, arg: Any) -> TraceFunc | None:
+        if filename is not None and frame.f_code.co_filename != filename:
+            return None
+        if time.monotonic() > deadline:
+            raise error(message)
+        return trace
+    return trace
+
+
+def _run_with_deadline(func: Callable[..., Any], args: tuple[Any, ...], timeout: float) -> Any:
+    """Call func(*args) on the current thread, interrupting it after timeout seconds."""
+    sys.settrace(deadline_tracer(time.monotonic() + timeout))
+    try:
+        return func(*args)
+    finally:
+        sys.settrace(None)
+
+
+@dataclass
+class _PendingCheck:
+    """One check_permission() call waiting for (or running on) a worker."""
+
+    args: tuple[Any, ...]
+    started: threading.Event = field(default_factory=threading.Event)
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+    cancelled: bool = False
+
+
+@dataclass
+class _Batch:
+    """Checks for one contract version, run back to back on one worker."""
+
+    key: NamespaceKey
+    code: str
+    timeout: float
+    checks: list[_PendingCheck] = field(default_factory=list)
+
+
+class ContractEvaluator:
+    """Evaluates executable contract checks with cached namespaces and timeouts.
+
+    Thread safety: namespaces, the pending-batch table and counters are
+    guarded by one lock. Contract code itself runs outside the lock, on
+    worker threads; the calling thread only waits.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_CONTRACT_WORKERS,
+        max_namespaces: int = DEFAULT_CONTRACT_NAMESPACE_CACHE_SIZE,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        if max_namespaces < 0:
+            raise ValueError(f"max_namespaces must be non-negative, got {max_namespaces}")
+        self.max_workers = max_workers
+        self.max_namespaces = max_namespaces
+        self._namespaces: OrderedDict[NamespaceKey, Callable[..., Any]] = OrderedDict()
+        self._pending: dict[NamespaceKey, _Batch] = {}
+        self._queue: SimpleQueue[_Batch | None] = SimpleQueue()
+        self._workers: list[threading.Thread] = []
+        self._idle_workers = 0
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self.checks = 0
+        self.batches = 0
+        self.batched_checks = 0
+        self.timeouts = 0
+        self.namespace_hits = 0
+        self.namespace_misses = 0
+        self.namespace_evictions = 0
+
+    def call(
+        self,
+        contract_id: str,
+        code: str,
+        timeout: float,
+        args: tuple[Any, ...],
+    ) -> Any:
+        """Call the contract's check_permission(*args) and return its result.
+
+        Waits at most 2 * timeout seconds for a worker to start the check
+        (queueing plus running the module body on a namespace miss) and at
+        most timeout seconds for the check itself.
+
+        Args:
+            contract_id: Contract identifier (namespace cache key)
+            code: Contract source defining check_permission()
+            timeout: Seconds allowed for the module body and for the call
+            args: Positional arguments for check_permission()
+
+        Returns:
+            Whatever check_permission() returned
+
+        Raises:
+            ContractExecutionError: The module body failed or did not define a
+                callable check_permission (message is the reason to report)
+            ContractTimeoutError: The check did not finish in time
+            Exception: Whatever check_permission() raised
+        """
+        key = (contract_id, get_code_cache().key_for(code, CONTRACT_CODE_FILENAME)[0])
+        check = _PendingCheck(args)
+        self._submit(key, code, timeout, check)
+
+        if not check.started.wait(2 * timeout):
+            with self._lock:
+                if not check.started.is_set():
+                    check.cancelled = True
+                    self.timeouts += 1
+                    raise ContractTimeoutError("Contract check was not started in time")
+        if not check.done.wait(timeout):
+            with self._lock:
+                self.timeouts += 1
+            raise ContractTimeoutError("Contract execution timed out")
+
+        if check.error is not None:
+            if isinstance(check.error, ContractTimeoutError):
+                with self._lock:
+                    self.timeouts += 1
+            raise check.error
+        return check.result
+
+    def _submit(self, key: NamespaceKey, code: str, timeout: float, check: _PendingCheck) -> None:
+        """Add a check to the queued batch for its contract, or queue a new batch."""
+        with self._lock:
+            if self._shutdown:
+                raise ContractExecutionError("Contract evaluator is shut down")
+            self.checks += 1
+            batch = self._pending.get(key)
+            if (
+                batch is not None
+                and batch.timeout == timeout
+                and len(batch.checks) < MAX_CONTRACT_BATCH_SIZE
+            ):
+                batch.checks.append(check)
+                self.batched_checks += 1
+                return
+            batch = _Batch(key, code, timeout, [check])
+            self._pending[key] = batch
+            self.batches += 1
+            if self._idle_workers == 0 and len(self._workers) < self.max_workers:
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"contract-eval-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+        self._queue.put(batch)
+
+    def _worker_loop(self) -> None:
+        """Run queued batches until shutdown."""
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+            batch = self._queue.get()
+            with self._lock:
+                self._idle_workers -= 1
+            if batch is None:
+                return
+            try:
+                self._run_batch(batch)
+            except BaseException as e:  # exception-ok: never leave callers waiting
+                logger.exception("Contract batch for %s failed", batch.key[0])
+                for check in batch.checks:
+                    if not check.done.is_set():
+                        check.error = e
+                        check.started.set()
+                        check.done.set()
+
+    def _run_batch(self, batch: _Batch) -> None:
+        """Load the contract namespace once, then run each check in the batch."""
+        with self._lock:
+            # Close the batch: later checks for this contract start a new one
+            if self._pending.get(batch.key) is batch:
+                del self._pending[batch.key]
+
+        try:
+            check_func = self._get_check_function(batch.key, batch.code, batch.timeout)
+        except ContractExecutionError as e:
+            for check in batch.checks:
+                check.error = e
+                check.started.set()
+                check.done.set()
+            return
+
+        for check in batch.checks:
+            with self._lock:
+                if check.cancelled:
+                    continue
+                check.started.set()
+            try:
+                check.result = _run_with_deadline(check_func, check.args, batch.timeout)
+            except BaseException as e:  # exception-ok: contract is user code
+                check.error = e
+            check.done.set()
+
+    def _get_check_function(self, key: NamespaceKey, code: str, timeout: float) -> Callable[..., Any]:
+        """Return check_permission from the contract's namespace, running the module on a miss."""
+        with self._lock:
+            check_func = self._namespaces.get(key)
+            if check_func is not None:
+                self._namespaces.move_to_end(key)
+                self.namespace_hits += 1
+                return check_func
+            self.namespace_misses += 1
+
+        try:
+            compiled = get_code_cache().compile(code, CONTRACT_CODE_FILENAME)
+        except SyntaxError as e:
+            raise ContractExecutionError(f"Syntax error in contract code: {e}") from e
+        except Exception as e:  # exception-ok: contract is user code
+            raise ContractExecutionError(f"Contract code compilation failed: {e}") from e
+
+        # Dangerous builtins like open/exec/__import__ are already removed
+        namespace: dict[str, Any] = {
+            "__builtins__": dict(CONTRACT_BUILTINS),
+            "__name__": "__contract__",
+        }
+        namespace.update(CONTRACT_ALLOWED_MODULES)
+        try:
+            _run_with_deadline(exec, (compiled, namespace), timeout)
+        except ContractTimeoutError as e:
+            raise ContractExecutionError("Contract code definition timed out") from e
+        except Exception as e:  # exception-ok: contract is user code
+            raise ContractExecutionError(
+                f"Contract code execution error: {type(e).__name__}: {e}"
+            ) from e
+
+        if "check_permission" not in namespace:
+            raise ContractExecutionError("Contract code did not define check_permission() function")
+        check_func = cast(Callable[..., Any], namespace["check_permission"])
+        if not callable(check_func):
+            raise ContractExecutionError("check_permission is not callable")
+
+        if self.max_namespaces == 0:
+            return check_func
+        with self._lock:
+            self._namespaces[key] = check_func
+            self._namespaces.move_to_end(key)
+            while len(self._namespaces) > self.max_namespaces:
+                self._namespaces.popitem(last=False)
+                self.namespace_evictions += 1
+        return check_func
+
+    def invalidate(self, contract_id: str) -> int:
+        """Drop cached namespaces for a contract. Returns how many were dropped."""
+        with self._lock:
+            stale = [key for key in self._namespaces if key[0] == contract_id]
+            for key in stale:
+                del self._namespaces[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached namespaces (counters are kept)."""
+        with self._lock:
+            self._namespaces.clear()
+
+    def shutdown(self) -> None:
+        """Stop idle workers once queued batches are done; new checks are rejected."""
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            workers = len(self._workers)
+        for _ in range(workers):
+            self._queue.put(None)
+
+    def stats(self) -> dict[str, int]:
+        """Return check/batch/timeout counters and namespace cache counters."""
+        with self._lock:
+            return {
+                "checks": self.checks,
+                "batches": self.batches,
+                "batched_checks": self.batched_checks,
+                "timeouts": self.timeouts,
+                "namespace_hits": self.namespace_hits,
+                "namespace_misses": self.namespace_misses,
+                "namespace_evictions": self.namespace_evictions,
+                "namespaces": len(self._namespaces),
+                "max_namespaces": self.max_namespaces,
+                "workers": len(self._workers),
+                "max_workers": self.max_workers,
+            }
+
+
+_contract_evaluator: ContractEvaluator | None = None
+_contract_evaluator_lock = threading.Lock()
+
+
+def _get_evaluator_config() -> tuple[int, int]:
+    """Get (contract_workers, contract_namespace_cache_size) from config, with defaults."""
+    try:
+        from src.config import get_validated_config
+        executor_config = get_validated_config().executor
+        return executor_config.contract_workers, executor_config.contract_namespace_cache_size
+    except Exception:  # exception-ok: config may be unavailable during startup/tests
+        logger.warning(
+            "Failed to load contract evaluator config, using defaults (%d workers, %d namespaces)",
+            DEFAULT_CONTRACT_WORKERS,
+            DEFAULT_CONTRACT_NAMESPACE_CACHE_SIZE,
+            exc_info=True,
+        )
+        return DEFAULT_CONTRACT_WORKERS, DEFAULT_CONTRACT_NAMESPACE_CACHE_SIZE
+
+
+def get_contract_evaluator() -> ContractEvaluator:
+    """Return the process-wide contract evaluator, creating it on first use."""
+    global _contract_evaluator
+    if _contract_evaluator is None:
+        with _contract_evaluator_lock:
+            if _contract_evaluator is None:
+                _contract_evaluator = ContractEvaluator(*_get_evaluator_config())
+    return _contract_evaluator
+
+
+def reset_contract_evaluator() -> None:
+    """Shut down the process-wide evaluator (next use re-reads config)."""
+    global _contract_evaluator
+    with _contract_evaluator_lock:
+        if _contract_evaluator is not None:
+            _contract_evaluator.shutdown()
+        _contract_evaluator = None
+
+
+__all__ = [
+    "CONTRACT_ALLOWED_MODULES",
+    "ContractEvaluator",
+    "ContractExecutionError",
+    "ContractTimeoutError",
+    "deadline_tracer",
+    "get_contract_evaluator",
+    "reset_contract_evaluator",
+]
@@ -7,6 +7,9 @@ This module defines the core interfaces for contract-based access control:
 - ExecutableContract: A contract with executable code for dynamic permission logic
 - ReadOnlyLedger: A read-only wrapper for ledger access in contract code
 
+Executable contract code runs on the ContractEvaluator (contract_pool.py),
+which caches initialized contract namespaces and enforces timeouts.
+
 Contracts replace inline policy dictionaries. Instead of storing access rules
 directly in artifacts, artifacts reference a contract by ID. The contract's
 check_permission() method determines whether an action is allowed.
@@ -32,19 +35,24 @@ See also:
 # --- GOVERNANCE END ---
 from __future__ import annotations
 
-import builtins
+import hashlib
+import heapq
 import json
 import logging
-import math
-import random
-import signal
+import threading
 import time as time_module
-from contextlib import contextmanager
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from types import FrameType
-from typing import Any, Generator, Optional, Protocol, TYPE_CHECKING, runtime_checkable
+from typing import Any, Optional, Protocol, TYPE_CHECKING, runtime_checkable
+
+from .code_cache import CONTRACT_CODE_FILENAME, get_code_cache
+from .contract_pool import (
+    ContractExecutionError,
+    ContractTimeoutError,
+    get_contract_evaluator,
+)
 
 if TYPE_CHECKING:
     from .ledger import Ledger
@@ -228,63 +236,88 @@ class ReadOnlyLedger:
         return self._ledger.principal_exists(principal_id)
 
 
-class ContractExecutionError(Exception):
-    """Error during contract code execution."""
-    pass
+# Cache key: (artifact_id, action, requester_id, contract_version, context_version)
+# contract_version is a content hash of the contract code and context_version
+# a hash of everything the contract is shown about the target (state,
+# metadata, method, args), so rewriting either makes old entries unreachable.
+CacheKey = tuple[str, ...]
 
+DEFAULT_PERMISSION_CACHE_SIZE = 10000
 
-class ContractTimeoutError(Exception):
-    """Contract code execution timed out."""
-    pass
+# Minimum seconds between expiry sweeps
+PERMISSION_CACHE_SWEEP_INTERVAL = 1.0
 
 
-# Type alias for cache key: (artifact_id, action, requester_id, contract_version)
-CacheKey = tuple[str, str, str, str]
+def context_version(context: dict[str, object]) -> str:
+    """Content hash of a permission-check context, for cache keys."""
+    encoded = json.dumps(context, sort_keys=True, default=repr)
+    return hashlib.sha256(encoded.encode("utf-8", "surrogatepass")).hexdigest()
 
 
 class PermissionCache:
-    """TTL-based cache for permission check results.
+    """LRU cache for permission check results with per-entry TTL.
 
     Per Plan #100 Phase 2:
     - Caching is opt-in via contract field `cache_policy: {ttl_seconds: N}`
     - No caching by default
-    - Cache key: (artifact_id, action, requester_id, contract_version)
+    - Cache key: (artifact_id, action, requester_id, contract_version, context_version)
 
-    Threading note: This cache assumes single-threaded async operation (the default).
-    The system uses asyncio with agents running as coroutines in one event loop thread.
-    Dictionary operations between await points are atomic in this model. If the optional
-    worker pool (use_worker_pool=true) is enabled, this cache would need thread locks.
-    Since worker pool is experimental and disabled by default, no locks are added here.
+    At most max_entries results are kept; the least recently used entry is
+    evicted first. Expired entries are removed by a sweep (driven by an
+    expiry heap) that runs at most once per PERMISSION_CACHE_SWEEP_INTERVAL
+    on get/put, so entries that are never read again do not accumulate.
+    invalidate() drops every entry for a target artifact when it is written.
+
+    Thread safety: contracts may be checked from the iteration pool's
+    threads, so all bookkeeping is guarded by a lock (like CompiledCodeCache).
 
     Attributes:
-        _cache: Dict mapping cache keys to (result, expiry_time) tuples
+        _entries: LRU-ordered map of cache keys to (result, expiry_time)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_entries: int = DEFAULT_PERMISSION_CACHE_SIZE) -> None:
         """Initialize empty permission cache."""
-        self._cache: dict[CacheKey, tuple[PermissionResult, float]] = {}
+        if max_entries < 0:
+            raise ValueError(f"max_entries must be non-negative, got {max_entries}")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, tuple[PermissionResult, float]] = OrderedDict()
+        # (expiry_time, key); may hold stale pairs for overwritten/evicted keys
+        self._expiry_heap: list[tuple[float, CacheKey]] = []
+        # artifact_id -> keys of entries for that target
+        self._by_artifact: dict[str, set[CacheKey]] = {}
+        self._next_sweep = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
 
     def get(self, key: CacheKey) -> Optional[PermissionResult]:
         """Get cached permission result if not expired.
 
         Args:
-            key: Cache key tuple (artifact_id, action, requester_id, contract_version)
+            key: Cache key tuple (artifact_id, action, requester_id, contract_version, ...)
 
         Returns:
             Cached PermissionResult if found and not expired, None otherwise
         """
-        if key not in self._cache:
-            return None
-
-        result, expiry_time = self._cache[key]
-        current_time = time_module.time()
-
-        if current_time >= expiry_time:
-            # Entry expired, remove it
-            del self._cache[key]
-            return None
-
-        return result
+        now = time_module.time()
+        with self._lock:
+            self._sweep(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            result, expiry_time = entry
+            if now >= expiry_time:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
 
     def put(
         self,
@@ -295,69 +328,92 @@ class PermissionCache:
         """Store permission result in cache with TTL.
 
         Args:
-            key: Cache key tuple (artifact_id, action, requester_id, contract_version)
+            key: Cache key tuple (artifact_id, action, requester_id, contract_version, ...)
             result: PermissionResult to cache
             ttl_seconds: Time-to-live in seconds
         """
-        expiry_time = time_module.time() + ttl_seconds
-        self._cache[key] = (result, expiry_time)
+        if self.max_entries == 0:
+            return
+        now = time_module.time()
+        expiry_time = now + ttl_seconds
+        with self._lock:
+            self._sweep(now)
+            self._entries[key] = (result, expiry_time)
+            self._entries.move_to_end(key)
+            self._by_artifact.setdefault(key[0], set()).add(key)
+            heapq.heappush(self._expiry_heap, (expiry_time, key))
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+            # Drop stale heap pairs once they dominate the heap
+            if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+                self._expiry_heap = [(exp, k) for k, (_, exp) in self._entries.items()]
+                heapq.heapify(self._expiry_heap)
+
+    def _remove(self, key: CacheKey) -> None:
+        del self._entries[key]
+        keys = self._by_artifact.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_artifact[key[0]]
+
+    def _sweep(self, now: float) -> None:
+        """Remove expired entries (caller holds the lock)."""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + PERMISSION_CACHE_SWEEP_INTERVAL
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry_time, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == expiry_time:
+                self._remove(key)
+                self.expirations += 1
+
+    def sweep(self) -> None:
+        """Remove all expired entries now."""
+        with self._lock:
+            self._next_sweep = 0.0
+            self._sweep(time_module.time())
+
+    def invalidate(self, artifact_id: str) -> int:
+        """Drop all cached results for a target artifact.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = self._by_artifact.pop(artifact_id, set())
+            for key in keys:
+                self._entries.pop(key, None)
+            self.invalidations += len(keys)
+            return len(keys)
 
     def clear(self) -> None:
-        """Remove all entries from cache."""
-        self._cache.clear()
+        """Remove all entries from cache (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._expiry_heap.clear()
+            self._by_artifact.clear()
 
     def size(self) -> int:
-        """Return number of entries in cache (including expired)."""
-        return len(self._cache)
-
-
-def _contract_timeout_handler(signum: int, frame: FrameType | None) -> None:
-    """Signal handler for contract execution timeout."""
-    raise ContractTimeoutError("Contract execution timed out")
-
-
-@contextmanager
-def _contract_timeout_context(timeout: int) -> Generator[None, None, None]:
-    """Context manager for contract code execution timeout.
-
-    On Windows/platforms without signal.alarm, silently does nothing.
-    Properly restores the previous signal handler on exit.
-
-    Args:
-        timeout: Timeout in seconds
-
-    Yields:
-        None - just provides timeout protection for the block
-
-    Raises:
-        ContractTimeoutError: If the block takes longer than timeout seconds
-    """
-    old_handler: Any = None
-    try:
-        old_handler = signal.signal(signal.SIGALRM, _contract_timeout_handler)
-        signal.alarm(timeout)
-    except (ValueError, AttributeError):
-        # signal.alarm not available (Windows) - skip timeout
-        pass
-
-    try:
-        yield
-    finally:
-        try:
-            signal.alarm(0)
-            if old_handler:
-                signal.signal(signal.SIGALRM, old_handler)
-        except (ValueError, AttributeError):
-            pass
-
-
-# Modules available to contract code
-CONTRACT_ALLOWED_MODULES: dict[str, Any] = {
-    "math": math,
-    "json": json,
-    "random": random,
-    "time": time_module,
-}
+        """Return number of entries in cache (including not yet swept expired ones)."""
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/eviction/expiration/invalidation counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
 
 
 def _get_contract_timeout_from_config() -> int:
@@ -456,6 +512,11 @@ def check_permission(caller, action, target, context, ledger):
             else:
                 self.timeout = _get_contract_timeout_from_config()
 
+    @property
+    def version(self) -> str:
+        """Content hash of the contract code (part of permission cache keys)."""
+        return get_code_cache().key_for(self.code, CONTRACT_CODE_FILENAME)[0]
+
     def _validate_code(self) -> tuple[bool, str]:
         """Validate that code can be compiled and has check_permission function.
 
@@ -469,9 +530,9 @@ def check_permission(caller, action, target, context, ledger):
         if "def check_permission(" not in self.code:
             return False, "Contract code must define a check_permission() function"
 
-        # Try to compile
+        # Try to compile (cached by content hash)
         try:
-            compile(self.code, '<contract_code>', 'exec')
+            get_code_cache().compile(self.code, CONTRACT_CODE_FILENAME)
             return True, ""
         except SyntaxError as e:
             return False, f"Syntax error in contract code: {e}"
@@ -488,6 +549,10 @@ def check_permission(caller, action, target, context, ledger):
     ) -> PermissionResult:
         """Execute the contract code in a sandboxed environment.
 
+        The check runs on the process-wide ContractEvaluator, which reuses
+        the contract's initialized namespace and enforces the timeout from
+        any thread.
+
         Args:
             caller: Principal requesting access
             action: Action being attempted
@@ -506,65 +571,6 @@ def check_permission(caller, action, target, context, ledger):
                 reason=f"Invalid contract code: {error}"
             )
 
-        # Compile the code
-        try:
-            compiled = compile(self.code, '<contract_code>', 'exec')
-        except Exception as e:
-            return PermissionResult(  # exception-ok: contract is user code
-                allowed=False,
-                reason=f"Contract compilation failed: {e}"
-            )
-
-        # Build controlled globals with safe builtins
-        controlled_builtins = dict(vars(builtins))
-        # Remove potentially dangerous builtins
-        dangerous_builtins = [
-            'open', 'exec', 'eval', 'compile', '__import__',
-            'input', 'breakpoint', 'exit', 'quit'
-        ]
-        for name in dangerous_builtins:
-            controlled_builtins.pop(name, None)
-
-        controlled_globals: dict[str, Any] = {
-            "__builtins__": controlled_builtins,
-            "__name__": "__contract__",
-        }
-
-        # Add allowed modules
-        for name, module in CONTRACT_ALLOWED_MODULES.items():
-            controlled_globals[name] = module
-
-        # Execute the code definition (creates the check_permission function)
-        # Note: self.timeout is always set after __post_init__, but mypy doesn't know
-        effective_timeout = self.timeout if self.timeout is not None else 5
-        try:
-            with _contract_timeout_context(effective_timeout):
-                exec(compiled, controlled_globals)
-        except ContractTimeoutError:
-            return PermissionResult(
-                allowed=False,
-                reason="Contract code definition timed out"
-            )
-        except Exception as e:
-            return PermissionResult(  # exception-ok: contract is user code
-                allowed=False,
-                reason=f"Contract code execution error: {type(e).__name__}: {e}"
-            )
-
-        # Check that check_permission was defined
-        if "check_permission" not in controlled_globals:
-            return PermissionResult(
-                allowed=False,
-                reason="Contract code did not define check_permission() function"
-            )
-
-        check_func = controlled_globals["check_permission"]
-        if not callable(check_func):
-            return PermissionResult(
-                allowed=False,
-                reason="check_permission is not callable"
-            )
-
         # Prepare arguments for check_permission
         action_str = action.value if isinstance(action, PermissionAction) else str(action)
         # Map kernel action names to agent-facing names.
@@ -579,10 +585,19 @@ def check_permission(caller, action, target, context, ledger):
         ctx = context if context else {}
         readonly_ledger = ReadOnlyLedger(ledger) if ledger else None
 
-        # Call check_permission with contract context
+        # Call check_permission on the contract evaluator: the namespace is
+        # built once per contract version, the call runs on a worker thread
+        # Note: self.timeout is always set after __post_init__, but mypy doesn't know
+        effective_timeout = self.timeout if self.timeout is not None else 5
         try:
-            with _contract_timeout_context(effective_timeout):
-                result = check_func(caller, action_str, target, ctx, readonly_ledger)
+            result = get_contract_evaluator().call(
+                self.contract_id,
+                self.code,
+                effective_timeout,
+                (caller, action_str, target, ctx, readonly_ledger),
+            )
+        except ContractExecutionError as e:
+            return PermissionResult(allowed=False, reason=str(e))
         except ContractTimeoutError:
             return PermissionResult(
                 allowed=False,
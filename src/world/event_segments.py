@@ -0,0 +1,349 @@
+"""Segment rotation and offset index for the JSONL event log.
+
+With logging.segments.enabled, EventLogger rotates events.jsonl once it
+reaches max_segment_bytes: the full file is renamed to a numbered sealed
+segment and a fresh events.jsonl is started. The active segment is therefore
+always events.jsonl, and the complete history is the sealed segments in
+number order followed by it:
+
+    logs/{run_id}/events.000000.jsonl   sealed
+    logs/{run_id}/events.000001.jsonl   sealed
+    logs/{run_id}/events.jsonl          active
+    logs/{run_id}/events.index.jsonl    sidecar index
+
+The sidecar index is append-only JSONL with two record kinds:
+
+    {"kind": "offset", "segment": 1, "sequence": 4097, "offset": 1048210}
+        Byte offset of an event, written every index_interval events. Sealing
+        renames the file, so offsets stay valid for the sealed segment.
+    {"kind": "segment", "segment": 1, "file": "events.000001.jsonl",
+     "first_sequence": 4001, "last_sequence": 8113, "bytes": 67108100,
+     "event_counts": {"action": 1200, ...}}
+        Written when a segment is sealed.
+
+EventLogIndex reads the index so tools can seek to a sequence range or skip
+segments without the wanted event types instead of scanning from byte 0.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+
+def sealed_segment_path(path: Path, segment: int) -> Path:
+    """Return the sealed file name for a segment of the log at path."""
+    return path.with_name(f"{path.stem}.{segment:06d}{path.suffix}")
+
+
+def index_path(path: Path) -> Path:
+    """Return the sidecar index path for the log at path."""
+    return path.with_name(f"{path.stem}.index{path.suffix}")
+
+
+def _segment_pattern(path: Path) -> re.Pattern[str]:
+    return re.compile(rf"^{re.escape(path.stem)}\.(\d+){re.escape(path.suffix)}$")
+
+
+def list_sealed_segments(path: Path) -> list[Path]:
+    """Return the sealed segments of the log at path, oldest first."""
+    pattern = _segment_pattern(path)
+    numbered: list[tuple[int, Path]] = []
+    try:
+        entries = os.listdir(path.parent)
+    except FileNotFoundError:
+        return []
+    for name in entries:
+        match = pattern.match(name)
+        if match:
+            numbered.append((int(match.group(1)), path.parent / name))
+    return [p for _, p in sorted(numbered)]
+
+
+def remove_segments(path: Path) -> None:
+    """Delete sealed segments and the index of the log at path (new run)."""
+    for segment in list_sealed_segments(path):
+        segment.unlink(missing_ok=True)
+    index_path(path).unlink(missing_ok=True)
+
+
+def iter_log_files(path: Path) -> list[Path]:
+    """Return every file of the log at path in event order (sealed, then active)."""
+    files = list_sealed_segments(path)
+    if path.exists():
+        files.append(path)
+    return files
+
+
+def _iter_file_events(path: Path, offset: int = 0) -> Iterator[dict[str, Any]]:
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        f.seek(offset)
+        for line in f:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partial trailing line of a live log
+
+
+def iter_event_log(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield every event of the log at path, across all segments, in order."""
+    for file in iter_log_files(path):
+        yield from _iter_file_events(file)
+
+
+class SegmentIndexWriter:
+    """Writer-side bookkeeping for rotation and the sidecar index.
+
+    Used by EventLogger's writer under its lock. Offsets are logical: they
+    count bytes handed to the writer, including events still sitting in a
+    batch buffer, which is where they will land once flushed. Index records
+    are queued and only appended by flush_index(), which the writer calls
+    right after the corresponding event bytes reach the file.
+    """
+
+    def __init__(self, path: Path, max_segment_bytes: int, index_interval: int) -> None:
+        self.path = path
+        self.max_segment_bytes = max_segment_bytes
+        self.index_interval = index_interval
+        self.segment = 0
+        self.offset = 0
+        self.first_sequence: int | None = None
+        self.last_sequence: int | None = None
+        self.event_counts: Counter[str] = Counter()
+        self._events_in_segment = 0
+        self._pending: list[bytes] = []
+        self._index_handle: IO[bytes] | None = None
+
+    def should_rotate(self, line_bytes: int) -> bool:
+        """Whether the active segment must be sealed before the next line."""
+        return self.offset > 0 and self.offset + line_bytes > self.max_segment_bytes
+
+    def record(self, sequence: int, event_type: str, line_bytes: int) -> None:
+        """Account for one event about to be written to the active segment."""
+        if self._events_in_segment % self.index_interval == 0:
+            self._queue({
+                "kind": "offset",
+                "segment": self.segment,
+                "sequence": sequence,
+                "offset": self.offset,
+            })
+        if self.first_sequence is None:
+            self.first_sequence = sequence
+        self.last_sequence = sequence
+        self.event_counts[event_type] += 1
+        self._events_in_segment += 1
+        self.offset += line_bytes
+
+    def seal(self) -> None:
+        """Rename the (flushed, closed) active segment and start a new one."""
+        sealed = sealed_segment_path(self.path, self.segment)
+        os.replace(self.path, sealed)
+        self._queue({
+            "kind": "segment",
+            "segment": self.segment,
+            "file": sealed.name,
+            "first_sequence": self.first_sequence,
+            "last_sequence": self.last_sequence,
+            "bytes": self.offset,
+            "event_counts": dict(self.event_counts),
+        })
+        self.flush_index()
+        self.segment += 1
+        self.offset = 0
+        self.first_sequence = None
+        self.last_sequence = None
+        self.event_counts = Counter()
+        self._events_in_segment = 0
+
+    def _queue(self, record: dict[str, Any]) -> None:
+        self._pending.append((json.dumps(record) + "\n").encode("utf-8"))
+
+    def flush_index(self) -> None:
+        """Append queued index records to the sidecar file."""
+        if not self._pending:
+            return
+        if self._index_handle is None:
+            self._index_handle = open(index_path(self.path), "ab")
+        self._index_handle.write(b"".join(self._pending))
+        self._index_handle.flush()
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush queued records and close the index handle."""
+        self.flush_index()
+        if self._index_handle is not None:
+            self._index_handle.close()
+            self._index_handle = None
+
+
+@dataclass
+class SegmentInfo:
+    """A sealed segment as recorded in the index."""
+
+    segment: int
+    path: Path
+    first_sequence: int | None
+    last_sequence: int | None
+    size_bytes: int
+    event_counts: dict[str, int] = field(default_factory=dict)
+
+
+class EventLogIndex:
+    """Read-side view of a segmented event log and its sidecar index.
+
+    Works on unsegmented logs too (no sealed segments, no index): every query
+    then degrades to a scan of events.jsonl, which is what tools did before.
+
+    Usage:
+        index = EventLogIndex.load(Path("logs/latest/events.jsonl"))
+        for event in index.iter_events(start_sequence=5000, end_sequence=5100):
+            ...
+        for event in index.iter_events(event_types={"mint_auction_resolved"}):
+            ...
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        segments: list[SegmentInfo],
+        offsets: dict[int, list[tuple[int, int]]],
+    ) -> None:
+        self.path = path
+        self.segments = segments
+        self._offsets = offsets
+
+    @classmethod
+    def load(cls, path: str | Path) -> "EventLogIndex":
+        """Load the index for the log at path (the active events.jsonl)."""
+        log_path = Path(path)
+        segments: dict[int, SegmentInfo] = {}
+        offsets: dict[int, list[tuple[int, int]]] = {}
+        try:
+            with open(index_path(log_path), "rb") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Partial trailing record of a live index
+                    if record.get("kind") == "offset":
+                        offsets.setdefault(record["segment"], []).append(
+                            (record["sequence"], record["offset"])
+                        )
+                    elif record.get("kind") == "segment":
+                        segments[record["segment"]] = SegmentInfo(
+                            segment=record["segment"],
+                            path=log_path.parent / record["file"],
+                            first_sequence=record.get("first_sequence"),
+                            last_sequence=record.get("last_sequence"),
+                            size_bytes=record.get("bytes", 0),
+                            event_counts=record.get("event_counts", {}),
+                        )
+        except FileNotFoundError:
+            pass
+        for entries in offsets.values():
+            entries.sort()
+        return cls(log_path, [segments[n] for n in sorted(segments)], offsets)
+
+    @property
+    def active_segment(self) -> int:
+        """Segment number of the active events.jsonl."""
+        return self.segments[-1].segment + 1 if self.segments else 0
+
+    def _file_for(self, segment: int) -> Path:
+        for info in self.segments:
+            if info.segment == segment:
+                return info.path
+        return self.path
+
+    def locate(self, sequence: int) -> tuple[Path, int]:
+        """Return (file, byte offset) to start scanning for a sequence.
+
+        The offset is that of the nearest indexed event at or before the
+        sequence, so at most index_interval - 1 events precede it.
+        """
+        segment = self.active_segment
+        for info in self.segments:
+            if info.last_sequence is not None and sequence <= info.last_sequence:
+                segment = info.segment
+                break
+        offset = 0
+        for entry_sequence, entry_offset in self._offsets.get(segment, []):
+            if entry_sequence > sequence:
+                break
+            offset = entry_offset
+        return self._file_for(segment), offset
+
+    def iter_events(
+        self,
+        start_sequence: int | None = None,
+        end_sequence: int | None = None,
+        event_types: Iterable[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield events in order, seeking past everything before start_sequence.
+
+        Args:
+            start_sequence: First sequence to yield (inclusive)
+            end_sequence: Last sequence to yield (inclusive)
+            event_types: Only yield these event types; sealed segments whose
+                counts contain none of them are skipped without reading
+        """
+        wanted = set(event_types) if event_types is not None else None
+        start_file, start_offset = (
+            self.locate(start_sequence) if start_sequence is not None else (None, 0)
+        )
+        files: list[tuple[Path, dict[str, int] | None]] = [
+            (info.path, info.event_counts) for info in self.segments
+        ]
+        files.append((self.path, None))
+
+        started = start_file is None
+        for file, counts in files:
+            offset = 0
+            if not started:
+                if file != start_file:
+                    continue
+                started = True
+                offset = start_offset
+            if wanted is not None and counts is not None and not wanted & counts.keys():
+                continue
+            for event in _iter_file_events(file, offset):
+                sequence = event.get("sequence", 0)
+                if start_sequence is not None and sequence < start_sequence:
+                    continue
+                if end_sequence is not None and sequence > end_sequence:
+                    return
+                if wanted is None or event.get("event_type") in wanted:
+                    yield event
+
+    def event_type_counts(self, include_active: bool = True) -> dict[str, int]:
+        """Return event counts by type from the index (plus a scan of the active segment)."""
+        totals: Counter[str] = Counter()
+        for info in self.segments:
+            totals.update(info.event_counts)
+        if include_active:
+            for event in _iter_file_events(self.path):
+                totals[event.get("event_type", "")] += 1
+        return dict(totals)
+
+
+__all__ = [
+    "EventLogIndex",
+    "SegmentIndexWriter",
+    "SegmentInfo",
+    "index_path",
+    "iter_event_log",
+    "iter_log_files",
+    "list_sealed_segments",
+    "remove_segments",
+    "sealed_segment_path",
+]
@@ -20,22 +20,17 @@ import math
 import random
 import signal
 import sys
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from types import FrameType, ModuleType
-from typing import Any, Callable, Generator, TypedDict
+from types import CodeType, FrameType, MappingProxyType, ModuleType
+from typing import Any, Callable, Generator, Mapping, TypedDict
 
 from ..config import get, get_validated_config
 
-# Pre-import litellm at module level to ensure full initialization.
-# Without this, first import inside an async executor context leaves
-# litellm partially initialized (circular import in submodules).
-try:
-    import litellm  # noqa: F401
-except ImportError:
-    pass  # litellm optional if no agents use can_call_llm
+from .code_cache import AGENT_BUILTINS, AGENT_CODE_FILENAME, get_code_cache
 from .simulation_engine import measure_resources
 
 # Import types for type hints (avoid circular import at runtime)
@@ -53,6 +48,7 @@ from .contracts import (
     PermissionAction,
     PermissionResult,
 )
+from .contract_pool import deadline_tracer, get_contract_evaluator
 # Import from permission_checker module (Plan #181: Split Large Files)
 from . import permission_checker as _permission_checker
 
@@ -232,6 +228,61 @@ def create_syscall_llm(
     return _syscall_llm
 
 
+def create_wallet_functions(
+    artifact_id: str,
+    ledger: "Ledger",
+    payments_made: list[PaymentResult],
+) -> tuple[Callable[[str, int], PaymentResult], Callable[[], int]]:
+    """Create pay() and get_balance() for an artifact's wallet.
+
+    The returned pay() can ONLY spend from this artifact's own balance.
+    Every attempt (successful or not) is appended to payments_made.
+
+    Args:
+        artifact_id: ID of the artifact whose wallet is used
+        ledger: Ledger instance for transfers
+        payments_made: List collecting PaymentResult records
+
+    Returns:
+        Tuple of (pay, get_balance) functions for the sandbox
+    """
+    def pay(target: str, amount: int) -> PaymentResult:
+        """Transfer scrip from this artifact's wallet to target."""
+        if amount <= 0:
+            result: PaymentResult = {
+                "success": False,
+                "amount": amount,
+                "target": target,
+                "error": "Amount must be positive"
+            }
+            payments_made.append(result)
+            return result
+
+        success = ledger.transfer_scrip(artifact_id, target, amount)
+        if success:
+            result = {
+                "success": True,
+                "amount": amount,
+                "target": target,
+                "error": ""
+            }
+        else:
+            result = {
+                "success": False,
+                "amount": amount,
+                "target": target,
+                "error": "Insufficient funds in artifact wallet"
+            }
+        payments_made.append(result)
+        return result
+
+    def get_balance() -> int:
+        """Get this artifact's current scrip balance."""
+        return ledger.get_scrip(artifact_id)
+
+    return pay, get_balance
+
+
 def get_max_invoke_depth() -> int:
     """Get max recursion depth for nested invoke() calls from config."""
     return get_validated_config().executor.max_invoke_depth
@@ -479,7 +530,15 @@ def _timeout_context(timeout: int) -> Generator[None, None, None]:
     """Context manager for Unix signal-based timeout.
 
     On Windows/platforms without signal.alarm, silently does nothing.
-    Properly restores the previous signal handler on exit.
+    Signal handlers can only be installed on the main thread, and calling
+    signal.alarm(0) from a worker would cancel the main thread's alarm, so
+    off the main thread (e.g. the artifact iteration pool) agent code in the
+    block runs under a per-thread trace function instead (see
+    contract_pool.deadline_tracer). It only interrupts agent code, on its
+    line and call events: kernel code and C calls (time.sleep, a provider
+    request) run to completion, and the timeout is raised when control
+    returns to agent code.
+    Properly restores the previous signal handler or trace function on exit.
 
     Args:
         timeout: Timeout in seconds
@@ -490,6 +549,18 @@ def _timeout_context(timeout: int) -> Generator[None, None, None]:
     Raises:
         TimeoutError: If the block takes longer than timeout seconds
     """
+    if threading.current_thread() is not threading.main_thread():
+        previous_trace = sys.gettrace()
+        sys.settrace(deadline_tracer(
+            time.monotonic() + timeout, TimeoutError, "Execution timed out",
+            filename=AGENT_CODE_FILENAME,
+        ))
+        try:
+            yield
+        finally:
+            sys.settrace(previous_trace)
+        return
+
     old_handler: Any = None
     try:
         old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
@@ -548,6 +619,7 @@ class SafeExecutor:
 
     timeout: int
     preloaded_modules: dict[str, ModuleType | _DatetimeModule]
+    _builtins_template: Mapping[str, Any]
     use_contracts: bool
     max_contract_depth: int
     _contract_cache: dict[str, AccessContract | ExecutableContract]
@@ -566,14 +638,21 @@ class SafeExecutor:
         default_timeout: int = get("executor.timeout_seconds") or 5
         self.timeout = timeout or default_timeout
         self.preloaded_modules = get_preloaded_modules()
+        self._builtins_template = MappingProxyType({
+            **AGENT_BUILTINS,
+            "__import__": _make_controlled_import(self.preloaded_modules),
+        })
         self.use_contracts = use_contracts
         self.max_contract_depth = max_contract_depth if max_contract_depth is not None else get_max_contract_depth()
         self._contract_cache = {}
         self._ledger = ledger
         self._artifact_store = None
         # Permission cache for TTL-based caching (Plan #100 Phase 2)
-        from src.world.contracts import PermissionCache
-        self._permission_cache = PermissionCache()
+        from src.world.contracts import DEFAULT_PERMISSION_CACHE_SIZE, PermissionCache
+        cache_size = get("executor.permission_cache_size")
+        self._permission_cache = PermissionCache(
+            DEFAULT_PERMISSION_CACHE_SIZE if cache_size is None else cache_size
+        )
         # Dangling contract counter for observability (Plan #100 Phase 2, ADR-0017)
         self._dangling_contract_count = 0
 
@@ -608,6 +687,22 @@ class SafeExecutor:
         """
         self._permission_cache.clear()
 
+    def invalidate_permissions(self, artifact_id: str) -> None:
+        """Forget cached permission state after an artifact is written or deleted.
+
+        Drops cached results for the artifact as a target and, if it is a
+        contract artifact, the loaded contract and its evaluated namespaces
+        (rebuilt on next use).
+        """
+        self._permission_cache.invalidate(artifact_id)
+        if isinstance(self._contract_cache.get(artifact_id), ExecutableContract):
+            del self._contract_cache[artifact_id]
+            get_contract_evaluator().invalidate(artifact_id)
+
+    def get_permission_cache_stats(self) -> dict[str, int]:
+        """Hit/miss/eviction/expiration/invalidation counters of the permission cache."""
+        return self._permission_cache.stats()
+
     def get_dangling_contract_count(self) -> int:
         """Get count of dangling contract fallbacks that have occurred.
 
@@ -758,24 +853,50 @@ class SafeExecutor:
         Returns:
             (success, error_message)
         """
+        compiled, error = self._compile_validated(code)
+        return compiled is not None, error
+
+    def _compile_validated(self, code: str) -> tuple[CodeType | None, str]:
+        """Validate code and return its compiled form.
+
+        The entry-point check is a plain substring test; compilation is one
+        content-hash-keyed cache lookup, so each execution hashes the source
+        once and hot artifacts are parsed once per process.
+
+        Returns:
+            (code_object, "") on success, (None, error_message) on failure
+        """
         if not code or not code.strip():
-            return False, "Empty code"
+            return None, "Empty code"
 
         # Check for recognized entry point function definition
         has_run = "def run(" in code
         has_handle_request = "def handle_request(" in code
         has_check_permission = "def check_permission(" in code
         if not has_run and not has_handle_request and not has_check_permission:
-            return False, "Code must define a run(), handle_request(), or check_permission() function"
+            return None, "Code must define a run(), handle_request(), or check_permission() function"
 
-        # Try to compile with standard Python
+        # Try to compile with standard Python (cached by content hash)
         try:
-            compile(code, '<agent_code>', 'exec')
-            return True, ""
+            return get_code_cache().compile(code, AGENT_CODE_FILENAME), ""
         except SyntaxError as e:
-            return False, f"Syntax error: {e}"
+            return None, f"Syntax error: {e}"
         except Exception as e:  # exception-ok: user code can raise anything
-            return False, f"Compilation failed: {e}"
+            return None, f"Compilation failed: {e}"
+
+    def _new_globals(self) -> dict[str, Any]:
+        """Return a fresh sandbox namespace built from the frozen templates.
+
+        Builtins are copied per execution so code that rebinds a builtin
+        cannot leak the change into other artifacts.
+        """
+        controlled_globals: dict[str, Any] = {
+            "__builtins__": dict(self._builtins_template),
+            "__name__": "__main__",
+        }
+        # Add allowed modules to namespace (so they can be used without import)
+        controlled_globals.update(self.preloaded_modules)
+        return controlled_globals
 
     def execute(self, code: str, args: list[Any] | None = None) -> ExecutionResult:
         """
@@ -791,35 +912,22 @@ class SafeExecutor:
             - result: return value from run() (if success)
             - error: error message (if failed)
         """
-        args = args or []
-
-        # Validate first
-        valid, error = self.validate_code(code)
-        if not valid:
+        # Validate and compile (cached by content hash)
+        compiled, error = self._compile_validated(code)
+        if compiled is None:
             return {"success": False, "error": error}
+        return self.execute_compiled(compiled, args)
 
-        # Compile with standard Python
-        try:
-            compiled = compile(code, '<agent_code>', 'exec')
-        except SyntaxError as e:
-            return {"success": False, "error": f"Syntax error: {e}"}
-        except Exception as e:  # exception-ok: user code can raise anything
-            return {"success": False, "error": f"Compilation failed: {e}"}
+    def execute_compiled(self, compiled: CodeType, args: list[Any] | None = None) -> ExecutionResult:
+        """Execute already validated and compiled code and call run(*args).
 
-        # Build controlled globals with full builtins and allowed modules
-        controlled_builtins = dict(vars(builtins))
-        controlled_builtins["__import__"] = _make_controlled_import(
-            self.preloaded_modules
-        )
-
-        controlled_globals: dict[str, Any] = {
-            "__builtins__": controlled_builtins,
-            "__name__": "__main__",
-        }
+        Same result as execute(); for callers that compile a submission once
+        and run it many times (the mint task test runner).
+        """
+        args = args or []
 
-        # Add allowed modules to namespace (so they can be used without import)
-        for name, module in self.preloaded_modules.items():
-            controlled_globals[name] = module
+        # Build controlled globals with full builtins and allowed modules
+        controlled_globals = self._new_globals()
 
         # Plan #140: Create Action class for agent-expected API
         # In this simple execute() context, most methods return errors
@@ -962,78 +1070,20 @@ class SafeExecutor:
         """
         args = args or []
 
-        # Validate first
-        valid, error = self.validate_code(code)
-        if not valid:
+        # Validate and compile (cached by content hash)
+        compiled, error = self._compile_validated(code)
+        if compiled is None:
             return {"success": False, "error": error}
 
-        # Compile with standard Python
-        try:
-            compiled = compile(code, '<agent_code>', 'exec')
-        except SyntaxError as e:
-            return {"success": False, "error": f"Syntax error: {e}"}
-        except Exception as e:  # exception-ok: user code can raise anything
-            return {"success": False, "error": f"Compilation failed: {e}"}
-
         # Build controlled globals with full builtins and allowed modules
-        controlled_builtins = dict(vars(builtins))
-        controlled_builtins["__import__"] = _make_controlled_import(
-            self.preloaded_modules
-        )
-
-        controlled_globals: dict[str, Any] = {
-            "__builtins__": controlled_builtins,
-            "__name__": "__main__",
-        }
-
-        # Add allowed modules to namespace
-        for name, module in self.preloaded_modules.items():
-            controlled_globals[name] = module
+        controlled_globals = self._new_globals()
 
         # Track payments made during execution
         payments_made: list[PaymentResult] = []
 
         # Create pay() function if wallet context provided
         if artifact_id and ledger:
-            def pay(target: str, amount: int) -> PaymentResult:
-                """Transfer scrip from this artifact's wallet to target.
-
-                Can ONLY spend from this artifact's own balance.
-                Returns dict with success status.
-                """
-                if amount <= 0:
-                    result: PaymentResult = {
-                        "success": False,
-                        "amount": amount,
-                        "target": target,
-                        "error": "Amount must be positive"
-                    }
-                    payments_made.append(result)
-                    return result
-
-                # Transfer from artifact's wallet
-                success = ledger.transfer_scrip(artifact_id, target, amount)
-                if success:
-                    result = {
-                        "success": True,
-                        "amount": amount,
-                        "target": target,
-                        "error": ""
-                    }
-                else:
-                    result = {
-                        "success": False,
-                        "amount": amount,
-                        "target": target,
-                        "error": "Insufficient funds in artifact wallet"
-                    }
-                payments_made.append(result)
-                return result
-
-            def get_balance() -> int:
-                """Get this artifact's current scrip balance."""
-                return ledger.get_scrip(artifact_id)
-
+            pay, get_balance = create_wallet_functions(artifact_id, ledger, payments_made)
             # Inject wallet functions into namespace
             controlled_globals["pay"] = pay
             controlled_globals["get_balance"] = get_balance
@@ -1164,33 +1214,13 @@ class SafeExecutor:
         if max_depth is None:
             max_depth = get_max_invoke_depth()
 
-        # Validate first
-        valid, error = self.validate_code(code)
-        if not valid:
+        # Validate and compile (cached by content hash)
+        compiled, error = self._compile_validated(code)
+        if compiled is None:
             return {"success": False, "error": error}
 
-        # Compile with standard Python
-        try:
-            compiled = compile(code, '<agent_code>', 'exec')
-        except SyntaxError as e:
-            return {"success": False, "error": f"Syntax error: {e}"}
-        except Exception as e:  # exception-ok: user code can raise anything
-            return {"success": False, "error": f"Compilation failed: {e}"}
-
         # Build controlled globals with full builtins and allowed modules
-        controlled_builtins = dict(vars(builtins))
-        controlled_builtins["__import__"] = _make_controlled_import(
-            self.preloaded_modules
-        )
-
-        controlled_globals: dict[str, Any] = {
-            "__builtins__": controlled_builtins,
-            "__name__": "__main__",
-        }
-
-        # Add allowed modules to namespace
-        for name, module in self.preloaded_modules.items():
-            controlled_globals[name] = module
+        controlled_globals = self._new_globals()
 
         # Inject kernel interfaces if world is provided (Plan #39 - Genesis Unprivilege)
         # This gives all artifacts equal access to kernel state/actions
@@ -1217,40 +1247,7 @@ class SafeExecutor:
 
         # Create pay() and get_balance() if wallet context provided
         if artifact_id and ledger:
-            def pay(target: str, amount: int) -> PaymentResult:
-                """Transfer scrip from this artifact's wallet to target."""
-                if amount <= 0:
-                    result: PaymentResult = {
-                        "success": False,
-                        "amount": amount,
-                        "target": target,
-                        "error": "Amount must be positive"
-                    }
-                    payments_made.append(result)
-                    return result
-
-                success = ledger.transfer_scrip(artifact_id, target, amount)
-                if success:
-                    result = {
-                        "success": True,
-                        "amount": amount,
-                        "target": target,
-                        "error": ""
-                    }
-                else:
-                    result = {
-                        "success": False,
-                        "amount": amount,
-                        "target": target,
-                        "error": "Insufficient funds in artifact wallet"
-                    }
-                payments_made.append(result)
-                return result
-
-            def get_balance() -> int:
-                """Get this artifact's current scrip balance."""
-                return ledger.get_scrip(artifact_id)
-
+            pay, get_balance = create_wallet_functions(artifact_id, ledger, payments_made)
             controlled_globals["pay"] = pay
             controlled_globals["get_balance"] = get_balance
 
@@ -0,0 +1,156 @@
+"""JSON Patch (RFC 6902 subset) for JSON-in-content artifacts.
+
+Agent state, notebook and journal artifacts are JSON documents that grow
+every iteration. Patches let code change one field or append one journal
+entry without re-sending the whole document.
+
+Supported operations: add, remove, replace, test. Paths are JSON Pointers
+(RFC 6901, "~0" for "~" and "~1" for "/"); "-" as the last token of an add
+path appends to an array.
+
+Patches are applied copy-on-write: only the containers on each operation's
+path are copied, so the input document (typically the store's cached parse)
+is never mutated.
+
+Usage:
+    new_doc = apply_json_patch(doc, [{"op": "add", "path": "/journal/-", "value": "entry"}])
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+JSON_PATCH_OPS = frozenset({"add", "remove", "replace", "test"})
+
+_MISSING = object()
+
+
+class JsonPatchError(ValueError):
+    """A patch operation is malformed or does not apply to the document."""
+    pass
+
+
+def parse_pointer(path: str) -> list[str]:
+    """Split a JSON Pointer into unescaped reference tokens."""
+    if path == "":
+        return []
+    if not path.startswith("/"):
+        raise JsonPatchError(f"JSON pointer must start with '/': {path!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")]
+
+
+def _list_index(token: str, length: int) -> int:
+    """Convert a pointer token to an index in [0, length)."""
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise JsonPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index >= length:
+        raise JsonPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _get(node: Any, tokens: list[str]) -> Any:
+    """Value at a pointer, or _MISSING."""
+    for token in tokens:
+        if isinstance(node, dict):
+            node = node.get(token, _MISSING)
+        elif isinstance(node, list):
+            try:
+                node = node[_list_index(token, len(node))]
+            except JsonPatchError:
+                return _MISSING
+        else:
+            return _MISSING
+        if node is _MISSING:
+            return _MISSING
+    return node
+
+
+def _patched(node: Any, tokens: list[str], op: str, value: Any) -> Any:
+    """Return a copy of node with one add/remove/replace applied at tokens."""
+    if not tokens:
+        if op == "remove":
+            raise JsonPatchError("Cannot remove the document root")
+        return value
+
+    token, rest = tokens[0], tokens[1:]
+    if isinstance(node, dict):
+        new_dict = dict(node)
+        if rest:
+            if token not in node:
+                raise JsonPatchError(f"Path not found: {token!r}")
+            new_dict[token] = _patched(node[token], rest, op, value)
+        elif op == "add":
+            new_dict[token] = value
+        elif token not in node:
+            raise JsonPatchError(f"Path not found: {token!r}")
+        elif op == "replace":
+            new_dict[token] = value
+        else:
+            del new_dict[token]
+        return new_dict
+
+    if isinstance(node, list):
+        new_list = list(node)
+        if rest:
+            index = _list_index(token, len(node))
+            new_list[index] = _patched(node[index], rest, op, value)
+        elif op == "add":
+            if token == "-":
+                new_list.append(value)
+            else:
+                new_list.insert(_list_index(token, len(node) + 1), value)
+        elif op == "replace":
+            new_list[_list_index(token, len(node))] = value
+        else:
+            del new_list[_list_index(token, len(node))]
+        return new_list
+
+    raise JsonPatchError(f"Cannot apply {op!r} below a {type(node).__name__} value")
+
+
+def apply_json_patch(doc: Any, operations: list[dict[str, Any]]) -> Any:
+    """Apply a list of patch operations and return the new document.
+
+    The patch is atomic: if any operation fails, JsonPatchError is raised
+    and no document is returned.
+
+    Args:
+        doc: Parsed JSON document (not mutated)
+        operations: Operations like {"op": "replace", "path": "/a", "value": 1}
+
+    Returns:
+        The patched document (shares unchanged subtrees with doc)
+
+    Raises:
+        JsonPatchError: If an operation is malformed or does not apply
+    """
+    if not isinstance(operations, list):
+        raise JsonPatchError("Patch must be a list of operations")
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise JsonPatchError(f"Patch operation must be an object, got {type(operation).__name__}")
+        op = operation.get("op")
+        if op not in JSON_PATCH_OPS:
+            raise JsonPatchError(f"Unsupported patch op {op!r}. Supported: {', '.join(sorted(JSON_PATCH_OPS))}")
+        path = operation.get("path")
+        if not isinstance(path, str):
+            raise JsonPatchError(f"Patch operation {op!r} requires a string 'path'")
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise JsonPatchError(f"Patch operation {op!r} requires a 'value'")
+
+        tokens = parse_pointer(path)
+        if op == "test":
+            if _get(doc, tokens) != operation["value"]:
+                raise JsonPatchError(f"Test failed at {path!r}")
+            continue
+        doc = _patched(doc, tokens, op, operation.get("value"))
+    return doc
+
+
+__all__ = [
+    "JSON_PATCH_OPS",
+    "JsonPatchError",
+    "apply_json_patch",
+    "parse_pointer",
+]
@@ -37,8 +37,9 @@ See also:
 # --- GOVERNANCE END ---
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from .constants import (
     KERNEL_CONTRACT_FREEWARE,
@@ -410,6 +411,118 @@ def get_contract_by_id(contract_id: str) -> AccessContract | None:
     return None
 
 
+# Precomputed kernel contract decisions (fast path for permission checks).
+#
+# A kernel contract's decision depends only on the action and on how the
+# caller relates to the artifact: whether state["writer"] / state["principal"]
+# are set and equal the caller, and whether the caller is the artifact itself.
+# The table below holds, for every combination, the contract's own answer
+# (computed once by calling check_permission on a synthetic artifact), so a
+# check against a kernel contract becomes one dict lookup. The relation
+# flags are computed from the artifact's current state on every lookup, so
+# state changes (e.g. an escrow moving state["writer"]) need no invalidation.
+
+# (contract_id, action, writer_set, caller_is_writer, principal_set,
+#  caller_is_principal, caller_is_target)
+DecisionKey = tuple[str, str, bool, bool, bool, bool, bool]
+# (allowed, reason, scrip_recipient role: "writer" | "principal" | "caller" | None)
+Decision = tuple[bool, str, Optional[str]]
+
+_SYNTHETIC_ROLES = {None: None, "caller": "caller", "writer": "writer", "principal": "principal"}
+
+
+def build_decision_table(contracts: Iterable[AccessContract]) -> dict[DecisionKey, Decision]:
+    """Tabulate kernel contract decisions for every caller relation.
+
+    Combinations whose result carries anything beyond allowed, reason and a
+    recipient drawn from the state (costs, state updates, conditions) are
+    left out, so those checks keep going through the contract.
+    """
+    table: dict[DecisionKey, Decision] = {}
+    for contract in contracts:
+        for action in PermissionAction:
+            for flags in itertools.product((False, True), repeat=5):
+                writer_set, caller_is_writer, principal_set, caller_is_principal, caller_is_target = flags
+                if (caller_is_writer and not writer_set) or (
+                    caller_is_principal and not principal_set
+                ):
+                    continue
+                state: dict[str, object] = {}
+                if writer_set:
+                    state["writer"] = "caller" if caller_is_writer else "writer"
+                if principal_set:
+                    state["principal"] = "caller" if caller_is_principal else "principal"
+                result = contract.check_permission(
+                    caller="caller",
+                    action=action,
+                    target="caller" if caller_is_target else "target",
+                    context={"_artifact_state": state},
+                )
+                if (
+                    result.scrip_recipient not in _SYNTHETIC_ROLES
+                    or result.scrip_cost
+                    or result.scrip_payer is not None
+                    or result.resource_payer is not None
+                    or result.state_updates is not None
+                    or result.conditions is not None
+                ):
+                    continue
+                key: DecisionKey = (
+                    contract.contract_id, action.value, writer_set, caller_is_writer,
+                    principal_set, caller_is_principal, caller_is_target,
+                )
+                table[key] = (result.allowed, result.reason, result.scrip_recipient)
+    return table
+
+
+KERNEL_DECISIONS: dict[DecisionKey, Decision] = build_decision_table(KERNEL_CONTRACTS.values())
+
+
+def decide_kernel_permission(
+    contract_id: str,
+    action: str,
+    caller: str,
+    target: str,
+    state: dict[str, Any],
+) -> PermissionResult | None:
+    """Look up a kernel contract's decision without dispatching to it.
+
+    Args:
+        contract_id: The artifact's access_contract_id
+        action: Action string (read, write, edit, invoke, delete)
+        caller: Principal requesting access
+        target: Artifact being accessed
+        state: The artifact's current state
+
+    Returns:
+        The PermissionResult the contract would return, or None if
+        contract_id is not a kernel contract (or the action is unknown)
+    """
+    writer = state.get("writer")
+    principal = state.get("principal")
+    decision = KERNEL_DECISIONS.get((
+        contract_id,
+        action,
+        writer is not None,
+        writer is not None and caller == writer,
+        principal is not None,
+        principal is not None and caller == principal,
+        caller == target,
+    ))
+    if decision is None:
+        return None
+    allowed, reason, role = decision
+    if role == "writer":
+        recipient = writer
+    elif role == "principal":
+        recipient = principal
+    elif role == "caller":
+        recipient = caller
+    else:
+        recipient = None
+    return PermissionResult(allowed=allowed, reason=reason, scrip_recipient=recipient)
+
+
 def list_kernel_contracts() -> list[str]:
     """List all available kernel contract types.
 
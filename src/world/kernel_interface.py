@@ -173,6 +173,33 @@ class KernelState:
 
         return artifact.content
 
+    def read_artifact_range(
+        self,
+        artifact_id: str,
+        caller_id: str,
+        start: int = 0,
+        end: int | None = None,
+    ) -> str | None:
+        """Read a slice of artifact content (access controlled via contracts).
+
+        Uses Python slice semantics, so start=-2000 reads the last 2000
+        characters. Lets loops read the tail of a growing journal instead
+        of the whole artifact.
+
+        Args:
+            artifact_id: The artifact to read
+            caller_id: Who is requesting the read
+            start: Start offset (characters; negative counts from the end)
+            end: End offset (exclusive; None = end of content)
+
+        Returns:
+            content[start:end] if access allowed, None otherwise
+        """
+        content = self.read_artifact(artifact_id, caller_id)
+        if content is None:
+            return None
+        return content[start:end]
+
     # --- Kernel Mint Read Methods (Plan #44) ---
 
     def get_mint_submissions(self) -> list[dict[str, Any]]:
@@ -479,6 +506,85 @@ class KernelActions:
             raise ValueError(result.message)
         return True
 
+    def _edit_artifact(self, intent: Any) -> bool:
+        """Run an edit_artifact intent, raising ValueError on failure."""
+        result = self._world.execute_action(intent)
+        if not result.success:
+            raise ValueError(result.message)
+        return True
+
+    def append_to_artifact(self, caller_id: str, artifact_id: str, text: str) -> bool:
+        """Append text to an artifact via the edit_artifact action.
+
+        Only the appended bytes are sent and charged, instead of reading
+        and rewriting the whole artifact.
+
+        Args:
+            caller_id: Who is writing (needs write permission)
+            artifact_id: Artifact to append to
+            text: Text to append
+
+        Returns:
+            True if the append succeeded
+
+        Raises:
+            ValueError: If the edit was rejected (permission, quota, not found)
+        """
+        from src.world.actions import EditArtifactIntent
+
+        return self._edit_artifact(EditArtifactIntent(
+            caller_id, artifact_id, "", text, operation="append",
+        ))
+
+    def write_artifact_range(
+        self, caller_id: str, artifact_id: str, start: int, end: int, text: str
+    ) -> bool:
+        """Replace content[start:end] of an artifact via the edit_artifact action.
+
+        Args:
+            caller_id: Who is writing (needs write permission)
+            artifact_id: Artifact to edit
+            start: Start character offset (0 <= start <= end)
+            end: End character offset (end <= len(content))
+            text: Replacement text
+
+        Returns:
+            True if the write succeeded
+
+        Raises:
+            ValueError: If the edit was rejected (permission, quota, bad range)
+        """
+        from src.world.actions import EditArtifactIntent
+
+        return self._edit_artifact(EditArtifactIntent(
+            caller_id, artifact_id, "", text, operation="range", start=start, end=end,
+        ))
+
+    def patch_artifact_json(
+        self, caller_id: str, artifact_id: str, patch: list[dict[str, Any]]
+    ) -> bool:
+        """Apply a JSON Patch to an artifact's JSON content via edit_artifact.
+
+        Supports add, remove, replace and test; "/journal/-" appends to the
+        journal array. The patch is applied atomically.
+
+        Args:
+            caller_id: Who is writing (needs write permission)
+            artifact_id: Artifact with JSON content
+            patch: Operations, e.g. [{"op": "add", "path": "/journal/-", "value": "..."}]
+
+        Returns:
+            True if the patch was applied
+
+        Raises:
+            ValueError: If the edit was rejected (permission, quota, bad patch)
+        """
+        from src.world.actions import EditArtifactIntent
+
+        return self._edit_artifact(EditArtifactIntent(
+            caller_id, artifact_id, "", "", operation="json_patch", patch=patch,
+        ))
+
     def submit_to_task(
         self,
         caller_id: str,
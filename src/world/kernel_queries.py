@@ -12,6 +12,29 @@ if TYPE_CHECKING:
     from .world import World
 
 
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+_REGEX_OPTIONAL = frozenset("*?{")
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Literal text every match of a ^-anchored pattern must start with.
+
+    Used to drive name_pattern queries from the ID prefix index. Returns ""
+    when no safe prefix exists (unanchored, alternation, escapes, ...).
+    """
+    if not pattern.startswith("^") or "|" in pattern:
+        return ""
+    prefix: list[str] = []
+    for char in pattern[1:]:
+        if char in _REGEX_SPECIAL:
+            # A quantifier makes the preceding literal optional
+            if char in _REGEX_OPTIONAL and prefix:
+                prefix.pop()
+            break
+        prefix.append(char)
+    return "".join(prefix)
+
+
 # Valid query types and their required/optional parameters
 QUERY_SCHEMA: dict[str, dict[str, Any]] = {
     "artifacts": {
@@ -75,6 +98,10 @@ QUERY_SCHEMA: dict[str, dict[str, Any]] = {
         "params": ["task_id"],
         "required": ["task_id"],
     },
+    "permission_cache": {
+        "params": [],
+        "required": [],
+    },
 }
 
 
@@ -166,27 +193,35 @@ class KernelQueryHandler:
         limit: int = limit_raw if limit_raw is not None else 50
         offset: int = offset_raw if offset_raw is not None else 0
 
-        # Build filtered results
+        if name_pattern:
+            try:
+                pattern = re.compile(name_pattern)
+            except re.error:
+                return {
+                    "success": False,
+                    "error": f"Invalid regex pattern: '{name_pattern}'",
+                    "error_code": "invalid_pattern",
+                }
+
+        # Candidate IDs from the store's indexes, in creation order
+        store = self._world.artifacts
+        if executable is not None and not isinstance(executable, bool):
+            ids: list[str] = []
+        else:
+            ids = store.find_ids(
+                artifact_type=artifact_type or None,
+                creator=owner or None,
+                executable=executable,
+                id_prefix=_literal_prefix(name_pattern) if name_pattern else None,
+            )
+        if name_pattern:
+            ids = [artifact_id for artifact_id in ids if pattern.search(artifact_id)]
+
+        # Paginate before building entries
+        total = len(ids)
         results = []
-        for artifact_id, artifact in self._world.artifacts.artifacts.items():
-            if artifact.deleted:
-                continue
-            if owner and artifact.created_by != owner:
-                continue
-            if artifact_type and artifact.type != artifact_type:
-                continue
-            if executable is not None and artifact.executable != executable:
-                continue
-            if name_pattern:
-                try:
-                    if not re.search(name_pattern, artifact_id):
-                        continue
-                except re.error:
-                    return {
-                        "success": False,
-                        "error": f"Invalid regex pattern: '{name_pattern}'",
-                        "error_code": "invalid_pattern",
-                    }
+        for artifact_id in ids[offset:offset + limit]:
+            artifact = store.artifacts[artifact_id]
             # Enriched format: enough info for agents to decide invoke vs rebuild
             entry: dict[str, Any] = {
                 "id": artifact.id,
@@ -201,9 +236,6 @@ class KernelQueryHandler:
                 entry["code_preview"] = artifact.code[:300]
             results.append(entry)
 
-        total = len(results)
-        results = results[offset:offset + limit]
-
         return {
             "success": True,
             "query_type": "artifacts",
@@ -586,3 +618,17 @@ class KernelQueryHandler:
             "query_type": "mint_task",
             "task": task.to_dict(include_hidden=False),
         }
+
+    def _query_permission_cache(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Get contract permission cache statistics.
+
+        Returns:
+            Hit/miss/eviction/expiration/invalidation counters, size and capacity
+        """
+        from .executor import get_executor
+
+        return {
+            "success": True,
+            "query_type": "permission_cache",
+            "stats": get_executor().get_permission_cache_stats(),
+        }
@@ -31,6 +31,7 @@ See docs/architecture/current/resources.md for full design rationale.
 from __future__ import annotations
 
 import asyncio
+import threading
 from decimal import Decimal
 from typing import Any, TypedDict
 
@@ -106,6 +107,7 @@ class Ledger:
     id_registry: "IDRegistry | None"
     _scrip_lock: asyncio.Lock
     _resource_lock: asyncio.Lock
+    _lock: threading.RLock
 
     def __init__(
         self,
@@ -123,6 +125,9 @@ class Ledger:
         # Async locks for thread-safe concurrent access
         self._scrip_lock = asyncio.Lock()
         self._resource_lock = asyncio.Lock()
+        # Guards every balance mutation against iteration-pool threads, which
+        # call the sync API while the event loop holds the async locks
+        self._lock = threading.RLock()
         # TD-011: Optional event logger for observability
         self._logger: "EventLogger | None" = None
 
@@ -180,17 +185,18 @@ class Ledger:
         If id_registry is set, registers the principal ID. Allows
         artifact→principal registration for unified ontology (Plan #254).
         """
-        # Register with ID registry if available (Plan #7)
-        # Plan #254: Allow if already registered as artifact (unified ontology)
-        if self.id_registry is not None:
-            existing_type = self.id_registry.lookup(principal_id)
-            if existing_type is None:
-                # Not registered - register as principal
-                self.id_registry.register(principal_id, "principal")
-            # If already registered as artifact or principal, skip registration
-            # This supports unified ontology where artifacts can be principals
-        self.scrip[principal_id] = starting_scrip
-        self.resources[principal_id] = starting_resources.copy() if starting_resources else {}
+        with self._lock:
+            # Register with ID registry if available (Plan #7)
+            # Plan #254: Allow if already registered as artifact (unified ontology)
+            if self.id_registry is not None:
+                existing_type = self.id_registry.lookup(principal_id)
+                if existing_type is None:
+                    # Not registered - register as principal
+                    self.id_registry.register(principal_id, "principal")
+                # If already registered as artifact or principal, skip registration
+                # This supports unified ontology where artifacts can be principals
+            self.scrip[principal_id] = starting_scrip
+            self.resources[principal_id] = starting_resources.copy() if starting_resources else {}
 
     # ===== GENERIC RESOURCE API =====
 
@@ -206,43 +212,47 @@ class Ledger:
 
     def spend_resource(self, principal_id: str, resource: str, amount: float) -> bool:
         """Spend a resource. Returns False if insufficient."""
-        if not self.can_spend_resource(principal_id, resource, amount):
-            return False
-        if principal_id not in self.resources:
-            self.resources[principal_id] = {}
-        current = self.get_resource(principal_id, resource)
-        self.resources[principal_id][resource] = _decimal_sub(current, amount)
-        return True
+        with self._lock:
+            if not self.can_spend_resource(principal_id, resource, amount):
+                return False
+            if principal_id not in self.resources:
+                self.resources[principal_id] = {}
+            current = self.get_resource(principal_id, resource)
+            self.resources[principal_id][resource] = _decimal_sub(current, amount)
+            return True
 
     def credit_resource(self, principal_id: str, resource: str, amount: float) -> None:
         """Add to a resource balance."""
-        if principal_id not in self.resources:
-            self.resources[principal_id] = {}
-        current = self.resources[principal_id].get(resource, 0.0)
-        self.resources[principal_id][resource] = _decimal_add(current, amount)
+        with self._lock:
+            if principal_id not in self.resources:
+                self.resources[principal_id] = {}
+            current = self.resources[principal_id].get(resource, 0.0)
+            self.resources[principal_id][resource] = _decimal_add(current, amount)
 
     def set_resource(self, principal_id: str, resource: str, amount: float) -> None:
         """Set a resource to a specific value."""
-        if principal_id not in self.resources:
-            self.resources[principal_id] = {}
-        self.resources[principal_id][resource] = amount
+        with self._lock:
+            if principal_id not in self.resources:
+                self.resources[principal_id] = {}
+            self.resources[principal_id][resource] = amount
 
     def transfer_resource(
         self, from_id: str, to_id: str, resource: str, amount: float
     ) -> bool:
         """Transfer a resource between principals."""
-        if amount <= 0:
-            return False
-        if not self.can_spend_resource(from_id, resource, amount):
-            return False
-        # Ensure recipient exists
-        if to_id not in self.resources:
-            self.resources[to_id] = {}
-        from_current = self.get_resource(from_id, resource)
-        to_current = self.get_resource(to_id, resource)
-        self.resources[from_id][resource] = _decimal_sub(from_current, amount)
-        self.resources[to_id][resource] = _decimal_add(to_current, amount)
-        return True
+        with self._lock:
+            if amount <= 0:
+                return False
+            if not self.can_spend_resource(from_id, resource, amount):
+                return False
+            # Ensure recipient exists
+            if to_id not in self.resources:
+                self.resources[to_id] = {}
+            from_current = self.get_resource(from_id, resource)
+            to_current = self.get_resource(to_id, resource)
+            self.resources[from_id][resource] = _decimal_sub(from_current, amount)
+            self.resources[to_id][resource] = _decimal_add(to_current, amount)
+            return True
 
     def get_all_resources(self, principal_id: str) -> dict[str, float]:
         """Get all resource balances for a principal."""
@@ -267,13 +277,14 @@ class Ledger:
             True if successful, False if insufficient resources
         """
         async with self._resource_lock:
-            if not self.can_spend_resource(principal_id, resource, amount):
-                return False
-            if principal_id not in self.resources:
-                self.resources[principal_id] = {}
-            current = self.get_resource(principal_id, resource)
-            self.resources[principal_id][resource] = _decimal_sub(current, amount)
-            return True
+            with self._lock:
+                if not self.can_spend_resource(principal_id, resource, amount):
+                    return False
+                if principal_id not in self.resources:
+                    self.resources[principal_id] = {}
+                current = self.get_resource(principal_id, resource)
+                self.resources[principal_id][resource] = _decimal_sub(current, amount)
+                return True
 
     async def credit_resource_async(
         self, principal_id: str, resource: str, amount: float
@@ -288,10 +299,11 @@ class Ledger:
             amount: Amount to add
         """
         async with self._resource_lock:
-            if principal_id not in self.resources:
-                self.resources[principal_id] = {}
-            current = self.resources[principal_id].get(resource, 0.0)
-            self.resources[principal_id][resource] = _decimal_add(current, amount)
+            with self._lock:
+                if principal_id not in self.resources:
+                    self.resources[principal_id] = {}
+                current = self.resources[principal_id].get(resource, 0.0)
+                self.resources[principal_id][resource] = _decimal_add(current, amount)
 
     async def transfer_resource_async(
         self, from_id: str, to_id: str, resource: str, amount: float
@@ -311,18 +323,19 @@ class Ledger:
             True if successful, False if insufficient resources or invalid amount
         """
         async with self._resource_lock:
-            if amount <= 0:
-                return False
-            if not self.can_spend_resource(from_id, resource, amount):
-                return False
-            # Ensure recipient exists
-            if to_id not in self.resources:
-                self.resources[to_id] = {}
-            from_current = self.get_resource(from_id, resource)
-            to_current = self.get_resource(to_id, resource)
-            self.resources[from_id][resource] = _decimal_sub(from_current, amount)
-            self.resources[to_id][resource] = _decimal_add(to_current, amount)
-            return True
+            with self._lock:
+                if amount <= 0:
+                    return False
+                if not self.can_spend_resource(from_id, resource, amount):
+                    return False
+                # Ensure recipient exists
+                if to_id not in self.resources:
+                    self.resources[to_id] = {}
+                from_current = self.get_resource(from_id, resource)
+                to_current = self.get_resource(to_id, resource)
+                self.resources[from_id][resource] = _decimal_sub(from_current, amount)
+                self.resources[to_id][resource] = _decimal_add(to_current, amount)
+                return True
 
     # ===== SCRIP (Economic Currency) =====
 
@@ -336,26 +349,28 @@ class Ledger:
 
     def deduct_scrip(self, principal_id: str, amount: int) -> bool:
         """Deduct scrip from principal. Returns False if insufficient funds."""
-        if not self.can_afford_scrip(principal_id, amount):
-            return False
-        self.scrip[principal_id] -= amount
-        self._log_scrip_event("scrip_deducted", {
-            "principal_id": principal_id,
-            "amount": amount,
-            "new_balance": self.scrip[principal_id],
-        })
-        return True
+        with self._lock:
+            if not self.can_afford_scrip(principal_id, amount):
+                return False
+            self.scrip[principal_id] -= amount
+            self._log_scrip_event("scrip_deducted", {
+                "principal_id": principal_id,
+                "amount": amount,
+                "new_balance": self.scrip[principal_id],
+            })
+            return True
 
     def credit_scrip(self, principal_id: str, amount: int) -> None:
         """Add scrip to principal (from sales, minting, etc.)."""
-        if principal_id not in self.scrip:
-            self.scrip[principal_id] = 0
-        self.scrip[principal_id] += amount
-        self._log_scrip_event("scrip_credited", {
-            "principal_id": principal_id,
-            "amount": amount,
-            "new_balance": self.scrip[principal_id],
-        })
+        with self._lock:
+            if principal_id not in self.scrip:
+                self.scrip[principal_id] = 0
+            self.scrip[principal_id] += amount
+            self._log_scrip_event("scrip_credited", {
+                "principal_id": principal_id,
+                "amount": amount,
+                "new_balance": self.scrip[principal_id],
+            })
 
     def transfer_scrip(self, from_id: str, to_id: str, amount: int) -> bool:
         """Transfer scrip between principals. Returns False if insufficient funds.
@@ -363,23 +378,24 @@ class Ledger:
         Auto-creates recipient with 0 balance if not exists. This enables
         transfers to artifacts (contracts, firms) without explicit creation.
         """
-        if amount <= 0:
-            return False
-        if not self.can_afford_scrip(from_id, amount):
-            return False
-        # Auto-create recipient if not exists (enables artifact wallets)
-        if to_id not in self.scrip:
-            self.scrip[to_id] = 0
-        self.scrip[from_id] -= amount
-        self.scrip[to_id] += amount
-        self._log_scrip_event("scrip_transferred", {
-            "from_id": from_id,
-            "to_id": to_id,
-            "amount": amount,
-            "from_balance": self.scrip[from_id],
-            "to_balance": self.scrip[to_id],
-        })
-        return True
+        with self._lock:
+            if amount <= 0:
+                return False
+            if not self.can_afford_scrip(from_id, amount):
+                return False
+            # Auto-create recipient if not exists (enables artifact wallets)
+            if to_id not in self.scrip:
+                self.scrip[to_id] = 0
+            self.scrip[from_id] -= amount
+            self.scrip[to_id] += amount
+            self._log_scrip_event("scrip_transferred", {
+                "from_id": from_id,
+                "to_id": to_id,
+                "amount": amount,
+                "from_balance": self.scrip[from_id],
+                "to_balance": self.scrip[to_id],
+            })
+            return True
 
     def principal_exists(self, principal_id: str) -> bool:
         """Check if a principal exists in the ledger (has any balance entry)."""
@@ -390,10 +406,11 @@ class Ledger:
 
         Useful for creating artifact wallets before transfers.
         """
-        if principal_id not in self.scrip:
-            self.scrip[principal_id] = 0
-        if principal_id not in self.resources:
-            self.resources[principal_id] = {}
+        with self._lock:
+            if principal_id not in self.scrip:
+                self.scrip[principal_id] = 0
+            if principal_id not in self.resources:
+                self.resources[principal_id] = {}
 
     # ===== ASYNC SCRIP OPERATIONS (Thread-Safe) =====
 
@@ -411,10 +428,11 @@ class Ledger:
             True if successful, False if insufficient funds
         """
         async with self._scrip_lock:
-            if not self.can_afford_scrip(principal_id, amount):
-                return False
-            self.scrip[principal_id] -= amount
-            return True
+            with self._lock:
+                if not self.can_afford_scrip(principal_id, amount):
+                    return False
+                self.scrip[principal_id] -= amount
+                return True
 
     async def credit_scrip_async(self, principal_id: str, amount: int) -> None:
         """Async thread-safe add scrip to principal.
@@ -426,9 +444,10 @@ class Ledger:
             amount: Amount of scrip to add
         """
         async with self._scrip_lock:
-            if principal_id not in self.scrip:
-                self.scrip[principal_id] = 0
-            self.scrip[principal_id] += amount
+            with self._lock:
+                if principal_id not in self.scrip:
+                    self.scrip[principal_id] = 0
+                self.scrip[principal_id] += amount
 
     async def transfer_scrip_async(self, from_id: str, to_id: str, amount: int) -> bool:
         """Async thread-safe transfer scrip between principals.
@@ -446,29 +465,31 @@ class Ledger:
             True if successful, False if insufficient funds or invalid amount
         """
         async with self._scrip_lock:
-            if amount <= 0:
-                return False
-            if not self.can_afford_scrip(from_id, amount):
-                return False
-            # Auto-create recipient if not exists (enables artifact wallets)
-            if to_id not in self.scrip:
-                self.scrip[to_id] = 0
-            self.scrip[from_id] -= amount
-            self.scrip[to_id] += amount
-            return True
+            with self._lock:
+                if amount <= 0:
+                    return False
+                if not self.can_afford_scrip(from_id, amount):
+                    return False
+                # Auto-create recipient if not exists (enables artifact wallets)
+                if to_id not in self.scrip:
+                    self.scrip[to_id] = 0
+                self.scrip[from_id] -= amount
+                self.scrip[to_id] += amount
+                return True
 
     # ===== REPORTING =====
 
     def get_all_balances(self) -> dict[str, BalanceInfo]:
         """Get snapshot of all balances including all resources."""
-        result: dict[str, BalanceInfo] = {}
-        all_principals = set(self.resources.keys()) | set(self.scrip.keys())
-        for pid in all_principals:
-            result[pid] = {
-                "scrip": self.scrip.get(pid, 0),
-                "resources": dict(self.resources.get(pid, {})),
-            }
-        return result
+        with self._lock:
+            result: dict[str, BalanceInfo] = {}
+            all_principals = set(self.resources.keys()) | set(self.scrip.keys())
+            for pid in all_principals:
+                result[pid] = {
+                    "scrip": self.scrip.get(pid, 0),
+                    "resources": dict(self.resources.get(pid, {})),
+                }
+            return result
 
     def get_all_scrip(self) -> dict[str, int]:
         """Get snapshot of all scrip balances."""
@@ -480,10 +501,11 @@ class Ledger:
         Used for UBI distribution - only real agents receive UBI, not
         system principals (those starting with 'SYSTEM' or 'kernel_').
         """
-        return [
-            pid for pid in self.scrip.keys()
-            if not pid.startswith(("genesis_", "SYSTEM", "kernel_"))
-        ]
+        with self._lock:
+            return [
+                pid for pid in self.scrip.keys()
+                if not pid.startswith(("genesis_", "SYSTEM", "kernel_"))
+            ]
 
     def distribute_ubi(self, amount: int, exclude: str | None = None) -> dict[str, int]:
         """Distribute scrip equally among all agent principals (UBI).
@@ -502,26 +524,27 @@ class Ledger:
             - Remainder from integer division goes to first recipients
             - If amount is 0 or no recipients, returns empty dict
         """
-        recipients = self.get_agent_principal_ids()
-        if exclude and exclude in recipients:
-            recipients = [r for r in recipients if r != exclude]
-
-        if not recipients or amount <= 0:
-            return {}
-
-        # Calculate per-recipient amount and remainder
-        per_recipient = amount // len(recipients)
-        remainder = amount % len(recipients)
-
-        distribution: dict[str, int] = {}
-        for i, pid in enumerate(recipients):
-            # First 'remainder' recipients get 1 extra
-            share = per_recipient + (1 if i < remainder else 0)
-            if share > 0:
-                self.credit_scrip(pid, share)
-                distribution[pid] = share
-
-        return distribution
+        with self._lock:
+            recipients = self.get_agent_principal_ids()
+            if exclude and exclude in recipients:
+                recipients = [r for r in recipients if r != exclude]
+
+            if not recipients or amount <= 0:
+                return {}
+
+            # Calculate per-recipient amount and remainder
+            per_recipient = amount // len(recipients)
+            remainder = amount % len(recipients)
+
+            distribution: dict[str, int] = {}
+            for i, pid in enumerate(recipients):
+                # First 'remainder' recipients get 1 extra
+                share = per_recipient + (1 if i < remainder else 0)
+                if share > 0:
+                    self.credit_scrip(pid, share)
+                    distribution[pid] = share
+
+            return distribution
 
     # ===== RATE LIMITING (Rolling Window) =====
 
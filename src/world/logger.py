@@ -3,12 +3,53 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
+import queue
+import threading
+import time
+import weakref
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
-
-from ..config import get
+from typing import IO, Any, Callable
+
+from ..config import get, get_validated_config
+from .event_segments import SegmentIndexWriter, list_sealed_segments, remove_segments
+from .run_catalog import RunSummary, remove_run_summary, write_run_summary
+
+try:
+    import orjson
+except ImportError:
+    # Optional fast serializer; the ignore is unused where orjson is absent
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+_log = logging.getLogger(__name__)
+
+# Durability levels for events.jsonl writes
+DURABILITY_EVENT = "event"  # Write + flush to the OS on every event (default)
+DURABILITY_BATCH = "batch"  # Buffer; flush on size/time thresholds or flush()
+DURABILITY_FSYNC = "fsync"  # Write + flush + fsync on every event
+DURABILITY_LEVELS = (DURABILITY_EVENT, DURABILITY_BATCH, DURABILITY_FSYNC)
+
+# Writer defaults, used when config is unavailable (mirrors EventLogWriterConfig)
+DEFAULT_WRITER_SETTINGS: dict[str, Any] = {
+    "durability": DURABILITY_EVENT,
+    "flush_max_events": 256,
+    "flush_max_bytes": 1_048_576,
+    "flush_interval_seconds": 1.0,
+    "background_thread": False,
+    "serializer": "json",
+}
+
+DEFAULT_RECENT_BUFFER_SIZE = 1000
+
+# Segment rotation defaults (mirrors EventLogSegmentsConfig)
+DEFAULT_SEGMENT_SETTINGS: dict[str, Any] = {
+    "enabled": False,
+    "max_segment_bytes": 67_108_864,
+    "index_interval": 64,
+}
 
 
 class SummaryLogger:
@@ -187,6 +228,308 @@ class SummaryCollector:
         return summary
 
 
+def read_tail_lines(path: Path, n: int, block_size: int = 65536) -> list[bytes]:
+    """Return the last n non-empty lines of a file without reading all of it.
+
+    Seeks backwards from the end in block_size chunks until n complete lines
+    have been seen, so the cost is proportional to the bytes in those lines
+    rather than to the file size.
+
+    Args:
+        path: File to read
+        n: Number of lines wanted
+        block_size: Bytes read per backward step
+
+    Returns:
+        Up to n lines (without trailing newlines), oldest first
+    """
+    if n <= 0:
+        return []
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return []
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        chunks: list[bytes] = []
+        newlines = 0
+        pos = end
+        # n lines need n+1 newlines to be sure the oldest one is complete
+        while pos > 0 and newlines <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b"\n")
+            chunks.append(chunk)
+    pieces = b"".join(reversed(chunks)).split(b"\n")
+    if pos > 0:
+        # The first piece may be a line cut by the seek; at least n complete
+        # lines follow it, so it is safe to drop
+        pieces = pieces[1:]
+    lines = [line for line in pieces if line.strip()]
+    return lines[-n:]
+
+
+def _serialize_json(event: dict[str, Any]) -> bytes:
+    return (json.dumps(event) + "\n").encode("utf-8")
+
+
+def _serialize_orjson(event: dict[str, Any]) -> bytes:
+    try:
+        line: bytes = orjson.dumps(
+            event, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        )
+        return line
+    except TypeError:
+        # Values orjson rejects (e.g. ints over 64 bits) - stdlib handles them
+        return _serialize_json(event)
+
+
+def get_serializer(name: str) -> Callable[[dict[str, Any]], bytes]:
+    """Return an event -> JSONL line serializer.
+
+    Args:
+        name: "json" (stdlib) or "orjson" (falls back to json if not installed)
+    """
+    if name == "orjson":
+        if orjson is not None:
+            return _serialize_orjson
+        _log.warning("orjson not installed, event log falls back to json serializer")
+        return _serialize_json
+    if name != "json":
+        raise ValueError(f"Unknown event log serializer: {name!r}")
+    return _serialize_json
+
+
+def _get_writer_settings_from_config() -> dict[str, Any]:
+    """Get event log writer settings from config.
+
+    Returns defaults if config is unavailable (during early startup or tests).
+    """
+    try:
+        return get_validated_config().logging.writer.model_dump()
+    except Exception:  # exception-ok: config may be unavailable during startup/tests
+        _log.warning("Failed to load logging.writer from config, using defaults", exc_info=True)
+        return dict(DEFAULT_WRITER_SETTINGS)
+
+
+def _get_recent_buffer_size_from_config() -> int:
+    """Get the recent-events ring buffer size from config."""
+    try:
+        return get_validated_config().logging.recent_buffer_size
+    except Exception:  # exception-ok: config may be unavailable during startup/tests
+        _log.warning(
+            "Failed to load logging.recent_buffer_size from config, using default %d",
+            DEFAULT_RECENT_BUFFER_SIZE,
+            exc_info=True,
+        )
+        return DEFAULT_RECENT_BUFFER_SIZE
+
+
+def _get_segment_settings_from_config() -> dict[str, Any]:
+    """Get event log segment rotation settings from config."""
+    try:
+        return get_validated_config().logging.segments.model_dump()
+    except Exception:  # exception-ok: config may be unavailable during startup/tests
+        _log.warning("Failed to load logging.segments from config, using defaults", exc_info=True)
+        return dict(DEFAULT_SEGMENT_SETTINGS)
+
+
+class _EventLogWriter:
+    """Persistent-handle writer behind EventLogger.
+
+    Keeps events.jsonl open for the life of the run instead of reopening it
+    per event. In batch durability, serialized lines accumulate in memory
+    and are written when flush_max_events / flush_max_bytes is reached,
+    when flush_interval_seconds has passed, or on an explicit flush().
+
+    With background_thread, log() only enqueues the serialized line; a daemon
+    thread owns the file handle and applies the same flush policy, also
+    waking on the interval so quiet periods still reach disk.
+
+    Thread safety: log() may be called from iteration pool threads, so all
+    buffer and handle access is guarded by a lock (or owned by the writer
+    thread). This object holds no reference to the EventLogger so it can be
+    finalized independently of it.
+
+    With segment rotation enabled, a SegmentIndexWriter tracks the active
+    segment; the writer seals it (flush, close, rename) before a line that
+    would push it past max_segment_bytes, and appends index records right
+    after the event bytes they describe reach the file.
+
+    With a RunSummary, every line is also accounted in file order, and the
+    summary sidecar (see run_catalog.py) is rewritten when a segment is
+    sealed, on flush() and on close().
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        settings: dict[str, Any],
+        segments: SegmentIndexWriter | None = None,
+        summary: RunSummary | None = None,
+    ) -> None:
+        durability = settings["durability"]
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Unknown event log durability: {durability!r}")
+        self.path = path
+        self.durability: str = durability
+        self.flush_max_events: int = settings["flush_max_events"]
+        self.flush_max_bytes: int = settings["flush_max_bytes"]
+        self.flush_interval: float = settings["flush_interval_seconds"]
+        self._handle: IO[bytes] | None = None
+        self._buffer: list[bytes] = []
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._segments = segments
+        self._summary = summary
+        self._queue: queue.Queue[tuple[bytes, int, str] | threading.Event | None] | None = None
+        self._thread: threading.Thread | None = None
+        if settings["background_thread"]:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(
+                target=self._writer_loop, name="event-log-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _open(self) -> IO[bytes]:
+        if self._handle is None:
+            self._handle = open(self.path, "ab")
+        return self._handle
+
+    def _write_line(self, line: bytes, sequence: int, event_type: str) -> None:
+        """Apply the durability policy to one line (caller holds the lock)."""
+        if self._segments is not None:
+            if self._segments.should_rotate(len(line)):
+                self._flush_buffer()
+                self._close_handle()
+                self._segments.seal()
+                self._write_summary()
+            self._segments.record(sequence, event_type, len(line))
+        if self._summary is not None:
+            self._summary.record(line, event_type)
+        if self.durability == DURABILITY_BATCH:
+            self._buffer.append(line)
+            self._buffered_bytes += len(line)
+            if (
+                len(self._buffer) >= self.flush_max_events
+                or self._buffered_bytes >= self.flush_max_bytes
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_buffer()
+            return
+        handle = self._open()
+        handle.write(line)
+        handle.flush()
+        if self.durability == DURABILITY_FSYNC:
+            os.fsync(handle.fileno())
+        if self._segments is not None:
+            self._segments.flush_index()
+
+    def _write_summary(self) -> None:
+        """Write the run summary sidecar for everything written so far.
+
+        Caller holds the lock and has flushed the buffer, so the file
+        position matches the lines the summary has recorded.
+        """
+        summary = self._summary
+        if summary is None:
+            return
+        try:
+            stat = os.stat(self.path)
+            summary.active_bytes, summary.active_mtime_ns = stat.st_size, stat.st_mtime_ns
+        except FileNotFoundError:
+            summary.active_bytes, summary.active_mtime_ns = 0, 0
+        summary.sealed_segments = len(list_sealed_segments(self.path))
+        try:
+            write_run_summary(self.path, summary)
+        except OSError:  # exception-ok: the sidecar is a cache; readers rescan without it
+            _log.warning("Failed to write run summary for %s", self.path, exc_info=True)
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _flush_buffer(self) -> None:
+        """Write out buffered lines (caller holds the lock)."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        handle = self._open()
+        handle.write(b"".join(self._buffer))
+        handle.flush()
+        self._buffer.clear()
+        self._buffered_bytes = 0
+        if self._segments is not None:
+            self._segments.flush_index()
+
+    def write(self, line: bytes, sequence: int, event_type: str) -> None:
+        """Queue or write one serialized event line."""
+        if self._closed:
+            # Late events after close(): append directly, hold no handle
+            with self._lock, open(self.path, "ab") as f:
+                f.write(line)
+            return
+        if self._queue is not None:
+            self._queue.put((line, sequence, event_type))
+            return
+        with self._lock:
+            self._write_line(line, sequence, event_type)
+
+    def flush(self) -> None:
+        """Make every logged event visible in the file."""
+        if self._queue is not None:
+            if self._thread is not None and self._thread.is_alive():
+                done = threading.Event()
+                self._queue.put(done)
+                done.wait()
+            return
+        with self._lock:
+            self._flush_buffer()
+            self._write_summary()
+
+    def _writer_loop(self) -> None:
+        """Background thread: drain the queue and apply the flush policy."""
+        assert self._queue is not None
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                with self._lock:
+                    self._flush_buffer()
+                continue
+            with self._lock:
+                if item is None:
+                    self._flush_buffer()
+                    return
+                if isinstance(item, threading.Event):
+                    self._flush_buffer()
+                    self._write_summary()
+                    item.set()
+                    continue
+                self._write_line(*item)
+
+    def close(self) -> None:
+        """Flush everything and release the file handle (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._queue is not None and self._thread is not None:
+            if self._thread.is_alive():
+                self._queue.put(None)
+                self._thread.join()
+        with self._lock:
+            self._flush_buffer()
+            self._close_handle()
+            if self._segments is not None:
+                self._segments.close()
+            self._write_summary()
+
+
 class EventLogger:
     """Append-only JSONL event log with per-run directory support.
 
@@ -198,6 +541,24 @@ class EventLogger:
     2. Legacy mode (output_file only): Single file, overwritten each run
 
     Plan #151: Added sequence counter and resource event helpers per ADR-0020.
+
+    Writes go through a persistent file handle with a configurable durability
+    level (logging.writer): "event" flushes each event to the OS, "batch"
+    buffers and flushes on size/time thresholds, "fsync" also fsyncs each
+    event. Call flush() before reading the file directly (read_recent() does
+    this itself) and close() at shutdown.
+
+    With logging.segments.enabled the log rotates into numbered sealed
+    segments with a sidecar offset index (see event_segments.py); use
+    EventLogIndex or iter_event_log() to read the full history.
+
+    In per-run mode a run summary sidecar (events.meta.json, see
+    run_catalog.py) is kept current on rotation, flush() and close(), so
+    the dashboard can list runs without reading their logs.
+
+    The last logging.recent_buffer_size serialized events are also kept in
+    an in-memory ring buffer, so read_recent(n) is O(n) regardless of log
+    size. Larger requests fall back to a reverse-seek tail read of the file.
     """
 
     output_path: Path
@@ -205,12 +566,16 @@ class EventLogger:
     _logs_dir: Path | None
     _run_id: str | None
     _sequence: int  # Monotonic event counter (Plan #151)
+    _writer: _EventLogWriter
 
     def __init__(
         self,
         output_file: str | None = None,
         logs_dir: str | None = None,
         run_id: str | None = None,
+        writer_settings: dict[str, Any] | None = None,
+        recent_buffer_size: int | None = None,
+        segment_settings: dict[str, Any] | None = None,
     ) -> None:
         """Initialize the event logger.
 
@@ -218,11 +583,23 @@ class EventLogger:
             output_file: Legacy mode - single file path (default: run.jsonl)
             logs_dir: Per-run mode - base directory for run logs
             run_id: Per-run mode - unique run identifier (e.g., run_20260115_120000)
+            writer_settings: Overrides for logging.writer settings
+                (durability, flush_max_events, flush_max_bytes,
+                flush_interval_seconds, background_thread, serializer)
+            recent_buffer_size: Events kept in memory for read_recent()
+                (default: logging.recent_buffer_size)
+            segment_settings: Overrides for logging.segments settings
+                (enabled, max_segment_bytes, index_interval)
         """
         self._logs_dir = Path(logs_dir) if logs_dir else None
         self._run_id = run_id
         self.summary_logger = None  # Set in _setup_per_run_logging if applicable
         self._sequence = 0  # Plan #151: monotonic event counter
+        self._sequence_lock = threading.Lock()
+        # Serialized recent events, newest last (read_recent fast path)
+        if recent_buffer_size is None:
+            recent_buffer_size = _get_recent_buffer_size_from_config()
+        self._recent: deque[bytes] = deque(maxlen=recent_buffer_size)
 
         if logs_dir and run_id:
             # Per-run mode: create timestamped directory
@@ -231,6 +608,24 @@ class EventLogger:
             # Legacy mode: single file
             self._setup_legacy_logging(output_file)
 
+        settings = _get_writer_settings_from_config()
+        if writer_settings:
+            settings.update(writer_settings)
+        self._serialize = get_serializer(settings["serializer"])
+        segments = _get_segment_settings_from_config()
+        if segment_settings:
+            segments.update(segment_settings)
+        segment_writer = None
+        if segments["enabled"]:
+            segment_writer = SegmentIndexWriter(
+                self.output_path, segments["max_segment_bytes"], segments["index_interval"]
+            )
+        # Only per-run logs are listed by the dashboard's run catalog
+        summary = RunSummary() if self._run_id is not None and self._logs_dir is not None else None
+        self._writer = _EventLogWriter(self.output_path, settings, segment_writer, summary)
+        # Flush buffered events if the logger is dropped or the process exits
+        self._finalizer = weakref.finalize(self, self._writer.close)
+
     def _setup_per_run_logging(self) -> None:
         """Set up per-run directory logging."""
         if self._logs_dir is None or self._run_id is None:
@@ -243,6 +638,8 @@ class EventLogger:
         # Set output path
         self.output_path = run_dir / "events.jsonl"
         self.output_path.write_text("")  # Clear/create file
+        remove_segments(self.output_path)  # Drop a previous run's segments/index
+        remove_run_summary(self.output_path)
 
         # Create companion SummaryLogger for tractable periodic summaries
         self.summary_logger = SummaryLogger(run_dir / "summary.jsonl")
@@ -270,6 +667,7 @@ class EventLogger:
         self.output_path = Path(resolved_file)
         # Clear existing log on init (new run)
         self.output_path.write_text("")
+        remove_segments(self.output_path)
 
     def log(self, event_type: str, data: dict[str, Any]) -> None:
         """Log an event to the JSONL file.
@@ -277,15 +675,37 @@ class EventLogger:
         Plan #151: All events include a monotonic 'sequence' field for ordering.
         Events also include 'event_number' from the caller for correlation.
         """
-        self._sequence += 1
-        event: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "sequence": self._sequence,  # Plan #151: monotonic counter
-            "event_type": event_type,
-            **data,
-        }
-        with open(self.output_path, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        # One lock keeps sequence order, ring buffer order and file order
+        # identical when pooled iterations log from several threads
+        with self._sequence_lock:
+            self._sequence += 1
+            event: dict[str, Any] = {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "sequence": self._sequence,  # Plan #151: monotonic counter
+                "event_type": event_type,
+                **data,
+            }
+            # Serialize now so later mutation of data cannot change the record
+            line = self._serialize(event)
+            self._recent.append(line)
+            self._writer.write(line, self._sequence, event_type)
+
+    def flush(self) -> None:
+        """Write any buffered events to events.jsonl.
+
+        Called on shutdown and before checkpoints; anything that reads the
+        log file directly should flush first.
+        """
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Flush buffered events and close the log file handle."""
+        self._writer.close()
+
+    @property
+    def durability(self) -> str:
+        """Return the configured durability level."""
+        return self._writer.durability
 
     # ========== Plan #151: Resource Event Helpers (ADR-0020) ==========
 
@@ -410,12 +830,22 @@ class EventLogger:
                 n = default_recent
             else:
                 n = 50
-        if not self.output_path.exists():
+        if n <= 0:
             return []
-        lines = self.output_path.read_text().strip().split("\n")
-        lines = [line for line in lines if line]  # filter empty
-        recent = lines[-n:] if len(lines) > n else lines
-        return [json.loads(line) for line in recent]
+        # The ring buffer holds everything since the log was (re)created
+        # until it wraps, so it is authoritative for n within its size
+        recent = list(self._recent)
+        if n <= len(recent) or self._sequence == len(recent):
+            lines = recent[-n:]
+        else:
+            self.flush()
+            lines = read_tail_lines(self.output_path, n)
+            # Continue into sealed segments if rotation split the tail
+            for segment in reversed(list_sealed_segments(self.output_path)):
+                if len(lines) >= n:
+                    break
+                lines = read_tail_lines(segment, n - len(lines)) + lines
+        return [json.loads(line) for line in lines]
 
     @property
     def run_id(self) -> str | None:
@@ -5,6 +5,11 @@ This module handles the mint auction system:
 - Track pending submissions and escrowed bids
 - Resolve auctions (second-price, LLM scoring, UBI distribution)
 
+Resolution settles bids synchronously, then scores the winner. The
+simulation's mint loop uses update_async()/resolve_async(), which await the
+scorer's thread pool so scoring never blocks agent loops; submissions made
+while a score is pending belong to the next auction.
+
 Plan #44 - Kernel Mint Primitives
 """
 
@@ -16,6 +21,7 @@ import uuid
 from typing import Any, TypedDict, TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
+    from .mint_scorer import ScoringResult
     from .ledger import Ledger
     from .artifacts import ArtifactStore
     from .logger import EventLogger
@@ -47,6 +53,15 @@ class KernelMintResult(TypedDict, total=False):
     resolved_at: int  # Event number when resolved
 
 
+class _Settlement(TypedDict):
+    """Bid settlement of a resolving auction, before the winner is scored."""
+    winner_id: str
+    artifact_id: str
+    winning_bid: int
+    price_paid: int
+    ubi_distributed: dict[str, int]
+
+
 class MintAuction:
     """Manages mint auctions - artifact scoring and scrip minting.
 
@@ -272,18 +287,30 @@ class MintAuction:
 
         Returns KernelMintResult if an auction was resolved, None otherwise.
         """
+        if not self._resolution_due():
+            return None
+        return self.resolve()
+
+    async def update_async(self) -> KernelMintResult | None:
+        """update() that awaits scoring instead of blocking on it."""
+        if not self._resolution_due():
+            return None
+        return await self.resolve_async()
+
+    def _resolution_due(self) -> bool:
+        """Advance the auction schedule; True if an auction should resolve now."""
         now = time.time()
         elapsed = now - self._start_time
 
         # Not yet time for first auction
         if elapsed < self._first_auction_delay_seconds:
-            return None
+            return False
 
         # Check if we should start a new bidding window
         if self._auction_start_time is None:
             # Start first auction
             self._auction_start_time = now
-            return None
+            return False
 
         # Calculate time since this auction period started
         time_since_auction_start = now - self._auction_start_time
@@ -293,18 +320,14 @@ class MintAuction:
             # Check if we haven't already resolved this auction
             # by seeing if we're past the bidding window but before next period
             if time_since_auction_start < self._period_seconds:
-                # Resolve the auction
-                result = self.resolve()
                 # Schedule next auction at the end of this period
                 self._auction_start_time = self._auction_start_time + self._period_seconds
-                return result
-            else:
-                # We're past the period - start a new auction
-                # This handles cases where update() wasn't called for a while
-                self._auction_start_time = now
-                return None
+                return True
+            # We're past the period - start a new auction
+            # This handles cases where update() wasn't called for a while
+            self._auction_start_time = now
 
-        return None
+        return False
 
     def resolve(self, _mock_score: int | None = None) -> KernelMintResult:
         """Resolve the current mint auction.
@@ -319,20 +342,82 @@ class MintAuction:
         Returns:
             KernelMintResult with auction outcome
         """
+        settlement = self._settle()
+        if settlement is None:
+            return self._record_no_submissions()
+
+        if _mock_score is not None:
+            # Testing mode - use provided score
+            return self._complete(settlement, {
+                "success": True,
+                "score": _mock_score,
+                "reason": "Mock score for testing",
+            })
+
+        # Production mode - use LLM scorer
+        artifact = self._artifacts.get(settlement["artifact_id"])
+        if artifact is None:
+            return self._complete(settlement, None, f"Artifact {settlement['artifact_id']} not found")
+        try:
+            from .mint_scorer import get_scorer
+            score_result = get_scorer().score_artifact(
+                artifact_id=settlement["artifact_id"],
+                artifact_type=artifact.type,
+                content=artifact.content,
+                is_budget_exhausted=self._is_budget_exhausted,
+            )
+        except Exception as e:  # exception-ok: scoring runs external code
+            return self._complete(settlement, None, f"Scoring error: {str(e)}")
+        return self._complete(settlement, score_result)
+
+    async def resolve_async(self) -> KernelMintResult:
+        """Resolve the current mint auction, awaiting the LLM score.
+
+        Bids are settled (and the submissions cleared) before scoring, so
+        submissions arriving while the score is pending go to the next
+        auction.
+        """
+        settlement = self._settle()
+        if settlement is None:
+            return self._record_no_submissions()
+
+        artifact = self._artifacts.get(settlement["artifact_id"])
+        if artifact is None:
+            return self._complete(settlement, None, f"Artifact {settlement['artifact_id']} not found")
+        try:
+            from .mint_scorer import get_scorer
+            score_result = await get_scorer().score_artifact_async(
+                artifact_id=settlement["artifact_id"],
+                artifact_type=artifact.type,
+                content=artifact.content,
+                is_budget_exhausted=self._is_budget_exhausted,
+            )
+        except Exception as e:  # exception-ok: scoring runs external code
+            return self._complete(settlement, None, f"Scoring error: {str(e)}")
+        return self._complete(settlement, score_result)
+
+    def _record_no_submissions(self) -> KernelMintResult:
+        result: KernelMintResult = {
+            "winner_id": None,
+            "artifact_id": None,
+            "winning_bid": 0,
+            "price_paid": 0,
+            "score": None,
+            "scrip_minted": 0,
+            "ubi_distributed": {},
+            "error": "No submissions",
+            "resolved_at": self.event_number,
+        }
+        self._history.append(result)
+        return result
+
+    def _settle(self) -> _Settlement | None:
+        """Pick the winner, settle bids and distribute UBI; None if no bids.
+
+        Clears the pending submissions for the next auction.
+        """
         if not self._submissions:
-            result: KernelMintResult = {
-                "winner_id": None,
-                "artifact_id": None,
-                "winning_bid": 0,
-                "price_paid": 0,
-                "score": None,
-                "scrip_minted": 0,
-                "ubi_distributed": {},
-                "error": "No submissions",
-                "resolved_at": self.event_number,
-            }
-            self._history.append(result)
-            return result
+            return None
 
         # Sort by bid amount (descending)
         submissions = list(self._submissions.values())
@@ -340,7 +425,6 @@ class MintAuction:
 
         winner = sorted_subs[0]
         winner_id = winner["principal_id"]
-        artifact_id = winner["artifact_id"]
         winning_bid = winner["bid"]
 
         # Second-price: pay the second-highest bid (or minimum if only one)
@@ -359,81 +443,68 @@ class MintAuction:
         if refund_to_winner > 0:
             self._ledger.credit_scrip(winner_id, refund_to_winner)
 
-        # Clear held bids
+        # Clear held bids and submissions for next auction
         self._held_bids.clear()
+        self._submissions.clear()
 
         # Distribute UBI from price paid
         ubi_distribution = self._ledger.distribute_ubi(price_paid, exclude=winner_id)
 
-        # Score the artifact
+        return {
+            "winner_id": winner_id,
+            "artifact_id": winner["artifact_id"],
+            "winning_bid": winning_bid,
+            "price_paid": price_paid,
+            "ubi_distributed": ubi_distribution,
+        }
+
+    def _complete(
+        self,
+        settlement: _Settlement,
+        score_result: ScoringResult | None,
+        error: str | None = None,
+    ) -> KernelMintResult:
+        """Mint scrip for the winner's score, then record and log the result."""
+        winner_id = settlement["winner_id"]
         score: int | None = None
         score_reason: str | None = None
         scrip_minted = 0
-        error: str | None = None
 
-        if _mock_score is not None:
-            # Testing mode - use provided score
-            score = _mock_score
-            score_reason = "Mock score for testing"
-            scrip_minted = score // self._mint_ratio
-            if scrip_minted > 0:
-                self.mint_scrip(winner_id, scrip_minted)
-        else:
-            # Production mode - use LLM scorer
-            artifact = self._artifacts.get(artifact_id)
-            if artifact:
-                try:
-                    from .mint_scorer import get_scorer
-                    scorer = get_scorer()
-                    score_result = scorer.score_artifact(
-                        artifact_id=artifact_id,
-                        artifact_type=artifact.type,
-                        content=artifact.content,
-                        is_budget_exhausted=self._is_budget_exhausted,
-                    )
-
-                    # Track scorer's LLM cost (Plan #153)
-                    if self._track_api_cost is not None:
-                        scorer_cost = getattr(scorer, "last_cost", 0.0)
-                        if scorer_cost > 0:
-                            self._track_api_cost(scorer_cost)
-
-                    if score_result["success"]:
-                        score = score_result["score"]
-                        score_reason = score_result.get("reason")
-                        scrip_minted = score // self._mint_ratio
-                        if scrip_minted > 0:
-                            self.mint_scrip(winner_id, scrip_minted)
-                    else:
-                        error = score_result.get("error", "Scoring failed")
-                except Exception as e:  # exception-ok: scoring runs external code
-                    error = f"Scoring error: {str(e)}"
+        if score_result is not None:
+            # Track scorer's LLM cost (Plan #153)
+            scorer_cost = score_result.get("cost", 0.0)
+            if self._track_api_cost is not None and scorer_cost > 0:
+                self._track_api_cost(scorer_cost)
+
+            if score_result["success"]:
+                score = score_result["score"]
+                score_reason = score_result.get("reason")
+                scrip_minted = score // self._mint_ratio
+                if scrip_minted > 0:
+                    self.mint_scrip(winner_id, scrip_minted)
             else:
-                error = f"Artifact {artifact_id} not found"
+                error = score_result.get("error", "Scoring failed")
 
         result = KernelMintResult(
             winner_id=winner_id,
-            artifact_id=artifact_id,
-            winning_bid=winning_bid,
-            price_paid=price_paid,
+            artifact_id=settlement["artifact_id"],
+            winning_bid=settlement["winning_bid"],
+            price_paid=settlement["price_paid"],
             score=score,
             score_reason=score_reason,
             scrip_minted=scrip_minted,
-            ubi_distributed=ubi_distribution,
+            ubi_distributed=settlement["ubi_distributed"],
             error=error,
             resolved_at=self.event_number,
         )
         self._history.append(result)
 
-        # Clear submissions for next auction
-        self._submissions.clear()
-
         self._logger.log("mint_auction_resolved", {
             "event_number": self.event_number,
             "winner_id": winner_id,
-            "artifact_id": artifact_id,
-            "winning_bid": winning_bid,
-            "price_paid": price_paid,
+            "artifact_id": settlement["artifact_id"],
+            "winning_bid": settlement["winning_bid"],
+            "price_paid": settlement["price_paid"],
             "score": score,
             "score_reason": score_reason,
             "scrip_minted": scrip_minted,
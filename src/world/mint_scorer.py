@@ -8,6 +8,14 @@ Scores submitted code on quality and utility criteria:
 - Originality (duplicate detection via content hash)
 
 All configuration (model, timeout, max_content_length) comes from config.yaml.
+
+LLM calls run on a long-lived thread pool (mint_scorer.thread_pool_workers),
+so scoring never blocks the event loop: score_artifact_async() and
+score_artifacts() await the pool, several submissions can be scored at once,
+and content hashes are claimed before dispatch so identical content reaches
+the LLM only once. Successful scores are cached per content hash for the
+scorer's lifetime (across auctions); a failed call releases its hash so the
+content can be scored again later.
 """
 
 from __future__ import annotations
@@ -15,8 +23,10 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, TypedDict
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Sequence, TypedDict
 
 from .llm_client import call_llm
 from ..config import get, get_validated_config
@@ -60,26 +70,51 @@ class ScoringResult(TypedDict, total=False):
     score: int
     reason: str
     error: str
+    cost: float  # LLM cost of this call (0.0 if no call was made)
+
+
+class ScoringRequest(TypedDict):
+    """One artifact to score in a score_artifacts() batch."""
+    artifact_id: str
+    artifact_type: str
+    content: str
+
+
+DUPLICATE_REASON = "Duplicate content - no originality reward"
+
+
+def _failure(error: str) -> ScoringResult:
+    return {"success": False, "score": 0, "reason": "", "error": error, "cost": 0.0}
 
 
 class MintScorer:
     """Uses an LLM to score artifacts for the mint.
 
     All settings (model, timeout, max_content_length) come from config.yaml.
+    Thread-safe: the originality check and score cache are guarded by a lock.
     """
 
     model: str
     timeout: int
     max_content_length: int
+    result_timeout: float
+    workers: int
     last_cost: float  # Cost of most recent LLM call (for mint_auction tracking)
-    _seen_hashes: set[str] = set()
 
     def __init__(self, model: str | None = None, log_dir: str | None = None) -> None:
         # Get config values with fallbacks
         self.model = model or get("mint_scorer.model") or "gemini/gemini-3-flash-preview"
         self.timeout = get("mint_scorer.timeout") or 30
         self.max_content_length = get("mint_scorer.max_content_length") or 2000
+        self.result_timeout = get("mint_scorer.result_timeout") or 60.0
+        self.workers = get("mint_scorer.thread_pool_workers") or 4
         self.last_cost = 0.0
+        # Hashes claimed by a scoring (in flight or scored)
+        self._seen_hashes: set[str] = set()
+        # Content hash -> successful result of the scoring that claimed it
+        self._scores: dict[str, ScoringResult] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
 
     def _compute_content_hash(self, content: str) -> str:
         """Compute MD5 hash of content for duplicate detection."""
@@ -90,7 +125,73 @@ class MintScorer:
     def is_original(self, content: str) -> bool:
         """Check if content is original (not seen before)."""
         content_hash = self._compute_content_hash(content)
-        return content_hash not in self._seen_hashes
+        with self._lock:
+            return content_hash not in self._seen_hashes
+
+    def cached_score(self, content: str) -> ScoringResult | None:
+        """Result of the earlier successful scoring of this content, if any."""
+        content_hash = self._compute_content_hash(content)
+        with self._lock:
+            return self._scores.get(content_hash)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="mint-scorer"
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the scoring pool (in-flight calls finish in the background)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _claim(self, content: str) -> tuple[str, bool]:
+        """Claim content's hash for a scoring; False if already claimed."""
+        content_hash = self._compute_content_hash(content)
+        with self._lock:
+            if content_hash in self._seen_hashes:
+                return content_hash, False
+            self._seen_hashes.add(content_hash)
+            return content_hash, True
+
+    def _finish(self, content_hash: str, result: ScoringResult) -> None:
+        """Cache a successful result, or release the hash of a failed one."""
+        with self._lock:
+            if result["success"]:
+                self._scores[content_hash] = result
+            else:
+                self._seen_hashes.discard(content_hash)
+        self.last_cost = result.get("cost", 0.0)
+
+    def _precheck(
+        self, content: str, is_budget_exhausted: Callable[[], bool] | None
+    ) -> tuple[str, ScoringResult | None]:
+        """Budget and originality checks before dispatch.
+
+        Returns the content hash and, if no LLM call should be made, the
+        result to return instead. Otherwise the hash is claimed.
+        """
+        # Check budget before making LLM call (defense in depth)
+        if is_budget_exhausted is not None and is_budget_exhausted():
+            self.last_cost = 0.0
+            return "", _failure("LLM budget exhausted - scoring skipped")
+
+        # Check for duplicate content (originality check)
+        content_hash, claimed = self._claim(content)
+        if not claimed:
+            self.last_cost = 0.0
+            return content_hash, {
+                "success": True,
+                "score": 0,
+                "reason": DUPLICATE_REASON,
+                "error": "",
+                "cost": 0.0,
+            }
+        return content_hash, None
 
     def score_artifact(
         self,
@@ -100,7 +201,10 @@ class MintScorer:
         is_budget_exhausted: Callable[[], bool] | None = None,
     ) -> ScoringResult:
         """
-        Score an artifact using LLM evaluation.
+        Score an artifact using LLM evaluation (blocking).
+
+        Prefer score_artifact_async() from async code: this blocks the
+        calling thread until the LLM responds.
 
         Args:
             artifact_id: The artifact's ID
@@ -114,28 +218,82 @@ class MintScorer:
             - score: int (0-100)
             - reason: str (explanation)
             - error: str (if failed)
+            - cost: float (LLM cost of this call)
         """
-        # Check budget before making LLM call (defense in depth)
-        if is_budget_exhausted is not None and is_budget_exhausted():
-            return {
-                "success": False,
-                "score": 0,
-                "reason": "",
-                "error": "LLM budget exhausted - scoring skipped"
-            }
+        content_hash, early = self._precheck(content, is_budget_exhausted)
+        if early is not None:
+            return early
 
-        # Check for duplicate content (originality check)
-        content_hash = self._compute_content_hash(content)
-        if content_hash in self._seen_hashes:
-            return {
-                "success": True,
-                "score": 0,
-                "reason": "Duplicate content - no originality reward",
-                "error": ""
-            }
-        # Mark as seen for future duplicate detection
-        self._seen_hashes.add(content_hash)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No async loop - call directly
+            result = self._score_blocking(artifact_id, artifact_type, content)
+        else:
+            # litellm detects a running event loop and refuses sync calls,
+            # so run the call on the scoring pool
+            future = self._get_executor().submit(
+                self._score_blocking, artifact_id, artifact_type, content
+            )
+            try:
+                result = future.result(timeout=self.result_timeout)
+            except FutureTimeoutError:
+                result = _failure(f"LLM call failed: no result after {self.result_timeout}s")
+        self._finish(content_hash, result)
+        return result
+
+    async def score_artifact_async(
+        self,
+        artifact_id: str,
+        artifact_type: str,
+        content: str,
+        is_budget_exhausted: Callable[[], bool] | None = None,
+    ) -> ScoringResult:
+        """Score an artifact on the scoring pool without blocking the loop.
 
+        Same arguments and result as score_artifact().
+        """
+        content_hash, early = self._precheck(content, is_budget_exhausted)
+        if early is not None:
+            return early
+
+        loop = asyncio.get_running_loop()
+        pending = loop.run_in_executor(
+            self._get_executor(), self._score_blocking, artifact_id, artifact_type, content
+        )
+        try:
+            result = await asyncio.wait_for(pending, self.result_timeout)
+        except asyncio.TimeoutError:
+            result = _failure(f"LLM call failed: no result after {self.result_timeout}s")
+        except BaseException:
+            self._finish(content_hash, _failure("Scoring cancelled"))
+            raise
+        self._finish(content_hash, result)
+        return result
+
+    async def score_artifacts(
+        self,
+        requests: Sequence[ScoringRequest],
+        is_budget_exhausted: Callable[[], bool] | None = None,
+    ) -> list[ScoringResult]:
+        """Score several artifacts concurrently, in request order.
+
+        Hashes are claimed in request order before any call is dispatched,
+        so when requests share content only the first is sent to the LLM;
+        the others get the duplicate result.
+        """
+        return list(await asyncio.gather(*(
+            self.score_artifact_async(
+                request["artifact_id"],
+                request["artifact_type"],
+                request["content"],
+                is_budget_exhausted=is_budget_exhausted,
+            )
+            for request in requests
+        )))
+
+    def _score_blocking(self, artifact_id: str, artifact_type: str, content: str) -> ScoringResult:
+        """Call the LLM and parse its score (runs on a pool thread or directly)."""
         # Truncate very long content
         if len(content) > self.max_content_length:
             content = content[:self.max_content_length] + "... [truncated]"
@@ -148,32 +306,11 @@ class MintScorer:
 
         try:
             messages = [{"role": "user", "content": prompt}]
-
-            # Run LLM call in thread pool to avoid async context issues
-            # (litellm detects async event loop and refuses sync calls)
-            try:
-                asyncio.get_running_loop()
-                # We're in an async context - run in thread pool
-                config = get_validated_config()
-                workers = config.mint_scorer.thread_pool_workers
-                with ThreadPoolExecutor(max_workers=workers) as executor:
-                    future = executor.submit(
-                        call_llm, self.model, messages, timeout=self.timeout
-                    )
-                    llm_result = future.result(timeout=60)
-            except RuntimeError:
-                # No async loop - call directly
-                llm_result = call_llm(self.model, messages, timeout=self.timeout)
-
-            self.last_cost = llm_result.cost
+            llm_result = call_llm(self.model, messages, timeout=self.timeout)
+            cost = llm_result.cost
             response: str = llm_result.content
         except Exception as e:  # exception-ok: LLM scoring can fail any way
-            return {
-                "success": False,
-                "score": 0,
-                "reason": "",
-                "error": f"LLM call failed: {e}"
-            }
+            return _failure(f"LLM call failed: {e}")
 
         # Parse the response
         try:
@@ -212,16 +349,14 @@ class MintScorer:
                 "success": True,
                 "score": score,
                 "reason": reason,
-                "error": ""
+                "error": "",
+                "cost": cost,
             }
 
         except (json.JSONDecodeError, ValueError, KeyError) as e:
-            return {
-                "success": False,
-                "score": 0,
-                "reason": "",
-                "error": f"Failed to parse LLM response: {e}"
-            }
+            result = _failure(f"Failed to parse LLM response: {e}")
+            result["cost"] = cost
+            return result
 
 
 # Singleton instance
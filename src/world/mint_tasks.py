@@ -16,16 +16,23 @@ Flow:
 
 from __future__ import annotations
 
+import hashlib
 import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from types import CodeType
 from typing import Any, TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from .ledger import Ledger
     from .artifacts import Artifact, ArtifactStore
-    from .executor import SafeExecutor
+    from .executor import ExecutionResult, SafeExecutor
     from .logger import EventLogger
+    from .task_runner import TaskTestRunner
+
+# Evaluations remembered per (code hash, task id), mirroring TaskEvaluationConfig
+DEFAULT_EVALUATION_CACHE_SIZE = 1024
 
 
 @dataclass
@@ -168,20 +175,34 @@ class MintTaskManager:
         artifacts: ArtifactStore,
         executor: SafeExecutor,
         logger: EventLogger,
+        test_runner: TaskTestRunner | None = None,
+        short_circuit: bool = True,
+        cache_size: int = DEFAULT_EVALUATION_CACHE_SIZE,
     ) -> None:
         """Initialize MintTaskManager.
 
         Args:
             ledger: For scrip operations
             artifacts: For artifact access
-            executor: For running tests
+            executor: For validating/compiling code (and running tests
+                in-process when there is no test_runner)
             logger: For event logging
+            test_runner: Runs tests in parallel sandboxed workers (optional)
+            short_circuit: Stop running hidden tests at the first failure
+            cache_size: Evaluations remembered per (code, task); 0 disables
         """
         self._ledger = ledger
         self._artifacts = artifacts
         self._executor = executor
         self._logger = logger
+        self._test_runner = test_runner
+        self._short_circuit = short_circuit
+        self._cache_size = cache_size
         self._tasks: dict[str, MintTask] = {}
+        # (code sha256, task_id) -> (public results, hidden passed), LRU order
+        self._evaluations: OrderedDict[
+            tuple[str, str], tuple[list[TaskTestResult], bool | None]
+        ] = OrderedDict()
 
     def seed_from_config(self, seed_tasks: list[dict[str, Any]]) -> None:
         """Load tasks from configuration.
@@ -228,6 +249,9 @@ class MintTaskManager:
                 expires_at=expires_at,
             )
             self._tasks[task_id] = task
+            # Tests may have changed: forget evaluations against the old task
+            for key in [k for k in self._evaluations if k[1] == task_id]:
+                del self._evaluations[key]
 
             self._logger.log("mint_task_created", {
                 "task_id": task_id,
@@ -262,54 +286,37 @@ class MintTaskManager:
         """
         return self._tasks.get(task_id)
 
-    def _run_test(
+    def _to_test_result(
         self,
-        artifact: Artifact,
         test: TaskTest,
+        exec_result: ExecutionResult,
     ) -> TaskTestResult:
-        """Run a single test against an artifact.
+        """Turn one execution of an artifact's run() into a test result.
 
         Args:
-            artifact: Artifact to test
-            test: Test to run
+            test: Test that was run
+            exec_result: Result of run(*test.invoke_args)
 
         Returns:
             Test result
         """
-        try:
-            # Execute artifact's run() with test args
-            exec_result = self._executor.execute(
-                code=artifact.code,
-                args=test.invoke_args,
+        if not exec_result.get("success", False):
+            return TaskTestResult(
+                test_id=test.test_id,
+                passed=False,
+                expected=test.expected_result,
+                actual=None,
+                error=exec_result.get("error", "Execution failed"),
             )
 
-            if not exec_result.get("success", False):
-                return TaskTestResult(
-                    test_id=test.test_id,
-                    passed=False,
-                    expected=test.expected_result,
-                    actual=None,
-                    error=exec_result.get("error", "Execution failed"),
-                )
-
-            actual = exec_result.get("result")
-
-            # Check assertion
+        actual = exec_result.get("result")
+        try:
             passed = self._check_assertion(
                 actual,
                 test.expected_result,
                 test.assertion_type,
             )
-
-            return TaskTestResult(
-                test_id=test.test_id,
-                passed=passed,
-                expected=test.expected_result,
-                actual=actual,
-                error=None,
-            )
-
-        except Exception as e:  # exception-ok: test execution runs user code
+        except Exception as e:  # exception-ok: assertions compare user-returned values
             return TaskTestResult(
                 test_id=test.test_id,
                 passed=False,
@@ -318,6 +325,113 @@ class MintTaskManager:
                 error=str(e),
             )
 
+        return TaskTestResult(
+            test_id=test.test_id,
+            passed=passed,
+            expected=test.expected_result,
+            actual=actual,
+            error=None,
+        )
+
+    def _run_tests(
+        self,
+        compiled: CodeType,
+        tests: list[TaskTest],
+        short_circuit: bool,
+    ) -> list[TaskTestResult]:
+        """Run tests against compiled artifact code.
+
+        Tests run in parallel on the test runner when there is one, else
+        one after another in-process.
+
+        Args:
+            compiled: Validated, compiled artifact code
+            tests: Tests to run
+            short_circuit: Stop starting tests after the first failure
+
+        Returns:
+            Results of the tests that ran, in test order
+        """
+        if self._test_runner is None:
+            results = []
+            for test in tests:
+                result = self._to_test_result(
+                    test, self._executor.execute_compiled(compiled, test.invoke_args)
+                )
+                results.append(result)
+                if short_circuit and not result.passed:
+                    break
+            return results
+
+        converted: dict[int, TaskTestResult] = {}
+
+        def on_result(index: int, exec_result: ExecutionResult) -> bool:
+            converted[index] = self._to_test_result(tests[index], exec_result)
+            return short_circuit and not converted[index].passed
+
+        self._test_runner.run(
+            compiled,
+            [test.invoke_args for test in tests],
+            stop=on_result,
+        )
+        return [converted[i] for i in sorted(converted)]
+
+    def _evaluate(
+        self,
+        artifact: Artifact,
+        task: MintTask,
+    ) -> tuple[list[TaskTestResult], bool | None]:
+        """Run a task's tests against an artifact's code.
+
+        The code is validated and compiled once for all tests. Public tests
+        always all run (their results are the submitter's feedback); hidden
+        tests only run if every public test passed and, with short_circuit,
+        stop at the first failure. Results are remembered per (code, task),
+        so resubmitting unchanged code does not run the tests again.
+
+        Args:
+            artifact: Artifact to test
+            task: Task whose tests to run
+
+        Returns:
+            (public test results, hidden_passed); hidden_passed is None when
+            the hidden tests did not run
+        """
+        key = (hashlib.sha256(artifact.code.encode()).hexdigest(), task.task_id)
+        cached = self._evaluations.get(key)
+        if cached is not None:
+            self._evaluations.move_to_end(key)
+            return cached
+
+        compiled, error = self._executor._compile_validated(artifact.code)
+        if compiled is None:
+            public_results = [
+                self._to_test_result(test, {"success": False, "error": error})
+                for test in task.public_tests
+            ]
+        else:
+            public_results = self._run_tests(compiled, task.public_tests, short_circuit=False)
+
+        hidden_passed: bool | None = None
+        if all(r.passed for r in public_results):
+            if compiled is None:
+                # Only reachable for tasks without public tests
+                hidden_passed = not task.hidden_tests
+            else:
+                hidden_results = self._run_tests(
+                    compiled, task.hidden_tests, short_circuit=self._short_circuit
+                )
+                hidden_passed = len(hidden_results) == len(task.hidden_tests) and all(
+                    r.passed for r in hidden_results
+                )
+
+        evaluation = (public_results, hidden_passed)
+        if self._cache_size > 0:
+            self._evaluations[key] = evaluation
+            if len(self._evaluations) > self._cache_size:
+                self._evaluations.popitem(last=False)
+        return evaluation
+
     def _check_assertion(
         self,
         actual: Any,
@@ -346,6 +460,11 @@ class MintTaskManager:
             # Unknown assertion type - fail safe
             return False
 
+    def shutdown(self) -> None:
+        """Stop the test runner's worker processes (if any)."""
+        if self._test_runner is not None:
+            self._test_runner.shutdown()
+
     def submit_solution(
         self,
         principal_id: str,
@@ -410,11 +529,8 @@ class MintTaskManager:
                 message=f"Artifact '{artifact_id}' has no executable code",
             )
 
-        # Run public tests
-        public_results = [
-            self._run_test(artifact, test)
-            for test in task.public_tests
-        ]
+        # Run public tests, then hidden tests if all public tests passed
+        public_results, hidden_passed = self._evaluate(artifact, task)
         public_passed = all(r.passed for r in public_results)
 
         # Log submission attempt
@@ -437,13 +553,6 @@ class MintTaskManager:
                 message="Public tests failed. Fix issues and try again.",
             )
 
-        # Run hidden tests
-        hidden_results = [
-            self._run_test(artifact, test)
-            for test in task.hidden_tests
-        ]
-        hidden_passed = all(r.passed for r in hidden_results)
-
         if not hidden_passed:
             return TaskSubmissionResult(
                 success=False,
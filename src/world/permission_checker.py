@@ -6,6 +6,7 @@ This module provides permission checking logic for:
 - Contract-based permission checking (Plan #100)
 - Dangling contract fallback handling (ADR-0017)
 - TTL-based permission caching
+- Kernel contract fast path (precomputed decision table)
 
 The functions here are used by SafeExecutor to check permissions before
 artifact access operations.
@@ -24,8 +25,9 @@ from .contracts import (
     ExecutableContract,
     PermissionAction,
     PermissionResult,
+    context_version,
 )
-from .kernel_contracts import get_contract_by_id, get_kernel_contract
+from .kernel_contracts import decide_kernel_permission, get_contract_by_id, get_kernel_contract
 
 if TYPE_CHECKING:
     from .artifacts import Artifact, ArtifactStore
@@ -61,7 +63,10 @@ def get_contract_with_fallback_info(
     found.
 
     Plan #100 Phase 2, ADR-0017: Dangling contracts fail open to default.
-    Plan #317: Artifact-store lookup for agent-created contracts.
+    Plan #317: Artifact-store lookup for agent-created contracts. A cached
+    artifact contract is reloaded when the artifact's code has changed, and
+    the artifact's metadata["cache_policy"] (e.g. {"ttl_seconds": 60})
+    opts it into permission result caching.
 
     Args:
         contract_id: The contract ID to look up
@@ -75,8 +80,15 @@ def get_contract_with_fallback_info(
         - is_fallback: True if this is a fallback due to missing contract
         - original_contract_id: The original ID if fallback occurred, else None
     """
-    if contract_id in contract_cache:
-        return contract_cache[contract_id], False, None
+    cached = contract_cache.get(contract_id)
+    if cached is not None:
+        # An artifact-backed contract whose code was rewritten is reloaded
+        stale = False
+        if isinstance(cached, ExecutableContract) and artifact_store is not None:
+            contract_artifact = artifact_store.get(contract_id)
+            stale = contract_artifact is not None and contract_artifact.code != cached.code
+        if not stale:
+            return cached, False, None
 
     # Check kernel contracts
     contract = get_contract_by_id(contract_id)
@@ -92,8 +104,12 @@ def get_contract_with_fallback_info(
             and contract_artifact.executable
             and "def check_permission(" in (contract_artifact.code or "")
         ):
+            # Contract artifacts opt into result caching via metadata
+            cache_policy = (contract_artifact.metadata or {}).get("cache_policy")
             exec_contract = ExecutableContract(
-                contract_id=contract_id, code=contract_artifact.code
+                contract_id=contract_id,
+                code=contract_artifact.code,
+                cache_policy=cache_policy if isinstance(cache_policy, dict) else None,
             )
             contract_cache[contract_id] = exec_contract
             return exec_contract, False, None
@@ -174,6 +190,19 @@ def check_permission_via_contract(
 
     # Get contract ID from artifact
     contract_id = artifact.access_contract_id
+
+    # Fast path: kernel contract decisions are a table lookup on the caller's
+    # relation to the artifact state (no contract dispatch or context build).
+    # Skipped if the contract cache maps the id to some other contract.
+    state = getattr(artifact, "state", None)
+    cached_contract = contract_cache.get(contract_id)
+    if isinstance(state, dict) and (
+        cached_contract is None or cached_contract is get_contract_by_id(contract_id)
+    ):
+        decision = decide_kernel_permission(contract_id, action, caller, artifact.id, state)
+        if decision is not None:
+            return decision
+
     contract, is_fallback, original_contract_id = get_contract_with_fallback_info(
         contract_id, contract_cache, dangling_count_tracker,
         artifact_store=artifact_store,
@@ -188,21 +217,6 @@ def check_permission_via_contract(
             reason=f"Unknown action: '{action}'. Valid actions: read, write, edit, invoke, delete"
         )
 
-    # Plan #100 Phase 2: Check permission cache for ExecutableContracts with cache_policy
-    cache_key = None
-    cache_policy = None
-    if isinstance(contract, ExecutableContract) and contract.cache_policy is not None:
-        cache_policy = contract.cache_policy
-        # Cache key: (artifact_id, action, requester_id, contract_version)
-        # Contract version is "v1" for now (versioning to be added later)
-        contract_version = getattr(contract, "version", "v1")
-        cache_key = (artifact.id, action, caller, contract_version)
-
-        # Check cache
-        cached_result = permission_cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
-
     # Build context for contract (ADR-0019: minimal context)
     context: dict[str, object] = {
         "target_created_by": artifact.created_by,  # Informational only (ADR-0028)
@@ -214,6 +228,23 @@ def check_permission_via_contract(
         context["method"] = method
         context["args"] = args if args is not None else []
 
+    # Plan #100 Phase 2: Check permission cache for ExecutableContracts with cache_policy
+    cache_key = None
+    cache_policy = None
+    if isinstance(contract, ExecutableContract) and contract.cache_policy is not None:
+        cache_policy = contract.cache_policy
+        # Versioned key: a rewritten contract or a changed target state,
+        # metadata, method or args never hits an older entry
+        cache_key = (
+            artifact.id, action, caller,
+            getattr(contract, "version", "v1"), context_version(context),
+        )
+
+        # Check cache
+        cached_result = permission_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
     # ExecutableContracts need ledger access for balance checks
     if isinstance(contract, ExecutableContract):
         result = contract.check_permission(
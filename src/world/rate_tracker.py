@@ -11,7 +11,7 @@ Usage:
         tracker.consume(agent_id, "llm_calls", amount=1.0)
         # Make the LLM call
 
-    # Or wait for capacity
+    # Or wait for capacity (woken when it frees up, no polling)
     acquired = await tracker.wait_for_capacity(agent_id, "llm_calls", timeout=30.0)
 
 See docs/architecture/gaps/plans/phase1_gap_res_001_rate_tracker.md for design.
@@ -20,11 +20,16 @@ See docs/architecture/gaps/plans/phase1_gap_res_001_rate_tracker.md for design.
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from typing import Deque
 
+# Minimum wakeup delay: records expire strictly after timestamp + window, so a
+# timer firing exactly at the computed instant could find nothing expired yet
+_MIN_WAKEUP_DELAY = 0.001
+
 
 @dataclass
 class UsageRecord:
@@ -42,6 +47,13 @@ class RateTracker:
     per-agent limits. Usage records older than the window are automatically
     expired.
 
+    A running total per (resource, agent) is maintained as records are
+    appended and expired, so capacity checks cost O(1) amortized regardless
+    of how many records the window holds.
+
+    Records and totals are guarded by a lock, since the ledger consumes
+    capacity from pool threads as well as the event loop.
+
     Attributes:
         window_seconds: Duration of the rolling window (default: 60.0)
     """
@@ -50,8 +62,16 @@ class RateTracker:
 
     # resource_type -> agent_id -> deque of UsageRecords
     _usage: dict[str, dict[str, Deque[UsageRecord]]] = field(default_factory=dict)
+    # resource_type -> agent_id -> sum of amounts in the deque above
+    _totals: dict[str, dict[str, float]] = field(default_factory=dict)
     # resource_type -> max_per_window
     _limits: dict[str, float] = field(default_factory=dict)
+    # (resource_type, agent_id) -> futures of tasks blocked in wait_for_available
+    _waiters: dict[tuple[str, str], set[asyncio.Future[None]]] = field(default_factory=dict)
+    # (resource_type, agent_id) -> timer firing when the earliest waiter can proceed
+    _wakeups: dict[tuple[str, str], asyncio.TimerHandle] = field(default_factory=dict)
+    # Guards _usage and _totals (reentrant: consume -> has_capacity -> get_usage)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
 
     def configure_limit(self, resource: str, max_per_window: float) -> None:
         """Set rate limit for a resource type.
@@ -62,9 +82,12 @@ class RateTracker:
         """
         if max_per_window < 0:
             raise ValueError(f"max_per_window must be non-negative, got {max_per_window}")
-        self._limits[resource] = max_per_window
-        if resource not in self._usage:
-            self._usage[resource] = {}
+        with self._lock:
+            self._limits[resource] = max_per_window
+            if resource not in self._usage:
+                self._usage[resource] = {}
+        # A changed limit invalidates armed wakeup times
+        self._notify(resource=resource)
 
     def get_limit(self, resource: str) -> float:
         """Get the configured limit for a resource.
@@ -81,17 +104,22 @@ class RateTracker:
         """Remove records outside the rolling window.
 
         Internal method that prunes expired usage records for a specific
-        agent and resource combination.
+        agent and resource combination, subtracting them from the running
+        total. Each record is popped once, so the cost is amortized O(1).
         """
-        if resource not in self._usage:
-            return
-        if agent_id not in self._usage[resource]:
+        records = self._usage.get(resource, {}).get(agent_id)
+        if not records:
             return
 
-        cutoff = time.time() - self.window_seconds
-        records = self._usage[resource][agent_id]
+        cutoff = self._get_current_time() - self.window_seconds
+        if records[0].timestamp >= cutoff:
+            return
+        totals = self._totals[resource]
+        total = totals[agent_id]
         while records and records[0].timestamp < cutoff:
-            records.popleft()
+            total -= records.popleft().amount
+        # Snap to exactly zero once empty so float drift cannot accumulate
+        totals[agent_id] = max(0.0, total) if records else 0.0
 
     def _get_current_time(self) -> float:
         """Get current time. Separated for testing."""
@@ -107,14 +135,9 @@ class RateTracker:
         Returns:
             Total usage amount within the current window
         """
-        self._clean_old_records(resource, agent_id)
-
-        if resource not in self._usage:
-            return 0.0
-        if agent_id not in self._usage[resource]:
-            return 0.0
-
-        return sum(r.amount for r in self._usage[resource][agent_id])
+        with self._lock:
+            self._clean_old_records(resource, agent_id)
+            return self._totals.get(resource, {}).get(agent_id, 0.0)
 
     def get_remaining(self, agent_id: str, resource: str) -> float:
         """Get remaining capacity in current window.
@@ -169,18 +192,21 @@ class RateTracker:
         if amount == 0:
             return True
 
-        if not self.has_capacity(agent_id, resource, amount):
-            return False
+        with self._lock:
+            if not self.has_capacity(agent_id, resource, amount):
+                return False
 
-        if resource not in self._usage:
-            self._usage[resource] = {}
-        if agent_id not in self._usage[resource]:
-            self._usage[resource][agent_id] = deque()
+            if resource not in self._usage:
+                self._usage[resource] = {}
+            if agent_id not in self._usage[resource]:
+                self._usage[resource][agent_id] = deque()
+            totals = self._totals.setdefault(resource, {})
 
-        self._usage[resource][agent_id].append(
-            UsageRecord(timestamp=self._get_current_time(), amount=amount)
-        )
-        return True
+            self._usage[resource][agent_id].append(
+                UsageRecord(timestamp=self._get_current_time(), amount=amount)
+            )
+            totals[agent_id] = totals.get(agent_id, 0.0) + amount
+            return True
 
     def time_until_capacity(
         self, agent_id: str, resource: str, amount: float = 1.0
@@ -201,84 +227,182 @@ class RateTracker:
         if amount <= 0:
             return 0.0
 
-        if self.has_capacity(agent_id, resource, amount):
-            return 0.0
+        with self._lock:
+            if self.has_capacity(agent_id, resource, amount):
+                return 0.0
 
-        self._clean_old_records(resource, agent_id)
+            self._clean_old_records(resource, agent_id)
 
-        if resource not in self._usage or agent_id not in self._usage[resource]:
-            return 0.0
+            if resource not in self._usage or agent_id not in self._usage[resource]:
+                return 0.0
 
-        records = self._usage[resource][agent_id]
-        if not records:
-            return 0.0
+            records = self._usage[resource][agent_id]
+            if not records:
+                return 0.0
 
-        # Calculate how much needs to expire
-        limit = self._limits.get(resource, float("inf"))
-        current_usage = sum(r.amount for r in records)
-        needed_to_expire = current_usage - (limit - amount)
+            # Calculate how much needs to expire
+            limit = self._limits.get(resource, float("inf"))
+            current_usage = self._totals[resource][agent_id]
+            needed_to_expire = current_usage - (limit - amount)
 
-        if needed_to_expire <= 0:
-            return 0.0
+            if needed_to_expire <= 0:
+                return 0.0
 
-        # Find when enough old records will expire (FIFO order)
-        current_time = self._get_current_time()
-        accumulated = 0.0
-        for record in records:
-            accumulated += record.amount
-            if accumulated >= needed_to_expire:
-                # This record's expiry time
-                expiry_time = record.timestamp + self.window_seconds
-                return max(0.0, expiry_time - current_time)
+            # Find when enough old records will expire (FIFO order)
+            current_time = self._get_current_time()
+            accumulated = 0.0
+            for record in records:
+                accumulated += record.amount
+                if accumulated >= needed_to_expire:
+                    # This record's expiry time
+                    expiry_time = record.timestamp + self.window_seconds
+                    return max(0.0, expiry_time - current_time)
 
-        # All records need to expire - return time until last one expires
-        return max(0.0, records[-1].timestamp + self.window_seconds - current_time)
+            # All records need to expire - return time until last one expires
+            return max(0.0, records[-1].timestamp + self.window_seconds - current_time)
 
-    async def wait_for_capacity(
+    async def wait_for_available(
         self,
         agent_id: str,
         resource: str,
         amount: float = 1.0,
         timeout: float | None = None,
-        poll_interval: float = 0.1,
     ) -> bool:
-        """Wait until capacity is available.
+        """Wait until capacity is available, without consuming it.
 
-        Blocks asynchronously until the agent has enough capacity for the
-        requested amount, or until timeout is reached.
+        The waiter parks on a future for its (resource, agent) pair. A timer is
+        armed for the moment enough records expire (from time_until_capacity),
+        and reset() / configure_limit() wake waiters immediately, so there is
+        no polling. Woken waiters re-check and re-arm if another waiter took
+        the capacity first.
 
         Args:
             agent_id: ID of the agent
             resource: Name of the resource
             amount: Amount needed (default: 1.0)
             timeout: Maximum seconds to wait (None = wait indefinitely)
-            poll_interval: How often to check for capacity (default: 0.1s)
 
         Returns:
-            True if capacity was acquired, False if timeout occurred
+            True if capacity is available, False if timeout occurred
         """
         if amount <= 0:
             return True
 
-        start = time.time()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        key = (resource, agent_id)
 
         while not self.has_capacity(agent_id, resource, amount):
-            if timeout is not None and (time.time() - start) >= timeout:
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+
+            future: asyncio.Future[None] = loop.create_future()
+            self._waiters.setdefault(key, set()).add(future)
+            self._schedule_wakeup(key, self._wakeup_delay(agent_id, resource, amount), loop)
+            try:
+                await asyncio.wait_for(future, remaining)
+            except asyncio.TimeoutError:
                 return False
+            finally:
+                self._discard_waiter(key, future)
 
-            # Calculate intelligent sleep time
-            wait_estimate = self.time_until_capacity(agent_id, resource, amount)
-            if wait_estimate > 0:
-                # Sleep for the estimated time, but cap at poll_interval for responsiveness
-                sleep_time = min(wait_estimate, poll_interval)
-            else:
-                sleep_time = poll_interval
+        return True
 
-            await asyncio.sleep(sleep_time)
+    async def wait_for_capacity(
+        self,
+        agent_id: str,
+        resource: str,
+        amount: float = 1.0,
+        timeout: float | None = None,
+        poll_interval: float | None = None,
+    ) -> bool:
+        """Wait until capacity is available, then consume it.
+
+        Blocks asynchronously until the agent has enough capacity for the
+        requested amount, or until timeout is reached. See wait_for_available
+        for how waiters are woken.
+
+        Args:
+            agent_id: ID of the agent
+            resource: Name of the resource
+            amount: Amount needed (default: 1.0)
+            timeout: Maximum seconds to wait (None = wait indefinitely)
+            poll_interval: Ignored; kept for backwards compatibility now that
+                waiters are woken by the scheduler instead of polling
 
-        # Consume the capacity
+        Returns:
+            True if capacity was acquired, False if timeout occurred
+        """
+        if amount <= 0:
+            return True
+        if not await self.wait_for_available(agent_id, resource, amount, timeout):
+            return False
+        # No await since the check above, so this cannot lose a race
         return self.consume(agent_id, resource, amount)
 
+    def _wakeup_delay(self, agent_id: str, resource: str, amount: float) -> float | None:
+        """Seconds until expiry alone frees capacity, or None if it never can."""
+        if amount > self.get_limit(resource):
+            return None  # Only configure_limit() can unblock this waiter
+        return max(self.time_until_capacity(agent_id, resource, amount), _MIN_WAKEUP_DELAY)
+
+    def _schedule_wakeup(
+        self,
+        key: tuple[str, str],
+        delay: float | None,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Arm (or pull forward) the wakeup timer for a (resource, agent) pair."""
+        if delay is None:
+            return
+        when = loop.time() + delay
+        handle = self._wakeups.get(key)
+        if handle is not None:
+            if handle.when() <= when:
+                return
+            handle.cancel()
+        self._wakeups[key] = loop.call_at(when, self._wake_waiters, key)
+
+    def _wake_waiters(self, key: tuple[str, str]) -> None:
+        """Resolve every future parked on a (resource, agent) pair."""
+        handle = self._wakeups.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        for future in self._waiters.pop(key, set()):
+            if not future.done():
+                future.set_result(None)
+
+    def _discard_waiter(self, key: tuple[str, str], future: asyncio.Future[None]) -> None:
+        """Unregister a finished waiter, disarming the timer if it was the last."""
+        waiters = self._waiters.get(key)
+        if waiters is None:
+            return
+        waiters.discard(future)
+        if not waiters:
+            del self._waiters[key]
+            handle = self._wakeups.pop(key, None)
+            if handle is not None:
+                handle.cancel()
+
+    def _notify(self, agent_id: str | None = None, resource: str | None = None) -> None:
+        """Wake waiters whose capacity may have grown outside of expiry.
+
+        Safe to call from any thread: wakeups run on the waiters' event loop.
+        """
+        for key in list(self._waiters):
+            res, agent = key
+            if (resource is None or res == resource) and (agent_id is None or agent == agent_id):
+                waiters = self._waiters.get(key)
+                if not waiters:
+                    continue
+                try:
+                    next(iter(waiters)).get_loop().call_soon_threadsafe(self._wake_waiters, key)
+                except RuntimeError:
+                    self._waiters.pop(key, None)  # Waiters' loop is closed
+
     def reset(self, agent_id: str | None = None, resource: str | None = None) -> None:
         """Reset usage records.
 
@@ -289,23 +413,29 @@ class RateTracker:
             agent_id: If provided, only reset records for this agent
             resource: If provided, only reset records for this resource
         """
-        if resource is not None and agent_id is not None:
-            # Reset specific agent-resource combination
-            if resource in self._usage and agent_id in self._usage[resource]:
-                self._usage[resource][agent_id].clear()
-        elif resource is not None:
-            # Reset all agents for this resource
-            if resource in self._usage:
-                self._usage[resource].clear()
-        elif agent_id is not None:
-            # Reset all resources for this agent
-            for res in self._usage:
-                if agent_id in self._usage[res]:
-                    self._usage[res][agent_id].clear()
-        else:
-            # Reset everything
-            for res in self._usage:
-                self._usage[res].clear()
+        with self._lock:
+            if resource is not None and agent_id is not None:
+                # Reset specific agent-resource combination
+                if resource in self._usage and agent_id in self._usage[resource]:
+                    self._usage[resource][agent_id].clear()
+                    self._totals[resource][agent_id] = 0.0
+            elif resource is not None:
+                # Reset all agents for this resource
+                if resource in self._usage:
+                    self._usage[resource].clear()
+                    self._totals.get(resource, {}).clear()
+            elif agent_id is not None:
+                # Reset all resources for this agent
+                for res in self._usage:
+                    if agent_id in self._usage[res]:
+                        self._usage[res][agent_id].clear()
+                        self._totals[res][agent_id] = 0.0
+            else:
+                # Reset everything
+                for res in self._usage:
+                    self._usage[res].clear()
+                self._totals.clear()
+        self._notify(agent_id=agent_id, resource=resource)
 
     def get_all_usage(self) -> dict[str, dict[str, float]]:
         """Get snapshot of all current usage.
@@ -314,14 +444,15 @@ class RateTracker:
             Dict mapping resource -> agent_id -> current usage
             Only includes resources and agents with non-zero usage.
         """
-        result: dict[str, dict[str, float]] = {}
-        for resource in self._usage:
-            resource_usage: dict[str, float] = {}
-            for agent_id in self._usage[resource]:
-                usage = self.get_usage(agent_id, resource)
-                if usage > 0:
-                    resource_usage[agent_id] = usage
-            # Only include resource if it has any non-zero usage
-            if resource_usage:
-                result[resource] = resource_usage
-        return result
+        with self._lock:
+            result: dict[str, dict[str, float]] = {}
+            for resource in self._usage:
+                resource_usage: dict[str, float] = {}
+                for agent_id in self._usage[resource]:
+                    usage = self.get_usage(agent_id, resource)
+                    if usage > 0:
+                        resource_usage[agent_id] = usage
+                # Only include resource if it has any non-zero usage
+                if resource_usage:
+                    result[resource] = resource_usage
+            return result
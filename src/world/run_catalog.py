@@ -0,0 +1,284 @@
+"""Run metadata summaries for the dashboard's run catalog.
+
+The dashboard lists historical runs with their start/end time, agent IDs,
+event count and status. Deriving that by decoding every event of every run
+does not scale, so each run's summary is kept in a small sidecar next to
+its event log:
+
+    logs/{run_id}/events.jsonl        active segment
+    logs/{run_id}/events.meta.json    run summary sidecar
+
+EventLogger writes the sidecar on segment rotation, flush and close. A
+summary records the log position it covers (number of sealed segments and
+bytes of the active segment), so a reader only has to scan events written
+after that position. Scanning works on raw bytes with a handful of regular
+expressions; only world_init events are JSON-decoded.
+
+Usage:
+    summary = load_run_summary(events_path) or RunSummary()
+    summary.catch_up(events_path)
+    write_run_summary(events_path, summary)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .event_segments import list_sealed_segments
+
+RUN_SUMMARY_VERSION = 1
+
+# Bytes read per step when scanning a log file
+SCAN_BLOCK_SIZE = 1_048_576
+
+# Events whose presence marks a run as completed
+COMPLETION_EVENT_TYPES = frozenset({"simulation_complete", "budget_pause"})
+# Events that name the acting principal
+AGENT_EVENT_TYPES = frozenset({"thinking", "action"})
+_SUMMARY_EVENT_TYPES = COMPLETION_EVENT_TYPES | AGENT_EVENT_TYPES | {"world_init"}
+
+# Matches both json.dumps (": ") and orjson (":") separators. Quotes inside
+# JSON string values are escaped, so these only match real keys.
+_TIMESTAMP_RE = re.compile(rb'"timestamp": ?"([^"\\]*)"')
+_WORLD_INIT_RE = re.compile(rb'"event_type": ?"world_init"')
+_AGENT_RE = re.compile(
+    rb'"event_type": ?"(?:thinking|action)"[^\n]*?"principal_id": ?"((?:[^"\\]|\\.)*)"'
+)
+_COMPLETED_RE = re.compile(rb'"event_type": ?"(?:simulation_complete|budget_pause)"')
+_BLANK_LINE_RE = re.compile(rb"^[ \t\r]*\n", re.MULTILINE)
+
+
+def run_summary_path(path: Path) -> Path:
+    """Return the summary sidecar path for the event log at path."""
+    return path.with_name(f"{path.stem}.meta.json")
+
+
+def _decode_string(raw: bytes) -> str:
+    """Decode the body of a JSON string literal."""
+    if b"\\" not in raw:
+        return raw.decode("utf-8", errors="replace")
+    try:
+        return str(json.loads(b'"' + raw + b'"'))
+    except json.JSONDecodeError:
+        return raw.decode("utf-8", errors="replace")
+
+
+@dataclass
+class RunSummary:
+    """Metadata of one run's event log up to a recorded log position."""
+
+    event_count: int = 0
+    start_time: str | None = None
+    end_time: str | None = None
+    agent_ids: set[str] = field(default_factory=set)
+    completed: bool = False
+    # Log position covered by this summary
+    sealed_segments: int = 0
+    active_bytes: int = 0
+    active_mtime_ns: int = 0
+
+    def record(self, line: bytes, event_type: str) -> None:
+        """Account for one serialized event line (EventLogger write path)."""
+        self.event_count += 1
+        match = _TIMESTAMP_RE.search(line)
+        if match:
+            timestamp = match.group(1).decode("ascii", errors="replace")
+            if self.start_time is None:
+                self.start_time = timestamp
+            self.end_time = timestamp
+        if event_type in _SUMMARY_EVENT_TYPES:
+            self._scan_summary_events(line)
+
+    def scan(self, data: bytes) -> None:
+        """Account for a block of complete, newline-terminated event lines."""
+        lines = data.count(b"\n") - len(_BLANK_LINE_RE.findall(data))
+        if lines <= 0:
+            return
+        self.event_count += lines
+        if self.start_time is None:
+            head = data.lstrip(b"\n")
+            match = _TIMESTAMP_RE.search(head, 0, head.find(b"\n"))
+            if match:
+                self.start_time = match.group(1).decode("ascii", errors="replace")
+        body = data.rstrip(b"\n")
+        match = _TIMESTAMP_RE.search(body, body.rfind(b"\n") + 1)
+        if match:
+            self.end_time = match.group(1).decode("ascii", errors="replace")
+        self._scan_summary_events(data)
+
+    def _scan_summary_events(self, data: bytes) -> None:
+        for match in _WORLD_INIT_RE.finditer(data):
+            line_start = data.rfind(b"\n", 0, match.start()) + 1
+            line_end = data.find(b"\n", match.end())
+            try:
+                event = json.loads(data[line_start:line_end if line_end != -1 else len(data)])
+            except json.JSONDecodeError:
+                continue
+            for principal in event.get("principals", []):
+                if isinstance(principal, dict) and principal.get("id"):
+                    self.agent_ids.add(principal["id"])
+        for match in _AGENT_RE.finditer(data):
+            if match.group(1):
+                self.agent_ids.add(_decode_string(match.group(1)))
+        if not self.completed and _COMPLETED_RE.search(data):
+            self.completed = True
+
+    def catch_up(self, path: Path) -> int:
+        """Scan whatever the log at path gained since the recorded position.
+
+        Sealed segments are immutable and the active segment only grows, so
+        the summary resumes from its position. If the log was truncated or
+        rewritten (fewer segments, a shorter or modified active file, or a
+        position that does not fall on a line boundary) it is rescanned from
+        the start. A partial line at the end of the active file is left for
+        the next call.
+
+        Returns:
+            Number of bytes scanned
+        """
+        sealed = list_sealed_segments(path)
+        try:
+            stat = os.stat(path)
+            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+        except FileNotFoundError:
+            size, mtime_ns = 0, 0
+
+        if self._is_stale(path, sealed, size, mtime_ns):
+            self._reset()
+
+        if len(sealed) > self.sealed_segments:
+            # The active file we stopped in has since been sealed
+            pending = [(sealed[self.sealed_segments], self.active_bytes)]
+            pending += [(segment, 0) for segment in sealed[self.sealed_segments + 1:]]
+            pending.append((path, 0))
+        else:
+            pending = [(path, self.active_bytes)]
+
+        scanned = 0
+        end = self.active_bytes
+        for file, offset in pending:
+            end = self._scan_file(file, offset)
+            scanned += end - offset
+        self.sealed_segments = len(sealed)
+        self.active_bytes = end
+        self.active_mtime_ns = mtime_ns
+        return scanned
+
+    def _is_stale(self, path: Path, sealed: list[Path], size: int, mtime_ns: int) -> bool:
+        """Whether the recorded position no longer describes the log at path."""
+        if len(sealed) < self.sealed_segments:
+            return True
+        if len(sealed) == self.sealed_segments:
+            if size < self.active_bytes:
+                return True
+            if size == self.active_bytes:
+                return self.active_mtime_ns != 0 and mtime_ns != self.active_mtime_ns
+            resume_in = path
+        else:
+            resume_in = sealed[self.sealed_segments]
+        if self.active_bytes == 0:
+            return False
+        try:
+            with open(resume_in, "rb") as f:
+                f.seek(self.active_bytes - 1)
+                return f.read(1) != b"\n"
+        except OSError:
+            return True
+
+    def _scan_file(self, path: Path, offset: int) -> int:
+        """Scan complete lines from offset; return the offset after the last one."""
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return offset
+        with f:
+            f.seek(offset)
+            carry = b""
+            while True:
+                block = f.read(SCAN_BLOCK_SIZE)
+                if not block:
+                    break
+                data = carry + block
+                cut = data.rfind(b"\n") + 1
+                if cut:
+                    self.scan(data[:cut])
+                    offset += cut
+                carry = data[cut:]
+        return offset
+
+    def _reset(self) -> None:
+        self.event_count = 0
+        self.start_time = None
+        self.end_time = None
+        self.agent_ids = set()
+        self.completed = False
+        self.sealed_segments = 0
+        self.active_bytes = 0
+        self.active_mtime_ns = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict (sidecar format)."""
+        return {
+            "version": RUN_SUMMARY_VERSION,
+            "event_count": self.event_count,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "agent_ids": sorted(self.agent_ids),
+            "completed": self.completed,
+            "sealed_segments": self.sealed_segments,
+            "active_bytes": self.active_bytes,
+            "active_mtime_ns": self.active_mtime_ns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RunSummary":
+        """Build from a sidecar dict; raises ValueError on other versions."""
+        if data.get("version") != RUN_SUMMARY_VERSION:
+            raise ValueError(f"Unsupported run summary version: {data.get('version')!r}")
+        return cls(
+            event_count=int(data["event_count"]),
+            start_time=data.get("start_time"),
+            end_time=data.get("end_time"),
+            agent_ids=set(data.get("agent_ids", [])),
+            completed=bool(data.get("completed", False)),
+            sealed_segments=int(data["sealed_segments"]),
+            active_bytes=int(data["active_bytes"]),
+            active_mtime_ns=int(data.get("active_mtime_ns", 0)),
+        )
+
+
+def load_run_summary(path: Path) -> RunSummary | None:
+    """Load the summary sidecar of the event log at path, or None."""
+    try:
+        with open(run_summary_path(path), "rb") as f:
+            return RunSummary.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_run_summary(path: Path, summary: RunSummary) -> None:
+    """Atomically write the summary sidecar of the event log at path."""
+    target = run_summary_path(path)
+    # Per-process temp name: the logger and the dashboard may both write
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(summary.to_dict()))
+    os.replace(tmp, target)
+
+
+def remove_run_summary(path: Path) -> None:
+    """Delete the summary sidecar of the event log at path (new run)."""
+    run_summary_path(path).unlink(missing_ok=True)
+
+
+__all__ = [
+    "RunSummary",
+    "load_run_summary",
+    "remove_run_summary",
+    "run_summary_path",
+    "write_run_summary",
+]
@@ -375,8 +375,9 @@ class ResourceMeasurer:
             measurer.record_disk_write(1024)
         usage = measurer.get_usage()
 
-    Note: This provides process-level measurement. For true per-action
-    isolation, ProcessPoolExecutor would be needed (future enhancement).
+    Note: This provides process-level measurement. Under
+    execution.use_worker_pool, turns run in dedicated worker processes
+    (src/world/worker_pool.py), so the measurement there is per-action.
     """
 
     def __init__(self) -> None:
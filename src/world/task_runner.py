@@ -0,0 +1,420 @@
+"""Sandboxed, parallel test runner for mint tasks (Plan #269).
+
+MintTaskManager used to run every public and hidden test of a submission
+one after another through SafeExecutor.execute() in the simulation process,
+relying on SIGALRM for timeouts. TaskTestRunner instead:
+
+- Takes code the caller compiled once and ships the code object (marshal)
+  to the workers, so no test recompiles the submission.
+- Runs the test cases of a submission in parallel on a pool of long-lived
+  worker processes (spawned lazily, up to num_workers, reused across
+  submissions). Each case still gets a fresh sandbox namespace via
+  SafeExecutor.execute_compiled() inside the worker.
+- Enforces hard limits in the workers: an address-space limit set once at
+  startup and a per-case CPU limit (RLIMIT_CPU, delivered as SIGXCPU). A
+  worker that does not answer by its deadline is killed and replaced.
+- Lets the caller stop dispatching cases after a result (short-circuit on
+  first failure). Cases already running finish and their results are kept.
+
+run() is synchronous (task submission is a synchronous kernel action) and
+thread-safe: concurrent submissions share the pool.
+
+Requires the Unix resource module; from_config() returns None elsewhere and
+MintTaskManager then runs tests in-process.
+
+Usage:
+    runner = TaskTestRunner.from_config()
+    results = runner.run(compiled, [[2, 3], [0, 0]], stop=on_result)
+"""
+
+from __future__ import annotations
+
+import logging
+import marshal
+import math
+import multiprocessing
+import signal
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING, Any, Callable, Generator, Sequence, cast
+
+from ..config import get_validated_config
+from .worker_pool import WORKER_KILL_GRACE, WORKER_STARTUP_TIMEOUT
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from .executor import ExecutionResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TASK_TEST_WORKERS = 4
+DEFAULT_CPU_LIMIT_SECONDS = 5
+DEFAULT_MEMORY_LIMIT_MB = 256
+
+
+class CpuLimitExceeded(BaseException):
+    """Raised in a test worker on SIGXCPU.
+
+    A BaseException so that `except Exception` in submitted code does not
+    swallow it.
+    """
+
+
+# =============================================================================
+# WORKER SIDE (runs in the child process)
+# =============================================================================
+
+
+def _on_sigxcpu(signum: int, frame: FrameType | None) -> None:
+    raise CpuLimitExceeded()
+
+
+def _address_space_bytes() -> int:
+    """Current virtual memory size of this process (0 if unknown)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _limit_memory(limit_bytes: int) -> None:
+    """Cap the address space at the startup baseline plus limit_bytes."""
+    if limit_bytes <= 0:
+        return
+    cap = _address_space_bytes() + limit_bytes
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        cap = min(cap, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (cap, hard))
+
+
+@contextmanager
+def _cpu_limit(seconds: int) -> Generator[None, None, None]:
+    """Deliver SIGXCPU once the block has used `seconds` of CPU time.
+
+    RLIMIT_CPU counts the whole process, so the soft limit is set relative
+    to the CPU time used so far and lifted again afterwards.
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    limit = math.ceil(usage.ru_utime + usage.ru_stime + seconds)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _run_case(code: CodeType, args: list[Any], cpu_seconds: int) -> "ExecutionResult":
+    """Run one test case in this worker."""
+    from .executor import get_executor
+
+    try:
+        with _cpu_limit(cpu_seconds):
+            return get_executor().execute_compiled(code, args)
+    except CpuLimitExceeded:
+        return {"success": False, "error": f"CPU limit exceeded ({cpu_seconds}s)"}
+    except MemoryError:
+        return {"success": False, "error": "Memory limit exceeded"}
+
+
+def _worker_main(conn: Connection, timeout: int, memory_limit_bytes: int) -> None:
+    """Entry point of a test worker process: run cases until shutdown."""
+    from .executor import get_executor
+
+    # Ctrl+C goes to the whole process group; the parent owns shutdown
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGXCPU, _on_sigxcpu)
+    get_executor(timeout)  # Build the sandbox templates before limiting memory
+    _limit_memory(memory_limit_bytes)
+    conn.send(("ready",))
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message[0] == "shutdown":
+            break
+        if message[0] == "run":
+            _, payload, args, cpu_seconds = message
+            try:
+                code = marshal.loads(payload)
+            except (ValueError, EOFError, TypeError) as e:
+                conn.send(("result", {"success": False, "error": f"Invalid code payload: {e}"}))
+                continue
+            conn.send(("result", _run_case(code, args, cpu_seconds)))
+
+
+# =============================================================================
+# PARENT SIDE
+# =============================================================================
+
+
+@dataclass
+class _TestWorker:
+    """A live test worker process and the parent end of its pipe."""
+
+    process: "BaseProcess"
+    conn: Connection
+    # Has not reported ready yet: its first deadline includes startup
+    starting: bool = True
+
+
+class TaskTestRunner:
+    """Runs test cases of compiled submissions on sandboxed worker processes.
+
+    Attributes:
+        num_workers: Maximum number of worker processes
+        timeout: Wall-clock timeout per phase inside workers (seconds)
+        cpu_seconds: CPU time limit per test case (seconds)
+        memory_limit_bytes: Address space a worker may add after startup
+        tests_run: Test cases that produced a result
+        workers_replaced: Workers killed after crashing or hanging
+    """
+
+    def __init__(
+        self,
+        num_workers: int = DEFAULT_TASK_TEST_WORKERS,
+        timeout: int | None = None,
+        cpu_seconds: int = DEFAULT_CPU_LIMIT_SECONDS,
+        memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB,
+    ) -> None:
+        """Initialize the runner (no processes are started yet).
+
+        Args:
+            num_workers: Maximum number of worker processes (must be positive)
+            timeout: Execution timeout in seconds (defaults to executor.timeout_seconds)
+            cpu_seconds: CPU time limit per test case
+            memory_limit_mb: Address space limit per worker beyond its
+                startup baseline (0 = unlimited)
+
+        Raises:
+            ValueError: If num_workers is not positive
+        """
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be positive: {num_workers}")
+        self.num_workers = num_workers
+        self.timeout = timeout or get_validated_config().executor.timeout_seconds
+        self.cpu_seconds = cpu_seconds
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        self.tests_run = 0
+        self.workers_replaced = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: list[_TestWorker] = []
+        self._live = 0
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_config(cls) -> "TaskTestRunner | None":
+        """Create a runner from mint_tasks.evaluation.
+
+        Returns:
+            TaskTestRunner if use_subprocesses is enabled and the platform
+            supports resource limits, None otherwise.
+        """
+        evaluation = get_validated_config().mint_tasks.evaluation
+        if not evaluation.use_subprocesses or resource is None:
+            return None
+        return cls(
+            num_workers=evaluation.num_workers,
+            cpu_seconds=evaluation.cpu_limit_seconds,
+            memory_limit_mb=evaluation.memory_limit_mb,
+        )
+
+    @property
+    def live_workers(self) -> int:
+        """Number of worker processes currently alive (idle or busy)."""
+        return self._live
+
+    def run(
+        self,
+        compiled: CodeType,
+        cases: Sequence[list[Any]],
+        stop: Callable[[int, "ExecutionResult"], bool] | None = None,
+    ) -> list["ExecutionResult | None"]:
+        """Run compiled's run(*args) for each case in parallel.
+
+        Args:
+            compiled: Validated, compiled submission code
+            cases: Arguments for run(), one list per test case
+            stop: Called with (case index, result) as results arrive (in
+                completion order); returning True stops dispatching the
+                remaining cases
+
+        Returns:
+            Results in case order; None for cases not run after a stop
+        """
+        payload = marshal.dumps(compiled)
+        hard_timeout = self.timeout * 2 + WORKER_KILL_GRACE
+        results: list[ExecutionResult | None] = [None] * len(cases)
+        pending = deque(range(len(cases)))
+        running: dict[Connection, tuple[_TestWorker, int, float]] = {}
+        stopped = False
+
+        def finish(index: int, result: "ExecutionResult") -> None:
+            nonlocal stopped
+            results[index] = result
+            with self._cond:
+                self.tests_run += 1
+            if stop is not None and stop(index, result):
+                stopped = True
+
+        try:
+            while running or (pending and not stopped):
+                # Fill free workers; block for one only when nothing is running
+                while pending and not stopped:
+                    try:
+                        worker = self._acquire(block=not running)
+                    except OSError as e:
+                        finish(pending.popleft(), {
+                            "success": False, "error": f"Test runner unavailable: {e}",
+                        })
+                        continue
+                    if worker is None:
+                        break
+                    index = pending.popleft()
+                    try:
+                        worker.conn.send(("run", payload, list(cases[index]), self.cpu_seconds))
+                    except OSError as e:
+                        self._discard(worker)
+                        finish(index, {"success": False, "error": f"Test worker crashed: {e}"})
+                        continue
+                    deadline = time.monotonic() + hard_timeout
+                    if worker.starting:
+                        deadline += WORKER_STARTUP_TIMEOUT
+                    running[worker.conn] = (worker, index, deadline)
+
+                if not running:
+                    break
+                next_deadline = min(deadline for _, _, deadline in running.values())
+                for ready in wait(list(running), max(0.0, next_deadline - time.monotonic())):
+                    conn = cast(Connection, ready)
+                    worker, index, _ = running[conn]
+                    try:
+                        message = conn.recv()
+                    except (EOFError, OSError):
+                        del running[conn]
+                        exitcode = worker.process.exitcode
+                        self._discard(worker)
+                        finish(index, {
+                            "success": False,
+                            "error": f"Test worker crashed (exit code {exitcode})",
+                        })
+                        continue
+                    if message[0] == "ready":
+                        worker.starting = False
+                        continue
+                    del running[conn]
+                    self._release(worker)
+                    result: ExecutionResult = message[1]
+                    finish(index, result)
+
+                now = time.monotonic()
+                for conn, (worker, index, deadline) in list(running.items()):
+                    if deadline <= now:
+                        del running[conn]
+                        logger.warning("Killing task test worker silent for %.0fs", hard_timeout)
+                        self._discard(worker)
+                        finish(index, {
+                            "success": False,
+                            "error": "Execution timed out (test worker killed)",
+                        })
+        finally:
+            # Only reached with running workers if stop() or a send raised
+            for worker, _, _ in running.values():
+                self._discard(worker)
+        return results
+
+    def _acquire(self, block: bool) -> _TestWorker | None:
+        """Take an idle worker or spawn one under num_workers.
+
+        Returns None if none is free and block is False.
+        """
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._live < self.num_workers:
+                    self._live += 1
+                    break
+                if not block:
+                    return None
+                self._cond.wait()
+        try:
+            return self._spawn()
+        except BaseException:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+
+    def _spawn(self) -> _TestWorker:
+        """Start a worker process (it reports ready before its first result)."""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.timeout, self.memory_limit_bytes),
+            name="task-test-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _TestWorker(process=process, conn=parent_conn)
+
+    def _release(self, worker: _TestWorker) -> None:
+        with self._cond:
+            self._idle.append(worker)
+            self._cond.notify()
+
+    def _discard(self, worker: _TestWorker) -> None:
+        """Kill a worker that crashed, hung or may be mid-case."""
+        try:
+            worker.conn.close()
+        except OSError:
+            pass
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.process.join(timeout=1.0)
+        with self._cond:
+            self._live -= 1
+            self.workers_replaced += 1
+            self._cond.notify()
+
+    def shutdown(self) -> None:
+        """Stop all idle workers. Busy workers are killed by their runs."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            try:
+                worker.conn.send(("shutdown",))
+            except OSError:
+                pass
+            worker.process.join(timeout=1.0)
+            if worker.process.is_alive():
+                worker.process.kill()
+            with self._cond:
+                self._live -= 1
+        logger.debug("Task test runner shut down")
+
+
+__all__ = [
+    "CpuLimitExceeded",
+    "DEFAULT_CPU_LIMIT_SECONDS",
+    "DEFAULT_MEMORY_LIMIT_MB",
+    "DEFAULT_TASK_TEST_WORKERS",
+    "TaskTestRunner",
+]
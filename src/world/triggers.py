@@ -4,8 +4,11 @@ Enables agents to register triggers: "when event matching X occurs, invoke artif
 
 Design:
 - Triggers are stored as artifacts with type="trigger"
-- TriggerRegistry scans trigger artifacts and caches active ones
+- TriggerRegistry scans trigger artifacts and caches active ones; writes to
+  trigger (or callback) artifacts update the cache incrementally
 - Events are matched using filter operators ($eq, $ne, $in, $exists)
+- TriggerIndex buckets triggers by one equality predicate (preferably on
+  event_type), so only candidate triggers have their filters evaluated
 - Matching invocations are queued (not synchronous) to prevent loops
 - Spam prevention: can only trigger artifacts you own
 """
@@ -73,7 +76,11 @@ def _get_nested_value(data: dict[str, Any], path: str) -> Any:
     Returns:
         Value at path, or None if not found
     """
-    keys = path.split(".")
+    return _get_path_value(data, tuple(path.split(".")))
+
+
+def _get_path_value(data: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    """Get a value from nested dict by a pre-split path (None if not found)."""
     value: Any = data
     for key in keys:
         if isinstance(value, dict) and key in value:
@@ -154,12 +161,177 @@ def matches_filter(event: dict[str, Any], filter_spec: dict[str, Any]) -> bool:
     return True
 
 
+# Field preferred as the index key: almost every filter constrains it
+PREFERRED_INDEX_FIELD = "event_type"
+
+
+def _equality_values(expected: Any) -> list[Any] | None:
+    """Values an event field must equal one of, if expected is a pure equality.
+
+    Plain values, {"$eq": v} and {"$in": [...]} are equalities; anything
+    else (other operators, combined operators, unhashable values) is not.
+
+    Returns:
+        List of hashable values, or None if expected cannot be indexed
+    """
+    if isinstance(expected, dict):
+        if len(expected) != 1:
+            return None
+        [(op, value)] = expected.items()
+        if op == "$eq":
+            values = [value]
+        elif op == "$in" and isinstance(value, list):
+            values = value
+        else:
+            return None
+    else:
+        values = [expected]
+    try:
+        for value in values:
+            hash(value)
+    except TypeError:
+        return None
+    return values
+
+
+@dataclass
+class _IndexedTrigger:
+    """A trigger compiled for the index."""
+
+    spec: TriggerSpec
+    seq: int  # Registration order, so matches keep a stable order
+    key_field: str | None  # Field the trigger is bucketed under (None = unindexed)
+    key_values: list[Any]
+    # Conditions left to check on candidates: (split path, expected)
+    residual: list[tuple[tuple[str, ...], Any]]
+
+
+class TriggerIndex:
+    """Event-based triggers compiled for matching.
+
+    Each trigger is bucketed under the values of one equality predicate of
+    its filter (event_type if it has one, else its first indexable field).
+    Matching an event looks up the event's value for each bucketed field
+    and evaluates the remaining conditions only on those candidates, plus
+    the few triggers without any equality predicate. Results are the same
+    as calling matches_filter() on every trigger, in registration order.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _IndexedTrigger] = {}
+        # field -> (split path, value -> trigger_ids)
+        self._buckets: dict[str, tuple[tuple[str, ...], dict[Any, set[str]]]] = {}
+        self._unindexed: set[str] = set()
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, trigger_id: object) -> bool:
+        return trigger_id in self._entries
+
+    def triggers(self) -> list[TriggerSpec]:
+        """All indexed triggers in registration order."""
+        entries = sorted(self._entries.values(), key=lambda entry: entry.seq)
+        return [entry.spec for entry in entries]
+
+    def add(self, spec: TriggerSpec) -> None:
+        """Index a trigger, replacing any trigger with the same ID.
+
+        A replaced trigger keeps its position in the match order.
+        """
+        previous = self._entries.get(spec.trigger_id)
+        if previous is not None:
+            self.remove(spec.trigger_id)
+            seq = previous.seq
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+
+        key_field: str | None = None
+        key_values: list[Any] = []
+        fields = sorted(spec.filter, key=lambda name: name != PREFERRED_INDEX_FIELD)
+        for name in fields:
+            values = _equality_values(spec.filter[name])
+            if values is not None:
+                key_field, key_values = name, values
+                break
+        residual = [
+            (tuple(name.split(".")), expected)
+            for name, expected in spec.filter.items()
+            if name != key_field
+        ]
+        self._entries[spec.trigger_id] = _IndexedTrigger(spec, seq, key_field, key_values, residual)
+
+        if key_field is None:
+            self._unindexed.add(spec.trigger_id)
+            return
+        _, by_value = self._buckets.setdefault(key_field, (tuple(key_field.split(".")), {}))
+        for value in key_values:
+            by_value.setdefault(value, set()).add(spec.trigger_id)
+
+    def remove(self, trigger_id: str) -> bool:
+        """Drop a trigger from the index.
+
+        Returns:
+            True if the trigger was indexed
+        """
+        entry = self._entries.pop(trigger_id, None)
+        if entry is None:
+            return False
+        if entry.key_field is None:
+            self._unindexed.discard(trigger_id)
+            return True
+        _, by_value = self._buckets[entry.key_field]
+        for value in entry.key_values:
+            ids = by_value.get(value)
+            if ids is not None:
+                ids.discard(trigger_id)
+                if not ids:
+                    del by_value[value]
+        if not by_value:
+            del self._buckets[entry.key_field]
+        return True
+
+    def clear(self) -> None:
+        """Drop all triggers."""
+        self._entries.clear()
+        self._buckets.clear()
+        self._unindexed.clear()
+
+    def match(self, event: dict[str, Any]) -> list[TriggerSpec]:
+        """Triggers whose filter matches event, in registration order."""
+        candidates = list(self._unindexed)
+        for path, by_value in self._buckets.values():
+            try:
+                ids = by_value.get(_get_path_value(event, path))
+            except TypeError:  # Unhashable event value equals no indexed value
+                continue
+            if ids:
+                candidates.extend(ids)
+
+        matched: list[_IndexedTrigger] = []
+        for trigger_id in candidates:
+            entry = self._entries[trigger_id]
+            if all(
+                _match_operator(_get_path_value(event, path), expected)
+                for path, expected in entry.residual
+            ):
+                matched.append(entry)
+        matched.sort(key=lambda entry: entry.seq)
+        return [entry.spec for entry in matched]
+
+
 class TriggerRegistry:
     """Registry for managing event triggers.
 
     Scans trigger artifacts and caches active ones. Provides methods
     to find matching triggers for events and queue invocations.
 
+    refresh() rebuilds the cache from all trigger artifacts;
+    update_trigger() re-registers only the triggers affected by a write to
+    one artifact (the trigger itself, or a callback some trigger names).
+
     Plan #185 adds time-based scheduling:
     - Triggers can specify fire_at_event or fire_after_events
     - Scheduled triggers are tracked separately and fired at the right event
@@ -177,11 +349,19 @@ class TriggerRegistry:
             artifact_store: Store to scan for trigger artifacts
         """
         self._artifact_store = artifact_store
-        self.active_triggers: list[TriggerSpec] = []
+        self._index = TriggerIndex()
         self._pending_invocations: list[dict[str, Any]] = []
         # Plan #185: Scheduled triggers indexed by fire event number
         self._scheduled_triggers: dict[int, list[TriggerSpec]] = defaultdict(list)
         self._current_event_number: int = 0
+        # callback artifact_id -> enabled trigger artifacts naming it (registered or not)
+        self._triggers_by_callback: dict[str, set[str]] = defaultdict(set)
+        self._callback_of: dict[str, str] = {}
+
+    @property
+    def active_triggers(self) -> list[TriggerSpec]:
+        """Currently active event-based triggers, in registration order."""
+        return self._index.triggers()
 
     def set_current_event_number(self, event_number: int) -> None:
         """Update the current event number for scheduling.
@@ -201,71 +381,113 @@ class TriggerRegistry:
 
         Plan #185: Also rebuilds scheduled trigger index for time-based triggers.
         """
-        self.active_triggers = []
+        self._index.clear()
         self._scheduled_triggers.clear()
+        self._triggers_by_callback.clear()
+        self._callback_of.clear()
 
-        # Scan all artifacts of type "trigger"
-        for artifact in self._artifact_store.artifacts.values():
-            if artifact.type != "trigger":
-                continue
-            if artifact.deleted:
-                continue
+        # Only trigger artifacts, via the store's type index (creation order)
+        for artifact_id in self._artifact_store.find_ids(artifact_type="trigger"):
+            self._register(artifact_id)
 
-            # Get trigger config from metadata
-            metadata = artifact.metadata
-            if not metadata:
-                continue
+    def update_trigger(self, artifact_id: str) -> None:
+        """Re-register triggers after artifact_id was written, edited or deleted.
 
-            # Check if enabled
-            if not metadata.get("enabled", False):
-                continue
-
-            # Get required fields
-            callback_artifact = metadata.get("callback_artifact")
-            callback_method = metadata.get("callback_method", "run")
-
-            if not callback_artifact:
-                continue
-
-            # Spam prevention: trigger's authorized principal must match callback's
-            callback = self._artifact_store.get(callback_artifact)
-            if callback is None:
-                continue
-            # Plan #311: Use artifact state for authorization, not metadata or created_by
-            trigger_principal = (artifact.state or {}).get("writer") or (artifact.state or {}).get("principal")
-            callback_principal = (callback.state or {}).get("writer") or (callback.state or {}).get("principal")
-            if trigger_principal != callback_principal:
-                # Cannot trigger artifacts you don't control
-                continue
+        Covers the trigger artifact itself and every trigger that names
+        artifact_id as its callback (whose ownership check may have
+        changed), without rescanning the store.
 
-            # Plan #185: Check for scheduling fields
-            fire_at_event = metadata.get("fire_at_event")
-            fire_after_events = metadata.get("fire_after_events")
-            registered_at_event = metadata.get("registered_at_event")
-
-            # Build trigger spec
-            trigger_spec = TriggerSpec(
-                trigger_id=artifact.id,
-                owner=artifact.created_by,
-                filter=metadata.get("filter", {}),
-                callback_artifact=callback_artifact,
-                callback_method=callback_method,
-                fire_at_event=fire_at_event,
-                fire_after_events=fire_after_events,
-                registered_at_event=registered_at_event,
-            )
-
-            # Plan #185: Separate scheduled vs event-based triggers
-            if trigger_spec.is_scheduled:
-                fire_event = trigger_spec.get_fire_event()
-                if fire_event is not None and fire_event >= self._current_event_number:
-                    # Only schedule if not already past
-                    self._scheduled_triggers[fire_event].append(trigger_spec)
-            else:
-                # Event-based trigger - requires filter
-                if not metadata.get("filter"):
-                    continue
-                self.active_triggers.append(trigger_spec)
+        Args:
+            artifact_id: The changed artifact
+        """
+        affected = {artifact_id, *self._triggers_by_callback.get(artifact_id, ())}
+        for trigger_id in sorted(affected):
+            self._unregister(trigger_id)
+            self._register(trigger_id)
+
+    def _unregister(self, trigger_id: str) -> None:
+        """Drop a trigger from all caches."""
+        callback = self._callback_of.pop(trigger_id, None)
+        if callback is None:
+            return  # Not an enabled trigger artifact with a callback
+        watchers = self._triggers_by_callback[callback]
+        watchers.discard(trigger_id)
+        if not watchers:
+            del self._triggers_by_callback[callback]
+        if self._index.remove(trigger_id):
+            return
+        for event_num, triggers in list(self._scheduled_triggers.items()):
+            triggers[:] = [t for t in triggers if t.trigger_id != trigger_id]
+            if not triggers:
+                del self._scheduled_triggers[event_num]
+
+    def _register(self, artifact_id: str) -> None:
+        """Validate a trigger artifact and add it to the caches if active."""
+        artifact = self._artifact_store.get(artifact_id)
+        if artifact is None or artifact.type != "trigger":
+            return
+        if artifact.deleted:
+            return
+
+        # Get trigger config from metadata
+        metadata = artifact.metadata
+        if not metadata:
+            return
+
+        # Check if enabled
+        if not metadata.get("enabled", False):
+            return
+
+        # Get required fields
+        callback_artifact = metadata.get("callback_artifact")
+        callback_method = metadata.get("callback_method", "run")
+
+        if not callback_artifact:
+            return
+
+        # Watch the callback even while invalid: writing it may make the trigger valid
+        self._callback_of[artifact.id] = callback_artifact
+        self._triggers_by_callback[callback_artifact].add(artifact.id)
+
+        # Spam prevention: trigger's authorized principal must match callback's
+        callback = self._artifact_store.get(callback_artifact)
+        if callback is None:
+            return
+        # Plan #311: Use artifact state for authorization, not metadata or created_by
+        trigger_principal = (artifact.state or {}).get("writer") or (artifact.state or {}).get("principal")
+        callback_principal = (callback.state or {}).get("writer") or (callback.state or {}).get("principal")
+        if trigger_principal != callback_principal:
+            # Cannot trigger artifacts you don't control
+            return
+
+        # Plan #185: Check for scheduling fields
+        fire_at_event = metadata.get("fire_at_event")
+        fire_after_events = metadata.get("fire_after_events")
+        registered_at_event = metadata.get("registered_at_event")
+
+        # Build trigger spec
+        trigger_spec = TriggerSpec(
+            trigger_id=artifact.id,
+            owner=artifact.created_by,
+            filter=metadata.get("filter", {}),
+            callback_artifact=callback_artifact,
+            callback_method=callback_method,
+            fire_at_event=fire_at_event,
+            fire_after_events=fire_after_events,
+            registered_at_event=registered_at_event,
+        )
+
+        # Plan #185: Separate scheduled vs event-based triggers
+        if trigger_spec.is_scheduled:
+            fire_event = trigger_spec.get_fire_event()
+            if fire_event is not None and fire_event >= self._current_event_number:
+                # Only schedule if not already past
+                self._scheduled_triggers[fire_event].append(trigger_spec)
+        else:
+            # Event-based trigger - requires filter
+            if not metadata.get("filter"):
+                return
+            self._index.add(trigger_spec)
 
     def get_matching_triggers(self, event: dict[str, Any]) -> list[TriggerSpec]:
         """Get all triggers that match an event.
@@ -276,7 +498,7 @@ class TriggerRegistry:
         Returns:
             List of matching TriggerSpec objects
         """
-        return [t for t in self.active_triggers if matches_filter(event, t.filter)]
+        return self._index.match(event)
 
     def queue_matching_invocations(self, event: dict[str, Any]) -> int:
         """Queue invocations for all triggers matching an event.
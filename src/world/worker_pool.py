@@ -0,0 +1,693 @@
+"""Process-isolated worker pool for artifact execution (Plan #53).
+
+When ``execution.use_worker_pool`` is enabled, artifact loop turns run in
+long-lived worker processes instead of the simulation process:
+
+- CPU-heavy agent code runs on all cores instead of contending for one GIL
+- Each worker runs one turn at a time, so ResourceMeasurer inside the worker
+  reports true per-action CPU time and peak memory, not process-wide numbers
+- SIGALRM timeouts work in every worker (each turn runs on a main thread),
+  and a worker that ignores its timeout is killed and replaced
+
+The kernel stays in the parent. Workers never hold World state: every
+sandbox service (kernel_state, kernel_actions, invoke, pay, get_balance,
+_syscall_llm, Action.read_artifact) is a proxy that sends a call message
+over the worker's pipe. The parent serves the call against the real World
+on the event loop and sends the result back, so all state mutations go
+through the same kernel code paths as in-process execution.
+
+Protocol (tuples over multiprocessing.Pipe):
+    parent -> worker: ("execute", job) | ("reply", ok, value) | ("shutdown",)
+    worker -> parent: ("ready",) | ("call", service, method, args, kwargs)
+                      | ("result", ExecutionResult)
+
+Nested invoke() targets execute in the parent (via SafeExecutor); only the
+top-level turn runs in the worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import logging
+import multiprocessing
+import pickle
+import signal
+import sys
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..config import get_validated_config
+from .code_cache import AGENT_BUILTINS, AGENT_CODE_FILENAME, get_code_cache
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from .executor import ExecutionResult, SafeExecutor
+    from .world import World
+
+logger = logging.getLogger(__name__)
+
+# Seconds a freshly spawned worker has to import the kernel modules and report ready
+WORKER_STARTUP_TIMEOUT = 60.0
+
+# Extra seconds (beyond executor timeout) before a silent worker is killed
+WORKER_KILL_GRACE = 5.0
+
+# Services whose parent-side implementation blocks on network I/O and so is
+# served from a thread instead of the event loop
+_BLOCKING_SERVICES = frozenset({"_syscall_llm"})
+
+
+class WorkerCrashedError(Exception):
+    """Worker process died or stopped responding mid-turn."""
+    pass
+
+
+# =============================================================================
+# WORKER SIDE (runs in the child process)
+# =============================================================================
+
+
+def _call_parent(
+    conn: Connection,
+    service: str,
+    method: str | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    """Send a kernel service call to the parent and wait for the result.
+
+    Exceptions raised by the parent are re-raised here. Builtin exception
+    types keep their type so artifact code can catch them as usual.
+    """
+    conn.send(("call", service, method, args, kwargs))
+    reply = conn.recv()
+    if reply[1]:
+        return reply[2]
+    error_type, message = reply[2]
+    exc_class = getattr(builtins, error_type, None)
+    if isinstance(exc_class, type) and issubclass(exc_class, Exception):
+        raise exc_class(message)
+    raise RuntimeError(f"{error_type}: {message}")
+
+
+class _ServiceProxy:
+    """Worker-side stand-in for a parent service object (kernel_state, ...)."""
+
+    def __init__(self, conn: Connection, service: str) -> None:
+        self._conn = conn
+        self._service = service
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            return _call_parent(self._conn, self._service, name, args, kwargs)
+
+        method.__name__ = name
+        return method
+
+
+def _make_function_proxy(conn: Connection, service: str) -> Callable[..., Any]:
+    """Worker-side stand-in for a parent service function (invoke, pay, ...)."""
+    def function(*args: Any, **kwargs: Any) -> Any:
+        return _call_parent(conn, service, None, args, kwargs)
+
+    function.__name__ = service
+    return function
+
+
+def _build_worker_globals(conn: Connection, job: dict[str, Any]) -> dict[str, Any]:
+    """Build the sandbox namespace for a job, mirroring execute_with_invoke()."""
+    from .executor import (
+        AVAILABLE_MODULES,
+        DependencyWrapper,
+        ExecutionContext,
+        _make_controlled_import,
+    )
+
+    preloaded = {
+        name: AVAILABLE_MODULES[name]
+        for name in job["preloaded_imports"]
+        if name in AVAILABLE_MODULES
+    }
+    controlled_builtins = dict(AGENT_BUILTINS)
+    controlled_builtins["__import__"] = _make_controlled_import(preloaded)
+    controlled_globals: dict[str, Any] = {
+        "__builtins__": controlled_builtins,
+        "__name__": "__main__",
+    }
+    controlled_globals.update(preloaded)
+
+    services: list[str] = job["services"]
+    for service in ("kernel_state", "kernel_actions"):
+        if service in services:
+            controlled_globals[service] = _ServiceProxy(conn, service)
+    for service in ("_syscall_llm", "pay", "get_balance", "invoke"):
+        if service in services:
+            controlled_globals[service] = _make_function_proxy(conn, service)
+    if job["caller_id"] is not None:
+        controlled_globals["caller_id"] = job["caller_id"]
+
+    read_artifact = _make_function_proxy(conn, "read_artifact")
+
+    class Action:
+        """Agent-friendly wrapper for sandbox functions (see executor.py)."""
+
+        def invoke_artifact(
+            self,
+            artifact_id: str,
+            method: str = "run",
+            args: list[Any] | None = None
+        ) -> dict[str, Any]:
+            if "invoke" not in controlled_globals:
+                return {
+                    "success": False,
+                    "error": "invoke not available in this context",
+                    "result": None,
+                    "price_paid": 0
+                }
+            result: dict[str, Any] = controlled_globals["invoke"](artifact_id, *(args or []))
+            return result
+
+        def pay(self, target: str, amount: int) -> dict[str, Any]:
+            if "pay" not in controlled_globals:
+                return {"success": False, "error": "pay not available"}
+            result: dict[str, Any] = controlled_globals["pay"](target, amount)
+            return result
+
+        def get_balance(self) -> int:
+            if "get_balance" not in controlled_globals:
+                return 0
+            balance: int = controlled_globals["get_balance"]()
+            return balance
+
+        def get_kernel_state(self) -> Any:
+            return controlled_globals.get("kernel_state")
+
+        def read_artifact(self, artifact_id: str) -> dict[str, Any]:
+            result: dict[str, Any] = read_artifact(artifact_id)
+            return result
+
+    actions_module = ModuleType("actions")
+    actions_module.Action = Action  # type: ignore[attr-defined]
+    sys.modules["actions"] = actions_module
+    controlled_globals["Action"] = Action
+
+    dep_wrappers: dict[str, DependencyWrapper] = {}
+    if "invoke" in controlled_globals:
+        for dep_id in job["dependencies"]:
+            dep_wrappers[dep_id] = DependencyWrapper(
+                artifact_id=dep_id,
+                invoke_func=controlled_globals["invoke"],
+            )
+    controlled_globals["context"] = ExecutionContext(dependencies=dep_wrappers)
+    return controlled_globals
+
+
+def _run_job(conn: Connection, job: dict[str, Any]) -> "ExecutionResult":
+    """Execute one artifact turn inside the worker."""
+    import json
+
+    from .executor import (
+        TimeoutError as ExecTimeoutError,
+        _format_runtime_error,
+        _timeout_context,
+        parse_json_args,
+    )
+    from .simulation_engine import measure_resources
+
+    timeout: int = job["timeout"]
+    entry_point: str = job["entry_point"]
+
+    try:
+        compiled = get_code_cache().compile(job["code"], AGENT_CODE_FILENAME)
+    except SyntaxError as e:
+        return {"success": False, "error": f"Syntax error: {e}"}
+    except Exception as e:  # exception-ok: user code can raise anything
+        return {"success": False, "error": f"Compilation failed: {e}"}
+
+    controlled_globals = _build_worker_globals(conn, job)
+
+    try:
+        with _timeout_context(timeout):
+            exec(compiled, controlled_globals)
+    except ExecTimeoutError:
+        return {"success": False, "error": "Code definition timed out"}
+    except Exception as e:  # exception-ok: user code can raise anything
+        return {"success": False, "error": _format_runtime_error(e, "Execution error")}
+
+    if entry_point not in controlled_globals:
+        return {"success": False, "error": f"Code did not define a {entry_point}() function"}
+    entry_func = controlled_globals[entry_point]
+    if not callable(entry_func):
+        return {"success": False, "error": f"{entry_point} is not callable"}
+
+    args = parse_json_args(job["args"])
+
+    start_time = time.perf_counter()
+    execution_time_ms: float = 0.0
+    result: Any = None
+    error_result: ExecutionResult | None = None
+
+    # This process runs nothing but this turn, so the measurement is per-action
+    with measure_resources() as measurer:
+        try:
+            with _timeout_context(timeout):
+                if entry_point == "handle_request":
+                    result = entry_func(
+                        job["caller_id"], job["method_name"] or "invoke", args
+                    )
+                else:
+                    result = entry_func(*args)
+                execution_time_ms = (time.perf_counter() - start_time) * 1000
+        except ExecTimeoutError:
+            execution_time_ms = (time.perf_counter() - start_time) * 1000
+            error_result = {
+                "success": False,
+                "error": "Execution timed out",
+                "execution_time_ms": execution_time_ms,
+            }
+        except TypeError as e:
+            execution_time_ms = (time.perf_counter() - start_time) * 1000
+            error_result = {
+                "success": False,
+                "error": _format_runtime_error(e, "Argument error"),
+                "execution_time_ms": execution_time_ms,
+            }
+        except Exception as e:  # exception-ok: user code can raise anything
+            execution_time_ms = (time.perf_counter() - start_time) * 1000
+            error_result = {
+                "success": False,
+                "error": _format_runtime_error(e),
+                "execution_time_ms": execution_time_ms,
+            }
+
+    usage = measurer.get_usage()
+    resources_consumed = {
+        "cpu_seconds": usage.cpu_seconds,
+        "peak_memory_bytes": float(usage.peak_memory_bytes),
+    }
+
+    if error_result is not None:
+        error_result["resources_consumed"] = resources_consumed
+        return error_result
+
+    try:
+        json.dumps(result)
+    except (TypeError, ValueError):
+        result = str(result)
+
+    return {
+        "success": True,
+        "result": result,
+        "execution_time_ms": execution_time_ms,
+        "resources_consumed": resources_consumed,
+    }
+
+
+def _worker_main(conn: Connection) -> None:
+    """Entry point of a worker process: serve jobs until shutdown."""
+    # Ctrl+C goes to the whole process group; the parent owns shutdown
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    conn.send(("ready",))
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message[0] == "shutdown":
+            break
+        if message[0] == "execute":
+            conn.send(("result", _run_job(conn, message[1])))
+
+
+# =============================================================================
+# PARENT SIDE (runs in the simulation process)
+# =============================================================================
+
+
+@dataclass
+class _Worker:
+    """A live worker process and the parent end of its pipe."""
+
+    process: "BaseProcess"
+    conn: Connection
+
+
+class WorkerPool:
+    """Dispatches artifact turns to a pool of worker processes.
+
+    Workers are spawned lazily (up to num_workers) and reused across turns.
+
+    Attributes:
+        num_workers: Maximum number of worker processes
+        timeout: Per-phase execution timeout enforced inside workers (seconds)
+        turns_completed: Turns that returned a result
+        workers_replaced: Workers killed after crashing or hanging
+    """
+
+    def __init__(self, num_workers: int, timeout: int | None = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            num_workers: Maximum number of worker processes (must be positive)
+            timeout: Execution timeout in seconds (defaults to executor.timeout_seconds)
+
+        Raises:
+            ValueError: If num_workers is not positive
+        """
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be positive: {num_workers}")
+        self.num_workers = num_workers
+        self.timeout = timeout or get_validated_config().executor.timeout_seconds
+        self.turns_completed = 0
+        self.workers_replaced = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: list[_Worker] = []
+        self._live = 0
+        self._slots: asyncio.Semaphore | None = None
+        self._slots_loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def from_config(cls) -> "WorkerPool | None":
+        """Create a pool from execution.use_worker_pool / execution.worker_pool.
+
+        Returns:
+            WorkerPool if use_worker_pool is enabled, None otherwise.
+        """
+        config = get_validated_config()
+        if not config.execution.use_worker_pool:
+            return None
+        return cls(num_workers=config.execution.worker_pool.num_workers)
+
+    @property
+    def live_workers(self) -> int:
+        """Number of worker processes currently alive (idle or busy)."""
+        return self._live
+
+    async def _spawn(self) -> _Worker:
+        """Start a worker process and wait until it has imported the kernel."""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn,),
+            name=f"artifact-worker-{self._live}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process=process, conn=parent_conn)
+        self._live += 1
+        try:
+            message = await self._recv(worker, WORKER_STARTUP_TIMEOUT)
+        except WorkerCrashedError:
+            self._kill(worker)
+            raise
+        if message[0] != "ready":
+            self._kill(worker)
+            raise WorkerCrashedError(f"Unexpected worker handshake: {message[0]}")
+        return worker
+
+    async def _recv(self, worker: _Worker, timeout: float) -> tuple[Any, ...]:
+        """Receive the next message without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        try:
+            ready = await loop.run_in_executor(None, worker.conn.poll, timeout)
+            if not ready:
+                raise WorkerCrashedError(f"Worker silent for {timeout:.0f}s")
+            message: tuple[Any, ...] = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            raise WorkerCrashedError(
+                f"Worker exited (code {worker.process.exitcode}): {e}"
+            ) from e
+        return message
+
+    def _send(self, worker: _Worker, message: tuple[Any, ...]) -> None:
+        """Send a message to a worker; a broken pipe means the worker is gone.
+
+        Pickling errors propagate unchanged. They are raised before anything
+        is written, so the worker is still usable.
+        """
+        try:
+            worker.conn.send(message)
+        except (EOFError, OSError) as e:
+            raise WorkerCrashedError(
+                f"Worker exited (code {worker.process.exitcode}): {e}"
+            ) from e
+
+    def _kill(self, worker: _Worker) -> None:
+        """Terminate a worker and release its slot."""
+        try:
+            worker.conn.close()
+        except OSError:
+            pass
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.process.join(timeout=1.0)
+        self._live -= 1
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        """Get the turn semaphore for the running event loop.
+
+        Semaphores bind to one loop; a restarted simulation gets a fresh one
+        while keeping the (loop-independent) worker processes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.num_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    async def _acquire(self) -> _Worker:
+        """Take an idle worker, spawning one if under num_workers."""
+        if self._idle:
+            return self._idle.pop()
+        return await self._spawn()
+
+    def _build_services(
+        self,
+        executor: "SafeExecutor",
+        world: "World",
+        caller_id: str,
+        artifact_id: str | None,
+    ) -> dict[str, Any]:
+        """Build the parent-side implementations of sandbox services.
+
+        Mirrors the injections made by SafeExecutor.execute_with_invoke().
+        """
+        from .executor import (
+            PaymentResult,
+            create_syscall_llm,
+            create_wallet_functions,
+            get_max_invoke_depth,
+        )
+        from .invoke_handler import create_invoke_function
+        from .kernel_interface import KernelActions, KernelState
+
+        store = world.artifacts
+        ledger = world.ledger
+        services: dict[str, Any] = {
+            "kernel_state": KernelState(world),
+            "kernel_actions": KernelActions(world),
+        }
+
+        if artifact_id:
+            artifact = store.get(artifact_id)
+            if artifact and "can_call_llm" in artifact.capabilities:
+                services["_syscall_llm"] = create_syscall_llm(world, caller_id)
+            payments_made: list[PaymentResult] = []
+            pay, get_balance = create_wallet_functions(artifact_id, ledger, payments_made)
+            services["pay"] = pay
+            services["get_balance"] = get_balance
+
+        services["invoke"] = create_invoke_function(
+            caller_id=caller_id,
+            artifact_id=artifact_id,
+            ledger=ledger,
+            artifact_store=store,
+            current_depth=0,
+            max_depth=get_max_invoke_depth(),
+            world=world,
+            check_permission_func=executor._check_permission,
+            check_permission_via_contract_func=executor._check_permission_via_contract,
+            execute_with_invoke_func=executor.execute_with_invoke,
+            use_contracts=executor.use_contracts,
+        )
+
+        def read_artifact(target_id: str) -> dict[str, Any]:
+            target = store.get(target_id)
+            if target is None:
+                return {"success": False, "error": f"Artifact {target_id} not found"}
+            if target.deleted:
+                return {"success": False, "error": f"Artifact {target_id} has been deleted"}
+            return {
+                "success": True,
+                "artifact_id": target_id,
+                "content": target.content,
+                "type": target.type,
+                "created_by": target.created_by,
+                "executable": target.executable,
+            }
+
+        services["read_artifact"] = read_artifact
+        return services
+
+    async def _serve_call(
+        self,
+        services: dict[str, Any],
+        service: str,
+        method: str | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> tuple[Any, ...]:
+        """Execute a worker's kernel call against the real world."""
+        try:
+            target = services.get(service)
+            if target is None:
+                raise NameError(f"'{service}' is not available in this context")
+            if method is not None:
+                if method.startswith("_"):
+                    raise AttributeError(f"'{service}' has no public attribute '{method}'")
+                target = getattr(target, method)
+            if service in _BLOCKING_SERVICES:
+                loop = asyncio.get_running_loop()
+                value = await loop.run_in_executor(None, lambda: target(*args, **kwargs))
+            else:
+                value = target(*args, **kwargs)
+            return ("reply", True, value)
+        except Exception as e:  # exception-ok: service errors are returned to the artifact
+            return ("reply", False, (type(e).__name__, str(e)))
+
+    async def execute(
+        self,
+        executor: "SafeExecutor",
+        world: "World",
+        code: str,
+        caller_id: str,
+        artifact_id: str | None = None,
+        args: list[Any] | None = None,
+        entry_point: str = "run",
+        method_name: str | None = None,
+    ) -> "ExecutionResult":
+        """Execute an artifact turn in a worker process.
+
+        Same contract as SafeExecutor.execute_with_invoke() with world set:
+        the sandbox gets kernel_state, kernel_actions, caller_id, invoke,
+        pay/get_balance, Action, context and (if capable) _syscall_llm.
+
+        Args:
+            executor: SafeExecutor used for validation, permission checks and
+                nested invokes (which run in the parent)
+            world: World whose kernel serves the worker's calls
+            code: Python code defining the entry point
+            caller_id: Principal who invoked the artifact (and pays)
+            artifact_id: ID of the executing artifact (for wallet/capabilities)
+            args: Arguments for the entry point
+            entry_point: "run" or "handle_request" (Plan #234)
+            method_name: Operation name passed to handle_request
+
+        Returns:
+            ExecutionResult; resources_consumed reflects only this turn
+        """
+        valid, error = executor.validate_code(code)
+        if not valid:
+            return {"success": False, "error": error}
+
+        dependencies: list[str] = []
+        if artifact_id:
+            artifact = world.artifacts.get(artifact_id)
+            if artifact and artifact.depends_on:
+                for dep_id in artifact.depends_on:
+                    dep_artifact = world.artifacts.get(dep_id)
+                    if dep_artifact is None or dep_artifact.deleted:
+                        return {
+                            "success": False,
+                            "error": f"Dependency '{dep_id}' not found or deleted",
+                        }
+                    dependencies.append(dep_id)
+
+        services = self._build_services(executor, world, caller_id, artifact_id)
+        job: dict[str, Any] = {
+            "code": code,
+            "args": list(args or []),
+            "caller_id": caller_id,
+            "entry_point": entry_point,
+            "method_name": method_name,
+            "timeout": self.timeout,
+            "preloaded_imports": list(executor.preloaded_modules),
+            "services": list(services),
+            "dependencies": dependencies,
+        }
+
+        async with self._get_slots():
+            try:
+                worker = await self._acquire()
+            except WorkerCrashedError as e:
+                return {"success": False, "error": f"Worker pool unavailable: {e}"}
+            try:
+                result = await self._run_on_worker(worker, job, services)
+            except WorkerCrashedError as e:
+                logger.warning("Replacing worker after failed turn: %s", e)
+                self._kill(worker)
+                self.workers_replaced += 1
+                return {"success": False, "error": f"Execution timed out or crashed: {e}"}
+            except asyncio.CancelledError:
+                # Worker may be mid-turn; it cannot be reused safely
+                self._kill(worker)
+                raise
+            self._idle.append(worker)
+            self.turns_completed += 1
+            return result
+
+    async def _run_on_worker(
+        self,
+        worker: _Worker,
+        job: dict[str, Any],
+        services: dict[str, Any],
+    ) -> "ExecutionResult":
+        """Send a job and serve its kernel calls until the result arrives."""
+        # Definition and entry point each get `timeout` inside the worker;
+        # the parent only intervenes if the worker stops responding entirely
+        hard_timeout = self.timeout * 2 + WORKER_KILL_GRACE
+        try:
+            self._send(worker, ("execute", job))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            return {"success": False, "error": f"Job cannot be sent to worker: {e}"}
+        while True:
+            message = await self._recv(worker, hard_timeout)
+            if message[0] == "result":
+                result: ExecutionResult = message[1]
+                return result
+            if message[0] == "call":
+                _, service, method, args, kwargs = message
+                reply = await self._serve_call(services, service, method, args, kwargs)
+                try:
+                    self._send(worker, reply)
+                except WorkerCrashedError:
+                    raise
+                except Exception as e:  # exception-ok: unpicklable values are reported
+                    self._send(worker, ("reply", False, (
+                        "TypeError", f"Result of {service} cannot be sent to worker: {e}"
+                    )))
+            else:
+                raise WorkerCrashedError(f"Unexpected worker message: {message[0]}")
+
+    def shutdown(self) -> None:
+        """Stop all idle workers. Busy workers are killed by their turns."""
+        while self._idle:
+            worker = self._idle.pop()
+            try:
+                worker.conn.send(("shutdown",))
+            except OSError:
+                pass
+            worker.process.join(timeout=1.0)
+            self._kill(worker)
+        self._slots = None
+        self._slots_loop = None
+        logger.debug("Worker pool shut down")
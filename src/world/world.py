@@ -19,6 +19,15 @@ import time
 from pathlib import Path
 from typing import Any, TypedDict, TYPE_CHECKING, cast
 
+# Pre-import litellm at module level to ensure full initialization.
+# Without this, first import inside an async executor context leaves
+# litellm partially initialized (circular import in submodules). Done here
+# rather than in executor.py so sandbox workers, which only need the
+# executor, do not load it.
+try:
+    import litellm  # noqa: F401
+except ImportError:
+    pass  # litellm optional if no agents use can_call_llm
 from .ledger import Ledger
 from .artifacts import ArtifactStore, Artifact, WriteResult
 from .logger import EventLogger
@@ -37,6 +46,7 @@ from .resource_manager import ResourceManager, ResourceType
 from .resource_metrics import ResourceMetricsProvider
 from .mint_auction import MintAuction, KernelMintSubmission, KernelMintResult
 from .mint_tasks import MintTaskManager  # Plan #269
+from .task_runner import TaskTestRunner
 from .triggers import TriggerRegistry
 from .delegation import DelegationManager
 
@@ -267,6 +277,9 @@ class World:
                 artifacts=self.artifacts,
                 executor=get_executor(),
                 logger=self.logger,
+                test_runner=TaskTestRunner.from_config(),
+                short_circuit=config_get("mint_tasks.evaluation.short_circuit", True),
+                cache_size=config_get("mint_tasks.evaluation.cache_size", 1024),
             )
             # Seed tasks from config
             seed_tasks = config_get("mint_tasks.seed_tasks", [])
@@ -531,7 +544,6 @@ class World:
             {"success": True} on success
             {"success": False, "error": "..."} on failure
         """
-        from datetime import datetime, timezone
         from src.world.executor import get_executor
 
         # Check if system artifact (kernel-level protection)
@@ -554,10 +566,7 @@ class World:
             return {"success": False, "error": f"Delete not permitted: {perm_result.reason}"}
 
         # Soft delete - mark as tombstone
-        artifact.deleted = True
-        artifact.deleted_at = datetime.now(timezone.utc).isoformat()
-        artifact.deleted_by = requester_id
-        self.artifacts._remove_from_index(artifact)
+        self.artifacts.mark_deleted(artifact, requester_id)
 
         # Log the deletion
         self.logger.log("artifact_deleted", {
@@ -986,6 +995,18 @@ class World:
         self.trigger_registry.set_current_event_number(self.event_number)
         self.trigger_registry.refresh()
 
+    def update_trigger(self, artifact_id: str) -> None:
+        """Re-register the triggers affected by a change to one artifact.
+
+        Incremental alternative to refresh_triggers() for when a single
+        trigger or callback artifact was written, edited or deleted.
+
+        Args:
+            artifact_id: The changed artifact
+        """
+        self.trigger_registry.set_current_event_number(self.event_number)
+        self.trigger_registry.update_trigger(artifact_id)
+
     def process_pending_triggers(self) -> list[ActionResult]:
         """Process all pending trigger invocations.
 
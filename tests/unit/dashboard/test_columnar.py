@@ -0,0 +1,102 @@
+"""Tests for the columnar event log export."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.dashboard.columnar import export_run, is_current, load_runs, load_table
+from src.world.logger import EventLogger
+
+
+def _write_run(run_dir: Path, agent: str = "alice") -> EventLogger:
+    run_dir.mkdir(parents=True, exist_ok=True)
+    logger = EventLogger(output_file=str(run_dir / "events.jsonl"))
+    logger.log("action", {
+        "event_number": 1,
+        "intent": {"action_type": "write_artifact", "principal_id": agent, "artifact_id": "doc"},
+        "result": {"success": True, "message": "ok"},
+        "scrip_after": 90,
+    })
+    logger.log("action", {
+        "event_number": 2,
+        "intent": {"action_type": "transfer", "principal_id": agent},
+        "result": {"success": False, "message": "no", "error_code": "insufficient_funds"},
+        "scrip_after": 90,
+    })
+    logger.log("thinking", {
+        "principal_id": agent, "model": "m", "input_tokens": 100,
+        "output_tokens": 20, "api_cost": 0.5, "llm_budget_after": 9.5,
+    })
+    logger.log("transfer", {
+        "sender": agent, "recipient": "bob", "amount": 10,
+        "sender_balance_after": 80, "recipient_balance_after": 110,
+    })
+    logger.log("invoke_success", {
+        "event_number": 3, "invoker_id": agent, "artifact_id": "tool",
+        "method": "run", "duration_ms": 1.5, "result_type": "dict",
+    })
+    logger.log("invoke_failure", {
+        "event_number": 4, "invoker_id": agent, "artifact_id": "tool",
+        "method": "run", "duration_ms": 2.0, "error_type": "timeout", "error_message": "x",
+    })
+    return logger
+
+
+class TestColumnarExport:
+    """Tests for export_run / load_table."""
+
+    @pytest.mark.parametrize("storage_format", ["npz", "parquet"])
+    def test_tables_are_typed(self, tmp_path: Path, storage_format: str) -> None:
+        """Each table holds typed columns for its event types."""
+        if storage_format == "parquet":
+            pytest.importorskip("pyarrow")
+        _write_run(tmp_path / "run_a").close()
+        rows = export_run(tmp_path / "run_a", storage_format)  # type: ignore[arg-type]
+        assert rows == {"events": 6, "actions": 2, "thinking": 1, "transfers": 1, "invocations": 2}
+
+        actions = load_table(tmp_path / "run_a", "actions")
+        assert actions["success"].dtype == np.bool_
+        assert actions["event_number"].dtype == np.int64
+        assert list(actions["error_code"]) == ["", "insufficient_funds"]
+        assert actions["timestamp"].dtype.kind == "M"
+
+        invocations = load_table(tmp_path / "run_a", "invocations")
+        assert list(invocations["success"]) == [True, False]
+        assert invocations["duration_ms"].sum() == pytest.approx(3.5)
+
+    def test_loader_rebuilds_stale_export(self, tmp_path: Path) -> None:
+        """Events appended after an export are picked up on the next load."""
+        logger = _write_run(tmp_path / "run_a")
+        export_run(tmp_path / "run_a", "npz")
+        assert is_current(tmp_path / "run_a")
+
+        logger.log("thinking", {"principal_id": "alice", "api_cost": 1.0})
+        logger.close()
+        assert not is_current(tmp_path / "run_a")
+        thinking = load_table(tmp_path / "run_a", "thinking")
+        assert thinking["api_cost"].sum() == pytest.approx(1.5)
+
+    def test_missing_numeric_fields_are_nan(self, tmp_path: Path) -> None:
+        """Absent float fields become NaN rather than failing the export."""
+        logger = _write_run(tmp_path / "run_a")
+        logger.log("transfer", {"sender": "a", "recipient": "b"})
+        logger.close()
+        transfers = load_table(tmp_path / "run_a", "transfers")
+        assert np.isnan(transfers["amount"].iloc[-1])
+
+    def test_load_runs_concatenates(self, tmp_path: Path) -> None:
+        """load_runs stacks tables from several runs with a run_id column."""
+        _write_run(tmp_path / "run_a", "alice").close()
+        _write_run(tmp_path / "run_b", "bob").close()
+        thinking = load_runs([tmp_path / "run_a", tmp_path / "run_b"], "thinking")
+        assert list(thinking["run_id"]) == ["run_a", "run_b"]
+        assert list(thinking["principal_id"]) == ["alice", "bob"]
+
+    def test_unknown_table(self, tmp_path: Path) -> None:
+        """Unknown table names fail loudly."""
+        _write_run(tmp_path / "run_a").close()
+        with pytest.raises(ValueError, match="Unknown table"):
+            load_table(tmp_path / "run_a", "nope")
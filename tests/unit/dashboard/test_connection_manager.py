@@ -0,0 +1,196 @@
+"""Tests for WebSocket delta batching and per-client backpressure.
+
+ConnectionManager queues messages per client and sends them from a task per
+client, merging queued delta frames and dropping old ones for slow clients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.dashboard.server import ConnectionManager, DashboardApp
+
+
+class FakeWebSocket:
+    """Records sent frames; sends block while `gate` is cleared."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.sent: list[Any] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = fail
+        self.close_code: int | None = None
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_json(self, message: dict[str, Any]) -> None:
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("connection reset")
+        self.sent.append(message)
+
+    async def send_text(self, message: str) -> None:
+        await self.gate.wait()
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+
+def _delta(*events: int, agents: list[dict[str, Any]] | None = None) -> dict[str, Any]:
+    return {"type": "delta", "data": {
+        "events": [{"n": n} for n in events],
+        "dropped_events": 0,
+        "agents": agents or [],
+        "artifacts": [],
+        "state": {"last": events[-1] if events else None},
+        "kpis": None,
+    }}
+
+
+def _events(frames: list[Any]) -> list[int]:
+    return [e["n"] for f in frames if isinstance(f, dict) and f["type"] == "delta"
+            for e in f["data"]["events"]]
+
+
+class TestConnectionManager:
+    """Queueing, coalescing and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self) -> None:
+        """broadcast returns at once and fast clients get frames while a slow one blocks."""
+        manager = ConnectionManager()
+        fast, slow = FakeWebSocket(), FakeWebSocket()
+        slow.gate.clear()
+        await manager.connect(fast)
+        await manager.connect(slow)
+
+        await asyncio.wait_for(manager.broadcast(_delta(1)), timeout=1)
+        await asyncio.sleep(0)
+        assert _events(fast.sent) == [1]
+        assert slow.sent == []
+
+        slow.gate.set()
+        await manager.flush()
+        assert _events(slow.sent) == [1]
+
+    @pytest.mark.asyncio
+    async def test_queued_deltas_are_merged(self) -> None:
+        """Deltas queued behind a blocked send merge into one frame."""
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        ws.gate.clear()
+        await manager.connect(ws)
+        await manager.broadcast(_delta(1))
+        await asyncio.sleep(0)  # frame 1 is now in flight
+        for n in range(2, 6):
+            await manager.broadcast(_delta(n, agents=[{"agent_id": "a", "scrip": n}]))
+        ws.gate.set()
+        await manager.flush()
+
+        assert len(ws.sent) == 2
+        merged = ws.sent[1]["data"]
+        assert [e["n"] for e in merged["events"]] == [2, 3, 4, 5]
+        assert merged["agents"] == [{"agent_id": "a", "scrip": 5}]
+        assert merged["state"] == {"last": 5}
+
+    @pytest.mark.asyncio
+    async def test_batch_cap_reports_dropped_events(self) -> None:
+        """A frame keeps the newest max_batch_events events and counts the rest."""
+        manager = ConnectionManager(max_batch_events=3)
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+        await manager.broadcast(_delta(*range(10)))
+        await manager.flush()
+        assert _events(ws.sent) == [7, 8, 9]
+        assert ws.sent[0]["data"]["dropped_events"] == 7
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_delta(self) -> None:
+        """With the queue full, the oldest delta goes and the next one reports it."""
+        manager = ConnectionManager(max_queue=2)
+        ws = FakeWebSocket()
+        ws.gate.clear()
+        await manager.connect(ws)
+        manager.send(ws, "ping")
+        await asyncio.sleep(0)  # "ping" in flight
+        await manager.broadcast(_delta(1, 2))
+        manager.send(ws, {"type": "simulation_control", "data": {}})
+        await manager.broadcast(_delta(3))
+        ws.gate.set()
+        await manager.flush()
+
+        assert ws.sent[0] == "ping"
+        assert ws.sent[1]["type"] == "simulation_control"
+        assert _events(ws.sent) == [3]
+        assert ws.sent[2]["data"]["dropped_events"] == 2
+        assert manager.connection_count == 1
+
+    @pytest.mark.asyncio
+    async def test_client_that_cannot_keep_up_is_closed(self) -> None:
+        """Non-droppable messages overflowing the queue disconnect the client."""
+        manager = ConnectionManager(max_queue=1)
+        ws = FakeWebSocket()
+        ws.gate.clear()
+        await manager.connect(ws)
+        manager.send(ws, "ping")
+        await asyncio.sleep(0)
+        manager.send(ws, "ping")
+        manager.send(ws, "ping")
+        assert manager.connection_count == 0
+        ws.gate.set()
+        await asyncio.sleep(0.01)
+        assert ws.close_code == 1013
+
+    @pytest.mark.asyncio
+    async def test_send_failure_and_timeout_drop_client(self) -> None:
+        """A failing or stalled socket is removed without affecting others."""
+        manager = ConnectionManager(send_timeout=0.05)
+        broken, stalled, healthy = FakeWebSocket(fail=True), FakeWebSocket(), FakeWebSocket()
+        stalled.gate.clear()
+        for ws in (broken, stalled, healthy):
+            await manager.connect(ws)
+        await manager.broadcast(_delta(1))
+        await asyncio.sleep(0.1)
+        await manager.flush()
+        assert manager.active_connections == [healthy]
+        assert _events(healthy.sent) == [1]
+
+
+class TestDeltaFrames:
+    """DashboardApp.on_file_change output."""
+
+    @pytest.mark.asyncio
+    async def test_one_frame_per_change_with_changed_summaries(self, tmp_path: Path) -> None:
+        """New events arrive in one delta carrying only the agents that changed."""
+        path = tmp_path / "events.jsonl"
+        path.write_text(json.dumps({"event_type": "world_init", "principals": [
+            {"id": "alice", "starting_scrip": 10}, {"id": "bob", "starting_scrip": 10},
+        ]}) + "\n")
+        app = DashboardApp(jsonl_path=path, live_mode=True)
+        ws = FakeWebSocket()
+        await app.connection_manager.connect(ws)
+
+        await app.on_file_change()
+        await app.connection_manager.flush()
+        with open(path, "a") as f:
+            for _ in range(3):
+                f.write(json.dumps({"event_type": "action", "intent": {
+                    "principal_id": "alice", "action_type": "noop",
+                }, "result": {"success": True}}) + "\n")
+        await app.on_file_change()
+        await app.connection_manager.flush()
+
+        first, second = ws.sent
+        assert first["type"] == second["type"] == "delta"
+        assert {a["agent_id"] for a in first["data"]["agents"]} == {"alice", "bob"}
+        assert len(second["data"]["events"]) == 3
+        assert [a["agent_id"] for a in second["data"]["agents"]] == ["alice"]
+        assert second["data"]["state"]["agent_count"] == 2
+        assert set(second["data"]["kpis"]) == {"kpis", "emergence", "health"}
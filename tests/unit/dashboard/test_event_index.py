@@ -0,0 +1,271 @@
+"""Tests for the dashboard's indexed event queries.
+
+Indexed filter_events / get_activity_feed / get_invocations must return
+exactly what the original list-comprehension filters returned.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.dashboard.event_index import TimeIndex
+from src.dashboard.models import RawEvent
+from src.dashboard.parser import JSONLParser
+
+AGENTS = ["alice", "bob", "carol"]
+ARTIFACTS = ["tool_a", "tool_b", "doc"]
+
+
+def _events(rng: random.Random, count: int) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = [{"event_type": "world_init", "principals": [
+        {"id": a, "starting_scrip": 100} for a in AGENTS
+    ]}]
+    tick = 0
+    for _ in range(count):
+        agent = rng.choice(AGENTS)
+        artifact = rng.choice(ARTIFACTS)
+        roll = rng.random()
+        if roll < 0.1:
+            tick += rng.choice([0, 1])
+            events.append({"event_type": "tick", "tick": tick})
+        elif roll < 0.4:
+            events.append({"event_type": "action", "intent": {
+                "principal_id": agent, "action_type": "write_artifact",
+                "artifact_id": artifact, "content": "x",
+            }, "result": {"success": True}})
+        elif roll < 0.6:
+            events.append({
+                "event_type": rng.choice(["invoke_success", "invoke_failure"]),
+                "invoker_id": agent, "artifact_id": artifact,
+                "timestamp": rng.choice(["t1", "t2"]),
+            })
+        elif roll < 0.8:
+            events.append({"event_type": "thinking", "principal_id": agent, "api_cost": 0.5})
+        else:
+            events.append({"event_type": "action", "intent": {
+                "principal_id": agent, "action_type": "invoke_artifact",
+                "artifact_id": "genesis_ledger", "method": "transfer",
+                "args": [agent, rng.choice(AGENTS), 1],
+            }, "result": {"success": True}})
+    return events
+
+
+@pytest.fixture
+def parser(tmp_path: Path) -> JSONLParser:
+    path = tmp_path / "events.jsonl"
+    path.write_text("".join(json.dumps(e) + "\n" for e in _events(random.Random(5), 1500)))
+    p = JSONLParser(path)
+    p.parse_full()
+    return p
+
+
+def _reference_filter(
+    events: list[RawEvent],
+    event_types: list[str] | None = None,
+    agent_id: str | None = None,
+    artifact_id: str | None = None,
+    tick_min: int | None = None,
+    tick_max: int | None = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> list[RawEvent]:
+    """The list-comprehension implementation filter_events replaced."""
+    if event_types:
+        events = [e for e in events if e.event_type in event_types]
+    if agent_id:
+        events = [e for e in events if e.data.get("principal_id") == agent_id
+                  or e.data.get("intent", {}).get("principal_id") == agent_id]
+    if artifact_id:
+        events = [e for e in events if e.data.get("artifact_id") == artifact_id
+                  or e.data.get("intent", {}).get("artifact_id") == artifact_id]
+    if tick_min is not None:
+        events = [e for e in events if e.data.get("tick", 0) >= tick_min]
+    if tick_max is not None:
+        events = [e for e in events if e.data.get("tick", float("inf")) <= tick_max]
+    return events[offset:offset + limit]
+
+
+class TestFilterEvents:
+    """filter_events / query_events over the event index."""
+
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"event_types": ["action"]},
+        {"event_types": ["action", "thinking"], "agent_id": "bob"},
+        {"agent_id": "alice", "artifact_id": "doc"},
+        {"artifact_id": "genesis_ledger", "offset": 5, "limit": 7},
+        {"tick_min": 3},
+        {"tick_min": 0, "tick_max": 4},
+        {"tick_max": 2, "event_types": ["tick", "thinking"]},
+        {"tick_min": 2, "tick_max": 5, "event_types": ["tick"]},
+        {"agent_id": "nobody"},
+    ])
+    def test_matches_reference(self, parser: JSONLParser, kwargs: dict[str, Any]) -> None:
+        """Indexed results equal the original filters."""
+        kwargs.setdefault("limit", 1000)
+        expected = _reference_filter(parser.state.all_events, **kwargs)
+        assert parser.filter_events(**kwargs) == expected
+
+    def test_cursor_pages_cover_all_matches(self, parser: JSONLParser) -> None:
+        """Following next cursors visits every match exactly once, in order."""
+        expected = _reference_filter(
+            parser.state.all_events, event_types=["action"], agent_id="carol", limit=10**6
+        )
+        seen: list[RawEvent] = []
+        cursor = None
+        while True:
+            page, cursor = parser.query_events(
+                event_types=["action"], agent_id="carol", limit=17, cursor=cursor
+            )
+            seen.extend(page)
+            if cursor is None:
+                break
+        assert seen == expected
+
+    def test_cursor_stable_while_log_grows(self, tmp_path: Path) -> None:
+        """Events appended between pages do not shift the next page."""
+        path = tmp_path / "events.jsonl"
+        lines = [json.dumps({"event_type": "tick", "tick": i}) + "\n" for i in range(10)]
+        path.write_text("".join(lines))
+        parser = JSONLParser(path)
+        parser.parse_incremental()
+        first, cursor = parser.query_events(limit=4)
+        with open(path, "a") as f:
+            f.write(json.dumps({"event_type": "tick", "tick": 10}) + "\n")
+        parser.parse_incremental()
+        second, _ = parser.query_events(limit=4, cursor=cursor)
+        assert [e.data["tick"] for e in first] == [0, 1, 2, 3]
+        assert [e.data["tick"] for e in second] == [4, 5, 6, 7]
+
+    def test_events_endpoint_cursor_header(self, tmp_path: Path) -> None:
+        """/api/events returns X-Next-Cursor until the last page."""
+        from fastapi.testclient import TestClient
+
+        from src.dashboard.server import create_app
+
+        path = tmp_path / "events.jsonl"
+        path.write_text("".join(
+            json.dumps({"event_type": "tick", "tick": i}) + "\n" for i in range(5)
+        ))
+        client = TestClient(create_app(jsonl_path=str(path)))
+        first = client.get("/api/events", params={"limit": 3})
+        cursor = first.headers["X-Next-Cursor"]
+        second = client.get("/api/events", params={"limit": 3, "cursor": cursor})
+        assert [e["data"]["tick"] for e in first.json() + second.json()] == list(range(5))
+        assert "X-Next-Cursor" not in second.headers
+
+    def test_query_cost_independent_of_history(self, tmp_path: Path) -> None:
+        """A selective page is served without scanning the whole log."""
+        def timed(count: int) -> float:
+            path = tmp_path / f"events_{count}.jsonl"
+            events = [{"event_type": "thinking", "principal_id": "alice"}] * count
+            events.append({"event_type": "action", "intent": {"principal_id": "bob"}})
+            path.write_text("".join(json.dumps(e) + "\n" for e in events))
+            parser = JSONLParser(path)
+            parser.parse_incremental()
+            start = time.perf_counter()
+            for _ in range(50):
+                assert len(parser.filter_events(agent_id="bob")) == 1
+                assert len(parser.filter_events(event_types=["thinking"], limit=10)) == 10
+            return time.perf_counter() - start
+
+        assert timed(50_000) < timed(500) * 5
+
+
+class TestRecentFirstViews:
+    """get_activity_feed and get_invocations keep their sort order."""
+
+    def test_activity_feed_matches_sorted_reference(self, parser: JSONLParser) -> None:
+        """Items come back as sorted(key=(tick, timestamp), reverse=True) would give."""
+        items = parser.state.activity_items
+        assert items
+        for kwargs in ({}, {"agent_id": "bob"}, {"activity_types": ["scrip_transfer"]},
+                       {"artifact_id": "doc", "offset": 2, "limit": 3}):
+            reference = items
+            if "agent_id" in kwargs:
+                reference = [i for i in reference
+                             if kwargs["agent_id"] in (i.agent_id, i.target_id)]
+            if "activity_types" in kwargs:
+                reference = [i for i in reference if i.activity_type in kwargs["activity_types"]]
+            if "artifact_id" in kwargs:
+                reference = [i for i in reference if i.artifact_id == kwargs["artifact_id"]]
+            reference = sorted(reference, key=lambda x: (x.tick, x.timestamp), reverse=True)
+            offset, limit = kwargs.pop("offset", 0), kwargs.pop("limit", 100)
+            feed = parser.get_activity_feed(offset=offset, limit=limit, **kwargs)
+            assert feed.total_count == len(reference)
+            assert feed.items == reference[offset:offset + limit]
+
+    def test_invocations_out_of_order_fall_back_to_sort(self, parser: JSONLParser) -> None:
+        """Invocation timestamps that go backwards still sort correctly."""
+        events = parser.state.invocation_events
+        assert events
+        for success in (None, True, False):
+            reference = [e for e in events if success is None or e.success == success]
+            reference = sorted(reference, key=lambda x: (x.tick, x.timestamp), reverse=True)
+            assert parser.get_invocations(success=success, limit=10_000) == reference
+
+    def test_artifact_invocations(self, parser: JSONLParser) -> None:
+        """get_artifact_invocations returns one artifact's events in order."""
+        expected = [e for e in parser.state.invocation_events if e.artifact_id == "doc"]
+        assert parser.get_artifact_invocations("doc") == expected
+        assert parser.get_invocation_stats("doc").total_invocations == len(expected)
+
+
+class TestRecordIndexBasics:
+    """Index bookkeeping."""
+
+    def test_reset_rebuilds_indexes(self, parser: JSONLParser) -> None:
+        """parse_full starts from empty indexes over the new state."""
+        before = len(parser.event_index)
+        parser.parse_full()
+        assert len(parser.event_index) == before == len(parser.state.all_events)
+        assert parser.activity_index.records is parser.state.activity_items
+
+    def test_unhashable_values_are_ignored(self, tmp_path: Path) -> None:
+        """Non-string principal or artifact fields do not break indexing."""
+        path = tmp_path / "events.jsonl"
+        path.write_text(json.dumps({"event_type": "x", "artifact_id": ["a"]}) + "\n")
+        parser = JSONLParser(path)
+        parser.parse_incremental()
+        assert parser.filter_events(artifact_id="a") == []
+        assert len(parser.filter_events()) == 1
+
+
+class TestTimeIndex:
+    """Timestamp windows over an append-only list."""
+
+    def test_window_matches_filter(self) -> None:
+        """window() returns the records in range, untimed ones only on request."""
+        records: list[str] = []
+        index: TimeIndex[str] = TimeIndex(records, lambda r: r)
+        stamps = [f"2025-01-01T00:00:{s:02d}" for s in range(0, 60, 5)]
+        for stamp in stamps[:6] + ["", "garbage"] + stamps[6:]:
+            records.append(stamp)
+            index.add(stamp)
+
+        low, high = "2025-01-01T00:00:10", "2025-01-01T00:00:40Z"
+        expected = [s for s in stamps if low <= s <= high.rstrip("Z")]
+        assert index.window(low, high) == expected
+        assert index.window(low, None) == [s for s in stamps if s >= low]
+        assert index.window(None, None) == stamps
+        assert index.window("not a time", None) == stamps
+        assert index.window(low, high, include_untimed=True) == (
+            expected[:4] + ["", "garbage"] + expected[4:]
+        )
+
+    def test_out_of_order_times(self) -> None:
+        """Records appended out of time order are still filtered correctly."""
+        records: list[str] = []
+        index: TimeIndex[str] = TimeIndex(records, lambda r: r)
+        for stamp in ["2025-01-01T00:00:30", "2025-01-01T00:00:10", "2025-01-01T00:00:20"]:
+            records.append(stamp)
+            index.add(stamp)
+        assert index.window("2025-01-01T00:00:15", None) == [
+            "2025-01-01T00:00:30", "2025-01-01T00:00:20",
+        ]
@@ -0,0 +1,203 @@
+"""Tests for spill-to-disk dashboard history.
+
+Tests:
+- SpillList behaves like a list while its oldest items live in SQLite
+- A parser with a small hot_history_items answers every get_* method
+  exactly like an unbounded one
+- Flow, network, pairwise and Lindy views never walk spilled history
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.dashboard.history_store import HistoryStore, SpillList
+from src.dashboard.parser import JSONLParser
+from tests.unit.dashboard.test_kpi_aggregator import AGENTS, _random_events
+
+
+class TestSpillList:
+    """List semantics across the memory/disk boundary."""
+
+    def test_list_operations(self, tmp_path: Path) -> None:
+        """len, indexing, slicing and iteration match a plain list."""
+        store = HistoryStore(tmp_path)
+        spill: SpillList[dict[str, int]] = SpillList(store, hot_items=4)
+        plain = []
+        for i in range(37):
+            spill.append({"n": i})
+            plain.append({"n": i})
+        assert spill.spilled > 0
+        assert len(spill) == 37
+        assert spill == plain
+        assert list(spill) == plain
+        assert list(reversed(spill)) == plain[::-1]
+        assert spill[0] == plain[0] and spill[-1] == plain[-1] and spill[-30] == plain[-30]
+        for s in (slice(None), slice(-20, None), slice(3, 30), slice(5, 2), slice(1, 30, 7)):
+            assert spill[s] == plain[s]
+        with pytest.raises(IndexError):
+            spill[37]
+
+    def test_memory_bounded(self, tmp_path: Path) -> None:
+        """No more than twice hot_items items stay in memory."""
+        spill: SpillList[int] = SpillList(HistoryStore(tmp_path), hot_items=10)
+        for i in range(1000):
+            spill.append(i)
+            assert len(spill) - spill.spilled < 20
+        assert sum(spill) == sum(range(1000))
+
+    def test_assignment_persists_spilled_items(self, tmp_path: Path) -> None:
+        """Assigning to a spilled position updates the stored copy."""
+        spill: SpillList[int] = SpillList(HistoryStore(tmp_path), hot_items=2)
+        for i in range(10):
+            spill.append(i)
+        spill[0] = 100
+        assert spill[0] == 100
+        with pytest.raises(TypeError):
+            del spill[0]
+
+    def test_store_file_removed_on_close(self, tmp_path: Path) -> None:
+        """Closing the store deletes the spill file."""
+        store = HistoryStore(tmp_path)
+        path = Path(store.path)
+        assert path.exists()
+        store.close()
+        assert not path.exists()
+
+
+def _snapshot(parser: JSONLParser) -> dict[str, Any]:
+    """Output of every parser query, as plain data."""
+    dump = lambda m: m.model_dump() if m is not None else None  # noqa: E731
+    state = parser.state
+    result: dict[str, Any] = {
+        "summaries": [dump(s) for s in parser.get_all_agent_summaries()],
+        "details": [dump(parser.get_agent_detail(a)) for a in state.agents],
+        "artifacts": [dump(a) for a in parser.get_all_artifacts()],
+        "genesis": dump(parser.get_genesis_activity()),
+        "llm_chart": dump(parser.get_llm_tokens_chart_data()),
+        "scrip_chart": dump(parser.get_scrip_chart_data()),
+        "flow": dump(parser.get_economic_flow_data()),
+        "events": [dump(e) for e in parser.filter_events(limit=10_000)],
+        "agent_events": [dump(e) for e in parser.filter_events(agent_id=AGENTS[0])],
+        "network": dump(parser.get_network_graph_data()),
+        "temporal": dump(parser.get_temporal_network_data()),
+        "activity": dump(parser.get_activity_feed(limit=500)),
+        "invocations": [dump(i) for i in parser.get_invocations(limit=500)],
+        "pairwise": dump(parser.get_pairwise_interactions(AGENTS[0], AGENTS[1])),
+        "capital": dump(parser.get_capital_flow_data()),
+        "standard": [dump(a) for a in parser.get_standard_artifacts()],
+        "kpis": parser.kpi_aggregator.emergence().model_dump(),
+        "tick_summaries": [dump(t) for t in state.tick_summaries],
+    }
+    progress = dump(parser.get_progress())
+    progress.pop("elapsed_seconds", None)
+    result["progress"] = progress
+    return result
+
+
+class TestSpillingParser:
+    """JSONLParser with a history memory budget."""
+
+    def test_queries_match_unbounded_parser(self, tmp_path: Path) -> None:
+        """Every get_* method returns the same data with history spilled."""
+        path = tmp_path / "events.jsonl"
+        events = _random_events(random.Random(2), 800)
+        path.write_text("".join(json.dumps(e) + "\n" for e in events))
+
+        unbounded = JSONLParser(path)
+        unbounded.parse_full()
+        bounded = JSONLParser(path, hot_history_items=16, spill_dir=tmp_path / "spill")
+        bounded.parse_full()
+
+        assert bounded.state.all_events.spilled > 0  # type: ignore[attr-defined]
+        assert bounded.state.interactions.spilled > 0  # type: ignore[attr-defined]
+        assert _snapshot(bounded) == _snapshot(unbounded)
+
+    def test_new_events_across_spill(self, tmp_path: Path) -> None:
+        """get_new_events returns every new event even when most have spilled."""
+        path = tmp_path / "events.jsonl"
+        path.write_text("")
+        parser = JSONLParser(path, hot_history_items=4, spill_dir=tmp_path / "spill")
+        parser.parse_incremental()
+        with open(path, "a") as f:
+            for i in range(50):
+                f.write(json.dumps({"event_type": "tick", "tick": i}) + "\n")
+        new = parser.get_new_events()
+        assert [e.data["tick"] for e in new] == list(range(50))
+
+    def test_reset_uses_fresh_store(self, tmp_path: Path) -> None:
+        """parse_full starts a new spill file for the new state."""
+        path = tmp_path / "events.jsonl"
+        path.write_text("".join(
+            json.dumps({"event_type": "tick", "tick": i}) + "\n" for i in range(30)
+        ))
+        parser = JSONLParser(path, hot_history_items=4, spill_dir=tmp_path / "spill")
+        parser.parse_full()
+        first_store = parser._history_store
+        parser.parse_full()
+        assert parser._history_store is not first_store
+        assert len(parser.state.all_events) == 30
+
+    def test_flow_views_do_not_walk_spilled_history(self, tmp_path: Path) -> None:
+        """Aggregated and time-window views read only what they need."""
+        rng = random.Random(3)
+        events: list[dict[str, Any]] = []
+        for n in range(400):
+            timestamp = f"2025-01-01T00:{n // 60:02d}:{n % 60:02d}"
+            sender, recipient = rng.sample(AGENTS, 2)
+            events.append({
+                "event_type": "action",
+                "timestamp": timestamp,
+                "intent": {
+                    "principal_id": sender,
+                    "action_type": "invoke_artifact",
+                    "artifact_id": "genesis_ledger",
+                    "method": "transfer",
+                    "args": [sender, recipient, rng.randrange(1, 20)],
+                },
+                "result": {"success": True},
+            })
+            events.append({
+                "event_type": rng.choice(["invoke_success", "invoke_failure"]),
+                "timestamp": timestamp,
+                "invoker_id": sender,
+                "artifact_id": f"art_{rng.randrange(5)}",
+            })
+        path = tmp_path / "events.jsonl"
+        path.write_text("".join(json.dumps(e) + "\n" for e in events))
+
+        unbounded = JSONLParser(path)
+        unbounded.parse_full()
+        bounded = JSONLParser(path, hot_history_items=16, spill_dir=tmp_path / "spill")
+        bounded.parse_full()
+        assert bounded.state.ledger_transfers.spilled > 0  # type: ignore[attr-defined]
+
+        window = ("2025-01-01T00:02:00", "2025-01-01T00:03:30")
+
+        def views(parser: JSONLParser) -> list[Any]:
+            return [
+                parser.get_economic_flow_data().model_dump(),
+                parser.get_capital_flow_data().model_dump(),
+                parser.get_capital_flow_data(*window).model_dump(),
+                parser.get_temporal_network_data(time_bucket_seconds=10).model_dump(),
+                parser.get_temporal_network_data(*window).model_dump(),
+                parser.get_pairwise_interactions(AGENTS[0], AGENTS[1]).model_dump(),
+                [a.model_dump() for a in parser.get_standard_artifacts()],
+            ]
+
+        expected = views(unbounded)
+        with patch.object(SpillList, "__iter__", side_effect=AssertionError("walked history")):
+            assert views(bounded) == expected
+
+        capital = expected[2]
+        in_window = [
+            t for t in unbounded.state.ledger_transfers if window[0] <= t.timestamp <= window[1]
+        ]
+        assert capital["total_flow"] == sum(t.amount for t in in_window)
+        assert capital["time_range"] == (in_window[0].timestamp, in_window[-1].timestamp)
@@ -0,0 +1,153 @@
+"""Tests for event log ingestion off the dashboard event loop.
+
+JSONLParser reads and decodes events separately from applying them, and
+EventIngestor loads logs in the background and publishes them when done.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.dashboard.ingest import EventIngestor
+from src.dashboard.parser import JSONLParser
+
+
+def _append(path: Path, *events: dict[str, Any]) -> None:
+    with open(path, "a") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def _action(principal_id: str) -> dict[str, Any]:
+    return {
+        "event_type": "action",
+        "intent": {"principal_id": principal_id, "action_type": "noop"},
+        "result": {"success": True},
+    }
+
+
+INIT = {"event_type": "world_init", "principals": [
+    {"id": "alice", "starting_scrip": 10}, {"id": "bob", "starting_scrip": 10},
+]}
+
+
+class TestReadApply:
+    """read_events() / apply_events() split."""
+
+    def test_batches_match_parse_incremental(self, tmp_path: Path) -> None:
+        """Applying small batches yields the same state as one parse."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT, *[_action("alice") for _ in range(5)])
+
+        batched = JSONLParser(path)
+        while True:
+            batch = batched.read_events(max_events=2)
+            batched.apply_events(batch)
+            if len(batch.events) < 2:
+                break
+        whole = JSONLParser(path)
+        whole.parse_incremental()
+
+        assert len(batched.state.all_events) == len(whole.state.all_events) == 6
+        assert batched.file_position == whole.file_position == path.stat().st_size
+        assert set(batched.state.agents) == set(whole.state.agents)
+
+    def test_read_does_not_change_state(self, tmp_path: Path) -> None:
+        """An unapplied batch is read again."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT)
+        parser = JSONLParser(path)
+
+        parser.read_events()
+        assert parser.file_position == 0
+        assert parser.state.all_events == []
+        parser.apply_events(parser.read_events())
+        assert len(parser.state.all_events) == 1
+
+    def test_partial_line_held_back(self, tmp_path: Path) -> None:
+        """A line still being written is decoded once it is complete."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT)
+        line = json.dumps(_action("alice"))
+        with open(path, "a") as f:
+            f.write(line[:20])
+        parser = JSONLParser(path)
+        parser.parse_incremental()
+        assert len(parser.state.all_events) == 1
+
+        with open(path, "a") as f:
+            f.write(line[20:] + "\n")
+        parser.parse_incremental()
+        assert len(parser.state.all_events) == 2
+        assert parser.state.all_events[1].event_type == "action"
+
+    def test_truncated_log_resets(self, tmp_path: Path) -> None:
+        """A restarted log clears state when its batch is applied."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT, _action("alice"), _action("bob"))
+        parser = JSONLParser(path)
+        parser.parse_incremental()
+
+        path.write_text("")
+        _append(path, INIT)
+        batch = parser.read_events()
+        assert batch.reset
+        parser.apply_events(batch)
+        assert len(parser.state.all_events) == 1
+
+
+class TestEventIngestor:
+    """Background loads and catch-up."""
+
+    @pytest.mark.asyncio
+    async def test_load_publishes_when_done(self, tmp_path: Path) -> None:
+        """A full load replaces the published parser once it has finished."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT, *[_action("alice") for _ in range(7)])
+        initial = JSONLParser(path)
+        ingestor = EventIngestor(initial, batch_events=3)
+
+        loaded = JSONLParser(path)
+        ingestor.load(loaded)
+        assert ingestor.parser is initial
+        await ingestor.catch_up()
+
+        assert ingestor.parser is loaded
+        assert not ingestor.loading
+        assert len(loaded.state.all_events) == 8
+        assert initial.state.all_events == []
+        ingestor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_catch_up_applies_new_events(self, tmp_path: Path) -> None:
+        """catch_up() brings the published parser to the end of the log."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT)
+        ingestor = EventIngestor(JSONLParser(path), batch_events=2)
+        await ingestor.catch_up()
+        assert len(ingestor.parser.state.all_events) == 1
+
+        _append(path, *[_action("bob") for _ in range(5)])
+        await ingestor.catch_up()
+        assert len(ingestor.parser.state.all_events) == 6
+        ingestor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_progress(self, tmp_path: Path) -> None:
+        """Progress reports bytes read against the log size."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT, _action("alice"))
+        ingestor = EventIngestor(JSONLParser(path))
+        assert ingestor.progress()["bytes_read"] == 0
+
+        await ingestor.catch_up()
+        progress = ingestor.progress()
+        assert progress["loading"] is False
+        assert progress["bytes_read"] == progress["bytes_total"] == path.stat().st_size
+        assert progress["fraction"] == 1.0
+        assert progress["events_parsed"] == 2
+        ingestor.shutdown()
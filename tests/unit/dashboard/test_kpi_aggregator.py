@@ -0,0 +1,192 @@
+"""Tests for the incremental KPI aggregator.
+
+The aggregator must agree with the full calculators in kpis.py at every
+point of a parse, including across incremental parses of a growing log.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from src.dashboard.kpis import calculate_emergence_metrics, calculate_kpis
+from src.dashboard.parser import JSONLParser
+
+AGENTS = [f"agent_{i}" for i in range(6)]
+
+
+def _action(agent: str, intent: dict[str, Any], **extra: Any) -> dict[str, Any]:
+    intent = {"principal_id": agent, **intent}
+    return {"event_type": "action", "intent": intent, "result": {"success": True}, **extra}
+
+
+def _random_events(rng: random.Random, count: int) -> list[dict[str, Any]]:
+    """A mixed event stream exercising every aggregator hook."""
+    events: list[dict[str, Any]] = [{
+        "event_type": "world_init",
+        "timestamp": "",
+        "principals": [
+            {"id": a, "starting_scrip": 100, "llm_tokens_quota": 50} for a in AGENTS
+        ],
+    }]
+    agents = list(AGENTS)
+    artifacts: list[str] = []
+    for n in range(count):
+        agent = rng.choice(agents)
+        roll = rng.random()
+        if roll < 0.2:
+            artifact_id = f"art_{rng.randrange(40)}"
+            deps = rng.sample(artifacts, k=min(len(artifacts), rng.randrange(3)))
+            events.append(_action(agent, {
+                "action_type": "write_artifact",
+                "artifact_id": artifact_id,
+                "artifact_type": rng.choice(["tool", "data", "contract"]),
+                "content": "x",
+                "depends_on": [d for d in deps if d != artifact_id],
+            }, scrip_after=rng.randrange(300)))
+            if artifact_id not in artifacts:
+                artifacts.append(artifact_id)
+        elif roll < 0.45:
+            target = rng.choice(artifacts + ["genesis_store"]) if artifacts else "genesis_store"
+            events.append(_action(agent, {"action_type": "invoke_artifact", "artifact_id": target}))
+        elif roll < 0.55:
+            recipient = rng.choice(agents + ["newcomer_0", "newcomer_1"])
+            events.append(_action(agent, {
+                "action_type": "invoke_artifact",
+                "artifact_id": "genesis_ledger",
+                "method": "transfer",
+                "args": [agent, recipient, rng.randrange(1, 20)],
+            }))
+        elif roll < 0.6 and artifacts:
+            events.append(_action(agent, {
+                "action_type": "invoke_artifact",
+                "artifact_id": "genesis_ledger",
+                "method": "transfer_ownership",
+                "args": [rng.choice(artifacts), rng.choice(agents)],
+            }, result={"success": True}))
+        elif roll < 0.65 and artifacts:
+            listed = rng.choice(artifacts)
+            events.append(_action(agent, {
+                "action_type": "invoke_artifact",
+                "artifact_id": "genesis_escrow",
+                "method": "deposit",
+                "args": [listed, rng.randrange(1, 50)],
+            }))
+            events.append(_action(rng.choice(agents), {
+                "action_type": "invoke_artifact",
+                "artifact_id": "genesis_escrow",
+                "method": "purchase",
+                "args": [listed],
+            }))
+        elif roll < 0.8:
+            thinker = rng.choice(agents + ["newcomer_0", "newcomer_1"])
+            if thinker not in agents:
+                agents.append(thinker)
+            events.append({
+                "event_type": "thinking",
+                "principal_id": thinker,
+                "input_tokens": rng.randrange(10, 100),
+                "output_tokens": rng.randrange(10, 100),
+                "api_cost": rng.choice([0.25, 0.5, 0.125]),
+            })
+        elif roll < 0.9:
+            events.append({"event_type": "intent_rejected", "principal_id": agent, "error": "no"})
+        else:
+            events.append({
+                "event_type": "tick",
+                "tick": n,
+                "scrip": {a: rng.randrange(500) for a in rng.sample(agents, 3)},
+                "llm_tokens": {a: rng.randrange(-10, 50) for a in rng.sample(agents, 2)},
+            })
+    return events
+
+
+def _assert_matches_full(parser: JSONLParser) -> None:
+    aggregator = parser.kpi_aggregator
+    assert asdict(aggregator.kpis()) == asdict(calculate_kpis(parser.state))
+    assert aggregator.emergence() == calculate_emergence_metrics(parser.state)
+
+
+class TestKPIAggregator:
+    """KPIAggregator equivalence with the full calculators."""
+
+    def test_matches_full_calculation_incrementally(self, tmp_path: Path) -> None:
+        """Results agree after every incremental parse of a growing log."""
+        path = tmp_path / "events.jsonl"
+        events = _random_events(random.Random(7), 600)
+        parser = JSONLParser(path)
+        with open(path, "w") as f:
+            for start in range(0, len(events), 50):
+                for event in events[start:start + 50]:
+                    f.write(json.dumps(event) + "\n")
+                f.flush()
+                parser.parse_incremental()
+                _assert_matches_full(parser)
+
+        emergence = parser.kpi_aggregator.emergence()
+        assert emergence.total_interactions > 0
+        assert emergence.capital_depth > 0
+        assert emergence.reuse_ratio > 0
+        assert parser.kpi_aggregator.kpis().escrow_volume > 0
+
+    def test_late_agents_join_coalitions(self, tmp_path: Path) -> None:
+        """Interactions with a not-yet-known principal count once it becomes an agent."""
+        path = tmp_path / "events.jsonl"
+        events = [
+            {"event_type": "world_init", "timestamp": "", "principals": [{"id": "a"}, {"id": "b"}]},
+            _action("a", {
+                "action_type": "invoke_artifact", "artifact_id": "genesis_ledger",
+                "method": "transfer", "args": ["a", "c", 5],
+            }),
+        ]
+        path.write_text("".join(json.dumps(e) + "\n" for e in events))
+        parser = JSONLParser(path)
+        parser.parse_incremental()
+        assert parser.kpi_aggregator.emergence().coalition_count == 2
+
+        with open(path, "a") as f:
+            f.write(json.dumps({"event_type": "thinking", "principal_id": "c"}) + "\n")
+        parser.parse_incremental()
+        metrics = parser.kpi_aggregator.emergence()
+        assert metrics.coalition_count == 2  # {a, c} and {b}
+        assert metrics.coordination_density == 1 / 3
+        _assert_matches_full(parser)
+
+    def test_reset_starts_fresh(self, tmp_path: Path) -> None:
+        """Truncating the log replaces the aggregator with an empty one."""
+        path = tmp_path / "events.jsonl"
+        events = _random_events(random.Random(3), 200)
+        path.write_text("".join(json.dumps(e) + "\n" for e in events))
+        parser = JSONLParser(path)
+        parser.parse_incremental()
+        first = parser.kpi_aggregator
+
+        path.write_text(json.dumps(events[0]) + "\n")
+        parser.parse_incremental()
+        assert parser.kpi_aggregator is not first
+        assert parser.kpi_aggregator.emergence().total_interactions == 0
+        _assert_matches_full(parser)
+
+    def test_refresh_cost_independent_of_history(self, tmp_path: Path) -> None:
+        """Reading KPIs after a long run costs about the same as after a short one."""
+        def timed_refresh(count: int) -> float:
+            path = tmp_path / f"events_{count}.jsonl"
+            events = _random_events(random.Random(11), count)
+            path.write_text("".join(json.dumps(e) + "\n" for e in events))
+            parser = JSONLParser(path)
+            parser.parse_incremental()
+            parser.kpi_aggregator.kpis()
+            parser.kpi_aggregator.emergence()
+            start = time.perf_counter()
+            for _ in range(20):
+                parser.kpi_aggregator.kpis()
+                parser.kpi_aggregator.emergence()
+            return time.perf_counter() - start
+
+        small = timed_refresh(200)
+        large = timed_refresh(8000)
+        assert large < small * 5
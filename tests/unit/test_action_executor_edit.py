@@ -172,3 +172,70 @@ class TestExecuteEditPermission:
         artifact = world.artifacts.get("private_doc")
         assert artifact is not None
         assert artifact.content == "Updated content"
+
+
+@pytest.mark.plans([239])
+class TestExecuteEditOperations:
+    """Tests for the append, range and json_patch edit operations."""
+
+    def test_execute_edit_append(self, world: World) -> None:
+        """operation=append adds text and charges only the appended bytes."""
+        _write_artifact(world, "log", "entry 1\n")
+
+        intent = EditArtifactIntent("alice", "log", "", "entry 2\n", operation="append")
+        result = world.execute_action(intent)
+
+        assert result.success is True
+        artifact = world.artifacts.get("log")
+        assert artifact is not None
+        assert artifact.content == "entry 1\nentry 2\n"
+        assert result.data is not None
+        assert result.data["size_delta"] == len("entry 2\n")
+
+    def test_execute_edit_range(self, world: World) -> None:
+        """operation=range replaces content between character offsets."""
+        _write_artifact(world, "doc", "Hello world")
+
+        intent = EditArtifactIntent("alice", "doc", "", "there", operation="range", start=6, end=11)
+        result = world.execute_action(intent)
+
+        assert result.success is True
+        artifact = world.artifacts.get("doc")
+        assert artifact is not None
+        assert artifact.content == "Hello there"
+
+    def test_execute_edit_json_patch(self, world: World) -> None:
+        """operation=json_patch applies a JSON Patch to JSON content."""
+        _write_artifact(world, "state", '{"journal": []}')
+
+        intent = EditArtifactIntent(
+            "alice", "state", "", "", operation="json_patch",
+            patch=[{"op": "add", "path": "/journal/-", "value": "hi"}],
+        )
+        result = world.execute_action(intent)
+
+        assert result.success is True
+        assert world.artifacts.get_json_content("state") == {"journal": ["hi"]}
+
+    def test_execute_edit_append_quota_exceeded(self, world: World) -> None:
+        """Appends beyond the remaining disk quota fail as QUOTA_EXCEEDED."""
+        _write_artifact(world, "log", "x")
+
+        intent = EditArtifactIntent("alice", "log", "", "y" * 50000, operation="append")
+        result = world.execute_action(intent)
+
+        assert result.success is False
+        assert result.error_code == ErrorCode.QUOTA_EXCEEDED.value
+
+    def test_execute_edit_invalid_patch(self, world: World) -> None:
+        """A patch that does not apply is reported as an invalid argument."""
+        _write_artifact(world, "state", '{"a": 1}')
+
+        intent = EditArtifactIntent(
+            "alice", "state", "", "", operation="json_patch",
+            patch=[{"op": "remove", "path": "/missing"}],
+        )
+        result = world.execute_action(intent)
+
+        assert result.success is False
+        assert result.error_code == ErrorCode.INVALID_ARGUMENT.value
@@ -1491,3 +1491,79 @@ class TestOnErrorCallback:
         )
 
         assert loop.on_error is record_error
+
+
+class TestAgentLoopEventDrivenWaits:
+    """Paused, blocked and sleeping loops wake on events rather than timers."""
+
+    @pytest.mark.asyncio
+    async def test_skip_policy_resumes_before_check_interval(
+        self,
+        rate_tracker: RateTracker,
+        mock_decide_action: AsyncMock,
+        mock_execute_action: AsyncMock,
+    ) -> None:
+        """A paused loop resumes as soon as capacity frees up."""
+        rate_tracker.consume("skip_agent", "llm_calls", 100.0)
+        loop = AgentLoop(
+            agent_id="skip_agent",
+            decide_action=mock_decide_action,
+            execute_action=mock_execute_action,
+            rate_tracker=rate_tracker,
+            config=AgentLoopConfig(min_loop_delay=0.01, resource_check_interval=30.0),
+        )
+        await loop.start()
+        await asyncio.sleep(0.02)
+        assert loop.state == AgentState.PAUSED
+
+        rate_tracker.reset(agent_id="skip_agent")
+        await asyncio.sleep(0.05)
+        assert mock_execute_action.called
+        await loop.stop(timeout=0.5)
+
+    @pytest.mark.asyncio
+    async def test_paused_loop_stops_promptly(
+        self,
+        rate_tracker: RateTracker,
+        mock_decide_action: AsyncMock,
+        mock_execute_action: AsyncMock,
+    ) -> None:
+        """stop() interrupts a paused loop and leaves no waiters behind."""
+        rate_tracker.consume("skip_agent", "llm_calls", 100.0)
+        loop = AgentLoop(
+            agent_id="skip_agent",
+            decide_action=mock_decide_action,
+            execute_action=mock_execute_action,
+            rate_tracker=rate_tracker,
+            config=AgentLoopConfig(min_loop_delay=0.01, resource_check_interval=30.0),
+        )
+        await loop.start()
+        await asyncio.sleep(0.02)
+        await loop.stop(timeout=0.2)
+        await asyncio.sleep(0)
+        assert loop.state == AgentState.STOPPED
+        assert rate_tracker._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_time_wake_condition_sleeps_until_deadline(
+        self,
+        rate_tracker: RateTracker,
+        mock_decide_action: AsyncMock,
+        mock_execute_action: AsyncMock,
+    ) -> None:
+        """A time wake condition wakes at its deadline, not the next check tick."""
+        loop = AgentLoop(
+            agent_id="sleepy_agent",
+            decide_action=mock_decide_action,
+            execute_action=mock_execute_action,
+            rate_tracker=rate_tracker,
+            config=AgentLoopConfig(min_loop_delay=0.01, resource_check_interval=30.0),
+        )
+        await loop.start()
+        await asyncio.sleep(0.01)
+        loop.sleep(WakeCondition("time", time.time() + 0.05))
+        await asyncio.sleep(0.02)
+        assert loop.state == AgentState.SLEEPING
+        await asyncio.sleep(0.1)
+        assert loop.state == AgentState.RUNNING
+        await loop.stop(timeout=0.5)
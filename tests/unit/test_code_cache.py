@@ -0,0 +1,154 @@
+"""Unit tests for the compiled-code cache.
+
+Tests:
+- LRU behaviour and hit/miss/eviction counters
+- Executor, contracts and mint task tests share the process-wide cache
+- Per-execution builtins isolation
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.world.code_cache import (
+    AGENT_CODE_FILENAME,
+    CONTRACT_BUILTINS,
+    CONTRACT_CODE_FILENAME,
+    CompiledCodeCache,
+    get_code_cache,
+    reset_code_cache,
+)
+from src.world.contracts import ExecutableContract, PermissionAction
+from src.world.executor import SafeExecutor
+
+
+@pytest.fixture
+def fresh_cache() -> Iterator[CompiledCodeCache]:
+    """Replace the process-wide cache with an empty one for the test."""
+    reset_code_cache()
+    yield get_code_cache()
+    reset_code_cache()
+
+
+class TestCompiledCodeCache:
+    """Tests for CompiledCodeCache itself."""
+
+    def test_hit_returns_same_code_object(self) -> None:
+        """Second compile of identical source is a hit."""
+        cache = CompiledCodeCache(max_entries=4)
+        first = cache.compile("x = 1", AGENT_CODE_FILENAME)
+        second = cache.compile("x = 1", AGENT_CODE_FILENAME)
+        assert first is second
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_filename_is_part_of_key(self) -> None:
+        """Same source under a different filename is a separate entry."""
+        cache = CompiledCodeCache(max_entries=4)
+        agent = cache.compile("x = 1", AGENT_CODE_FILENAME)
+        contract = cache.compile("x = 1", CONTRACT_CODE_FILENAME)
+        assert agent.co_filename == AGENT_CODE_FILENAME
+        assert contract.co_filename == CONTRACT_CODE_FILENAME
+        assert len(cache) == 2
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Entries beyond max_entries evict the least recently used."""
+        cache = CompiledCodeCache(max_entries=2)
+        cache.compile("a = 1")
+        cache.compile("b = 1")
+        cache.compile("a = 1")  # refresh a
+        cache.compile("c = 1")  # evicts b
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["size"] == 2
+        cache.compile("a = 1")
+        assert cache.stats()["hits"] == 2
+        cache.compile("b = 1")
+        assert cache.stats()["misses"] == 4
+
+    def test_syntax_errors_not_cached(self) -> None:
+        """Bad source raises every time and is never stored."""
+        cache = CompiledCodeCache(max_entries=2)
+        for _ in range(2):
+            with pytest.raises(SyntaxError):
+                cache.compile("def broken(:")
+        assert len(cache) == 0
+
+    def test_zero_size_disables_storage(self) -> None:
+        """max_entries=0 compiles every time."""
+        cache = CompiledCodeCache(max_entries=0)
+        cache.compile("x = 1")
+        cache.compile("x = 1")
+        assert cache.stats()["misses"] == 2
+        assert len(cache) == 0
+
+    def test_rejects_negative_size(self) -> None:
+        """max_entries must be non-negative."""
+        with pytest.raises(ValueError, match="max_entries"):
+            CompiledCodeCache(max_entries=-1)
+
+    def test_size_read_from_config(self) -> None:
+        """The shared cache is sized by executor.code_cache_size."""
+        config = MagicMock()
+        config.executor.code_cache_size = 7
+        reset_code_cache()
+        try:
+            with patch("src.config.get_validated_config", return_value=config):
+                assert get_code_cache().max_entries == 7
+        finally:
+            reset_code_cache()
+
+
+class TestSharedCacheUsage:
+    """Tests that execution paths compile through the shared cache."""
+
+    def test_executor_compiles_once_per_source(self, fresh_cache: CompiledCodeCache) -> None:
+        """Repeated execute() calls reuse the compiled code."""
+        executor = SafeExecutor(use_contracts=False)
+        code = "def run(x):\n    return x * 2"
+        for i in range(5):
+            assert executor.execute(code, [i])["result"] == i * 2
+        assert fresh_cache.stats()["misses"] == 1
+        assert fresh_cache.stats()["hits"] == 4  # One lookup per execution
+
+    def test_builtins_isolated_between_executions(
+        self, fresh_cache: CompiledCodeCache
+    ) -> None:
+        """Rebinding a builtin in one execution does not leak to the next."""
+        executor = SafeExecutor(use_contracts=False)
+        clobber = "def run():\n    __builtins__['len'] = lambda x: -1\n    return len([1])"
+        assert executor.execute(clobber)["result"] == -1
+        assert executor.execute("def run():\n    return len([1, 2])")["result"] == 2
+
+    def test_contract_checks_share_cache(self, fresh_cache: CompiledCodeCache) -> None:
+        """Permission checks compile contract code once."""
+        contract = ExecutableContract(
+            contract_id="always",
+            code="def check_permission(caller, action, target, context, ledger):\n"
+                 "    return {'allowed': True, 'reason': 'ok', 'scrip_cost': 0}",
+            timeout=1,
+        )
+        for _ in range(3):
+            result = contract.check_permission("alice", PermissionAction.READ, "doc")
+            assert result.allowed is True
+        assert fresh_cache.stats()["misses"] == 1
+
+    def test_contract_builtins_remain_restricted(
+        self, fresh_cache: CompiledCodeCache
+    ) -> None:
+        """Contract namespaces do not expose dangerous builtins."""
+        assert "open" not in CONTRACT_BUILTINS
+        assert "__import__" not in CONTRACT_BUILTINS
+        contract = ExecutableContract(
+            contract_id="sneaky",
+            code="def check_permission(caller, action, target, context, ledger):\n"
+                 "    open('/etc/passwd')\n"
+                 "    return True",
+            timeout=1,
+        )
+        result = contract.check_permission("alice", PermissionAction.READ, "doc")
+        assert result.allowed is False
+        assert "NameError" in result.reason
@@ -0,0 +1,184 @@
+"""Unit tests for the contract evaluation pool.
+
+Tests:
+- Namespaces are initialized once per (contract_id, code hash) and LRU-bounded
+- Timeouts work from threads other than the main thread
+- Concurrent checks for one contract are batched
+- ExecutableContract reports pool errors as denied PermissionResults
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Iterator
+
+import pytest
+
+from src.world.contract_pool import (
+    ContractEvaluator,
+    ContractExecutionError,
+    ContractTimeoutError,
+    get_contract_evaluator,
+)
+from src.world.contracts import ExecutableContract, PermissionAction
+
+COUNTING_CONTRACT = '''
+calls = 0
+def check_permission(caller, action, target, context, ledger):
+    global calls
+    calls += 1
+    return {"allowed": caller == "alice", "reason": str(calls), "scrip_cost": 0}
+'''
+
+ARGS: tuple[Any, ...] = ("alice", "read_artifact", "target", {}, None)
+
+
+@pytest.fixture
+def evaluator() -> Iterator[ContractEvaluator]:
+    """A private evaluator, shut down after the test."""
+    pool = ContractEvaluator(max_workers=2, max_namespaces=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestNamespaceCache:
+    """Contract module bodies run once per contract version."""
+
+    def test_module_body_runs_once(self, evaluator: ContractEvaluator) -> None:
+        """Repeat checks reuse the initialized namespace."""
+        first = evaluator.call("c", COUNTING_CONTRACT, 5, ARGS)
+        second = evaluator.call("c", COUNTING_CONTRACT, 5, ARGS)
+        assert first["reason"] == "1"
+        assert second["reason"] == "2"
+        stats = evaluator.stats()
+        assert stats["namespace_misses"] == 1
+        assert stats["namespace_hits"] == 1
+
+    def test_changed_code_gets_new_namespace(self, evaluator: ContractEvaluator) -> None:
+        """Rewriting a contract's code starts from a fresh namespace."""
+        evaluator.call("c", COUNTING_CONTRACT, 5, ARGS)
+        result = evaluator.call("c", COUNTING_CONTRACT + "\n# v2\n", 5, ARGS)
+        assert result["reason"] == "1"
+        assert evaluator.stats()["namespaces"] == 2
+
+    def test_evicts_least_recently_used(self, evaluator: ContractEvaluator) -> None:
+        """Namespaces beyond max_namespaces are evicted."""
+        for contract_id in ("a", "b", "c"):
+            evaluator.call(contract_id, COUNTING_CONTRACT, 5, ARGS)
+        stats = evaluator.stats()
+        assert stats["namespaces"] == 2
+        assert stats["namespace_evictions"] == 1
+
+    def test_invalidate_drops_contract_namespaces(self, evaluator: ContractEvaluator) -> None:
+        """invalidate() forgets every version of one contract."""
+        evaluator.call("c", COUNTING_CONTRACT, 5, ARGS)
+        evaluator.call("other", COUNTING_CONTRACT, 5, ARGS)
+        assert evaluator.invalidate("c") == 1
+        assert evaluator.call("c", COUNTING_CONTRACT, 5, ARGS)["reason"] == "1"
+
+    def test_definition_errors_are_not_cached(self, evaluator: ContractEvaluator) -> None:
+        """A module body that raises is reported and retried on the next call."""
+        code = "x = 1 / 0\ndef check_permission(*args):\n    return True\n"
+        for _ in range(2):
+            with pytest.raises(ContractExecutionError, match="ZeroDivisionError"):
+                evaluator.call("bad", code, 5, ARGS)
+        assert evaluator.stats()["namespace_misses"] == 2
+
+    def test_missing_check_permission(self, evaluator: ContractEvaluator) -> None:
+        """Code without a callable check_permission is rejected."""
+        with pytest.raises(ContractExecutionError, match="not callable"):
+            evaluator.call("bad", "check_permission = 3\n", 5, ARGS)
+
+
+class TestTimeouts:
+    """Timeouts do not depend on SIGALRM or the main thread."""
+
+    def test_runaway_loop_times_out(self, evaluator: ContractEvaluator) -> None:
+        """A looping check is interrupted at the deadline."""
+        code = "def check_permission(*args):\n    while True:\n        pass\n"
+        with pytest.raises(ContractTimeoutError):
+            evaluator.call("loop", code, 1, ARGS)
+        # The worker was freed, so the pool still answers
+        assert evaluator.call("c", COUNTING_CONTRACT, 5, ARGS)["allowed"] is True
+
+    def test_runaway_module_body_times_out(self, evaluator: ContractEvaluator) -> None:
+        """A looping module body is reported as a definition timeout."""
+        code = "while True:\n    pass\ndef check_permission(*args):\n    return True\n"
+        with pytest.raises(ContractExecutionError, match="definition timed out"):
+            evaluator.call("loop", code, 1, ARGS)
+
+    def test_timeout_from_non_main_thread(self) -> None:
+        """ExecutableContract timeouts work when called off the main thread."""
+        contract = ExecutableContract(
+            contract_id="slow_off_main",
+            code="def check_permission(*args):\n    time.sleep(2)\n    return True\n",
+            timeout=1,
+        )
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(
+                contract.check_permission("anyone", PermissionAction.READ, "t")
+            )
+        )
+        start = time.monotonic()
+        thread.start()
+        thread.join()
+        assert time.monotonic() - start < 2
+        assert results[0].allowed is False
+        assert "timed out" in results[0].reason
+
+
+class TestBatching:
+    """Concurrent checks for one contract share worker dispatches."""
+
+    def test_concurrent_checks_are_batched(self) -> None:
+        """Checks queued behind a busy worker join a single batch."""
+        evaluator = ContractEvaluator(max_workers=1, max_namespaces=4)
+        try:
+            blocker = "def check_permission(*args):\n    time.sleep(0.3)\n    return True\n"
+            blocking = threading.Thread(target=evaluator.call, args=("slow", blocker, 5, ARGS))
+            blocking.start()
+            time.sleep(0.05)
+
+            results: list[Any] = []
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(evaluator.call("c", COUNTING_CONTRACT, 5, ARGS))
+                )
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads + [blocking]:
+                thread.join()
+
+            assert sorted(int(r["reason"]) for r in results) == list(range(1, 9))
+            stats = evaluator.stats()
+            assert stats["batched_checks"] >= 1
+            assert stats["batches"] < stats["checks"]
+        finally:
+            evaluator.shutdown()
+
+
+class TestExecutableContractIntegration:
+    """ExecutableContract goes through the process-wide evaluator."""
+
+    def test_repeat_checks_hit_namespace_cache(self) -> None:
+        """Checking the same contract twice does not re-run its module body."""
+        contract = ExecutableContract(contract_id="pool_integration", code=COUNTING_CONTRACT)
+        before = get_contract_evaluator().stats()["namespace_hits"]
+        contract.check_permission("alice", PermissionAction.READ, "t")
+        result = contract.check_permission("alice", PermissionAction.READ, "t")
+        assert result.allowed is True
+        assert get_contract_evaluator().stats()["namespace_hits"] > before
+
+    def test_check_error_becomes_denial(self) -> None:
+        """Exceptions from check_permission are denials with the error in the reason."""
+        contract = ExecutableContract(
+            contract_id="pool_raises",
+            code="def check_permission(*args):\n    return 1 / 0\n",
+        )
+        result = contract.check_permission("alice", PermissionAction.READ, "t")
+        assert result.allowed is False
+        assert "ZeroDivisionError" in result.reason
@@ -1646,8 +1646,7 @@ def check_permission(caller, action, target, context, ledger):
         artifact.access_contract_id = "cached_contract"  # type: ignore[attr-defined]
 
         # Permission cache should be empty before first call
-        cache_key = ("test_artifact", "read", "test_user", "v1")
-        assert executor._permission_cache.get(cache_key) is None
+        assert executor._permission_cache.size() == 0
 
         # First call should execute contract and populate cache
         result1 = executor._check_permission_via_contract(
@@ -1656,11 +1655,9 @@ def check_permission(caller, action, target, context, ledger):
         assert result1.allowed is True
         assert "cached result" in result1.reason
 
-        # Permission cache should now have the result
-        cached_result = executor._permission_cache.get(cache_key)
-        assert cached_result is not None
-        assert cached_result.allowed is True
-        assert "cached result" in cached_result.reason
+        # Permission cache should now have the result (key is versioned)
+        assert executor._permission_cache.size() == 1
+        assert executor.get_permission_cache_stats()["hits"] == 0
 
         # Second call should use cache (same result)
         result2 = executor._check_permission_via_contract(
@@ -1668,6 +1665,7 @@ def check_permission(caller, action, target, context, ledger):
         )
         assert result2.allowed is True
         assert "cached result" in result2.reason
+        assert executor.get_permission_cache_stats()["hits"] == 1
 
     def test_executor_no_cache_without_policy(self) -> None:
         """Test that executor does not cache when contract has no cache_policy."""
@@ -1709,8 +1707,7 @@ def check_permission(caller, action, target, context, ledger):
         assert result1.allowed is True
 
         # Permission cache should be empty (no cache_policy)
-        cache_key = ("test_artifact", "read", "test_user", "v1")
-        assert executor._permission_cache.get(cache_key) is None
+        assert executor._permission_cache.size() == 0
 
         # Second call
         result2 = executor._check_permission_via_contract(
@@ -1719,7 +1716,7 @@ def check_permission(caller, action, target, context, ledger):
         assert result2.allowed is True
 
         # Permission cache should still be empty
-        assert executor._permission_cache.get(cache_key) is None
+        assert executor._permission_cache.size() == 0
 
     def test_cache_invalidated_on_different_context(self) -> None:
         """Test that cache respects different request contexts."""
@@ -1785,6 +1782,100 @@ def check_permission(caller, action, target, context, ledger):
         assert cache.get(("artifact", "read", "user", "v2")).allowed is False
 
 
+class TestPermissionCacheBounds:
+    """LRU capacity, expiry sweeping, invalidation and versioned keys."""
+
+    def test_lru_eviction(self) -> None:
+        """Beyond max_entries the least recently used entry is evicted."""
+        from src.world.contracts import PermissionCache
+
+        cache = PermissionCache(max_entries=2)
+        result = PermissionResult(allowed=True, reason="ok")
+        cache.put(("a", "read", "u", "v"), result, ttl_seconds=60)
+        cache.put(("b", "read", "u", "v"), result, ttl_seconds=60)
+        assert cache.get(("a", "read", "u", "v")) is not None  # a is now most recent
+        cache.put(("c", "read", "u", "v"), result, ttl_seconds=60)
+
+        assert cache.get(("b", "read", "u", "v")) is None
+        assert cache.get(("a", "read", "u", "v")) is not None
+        stats = cache.stats()
+        assert stats["evictions"] == 1 and stats["size"] == 2 and stats["max_entries"] == 2
+
+    def test_sweep_removes_unread_expired_entries(self) -> None:
+        """Expired entries go away without being read again."""
+        from unittest.mock import patch
+
+        from src.world.contracts import PermissionCache
+
+        cache = PermissionCache()
+        result = PermissionResult(allowed=True, reason="ok")
+        with patch("src.world.contracts.time_module.time", return_value=1000.0):
+            for i in range(5):
+                cache.put((f"a{i}", "read", "u", "v"), result, ttl_seconds=10)
+            cache.put(("long", "read", "u", "v"), result, ttl_seconds=100)
+        with patch("src.world.contracts.time_module.time", return_value=1020.0):
+            cache.put(("new", "read", "u", "v"), result, ttl_seconds=10)
+
+        assert cache.size() == 2
+        assert cache.stats()["expirations"] == 5
+
+    def test_invalidate_artifact(self) -> None:
+        """invalidate() drops every entry for one target artifact."""
+        from src.world.contracts import PermissionCache
+
+        cache = PermissionCache()
+        result = PermissionResult(allowed=True, reason="ok")
+        cache.put(("a", "read", "u1", "v"), result, ttl_seconds=60)
+        cache.put(("a", "write", "u2", "v"), result, ttl_seconds=60)
+        cache.put(("b", "read", "u1", "v"), result, ttl_seconds=60)
+
+        assert cache.invalidate("a") == 2
+        assert cache.get(("a", "read", "u1", "v")) is None
+        assert cache.get(("b", "read", "u1", "v")) is not None
+        assert cache.stats()["invalidations"] == 2
+
+    def test_zero_capacity_disables_caching(self) -> None:
+        """max_entries=0 stores nothing."""
+        from src.world.contracts import PermissionCache
+
+        cache = PermissionCache(max_entries=0)
+        cache.put(("a", "read", "u", "v"), PermissionResult(allowed=True, reason="ok"), 60)
+        assert cache.size() == 0
+
+    def test_state_and_code_changes_miss_the_cache(self) -> None:
+        """A changed target state or rewritten contract artifact is re-evaluated."""
+        from src.world.artifacts import ArtifactStore
+        from src.world.executor import SafeExecutor
+
+        store = ArtifactStore()
+        allow = '''
+def check_permission(caller, action, target, context, ledger):
+    return {"allowed": context["_artifact_state"].get("open", False), "reason": "v1"}
+'''
+        store.write(
+            "gate", "contract", "", created_by="alice", executable=True, code=allow,
+            metadata={"cache_policy": {"ttl_seconds": 60}},
+        )
+        target = store.write("doc", "data", "x", created_by="alice", access_contract_id="gate")
+        executor = SafeExecutor(timeout=5, use_contracts=True, ledger=Ledger())
+        executor.set_artifact_store(store)
+
+        assert executor._check_permission_via_contract("bob", "read", target).allowed is False
+        assert executor._check_permission_via_contract("bob", "read", target).allowed is False
+        assert executor.get_permission_cache_stats()["hits"] == 1
+
+        target.state["open"] = True
+        assert executor._check_permission_via_contract("bob", "read", target).allowed is True
+
+        store.get("gate").code = allow.replace('"v1"', '"v2"')  # type: ignore[union-attr]
+        result = executor._check_permission_via_contract("bob", "read", target)
+        assert result.reason == "v2"
+        assert executor.get_permission_cache_stats()["hits"] == 1
+
+        executor.invalidate_permissions("doc")
+        assert executor.get_permission_cache_stats()["size"] == 0
+
+
 class TestDanglingContractHandling:
     """Tests for dangling contract handling (Plan #100 Phase 2, ADR-0017).
 
@@ -166,3 +166,93 @@ Line 3"""
         artifact = store.get("doc1")
         assert artifact is not None
         assert artifact.content == "Hello"
+
+
+class TestIncrementalEdits:
+    """Tests for append, ranged writes and JSON patches on ArtifactStore."""
+
+    def test_append_artifact(self) -> None:
+        """append_artifact adds text to the end and reports the byte delta."""
+        store = ArtifactStore()
+        store.write("log", "document", "line 1\n", "agent1")
+
+        result = store.append_artifact("log", "line 2 é\n")
+
+        assert result["success"] is True
+        assert result["data"]["size_delta"] == len("line 2 é\n".encode("utf-8"))
+        artifact = store.get("log")
+        assert artifact is not None
+        assert artifact.content == "line 1\nline 2 é\n"
+
+    def test_append_respects_max_size_delta(self) -> None:
+        """Growth beyond max_size_delta is refused without changing content."""
+        store = ArtifactStore()
+        store.write("log", "document", "abc", "agent1")
+
+        result = store.append_artifact("log", "0123456789", max_size_delta=5)
+
+        assert result["success"] is False
+        assert result["data"]["error"] == "quota_exceeded"
+        artifact = store.get("log")
+        assert artifact is not None
+        assert artifact.content == "abc"
+
+    def test_write_artifact_range(self) -> None:
+        """write_artifact_range replaces, inserts and shrinks by offsets."""
+        store = ArtifactStore()
+        store.write("doc1", "document", "Hello world", "agent1")
+
+        assert store.write_artifact_range("doc1", 6, 11, "there")["success"] is True
+        assert store.write_artifact_range("doc1", 0, 0, ">> ")["data"]["size_delta"] == 3
+        shrink = store.write_artifact_range("doc1", 3, 9, "")
+        assert shrink["data"]["size_delta"] == -6
+        artifact = store.get("doc1")
+        assert artifact is not None
+        assert artifact.content == ">> there"
+
+    def test_write_artifact_range_invalid(self) -> None:
+        """Out-of-bounds or reversed ranges are rejected."""
+        store = ArtifactStore()
+        store.write("doc1", "document", "short", "agent1")
+
+        for start, end in ((3, 2), (-1, 2), (0, 99)):
+            result = store.write_artifact_range("doc1", start, end, "x")
+            assert result["success"] is False
+            assert result["data"]["error"] == "invalid_range"
+
+    def test_json_patch_artifact(self) -> None:
+        """json_patch_artifact applies operations and refreshes the parse cache."""
+        store = ArtifactStore()
+        store.write("state", "document", '{"journal": []}', "agent1")
+
+        result = store.json_patch_artifact(
+            "state", [{"op": "add", "path": "/journal/-", "value": "entry"}]
+        )
+
+        assert result["success"] is True
+        assert store.get_json_content("state") == {"journal": ["entry"]}
+
+    def test_json_patch_artifact_errors(self) -> None:
+        """Non-JSON content and failing patches leave content unchanged."""
+        store = ArtifactStore()
+        store.write("text", "document", "plain text", "agent1")
+        store.write("state", "document", '{"a": 1}', "agent1")
+
+        not_json = store.json_patch_artifact("text", [{"op": "add", "path": "/a", "value": 1}])
+        bad_patch = store.json_patch_artifact("state", [{"op": "remove", "path": "/b"}])
+
+        assert not_json["data"]["error"] == "invalid_json"
+        assert bad_patch["data"]["error"] == "invalid_patch"
+        artifact = store.get("state")
+        assert artifact is not None
+        assert artifact.content == '{"a": 1}'
+
+    def test_incremental_edit_deleted_artifact(self) -> None:
+        """Incremental edits refuse deleted artifacts like edit_artifact."""
+        store = ArtifactStore()
+        store.write("doc1", "document", "content", "agent1")
+        artifact = store.get("doc1")
+        assert artifact is not None
+        artifact.deleted = True
+
+        assert store.append_artifact("doc1", "x")["data"]["error"] == "deleted"
@@ -0,0 +1,180 @@
+"""Tests for event log segment rotation and the offset index.
+
+Tests:
+- EventLogger rotates events.jsonl into sealed segments and writes the index
+- EventLogIndex seeks by sequence and skips segments by event type
+- read_recent, iter_event_log and the dashboard parser follow rotation
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from src.dashboard.parser import JSONLParser
+from src.world.event_segments import (
+    EventLogIndex,
+    index_path,
+    iter_event_log,
+    list_sealed_segments,
+)
+from src.world.logger import EventLogger
+
+
+def _segmented_logger(path: Path, **writer: Any) -> EventLogger:
+    return EventLogger(
+        output_file=str(path),
+        writer_settings=writer or None,
+        segment_settings={"enabled": True, "max_segment_bytes": 2000, "index_interval": 4},
+    )
+
+
+def _log_events(logger: EventLogger, count: int) -> None:
+    for i in range(count):
+        logger.log("tick" if i % 10 else "milestone", {"n": i, "pad": "x" * 50})
+
+
+class TestRotation:
+    """EventLogger writer-side rotation"""
+
+    def test_segments_sealed_at_size_limit(self, tmp_path: Path) -> None:
+        """Sealed segments stay under max_segment_bytes and hold every event"""
+        path = tmp_path / "events.jsonl"
+        logger = _segmented_logger(path)
+        _log_events(logger, 100)
+        logger.close()
+
+        sealed = list_sealed_segments(path)
+        assert len(sealed) >= 3
+        assert all(p.stat().st_size <= 2000 for p in sealed)
+        assert [e["n"] for e in iter_event_log(path)] == list(range(100))
+
+    def test_index_records_segments_and_counts(self, tmp_path: Path) -> None:
+        """Seal records carry sequence ranges and event type counts"""
+        path = tmp_path / "events.jsonl"
+        logger = _segmented_logger(path)
+        _log_events(logger, 100)
+        logger.close()
+
+        index = EventLogIndex.load(path)
+        assert [s.path for s in index.segments] == list_sealed_segments(path)
+        first = index.segments[0]
+        assert first.first_sequence == 1
+        assert sum(first.event_counts.values()) == first.last_sequence
+        assert index.event_type_counts() == {"milestone": 10, "tick": 90}
+
+    def test_batch_mode_offsets_match_file(self, tmp_path: Path) -> None:
+        """Offsets recorded for buffered events point at the right bytes"""
+        path = tmp_path / "events.jsonl"
+        logger = _segmented_logger(path, durability="batch", flush_interval_seconds=60.0)
+        _log_events(logger, 60)
+        logger.close()
+
+        for line in index_path(path).read_text().splitlines():
+            record = json.loads(line)
+            if record["kind"] != "offset":
+                continue
+            index = EventLogIndex.load(path)
+            file, offset = index.locate(record["sequence"])
+            with open(file, "rb") as f:
+                f.seek(offset)
+                assert json.loads(f.readline())["sequence"] == record["sequence"]
+
+    def test_new_logger_removes_old_segments(self, tmp_path: Path) -> None:
+        """Starting a new log over the same path drops the old segments"""
+        path = tmp_path / "events.jsonl"
+        logger = _segmented_logger(path)
+        _log_events(logger, 100)
+        logger.close()
+        EventLogger(output_file=str(path)).close()
+        assert list_sealed_segments(path) == []
+        assert not index_path(path).exists()
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """Without logging.segments.enabled nothing rotates"""
+        path = tmp_path / "events.jsonl"
+        logger = EventLogger(output_file=str(path))
+        _log_events(logger, 100)
+        logger.close()
+        assert list_sealed_segments(path) == []
+        assert not index_path(path).exists()
+
+
+class TestEventLogIndex:
+    """Read-side seeking"""
+
+    def test_sequence_range(self, tmp_path: Path) -> None:
+        """iter_events returns exactly the requested sequence range"""
+        path = tmp_path / "events.jsonl"
+        logger = _segmented_logger(path)
+        _log_events(logger, 100)
+        logger.close()
+
+        index = EventLogIndex.load(path)
+        events = list(index.iter_events(start_sequence=37, end_sequence=52))
+        assert [e["sequence"] for e in events] == list(range(37, 53))
+
+    def test_event_type_filter_skips_segments(self, tmp_path: Path) -> None:
+        """Sealed segments without the wanted type are not opened"""
+        path = tmp_path / "events.jsonl"
+        logger = _segmented_logger(path)
+        for i in range(100):
+            logger.log("rare" if i == 95 else "tick", {"n": i, "pad": "x" * 50})
+        logger.close()
+
+        index = EventLogIndex.load(path)
+        opened: list[Path] = []
+        real_open = open
+
+        def tracking_open(file: Any, *args: Any, **kwargs: Any) -> Any:
+            opened.append(Path(file))
+            return real_open(file, *args, **kwargs)
+
+        with patch("builtins.open", tracking_open):
+            events = list(index.iter_events(event_types={"rare"}))
+        assert [e["n"] for e in events] == [95]
+        skipped = {s.path for s in index.segments if "rare" not in s.event_counts}
+        assert skipped
+        assert not skipped & set(opened)
+
+    def test_unsegmented_log(self, tmp_path: Path) -> None:
+        """A plain events.jsonl is scanned as a single active segment"""
+        path = tmp_path / "events.jsonl"
+        logger = EventLogger(output_file=str(path))
+        _log_events(logger, 20)
+        logger.close()
+        index = EventLogIndex.load(path)
+        assert index.segments == []
+        assert [e["sequence"] for e in index.iter_events(start_sequence=18)] == [18, 19, 20]
+
+
+class TestReadersFollowRotation:
+    """Consumers of events.jsonl see the whole history"""
+
+    def test_read_recent_spans_segments(self, tmp_path: Path) -> None:
+        """Cold read_recent continues into sealed segments"""
+        path = tmp_path / "events.jsonl"
+        logger = EventLogger(
+            output_file=str(path),
+            recent_buffer_size=5,
+            segment_settings={"enabled": True, "max_segment_bytes": 2000, "index_interval": 4},
+        )
+        _log_events(logger, 100)
+        recent = logger.read_recent(60)
+        assert [e["n"] for e in recent] == list(range(40, 100))
+        logger.close()
+
+    def test_dashboard_parser_follows_rotation(self, tmp_path: Path) -> None:
+        """Incremental parsing across a rotation loses no events"""
+        path = tmp_path / "events.jsonl"
+        logger = _segmented_logger(path)
+        parser = JSONLParser(path)
+        _log_events(logger, 10)
+        parser.parse_incremental()
+        _log_events(logger, 90)
+        parser.parse_incremental()
+        logger.close()
+        assert len(list_sealed_segments(path)) >= 3
+        assert len(parser.state.all_events) == 100
@@ -7,7 +7,7 @@ import pytest
 from typing import Any
 
 from src.world.artifacts import ArtifactStore
-from src.world.triggers import TriggerRegistry, TriggerSpec, matches_filter
+from src.world.triggers import TriggerIndex, TriggerRegistry, TriggerSpec, matches_filter
 
 
 class TestFilterMatching:
@@ -360,3 +360,140 @@ class TestTriggerInvocationQueue:
 
         registry.clear_pending_invocations()
         assert len(registry.get_pending_invocations()) == 0
+
+
+class TestTriggerIndex:
+    """Test indexed matching against the plain filter semantics."""
+
+    FILTERS: list[dict[str, Any]] = [
+        {"event_type": "write_artifact_success"},
+        {"event_type": {"$eq": "write_artifact_success"}, "principal_id": "alice"},
+        {"event_type": {"$in": ["write_artifact_success", "transfer_success"]}},
+        {"event_type": {"$ne": "transfer_success"}},  # No equality: unindexed
+        {"principal_id": "bob", "data.category": {"$exists": True}},
+        {"data.category": ["unhashable"]},
+        {"event_type": "transfer_success", "data.amount": {"$in": [1, 2]}},
+    ]
+
+    EVENTS: list[dict[str, Any]] = [
+        {"event_type": "write_artifact_success", "principal_id": "alice"},
+        {"event_type": "transfer_success", "principal_id": "bob", "data": {"amount": 2}},
+        {"event_type": "noop_success", "principal_id": "bob", "data": {"category": "oracle"}},
+        {"event_type": ["not", "hashable"], "data": {"category": ["unhashable"]}},
+        {},
+    ]
+
+    def _index(self) -> TriggerIndex:
+        index = TriggerIndex()
+        for i, filter_spec in enumerate(self.FILTERS):
+            index.add(TriggerSpec(f"t{i}", "alice", filter_spec, "handler"))
+        return index
+
+    def test_matches_same_as_filter(self) -> None:
+        """Index results equal matches_filter() over all triggers, in order."""
+        index = self._index()
+        for event in self.EVENTS:
+            expected = [
+                f"t{i}" for i, filter_spec in enumerate(self.FILTERS)
+                if matches_filter(event, filter_spec)
+            ]
+            assert [t.trigger_id for t in index.match(event)] == expected
+
+    def test_remove_and_replace(self) -> None:
+        """Removed triggers stop matching; replaced ones keep their position."""
+        index = self._index()
+        assert index.remove("t0") is True
+        assert index.remove("t0") is False
+        index.add(TriggerSpec("t2", "alice", {"event_type": "noop_success"}, "handler"))
+
+        event = {"event_type": "noop_success", "principal_id": "bob", "data": {"category": "x"}}
+        assert [t.trigger_id for t in index.match(event)] == ["t2", "t3", "t4"]
+        assert len(index) == len(self.FILTERS) - 1
+
+
+class TestIncrementalUpdates:
+    """Test TriggerRegistry.update_trigger()."""
+
+    @pytest.fixture
+    def artifact_store(self) -> ArtifactStore:
+        """Create a fresh artifact store."""
+        return ArtifactStore()
+
+    @pytest.fixture
+    def registry(self, artifact_store: ArtifactStore) -> TriggerRegistry:
+        """Create trigger registry with artifact store."""
+        return TriggerRegistry(artifact_store)
+
+    def _write_trigger(self, store: ArtifactStore, event_type: str) -> None:
+        t = {
+            "filter": {"event_type": event_type},
+            "callback_artifact": "my_handler",
+            "enabled": True,
+        }
+        store.write(
+            artifact_id="my_trigger",
+            type="trigger",
+            content=str(t),
+            created_by="alice",
+            metadata=t,
+        )
+
+    def _write_handler(self, store: ArtifactStore, created_by: str = "alice") -> None:
+        store.write(
+            artifact_id="my_handler",
+            type="executable",
+            content="Handler",
+            created_by=created_by,
+            executable=True,
+            code="def run(event): pass",
+        )
+
+    def test_trigger_write_updates_registration(
+        self,
+        artifact_store: ArtifactStore,
+        registry: TriggerRegistry,
+    ) -> None:
+        """Writing or deleting a trigger artifact updates only that trigger."""
+        self._write_handler(artifact_store)
+        self._write_trigger(artifact_store, "a")
+        registry.update_trigger("my_trigger")
+        assert [t.trigger_id for t in registry.get_matching_triggers({"event_type": "a"})] == ["my_trigger"]
+
+        self._write_trigger(artifact_store, "b")
+        registry.update_trigger("my_trigger")
+        assert registry.get_matching_triggers({"event_type": "a"}) == []
+        assert len(registry.get_matching_triggers({"event_type": "b"})) == 1
+
+        trigger = artifact_store.get("my_trigger")
+        assert trigger is not None
+        artifact_store.mark_deleted(trigger, "alice")
+        registry.update_trigger("my_trigger")
+        assert registry.active_triggers == []
+
+    def test_callback_write_revalidates_trigger(
+        self,
+        artifact_store: ArtifactStore,
+        registry: TriggerRegistry,
+    ) -> None:
+        """A trigger written before its callback activates once the callback exists."""
+        self._write_trigger(artifact_store, "a")
+        registry.update_trigger("my_trigger")
+        assert registry.active_triggers == []
+
+        self._write_handler(artifact_store)
+        registry.update_trigger("my_handler")
+        assert len(registry.active_triggers) == 1
+
+    def test_matches_full_refresh(
+        self,
+        artifact_store: ArtifactStore,
+        registry: TriggerRegistry,
+    ) -> None:
+        """Incremental updates end in the same state as refresh()."""
+        self._write_handler(artifact_store)
+        self._write_trigger(artifact_store, "a")
+        registry.update_trigger("my_trigger")
+
+        fresh = TriggerRegistry(artifact_store)
+        fresh.refresh()
+        assert registry.active_triggers == fresh.active_triggers
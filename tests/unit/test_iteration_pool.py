@@ -0,0 +1,250 @@
+"""Unit tests for IterationPool (off-loop artifact iterations).
+
+Tests:
+- Blocking work runs off the event loop, concurrently across principals
+- Per-principal concurrency limits
+- Config-driven construction
+- ArtifactLoop dispatches iterations through the pool
+- Pooled code is timed out, and ledger/store writes from pool threads are atomic
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.simulation.artifact_loop import ArtifactLoop
+from src.simulation.iteration_pool import IterationPool
+from src.world.artifacts import ArtifactStore
+from src.world.executor import SafeExecutor
+from src.world.ledger import Ledger
+
+
+class TestIterationPoolInit:
+    """Tests for IterationPool construction."""
+
+    def test_rejects_non_positive_limits(self) -> None:
+        """Both limits must be positive."""
+        with pytest.raises(ValueError, match="max_workers"):
+            IterationPool(max_workers=0)
+        with pytest.raises(ValueError, match="max_per_principal"):
+            IterationPool(max_workers=2, max_per_principal=0)
+
+    def test_from_config_disabled_by_default(self) -> None:
+        """Default config keeps iterations on the event loop."""
+        assert IterationPool.from_config() is None
+
+    def test_from_config_enabled(self) -> None:
+        """Enabled config builds a pool with configured limits."""
+        config = MagicMock()
+        config.execution.iteration_pool.enabled = True
+        config.execution.iteration_pool.max_workers = 3
+        config.execution.iteration_pool.max_per_principal = 2
+        with patch("src.simulation.iteration_pool.get_validated_config", return_value=config):
+            pool = IterationPool.from_config()
+        assert pool is not None
+        assert pool.max_workers == 3
+        assert pool.max_per_principal == 2
+
+
+class TestIterationPoolRun:
+    """Tests for IterationPool.run()."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_thread(self) -> None:
+        """Work runs on a pool thread, not the event loop thread."""
+        pool = IterationPool(max_workers=2)
+        try:
+            thread = await pool.run("alice", threading.current_thread)
+            assert thread is not threading.current_thread()
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_passes_args_and_kwargs(self) -> None:
+        """Positional and keyword arguments reach the callable."""
+        pool = IterationPool(max_workers=1)
+        try:
+            result = await pool.run("alice", lambda a, b=0: a + b, 2, b=3)
+            assert result == 5
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_principals_run_in_parallel(self) -> None:
+        """Blocking calls for different principals overlap."""
+        pool = IterationPool(max_workers=4)
+        try:
+            start = time.perf_counter()
+            await asyncio.gather(*[
+                pool.run(f"agent_{i}", time.sleep, 0.2) for i in range(4)
+            ])
+            assert time.perf_counter() - start < 0.6
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self) -> None:
+        """The event loop keeps ticking while a blocking call runs."""
+        pool = IterationPool(max_workers=1)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        try:
+            await asyncio.gather(pool.run("alice", time.sleep, 0.2), ticker())
+            assert ticks == 5
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_per_principal_limit(self) -> None:
+        """A principal never exceeds max_per_principal in-flight iterations."""
+        pool = IterationPool(max_workers=4, max_per_principal=1)
+        peak = 0
+        current = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal peak, current
+            with lock:
+                current += 1
+                peak = max(peak, current)
+            time.sleep(0.05)
+            with lock:
+                current -= 1
+
+        try:
+            await asyncio.gather(*[pool.run("alice", work) for _ in range(3)])
+            assert peak == 1
+            assert pool.in_flight() == 0
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates(self) -> None:
+        """Exceptions raised in the worker surface to the awaiting caller."""
+        pool = IterationPool(max_workers=1)
+
+        def boom() -> None:
+            raise RuntimeError("boom")
+
+        try:
+            with pytest.raises(RuntimeError, match="boom"):
+                await pool.run("alice", boom)
+            assert pool.in_flight("alice") == 0
+        finally:
+            pool.shutdown()
+
+
+class TestArtifactLoopWithPool:
+    """ArtifactLoop uses the pool when one is configured."""
+
+    @pytest.mark.asyncio
+    async def test_iteration_dispatched_through_pool(self) -> None:
+        """_execute_iteration runs execute_with_invoke via the pool."""
+        world = MagicMock()
+        artifact = MagicMock()
+        artifact.code = "def run(): return 1"
+        world.artifacts.get.return_value = artifact
+
+        pool = IterationPool(max_workers=1)
+        calls: list[dict[str, Any]] = []
+
+        async def fake_run(principal_id: str, func: Any, **kwargs: Any) -> dict[str, Any]:
+            calls.append({"principal_id": principal_id, **kwargs})
+            return {"success": True, "result": 1}
+
+        loop = ArtifactLoop(
+            artifact_id="agent_loop",
+            world=world,
+            rate_tracker=MagicMock(),
+            iteration_pool=pool,
+        )
+        with patch.object(pool, "run", side_effect=fake_run):
+            result = await loop._execute_iteration()
+
+        assert result["success"] is True
+        assert calls[0]["principal_id"] == "agent_loop"
+        assert calls[0]["code"] == "def run(): return 1"
+        pool.shutdown()
+
+
+@pytest.fixture
+def fast_switching() -> Iterator[None]:
+    """Switch threads as often as possible to expose unlocked read-modify-writes."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+class TestPooledKernelSafety:
+    """Kernel state touched from pool threads."""
+
+    @pytest.mark.asyncio
+    async def test_pooled_code_times_out(self) -> None:
+        """executor.timeout_seconds applies to code running off the main thread."""
+        executor = SafeExecutor(timeout=1, use_contracts=False)
+        pool = IterationPool(max_workers=1)
+        try:
+            start = time.monotonic()
+            result = await pool.run(
+                "alice", executor.execute, "def run():\n    while True:\n        pass\n"
+            )
+            assert time.monotonic() - start < 5
+            assert result["success"] is False
+            assert "timed out" in result["error"]
+            # The deadline is removed afterwards: the next run on the thread succeeds
+            ok = await pool.run("alice", executor.execute, "def run():\n    return 1\n")
+            assert ok["result"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_concurrent_transfers_conserve_scrip(self, fast_switching: None) -> None:
+        """Concurrent transfer_scrip calls neither create nor lose scrip."""
+        ledger = Ledger()
+        ledger.create_principal("alice", starting_scrip=10_000)
+        ledger.create_principal("bob", starting_scrip=10_000)
+
+        def shuffle(from_id: str, to_id: str) -> None:
+            for _ in range(2_000):
+                ledger.transfer_scrip(from_id, to_id, 1)
+                ledger.transfer_resource(from_id, to_id, "disk", 1.0)
+
+        ledger.set_resource("alice", "disk", 10_000.0)
+        ledger.set_resource("bob", "disk", 10_000.0)
+        with ThreadPoolExecutor(max_workers=4) as threads:
+            for pair in [("alice", "bob"), ("bob", "alice")] * 2:
+                threads.submit(shuffle, *pair)
+
+        assert ledger.get_scrip("alice") + ledger.get_scrip("bob") == 20_000
+        assert ledger.get_resource("alice", "disk") + ledger.get_resource("bob", "disk") == 20_000
+
+    def test_concurrent_writes_keep_store_consistent(self, fast_switching: None) -> None:
+        """Writes from several threads keep indexes and usage totals consistent."""
+        store = ArtifactStore()
+
+        def write_many(worker: int) -> None:
+            for n in range(200):
+                store.write(f"art_{worker}_{n % 20}", "data", "x" * n, created_by="alice")
+                store.find_ids(artifact_type="data")
+
+        with ThreadPoolExecutor(max_workers=4) as threads:
+            list(threads.map(write_many, range(4)))
+
+        assert len(store.find_ids(artifact_type="data")) == 80
+        assert store.get_creator_usage("alice") == sum(
+            store.get_artifact_size(aid) for aid in store.find_ids(creator="alice")
+        )
@@ -0,0 +1,69 @@
+"""Unit tests for JSON Patch application on artifact content."""
+
+import pytest
+
+from src.world.json_patch import JsonPatchError, apply_json_patch, parse_pointer
+
+
+class TestParsePointer:
+    """Tests for JSON Pointer parsing."""
+
+    def test_root_and_escapes(self) -> None:
+        """Empty pointer is the root; ~1 and ~0 unescape."""
+        assert parse_pointer("") == []
+        assert parse_pointer("/a~1b/c~0d") == ["a/b", "c~d"]
+
+    def test_requires_leading_slash(self) -> None:
+        """Pointers other than the root start with '/'."""
+        with pytest.raises(JsonPatchError):
+            parse_pointer("a/b")
+
+
+class TestApplyJsonPatch:
+    """Tests for add/remove/replace/test operations."""
+
+    def test_add_replace_remove(self) -> None:
+        """Basic operations on objects and arrays."""
+        doc = {"journal": ["a"], "state": {"step": 1, "tmp": True}}
+        patched = apply_json_patch(doc, [
+            {"op": "add", "path": "/journal/-", "value": "b"},
+            {"op": "add", "path": "/journal/0", "value": "z"},
+            {"op": "replace", "path": "/state/step", "value": 2},
+            {"op": "remove", "path": "/state/tmp"},
+        ])
+        assert patched == {"journal": ["z", "a", "b"], "state": {"step": 2}}
+
+    def test_input_not_mutated_and_siblings_shared(self) -> None:
+        """Patching copies only the containers on the changed path."""
+        doc = {"journal": ["a"], "big": {"x": [1, 2, 3]}}
+        patched = apply_json_patch(doc, [{"op": "add", "path": "/journal/-", "value": "b"}])
+        assert doc == {"journal": ["a"], "big": {"x": [1, 2, 3]}}
+        assert patched["big"] is doc["big"]
+
+    def test_test_op_guards_patch(self) -> None:
+        """A failing test op aborts the whole patch."""
+        doc = {"version": 1}
+        with pytest.raises(JsonPatchError, match="Test failed"):
+            apply_json_patch(doc, [
+                {"op": "replace", "path": "/version", "value": 2},
+                {"op": "test", "path": "/version", "value": 1},
+            ])
+        assert doc == {"version": 1}
+
+    @pytest.mark.parametrize("operation", [
+        {"op": "move", "path": "/a", "from": "/b"},
+        {"op": "replace", "path": "/missing", "value": 1},
+        {"op": "remove", "path": "/list/5"},
+        {"op": "add", "path": "/list/01", "value": 1},
+        {"op": "add", "path": "/a/b", "value": 1},
+        {"op": "add", "path": "/x"},
+        {"op": "remove", "path": ""},
+    ])
+    def test_invalid_operations(self, operation: dict) -> None:
+        """Unsupported ops, bad paths and missing values are rejected."""
+        with pytest.raises(JsonPatchError):
+            apply_json_patch({"a": 1, "list": [0]}, [operation])
+
+    def test_replace_root(self) -> None:
+        """Replacing the root swaps the whole document."""
+        assert apply_json_patch({"a": 1}, [{"op": "replace", "path": "", "value": [1]}]) == [1]
@@ -11,23 +11,31 @@ Also tests the helper functions:
 - get_contract_by_id()
 - list_kernel_contracts()
 - KERNEL_CONTRACTS registry
+- decide_kernel_permission() decision table
 """
 
 from __future__ import annotations
 
+import itertools
+from typing import Any
+from unittest.mock import patch
+
 import pytest
 
-from src.world.contracts import AccessContract, PermissionAction, PermissionResult
+from src.world.artifacts import ArtifactStore
+from src.world.contracts import AccessContract, PermissionAction, PermissionCache, PermissionResult
 from src.world.kernel_contracts import (
     KERNEL_CONTRACTS,
     FreewareContract,
     PrivateContract,
     PublicContract,
     SelfOwnedContract,
+    decide_kernel_permission,
     get_contract_by_id,
     get_kernel_contract,
     list_kernel_contracts,
 )
+from src.world.permission_checker import check_permission_via_contract
 
 
 class TestFreewareContract:
@@ -641,3 +649,55 @@ class TestContractComparison:
                 context=context,
             )
             assert result.scrip_cost == 0, f"{name} should have zero cost by default"
+
+
+class TestDecisionTable:
+    """decide_kernel_permission() against the contracts it tabulates."""
+
+    STATES: list[dict[str, Any]] = [
+        {},
+        {"writer": "alice"},
+        {"writer": "bob"},
+        {"principal": "alice"},
+        {"writer": "alice", "principal": "alice"},
+        {"writer": "bob", "principal": "alice"},
+        {"writer": "", "principal": "carol"},
+        {"writer": None, "principal": "alice", "other": 1},
+    ]
+
+    def test_matches_contracts(self) -> None:
+        """Every (contract, action, caller, target, state) gives the contract's result."""
+        for contract, action, caller, target, state in itertools.product(
+            KERNEL_CONTRACTS.values(), PermissionAction, ["alice", "bob", "art"],
+            ["art", "alice"], self.STATES,
+        ):
+            expected = contract.check_permission(
+                caller=caller, action=action, target=target,
+                context={"_artifact_state": dict(state)},
+            )
+            actual = decide_kernel_permission(
+                contract.contract_id, action.value, caller, target, state
+            )
+            assert actual == expected, (contract.contract_id, action, caller, target, state)
+
+    def test_unknown_contract_or_action(self) -> None:
+        """Non-kernel contracts and unknown actions are not decided by the table."""
+        assert decide_kernel_permission("my_contract", "read", "a", "t", {}) is None
+        assert decide_kernel_permission("kernel_contract_public", "fly", "a", "t", {}) is None
+
+    def test_permission_check_skips_contract_dispatch(self) -> None:
+        """check_permission_via_contract answers kernel contracts without calling them."""
+        store = ArtifactStore()
+        artifact = store.write(
+            "doc", "data", "x", created_by="alice",
+            access_contract_id="kernel_contract_freeware",
+        )
+        artifact.state["writer"] = "bob"
+        with patch.object(FreewareContract, "check_permission") as dispatched:
+            result = check_permission_via_contract(
+                caller="bob", action="write", artifact=artifact, contract_cache={},
+                permission_cache=PermissionCache(), dangling_count_tracker=[0],
+                ledger=None, max_contract_depth=10, artifact_store=store,
+            )
+        dispatched.assert_not_called()
+        assert result.allowed and result.scrip_recipient == "bob"
@@ -6,7 +6,7 @@ Tests that agents can query kernel state directly via query_kernel action.
 import pytest
 from typing import Any
 
-from src.world.kernel_queries import KernelQueryHandler, QUERY_SCHEMA
+from src.world.kernel_queries import KernelQueryHandler, QUERY_SCHEMA, _literal_prefix
 from src.world.artifacts import ArtifactStore
 
 
@@ -19,6 +19,7 @@ class TestQuerySchema:
             "artifacts", "artifact", "principals", "principal",
             "balances", "resources", "quotas", "mint", "events",
             "invocations", "frozen", "libraries", "dependencies",
+            "permission_cache",
         ]
         for qt in expected_types:
             assert qt in QUERY_SCHEMA, f"Missing schema for query type: {qt}"
@@ -167,6 +168,13 @@ class TestArtifactsQuery:
         assert result["total"] == 2
         assert all(a["executable"] is True for a in result["results"])
 
+    def test_non_bool_executable_matches_nothing(self, handler: KernelQueryHandler) -> None:
+        """Only real booleans filter on executable; 1/0 and strings match nothing."""
+        for value in (1, 0, "true"):
+            result = handler.execute("artifacts", {"executable": value})
+            assert result["success"] is True
+            assert result["total"] == 0
+
     def test_filter_by_name_pattern(self, handler: KernelQueryHandler) -> None:
         """Can filter artifacts by name pattern regex."""
         result = handler.execute("artifacts", {"name_pattern": "^tool"})
@@ -188,6 +196,60 @@ class TestArtifactsQuery:
         assert result["total"] == 3
         assert result["returned"] == 1
 
+    def test_results_keep_creation_order(self, handler: KernelQueryHandler) -> None:
+        """Index-driven results come back in creation order across pages."""
+        first = handler.execute("artifacts", {"owner": "alice", "limit": 1})
+        second = handler.execute("artifacts", {"owner": "alice", "limit": 1, "offset": 1})
+        assert [first["results"][0]["id"], second["results"][0]["id"]] == ["tool_1", "tool_2"]
+
+    def test_combined_filters(self, handler: KernelQueryHandler) -> None:
+        """Filters intersect, including an anchored name_pattern."""
+        result = handler.execute(
+            "artifacts", {"owner": "alice", "executable": True, "name_pattern": "^tool_2$"}
+        )
+        assert [a["id"] for a in result["results"]] == ["tool_2"]
+        result = handler.execute("artifacts", {"executable": False})
+        assert [a["id"] for a in result["results"]] == ["data_1"]
+
+    def test_deleted_artifacts_excluded(
+        self, handler: KernelQueryHandler, mock_world: Any
+    ) -> None:
+        """Soft-deleted artifacts never appear, filtered or not."""
+        store = mock_world.artifacts
+        store.mark_deleted(store.get("tool_1"), "alice")
+        assert handler.execute("artifacts", {})["total"] == 2
+        result = handler.execute("artifacts", {"name_pattern": "^tool"})
+        assert [a["id"] for a in result["results"]] == ["tool_2"]
+
+    def test_invalid_pattern_rejected_up_front(self, handler: KernelQueryHandler) -> None:
+        """A bad regex fails even when no artifact would reach it."""
+        result = handler.execute("artifacts", {"owner": "nobody", "name_pattern": "(["})
+        assert result["success"] is False
+        assert result["error_code"] == "invalid_pattern"
+
+    def test_unanchored_pattern_scans_ids(self, handler: KernelQueryHandler) -> None:
+        """Patterns without a literal prefix still match anywhere in the ID."""
+        result = handler.execute("artifacts", {"name_pattern": "_2|data"})
+        assert [a["id"] for a in result["results"]] == ["data_1", "tool_2"]
+
+
+class TestLiteralPrefix:
+    """Test prefix extraction for name_pattern queries."""
+
+    @pytest.mark.parametrize(("pattern", "prefix"), [
+        ("^tool", "tool"),
+        ("^tool_\\d+", "tool_"),
+        ("^tools?", "tool"),
+        ("^ab{0,2}", "a"),
+        ("^ab+", "ab"),
+        ("tool", ""),
+        ("^tool|data", ""),
+        ("^(?i)tool", ""),
+    ])
+    def test_literal_prefix(self, pattern: str, prefix: str) -> None:
+        """Only text every match must start with is used as a prefix."""
+        assert _literal_prefix(pattern) == prefix
+
 
 class TestBalancesQuery:
     """Test balances query type."""
@@ -341,3 +403,9 @@ class TestFrozenQuery:
         result = handler.execute("frozen", {"agent_id": "bob"})
         assert result["success"] is True
         assert result["frozen"] is False
+
+    def test_query_permission_cache(self, handler: KernelQueryHandler) -> None:
+        """Permission cache stats come from the executor."""
+        result = handler.execute("permission_cache", {})
+        assert result["success"] is True
+        assert {"hits", "misses", "evictions", "size", "max_entries"} <= set(result["stats"])
@@ -11,7 +11,7 @@ from unittest.mock import patch
 
 import pytest
 
-from src.world.logger import EventLogger, SummaryCollector
+from src.world.logger import EventLogger, SummaryCollector, read_tail_lines
 
 
 class TestPerRunLogging:
@@ -166,6 +166,171 @@ class TestEventLoggerBasics:
         assert "event_type" in event
 
 
+def _lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+class TestBufferedWriter:
+    """Event log writer durability levels (logging.writer)"""
+
+    def test_default_durability_visible_immediately(self, tmp_path: Path) -> None:
+        """'event' durability makes each event visible without flush()"""
+        output_file = tmp_path / "test.jsonl"
+        logger = EventLogger(output_file=str(output_file))
+        assert logger.durability == "event"
+        logger.log("event", {"n": 1})
+        assert len(_lines(output_file)) == 1
+        logger.close()
+
+    def test_batch_buffers_until_threshold(self, tmp_path: Path) -> None:
+        """'batch' durability writes once flush_max_events is reached"""
+        output_file = tmp_path / "test.jsonl"
+        logger = EventLogger(
+            output_file=str(output_file),
+            writer_settings={
+                "durability": "batch",
+                "flush_max_events": 3,
+                "flush_interval_seconds": 60.0,
+            },
+        )
+        logger.log("event", {"n": 1})
+        logger.log("event", {"n": 2})
+        assert output_file.read_text() == ""
+        logger.log("event", {"n": 3})
+        assert [e["n"] for e in _lines(output_file)] == [1, 2, 3]
+        logger.close()
+
+    def test_batch_flush_and_close(self, tmp_path: Path) -> None:
+        """flush() and close() write buffered events; later events still land"""
+        output_file = tmp_path / "test.jsonl"
+        logger = EventLogger(
+            output_file=str(output_file),
+            writer_settings={"durability": "batch", "flush_interval_seconds": 60.0},
+        )
+        logger.log("event", {"n": 1})
+        logger.flush()
+        assert len(_lines(output_file)) == 1
+        logger.log("event", {"n": 2})
+        logger.close()
+        assert len(_lines(output_file)) == 2
+        logger.log("event", {"n": 3})
+        assert [e["sequence"] for e in _lines(output_file)] == [1, 2, 3]
+
+    def test_read_recent_sees_buffered_events(self, tmp_path: Path) -> None:
+        """read_recent flushes before reading"""
+        output_file = tmp_path / "test.jsonl"
+        logger = EventLogger(
+            output_file=str(output_file),
+            writer_settings={"durability": "batch", "flush_interval_seconds": 60.0},
+        )
+        logger.log("event", {"n": 1})
+        assert logger.read_recent(5)[0]["n"] == 1
+        logger.close()
+
+    def test_background_thread_writer(self, tmp_path: Path) -> None:
+        """background_thread writes in order and flush() waits for the thread"""
+        output_file = tmp_path / "test.jsonl"
+        logger = EventLogger(
+            output_file=str(output_file),
+            writer_settings={"durability": "batch", "background_thread": True},
+        )
+        for i in range(100):
+            logger.log("event", {"n": i})
+        logger.flush()
+        assert [e["n"] for e in _lines(output_file)] == list(range(100))
+        logger.close()
+
+    def test_orjson_serializer_matches_json(self, tmp_path: Path) -> None:
+        """orjson output parses to the same events as the stdlib serializer"""
+        pytest.importorskip("orjson")
+        output_file = tmp_path / "test.jsonl"
+        logger = EventLogger(
+            output_file=str(output_file), writer_settings={"serializer": "orjson"}
+        )
+        logger.log("event", {"nested": {1: "a"}, "big": 2**70, "text": "h\u00e9"})
+        logger.close()
+        event = _lines(output_file)[0]
+        assert event["nested"] == {"1": "a"}
+        assert event["big"] == 2**70
+        assert event["text"] == "h\u00e9"
+
+    def test_unknown_durability_rejected(self, tmp_path: Path) -> None:
+        """Invalid durability levels fail loudly"""
+        with pytest.raises(ValueError, match="durability"):
+            EventLogger(
+                output_file=str(tmp_path / "test.jsonl"),
+                writer_settings={"durability": "sometimes"},
+            )
+
+
+class TestReadRecent:
+    """read_recent ring buffer and tail reader"""
+
+    def test_served_from_ring_buffer(self, tmp_path: Path) -> None:
+        """Requests within the buffer never touch the file"""
+        output_file = tmp_path / "test.jsonl"
+        logger = EventLogger(output_file=str(output_file), recent_buffer_size=10)
+        for i in range(25):
+            logger.log("event", {"n": i})
+        with patch("src.world.logger.read_tail_lines") as tail:
+            recent = logger.read_recent(5)
+        tail.assert_not_called()
+        assert [e["n"] for e in recent] == [20, 21, 22, 23, 24]
+        logger.close()
+
+    def test_returns_fresh_dicts(self, tmp_path: Path) -> None:
+        """Mutating a returned event does not affect later reads"""
+        logger = EventLogger(output_file=str(tmp_path / "test.jsonl"))
+        logger.log("event", {"n": 1})
+        logger.read_recent(1)[0]["n"] = 99
+        assert logger.read_recent(1)[0]["n"] == 1
+        logger.close()
+
+    def test_cold_read_beyond_buffer(self, tmp_path: Path) -> None:
+        """Requests larger than the buffer fall back to the tail reader"""
+        output_file = tmp_path / "test.jsonl"
+        logger = EventLogger(
+            output_file=str(output_file),
+            recent_buffer_size=3,
+            writer_settings={"durability": "batch", "flush_interval_seconds": 60.0},
+        )
+        for i in range(20):
+            logger.log("event", {"n": i})
+        recent = logger.read_recent(8)
+        assert [e["n"] for e in recent] == list(range(12, 20))
+        assert len(logger.read_recent(100)) == 20
+        logger.close()
+
+    def test_non_positive_n(self, tmp_path: Path) -> None:
+        """n <= 0 returns nothing"""
+        logger = EventLogger(output_file=str(tmp_path / "test.jsonl"))
+        logger.log("event", {})
+        assert logger.read_recent(0) == []
+        logger.close()
+
+
+class TestReadTailLines:
+    """Reverse-seek tail reader"""
+
+    def test_reads_across_block_boundaries(self, tmp_path: Path) -> None:
+        """Lines split across blocks are reassembled"""
+        path = tmp_path / "lines.jsonl"
+        path.write_bytes(b"".join(b"line-%03d\n" % i for i in range(50)))
+        for block_size in (1, 3, 7, 64, 4096):
+            lines = read_tail_lines(path, 4, block_size=block_size)
+            assert lines == [b"line-046", b"line-047", b"line-048", b"line-049"]
+
+    def test_whole_file_and_missing_trailing_newline(self, tmp_path: Path) -> None:
+        """Asking for more lines than exist returns them all"""
+        path = tmp_path / "lines.jsonl"
+        path.write_bytes(b"a\nb\nc")
+        assert read_tail_lines(path, 10, block_size=2) == [b"a", b"b", b"c"]
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """A missing file has no lines"""
+        assert read_tail_lines(tmp_path / "nope.jsonl", 5) == []
+
+
 @pytest.mark.plans(76)
 class TestSummaryCollectorPerAgent:
     """Test SummaryCollector per-agent tracking (Plan #76)"""
@@ -348,3 +348,125 @@ class TestMetadataIndexing:
 
         # Should work fine - no crashes, no spurious index entries
         assert "art1" not in store._index_by_metadata.get("status", {}).get(None, set())
+
+
+class TestFindIds:
+    """Tests for index-driven find_ids lookups."""
+
+    @pytest.fixture
+    def store(self) -> ArtifactStore:
+        store = ArtifactStore()
+        for i in range(30):
+            store.write(
+                artifact_id=f"{'tool' if i % 3 == 0 else 'doc'}_{i:02d}",
+                type="executable" if i % 3 == 0 else "data",
+                content="x",
+                created_by="alice" if i % 2 == 0 else "bob",
+                executable=i % 3 == 0,
+            )
+        return store
+
+    def test_filters_intersect_in_creation_order(self, store: ArtifactStore) -> None:
+        """Matches satisfy every filter and keep write order."""
+        ids = store.find_ids(creator="alice", executable=True)
+        assert ids == ["tool_00", "tool_06", "tool_12", "tool_18", "tool_24"]
+        assert store.find_ids(artifact_type="data", id_prefix="doc_2")[:2] == ["doc_20", "doc_22"]
+
+    def test_prefix_index_sees_new_ids(self, store: ArtifactStore) -> None:
+        """IDs written after a prefix lookup are merged into the prefix index."""
+        assert store.find_ids(id_prefix="tool_0") == ["tool_00", "tool_03", "tool_06", "tool_09"]
+        store.write(artifact_id="tool_0x", type="data", content="", created_by="carol")
+        assert store.find_ids(id_prefix="tool_0")[-1] == "tool_0x"
+
+    def test_executable_index_follows_rewrites(self, store: ArtifactStore) -> None:
+        """Rewriting an artifact as non-executable drops it from the index."""
+        store.write(artifact_id="tool_00", type="executable", content="", created_by="alice")
+        assert "tool_00" not in store.find_ids(executable=True)
+        assert "tool_00" in store.find_ids(executable=False)
+
+    def test_deleted_excluded_and_survive_rebuild(self, store: ArtifactStore) -> None:
+        """mark_deleted hides an artifact from every lookup, also after rebuild_indexes."""
+        artifact = store.get("doc_01")
+        assert artifact is not None
+        store.mark_deleted(artifact, "bob")
+        assert artifact.deleted and artifact.deleted_by == "bob"
+        for ids in (store.find_ids(), store.find_ids(creator="bob"), store.find_ids(id_prefix="doc_0")):
+            assert "doc_01" not in ids
+        store.rebuild_indexes()
+        assert "doc_01" not in store.find_ids(artifact_type="data")
+        assert len(store.find_ids()) == 29
+
+
+class TestDiskUsageAccounting:
+    """Per-creator disk usage is a running total maintained by the store."""
+
+    def test_usage_follows_writes_edits_and_deletes(self) -> None:
+        """Every store mutation keeps get_creator_usage in step with content."""
+        store = ArtifactStore()
+        store.write(artifact_id="a", type="data", content="hello", created_by="alice")
+        store.write(artifact_id="b", type="data", content="x", created_by="alice", code="def run(): pass")
+        assert store.get_creator_usage("alice") == 5 + 1 + 15
+
+        store.write(artifact_id="a", type="data", content="hi", created_by="alice")
+        assert store.get_creator_usage("alice") == 2 + 16
+
+        store.edit_artifact("a", "hi", "héllo")
+        store.append_artifact("a", "!")
+        assert store.get_artifact_size("a") == 7
+        assert store.get_creator_usage("alice") == 7 + 16
+
+        artifact = store.get("b")
+        assert artifact is not None
+        store.mark_deleted(artifact, "alice")
+        assert store.get_creator_usage("alice") == 7
+
+    def test_transfer_does_not_move_usage(self) -> None:
+        """Usage is charged to the immutable creator, not the controller."""
+        store = ArtifactStore()
+        store.write(artifact_id="a", type="data", content="hello", created_by="alice")
+        store.transfer_ownership("a", "alice", "bob")
+        assert store.get_creator_usage("alice") == 5
+        assert store.get_creator_usage("bob") == 0
+
+    def test_direct_assignment_remeasured(self) -> None:
+        """Content assigned outside the store is picked up by get_artifact_size."""
+        store = ArtifactStore()
+        store.write(artifact_id="a", type="data", content="hello", created_by="alice")
+        artifact = store.get("a")
+        assert artifact is not None
+        artifact.content = "hello world"
+        assert store.get_artifact_size("a") == 11
+        assert store.get_creator_usage("alice") == 11
+
+    def test_rebuild_indexes_recomputes_usage(self) -> None:
+        """Bulk-loaded artifacts are counted after rebuild_indexes."""
+        store = ArtifactStore()
+        store.write(artifact_id="a", type="data", content="hello", created_by="alice")
+        source = ArtifactStore()
+        source.write(artifact_id="b", type="data", content="world!", created_by="alice")
+        store.artifacts["b"] = source.artifacts["b"]
+        store.rebuild_indexes()
+        assert store.get_creator_usage("alice") == 11
+
+    def test_non_string_content_measured(self) -> None:
+        """Dict content (written directly by kernel code) is sized by its str() form."""
+        store = ArtifactStore()
+        content = {"description": "artifact with loop"}
+        store.write(artifact_id="a", type="executable", content=content, created_by="alice")
+        assert store.get_artifact_size("a") == len(str(content))
+        assert store.get_creator_usage("alice") == len(str(content))
+
+        content["description"] = "longer description"
+        assert store.get_artifact_size("a") == len(str(content))
+
+    def test_incremental_edits_shift_usage_by_delta(self) -> None:
+        """Append/range edits adjust the running totals without re-encoding."""
+        from unittest.mock import patch
+
+        store = ArtifactStore()
+        store.write(artifact_id="log", type="text", content="a" * 1000, created_by="alice")
+        with patch("src.world.artifacts._encoded_size", side_effect=AssertionError("re-encoded")):
+            store.append_artifact("log", "é\n")
+            store.write_artifact_range("log", 0, 10, "b")
+        assert store.get_artifact_size("log") == 1000 + 3 - 9
+        assert store.get_creator_usage("alice") == 994
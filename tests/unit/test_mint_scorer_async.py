@@ -0,0 +1,155 @@
+"""Tests for the asynchronous MintScorer pipeline and async auction resolution.
+
+Scoring runs on a long-lived pool, claims content hashes before dispatch and
+caches successful scores per content hash.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import threading
+from typing import Any, Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.world.llm_client import LLMCallResult
+from src.world.mint_scorer import MintScorer, ScoringResult
+from src.world.world import World
+
+
+def _llm_result(content: str = '{"score": 60, "reason": "Useful"}') -> LLMCallResult:
+    return LLMCallResult(
+        content=content,
+        usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        cost=0.002,
+        model="test-model",
+    )
+
+
+@pytest.fixture
+def scorer() -> Iterator[MintScorer]:
+    """Fresh scorer with two pool workers.
+
+    # mock-ok: LLM calls are external API
+    """
+    scorer = MintScorer(model="test-model")
+    scorer.workers = 2
+    yield scorer
+    scorer.shutdown()
+
+
+class TestAsyncScoring:
+    """score_artifact_async() / score_artifacts()."""
+
+    @pytest.mark.asyncio
+    async def test_batch_dedupes_before_dispatch(self, scorer: MintScorer) -> None:
+        """Identical content in one batch reaches the LLM once."""
+        mock_llm = MagicMock(return_value=_llm_result())
+        with patch("src.world.mint_scorer.call_llm", mock_llm):
+            results = await scorer.score_artifacts([
+                {"artifact_id": "a", "artifact_type": "executable", "content": "def run(): 1"},
+                {"artifact_id": "b", "artifact_type": "executable", "content": " DEF RUN(): 1 "},
+                {"artifact_id": "c", "artifact_type": "executable", "content": "def run(): 2"},
+            ])
+
+        assert mock_llm.call_count == 2
+        assert [r["score"] for r in results] == [60, 0, 60]
+        assert "Duplicate" in results[1]["reason"]
+        assert results[0]["cost"] == 0.002
+        assert results[1]["cost"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently(self, scorer: MintScorer) -> None:
+        """Two submissions are scored at the same time on the pool."""
+        both_started = threading.Barrier(2, timeout=5)
+
+        def call_llm(*args: Any, **kwargs: Any) -> LLMCallResult:
+            both_started.wait()  # Deadlocks (times out) if calls were serialized
+            return _llm_result()
+
+        with patch("src.world.mint_scorer.call_llm", side_effect=call_llm):
+            results = await scorer.score_artifacts([
+                {"artifact_id": "a", "artifact_type": "executable", "content": "one"},
+                {"artifact_id": "b", "artifact_type": "executable", "content": "two"},
+            ])
+        assert all(r["success"] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_score_cached_per_content_hash(self, scorer: MintScorer) -> None:
+        """A successful score is kept for the content across auctions."""
+        with patch("src.world.mint_scorer.call_llm", return_value=_llm_result()):
+            await scorer.score_artifact_async("a", "executable", "def run(): 3")
+
+        cached = scorer.cached_score("  def run(): 3")
+        assert cached is not None
+        assert cached["score"] == 60
+        assert scorer.is_original("def run(): 3") is False
+
+    @pytest.mark.asyncio
+    async def test_failure_releases_hash(self, scorer: MintScorer) -> None:
+        """Content whose scoring failed can be scored again."""
+        with patch("src.world.mint_scorer.call_llm", side_effect=RuntimeError("down")):
+            failed = await scorer.score_artifact_async("a", "executable", "def run(): 4")
+        assert failed["success"] is False
+        assert scorer.is_original("def run(): 4") is True
+        assert scorer.cached_score("def run(): 4") is None
+
+        with patch("src.world.mint_scorer.call_llm", return_value=_llm_result()):
+            retried = await scorer.score_artifact_async("a", "executable", "def run(): 4")
+        assert retried["score"] == 60
+
+    @pytest.mark.asyncio
+    async def test_budget_exhausted_skips_call(self, scorer: MintScorer) -> None:
+        """No LLM call is made once the budget is exhausted."""
+        mock_llm = MagicMock(return_value=_llm_result())
+        with patch("src.world.mint_scorer.call_llm", mock_llm):
+            result = await scorer.score_artifact_async(
+                "a", "executable", "def run(): 5", is_budget_exhausted=lambda: True
+            )
+        mock_llm.assert_not_called()
+        assert result["success"] is False
+        assert scorer.is_original("def run(): 5") is True
+
+
+@pytest.fixture
+def world() -> World:
+    """World with two principals for auction tests."""
+    with tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False) as f:
+        output_file = f.name
+    return World({
+        "world": {"max_ticks": 20},
+        "costs": {"per_1k_input_tokens": 1, "per_1k_output_tokens": 1},
+        "logging": {"output_file": output_file},
+        "principals": [
+            {"id": "alice", "starting_scrip": 100},
+            {"id": "bob", "starting_scrip": 200},
+        ],
+        "rights": {"default_quotas": {"compute": 100.0, "disk": 10000.0}},
+    })
+
+
+class TestResolveAsync:
+    """MintAuction.resolve_async()."""
+
+    @pytest.mark.asyncio
+    async def test_submissions_during_scoring_go_to_next_auction(self, world: World) -> None:
+        """A bid placed while the winner is being scored is not cleared."""
+        world.artifacts.write("art_1", "executable", "code1", "alice", executable=True)
+        world.artifacts.write("art_2", "executable", "code2", "bob", executable=True)
+        world.submit_for_mint("alice", "art_1", bid=20)
+
+        class FakeScorer:
+            async def score_artifact_async(self, **kwargs: Any) -> ScoringResult:
+                world.submit_for_mint("bob", "art_2", bid=10)
+                await asyncio.sleep(0)
+                return {"success": True, "score": 50, "reason": "ok", "error": "", "cost": 0.0}
+
+        with patch("src.world.mint_scorer.get_scorer", return_value=FakeScorer()):
+            result = await world.mint_auction.resolve_async()
+
+        assert result["winner_id"] == "alice"
+        assert result["scrip_minted"] == 5
+        pending = world.get_mint_submissions()
+        assert [s["artifact_id"] for s in pending] == ["art_2"]
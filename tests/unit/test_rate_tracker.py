@@ -213,6 +213,26 @@ class TestConsume:
 
         assert result is False
 
+    def test_consume_is_thread_safe(self) -> None:
+        """Concurrent consumers never over-admit past the limit."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        tracker = RateTracker()
+        tracker.configure_limit("llm_calls", max_per_window=50.0)
+
+        def slow_clock() -> float:
+            time.sleep(0.001)  # Widen the gap between capacity check and record
+            return time.time()
+
+        with patch.object(tracker, "_get_current_time", side_effect=slow_clock):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(
+                    lambda _: tracker.consume("agent_a", "llm_calls", 1.0), range(200)
+                ))
+
+        assert sum(results) == 50
+        assert tracker.get_usage("agent_a", "llm_calls") == 50.0
+
 
 class TestHasCapacity:
     """Tests for has_capacity method."""
@@ -622,3 +642,168 @@ class TestEdgeCases:
         assert tracker.get_usage("agent_0", "resource") == 5.0
         assert tracker.get_usage("agent_500", "resource") == 5.0
         assert tracker.get_usage("agent_999", "resource") == 5.0
+
+
+class TestRunningTotals:
+    """Tests for the running-total representation of window usage."""
+
+    def test_total_tracks_append_and_expire(self) -> None:
+        """Running total follows consumption and per-record expiry."""
+        tracker = RateTracker(window_seconds=10.0)
+        tracker.configure_limit("llm_calls", max_per_window=100.0)
+        now = [1000.0]
+        with patch.object(tracker, "_get_current_time", side_effect=lambda: now[0]):
+            tracker.consume("agent_a", "llm_calls", 3.0)
+            now[0] += 4.0
+            tracker.consume("agent_a", "llm_calls", 5.0)
+            assert tracker.get_usage("agent_a", "llm_calls") == 8.0
+
+            now[0] += 7.0  # first record (t=1000) is now outside the window
+            assert tracker.get_usage("agent_a", "llm_calls") == 5.0
+            assert len(tracker._usage["llm_calls"]["agent_a"]) == 1
+
+            now[0] += 10.0
+            assert tracker.get_usage("agent_a", "llm_calls") == 0.0
+            assert tracker.get_remaining("agent_a", "llm_calls") == 100.0
+
+    def test_total_snaps_to_zero_when_window_empties(self) -> None:
+        """Float drift from fractional amounts does not survive an empty window."""
+        tracker = RateTracker(window_seconds=10.0)
+        tracker.configure_limit("resource", max_per_window=1.0)
+        now = [0.0]
+        with patch.object(tracker, "_get_current_time", side_effect=lambda: now[0]):
+            for _ in range(10):
+                tracker.consume("agent_a", "resource", 0.1)
+                now[0] += 0.5
+            now[0] += 20.0
+            assert tracker.get_usage("agent_a", "resource") == 0.0
+            assert tracker.has_capacity("agent_a", "resource", 1.0) is True
+
+    def test_reset_clears_totals(self) -> None:
+        """Every reset scope zeroes the matching running totals."""
+        tracker = RateTracker()
+        tracker.configure_limit("a", max_per_window=10.0)
+        tracker.configure_limit("b", max_per_window=10.0)
+        for resource in ("a", "b"):
+            for agent in ("x", "y"):
+                tracker.consume(agent, resource, 4.0)
+
+        tracker.reset(agent_id="x", resource="a")
+        assert tracker.get_usage("x", "a") == 0.0
+        tracker.reset(resource="b")
+        assert tracker.get_usage("x", "b") == 0.0
+        assert tracker.get_usage("y", "b") == 0.0
+        tracker.reset(agent_id="y")
+        assert tracker.get_usage("y", "a") == 0.0
+        tracker.consume("x", "a", 2.0)
+        tracker.reset()
+        assert tracker.get_all_usage() == {}
+
+    def test_capacity_checks_constant_time(self) -> None:
+        """Checks at 20k records per window cost about the same as at 10.
+
+        Micro-benchmark: the old implementation summed the whole deque on
+        every call, which made the large window ~2000x slower.
+        """
+        def time_checks(records: int) -> float:
+            tracker = RateTracker(window_seconds=3600.0)
+            tracker.configure_limit("llm_calls", max_per_window=float(records + 10))
+            for _ in range(records):
+                tracker.consume("agent_a", "llm_calls", 1.0)
+            best = float("inf")
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(2000):
+                    tracker.has_capacity("agent_a", "llm_calls", 1.0)
+                    tracker.get_remaining("agent_a", "llm_calls")
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        small = time_checks(10)
+        large = time_checks(20_000)
+        assert large < small * 5
+
+
+class TestWakeupScheduler:
+    """Tests for event-driven wakeups of capacity waiters."""
+
+    @pytest.mark.asyncio
+    async def test_waiter_wakes_when_record_expires(self) -> None:
+        """A waiter resumes right after the blocking record leaves the window."""
+        tracker = RateTracker(window_seconds=0.2)
+        tracker.configure_limit("llm_calls", max_per_window=1.0)
+        tracker.consume("agent_a", "llm_calls", 1.0)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await tracker.wait_for_available("agent_a", "llm_calls") is True
+        assert 0.15 <= loop.time() - start <= 0.3
+        # Not consumed by wait_for_available
+        assert tracker.get_usage("agent_a", "llm_calls") == 0.0
+
+    @pytest.mark.asyncio
+    async def test_waiter_parks_without_polling(self) -> None:
+        """While blocked, a waiter holds one future and one timer, not a poll loop."""
+        tracker = RateTracker(window_seconds=60.0)
+        tracker.configure_limit("llm_calls", max_per_window=1.0)
+        tracker.consume("agent_a", "llm_calls", 1.0)
+
+        with patch.object(tracker, "has_capacity", wraps=tracker.has_capacity) as checks:
+            task = asyncio.create_task(tracker.wait_for_capacity("agent_a", "llm_calls"))
+            await asyncio.sleep(0.01)
+            parked_checks = checks.call_count
+            await asyncio.sleep(0.2)
+            assert checks.call_count == parked_checks
+            assert len(tracker._waiters[("llm_calls", "agent_a")]) == 1
+            assert tracker._wakeups[("llm_calls", "agent_a")].when() > (
+                asyncio.get_running_loop().time() + 50
+            )
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert tracker._waiters == {}
+        assert tracker._wakeups == {}
+
+    @pytest.mark.asyncio
+    async def test_reset_wakes_waiters(self) -> None:
+        """reset() releases blocked waiters immediately."""
+        tracker = RateTracker(window_seconds=60.0)
+        tracker.configure_limit("llm_calls", max_per_window=1.0)
+        tracker.consume("agent_a", "llm_calls", 1.0)
+
+        task = asyncio.create_task(tracker.wait_for_capacity("agent_a", "llm_calls"))
+        await asyncio.sleep(0.01)
+        tracker.reset(agent_id="agent_a")
+        assert await asyncio.wait_for(task, timeout=0.5) is True
+        assert tracker.get_usage("agent_a", "llm_calls") == 1.0
+
+    @pytest.mark.asyncio
+    async def test_raised_limit_wakes_waiters(self) -> None:
+        """A waiter needing more than the limit is woken by configure_limit()."""
+        tracker = RateTracker(window_seconds=60.0)
+        tracker.configure_limit("llm_calls", max_per_window=1.0)
+
+        task = asyncio.create_task(tracker.wait_for_capacity("agent_a", "llm_calls", 5.0))
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        assert ("llm_calls", "agent_a") not in tracker._wakeups  # expiry cannot help
+        tracker.configure_limit("llm_calls", max_per_window=10.0)
+        assert await asyncio.wait_for(task, timeout=0.5) is True
+
+    @pytest.mark.asyncio
+    async def test_woken_waiters_share_freed_capacity(self) -> None:
+        """When capacity frees up, only as many waiters as fit proceed."""
+        tracker = RateTracker(window_seconds=60.0)
+        tracker.configure_limit("llm_calls", max_per_window=2.0)
+        tracker.consume("agent_a", "llm_calls", 2.0)
+
+        tasks = [
+            asyncio.create_task(tracker.wait_for_capacity("agent_a", "llm_calls", timeout=0.3))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        tracker.reset(agent_id="agent_a", resource="llm_calls")
+        results = await asyncio.gather(*tasks)
+        assert sorted(results) == [False, True, True]
+        assert tracker.get_usage("agent_a", "llm_calls") == 2.0
+        assert tracker._waiters == {}
@@ -0,0 +1,206 @@
+"""Tests for the run catalog (run summaries and their sidecar).
+
+Tests:
+- RunSummary scans raw event bytes and resumes from its log position
+- Truncated or rewritten logs are rescanned from the start
+- EventLogger keeps the sidecar current, including across rotation
+- RunManager lists runs from the sidecar without rereading the log
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from src.dashboard.run_manager import RunManager
+from src.world.event_segments import list_sealed_segments
+from src.world.logger import EventLogger
+from src.world.run_catalog import (
+    RunSummary,
+    load_run_summary,
+    run_summary_path,
+    write_run_summary,
+)
+
+
+def _append(path: Path, *events: dict[str, Any]) -> None:
+    with open(path, "a") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+INIT = {
+    "timestamp": "2026-01-26T09:00:00+00:00",
+    "event_type": "world_init",
+    "principals": [{"id": "alpha"}, {"id": "beta"}],
+}
+THINKING = {"timestamp": "2026-01-26T09:05:00+00:00", "event_type": "thinking", "principal_id": "gamma"}
+ACTION = {
+    "timestamp": "2026-01-26T09:06:00+00:00",
+    "event_type": "action",
+    "intent": {"action_type": "noop", "principal_id": "delta", "reasoning": '"principal_id": "fake"'},
+}
+COMPLETE = {"timestamp": "2026-01-26T09:10:00+00:00", "event_type": "simulation_complete"}
+
+
+class TestRunSummaryScan:
+    """Byte-level scanning and resumption."""
+
+    def test_scan_extracts_metadata(self, tmp_path: Path) -> None:
+        """Counts, timestamps, agents and status come from a raw scan."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT, THINKING, ACTION, COMPLETE)
+
+        summary = RunSummary()
+        summary.catch_up(path)
+
+        assert summary.event_count == 4
+        assert summary.start_time == "2026-01-26T09:00:00+00:00"
+        assert summary.end_time == "2026-01-26T09:10:00+00:00"
+        assert summary.agent_ids == {"alpha", "beta", "gamma", "delta"}
+        assert summary.completed is True
+
+    def test_resumes_from_position(self, tmp_path: Path) -> None:
+        """A second catch_up only scans appended bytes."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT)
+        summary = RunSummary()
+        first = summary.catch_up(path)
+        assert summary.catch_up(path) == 0
+
+        _append(path, THINKING)
+        assert summary.catch_up(path) == path.stat().st_size - first
+        assert summary.event_count == 2
+        assert "gamma" in summary.agent_ids
+
+    def test_partial_last_line_left_for_later(self, tmp_path: Path) -> None:
+        """An unterminated line (log being written) is not counted yet."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT)
+        with open(path, "a") as f:
+            f.write('{"timestamp": "2026-01-26T09:05:00+00:00", "event_ty')
+        summary = RunSummary()
+        summary.catch_up(path)
+        assert summary.event_count == 1
+
+        with open(path, "a") as f:
+            f.write('pe": "tick"}\n')
+        summary.catch_up(path)
+        assert summary.event_count == 2
+        assert summary.end_time == "2026-01-26T09:05:00+00:00"
+
+    def test_truncated_log_is_rescanned(self, tmp_path: Path) -> None:
+        """A log that shrank (new run in the same file) starts over."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT, THINKING, COMPLETE)
+        summary = RunSummary()
+        summary.catch_up(path)
+
+        path.write_text("")
+        _append(path, THINKING)
+        summary.catch_up(path)
+        assert summary.event_count == 1
+        assert summary.agent_ids == {"gamma"}
+        assert summary.completed is False
+
+    def test_resumes_across_sealed_segment(self, tmp_path: Path) -> None:
+        """Bytes in the segment sealed since the last scan are not recounted."""
+        path = tmp_path / "events.jsonl"
+        _append(path, INIT)
+        summary = RunSummary()
+        summary.catch_up(path)
+
+        _append(path, THINKING)
+        path.rename(tmp_path / "events.000000.jsonl")
+        _append(path, COMPLETE)
+        summary.catch_up(path)
+
+        assert summary.event_count == 3
+        assert summary.sealed_segments == 1
+        assert summary.completed is True
+
+
+class TestSidecar:
+    """EventLogger writes the sidecar that RunManager reads."""
+
+    def test_logger_writes_sidecar_on_close(self, tmp_path: Path) -> None:
+        """The sidecar matches a full scan of the finished log."""
+        logger = EventLogger(logs_dir=str(tmp_path), run_id="run_1")
+        logger.log("world_init", {"principals": [{"id": "alpha"}]})
+        logger.log("thinking", {"principal_id": "beta"})
+        logger.log("simulation_complete", {})
+        logger.close()
+
+        events = tmp_path / "run_1" / "events.jsonl"
+        stored = load_run_summary(events)
+        assert stored is not None
+        scanned = RunSummary()
+        scanned.catch_up(events)
+        assert stored.to_dict() == scanned.to_dict()
+        assert stored.catch_up(events) == 0
+
+    def test_logger_sidecar_across_rotation(self, tmp_path: Path) -> None:
+        """A summary written at rotation resumes correctly afterwards."""
+        logger = EventLogger(
+            logs_dir=str(tmp_path), run_id="run_1",
+            segment_settings={"enabled": True, "max_segment_bytes": 500, "index_interval": 4},
+        )
+        for i in range(20):
+            logger.log("thinking", {"principal_id": f"agent_{i % 3}", "pad": "x" * 40})
+        events = tmp_path / "run_1" / "events.jsonl"
+        assert list_sealed_segments(events)
+
+        stored = load_run_summary(events)
+        assert stored is not None
+        logger.flush()
+        stored.catch_up(events)
+        assert stored.event_count == 20
+        assert stored.agent_ids == {"agent_0", "agent_1", "agent_2"}
+        logger.close()
+
+    def test_new_run_removes_stale_sidecar(self, tmp_path: Path) -> None:
+        """Re-using a run directory drops the previous summary."""
+        EventLogger(logs_dir=str(tmp_path), run_id="run_1").close()
+        events = tmp_path / "run_1" / "events.jsonl"
+        assert run_summary_path(events).exists()
+        # Keep a reference: closing the new logger writes its own summary
+        logger = EventLogger(logs_dir=str(tmp_path), run_id="run_1")
+        assert not run_summary_path(events).exists()
+        logger.close()
+
+
+class TestRunManagerCatalog:
+    """RunManager lists runs from the catalog."""
+
+    def test_sidecar_covering_log_is_trusted(self, tmp_path: Path) -> None:
+        """A sidecar whose position matches the log is used without a scan."""
+        run_dir = tmp_path / "logs" / "run_20260126_090000"
+        run_dir.mkdir(parents=True)
+        events = run_dir / "events.jsonl"
+        _append(events, INIT, COMPLETE)
+        summary = RunSummary()
+        summary.catch_up(events)
+        summary.event_count = 999  # Only the sidecar knows this value
+        write_run_summary(events, summary)
+
+        runs = RunManager(logs_dir=tmp_path / "logs").list_runs()
+        assert runs[0].event_count == 999
+
+    def test_scan_result_is_persisted(self, tmp_path: Path) -> None:
+        """Runs without a sidecar get one after the first listing."""
+        run_dir = tmp_path / "logs" / "run_20260126_090000"
+        run_dir.mkdir(parents=True)
+        events = run_dir / "events.jsonl"
+        _append(events, INIT, THINKING, COMPLETE)
+
+        manager = RunManager(logs_dir=tmp_path / "logs")
+        run = manager.list_runs()[0]
+        assert run.event_count == 3
+        assert run.status == "completed"
+        stored = load_run_summary(events)
+        assert stored is not None
+        assert stored.event_count == 3
+
+        _append(events, ACTION)
+        assert manager.list_runs()[0].event_count == 4
@@ -253,6 +253,11 @@ class TestTriggerRegistryRefreshScheduled:
         store = MagicMock()
         store.artifacts = {"trigger1": mock_artifact, "callback1": mock_callback}
         store.get = lambda aid: store.artifacts.get(aid)
+        # refresh() walks trigger artifacts through the store's type index
+        store.find_ids = lambda artifact_type: [
+            aid for aid, a in store.artifacts.items()
+            if a.type == artifact_type and not a.deleted
+        ]
         return store
 
     def test_refresh_scheduled_trigger(
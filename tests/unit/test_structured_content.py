@@ -0,0 +1,117 @@
+"""Tests for the structured (JSON) content layer on ArtifactStore.
+
+get_json_content caches the parsed content per content version and
+patch_json_content applies field-level changes without re-parsing.
+"""
+
+import json
+
+import pytest
+
+from src.world.artifacts import ArtifactStore
+
+
+def _store_with_config(config: dict) -> ArtifactStore:
+    store = ArtifactStore()
+    store.write("agent_001", "agent", json.dumps(config), "agent_001")
+    return store
+
+
+class TestGetJsonContent:
+    """Tests for cached parsing of JSON content."""
+
+    def test_parses_and_caches(self) -> None:
+        """Repeat reads of unchanged content return the cached object."""
+        store = _store_with_config({"llm_model": "m"})
+        first = store.get_json_content("agent_001")
+        assert first == {"llm_model": "m"}
+        assert store.get_json_content("agent_001") is first
+
+    def test_reparses_after_direct_content_change(self) -> None:
+        """Assigning artifact.content directly invalidates the cached parse."""
+        store = _store_with_config({"a": 1})
+        store.get_json_content("agent_001")
+        artifact = store.get("agent_001")
+        assert artifact is not None
+        artifact.content = json.dumps({"a": 2})
+        assert store.get_json_content("agent_001") == {"a": 2}
+
+    def test_missing_empty_and_invalid(self) -> None:
+        """Missing artifacts, empty content and invalid JSON read as None."""
+        store = ArtifactStore()
+        store.write("empty", "document", "", "agent_001")
+        store.write("text", "document", "not json {", "agent_001")
+        assert store.get_json_content("missing") is None
+        assert store.get_json_content("empty") is None
+        assert store.get_json_content("text") is None
+
+    def test_delete_evicts_cached_parse(self) -> None:
+        """Soft-deleted artifacts drop their cached parse and are not re-cached."""
+        store = _store_with_config({"a": 1})
+        store.get_json_content("agent_001")
+        artifact = store.get("agent_001")
+        assert artifact is not None
+        store.mark_deleted(artifact, "agent_001")
+        assert "agent_001" not in store._parsed_content
+        assert store.get_json_content("agent_001") == {"a": 1}
+        assert "agent_001" not in store._parsed_content
+
+    def test_get_json_field_checks_type(self) -> None:
+        """Fields of the wrong type fall back to the default."""
+        store = _store_with_config({"subscribed_artifacts": "oops", "context_sections": {"x": True}})
+        assert store.get_json_field("agent_001", "subscribed_artifacts", list, []) == []
+        assert store.get_json_field("agent_001", "context_sections", dict, {}) == {"x": True}
+        assert store.get_json_field("agent_001", "absent", dict, {}) == {}
+
+
+class TestPatchJsonContent:
+    """Tests for field-level patches."""
+
+    def test_sets_and_removes_fields(self) -> None:
+        """Patches change only the named fields."""
+        store = _store_with_config({"keep": 1, "drop": 2, "change": 3})
+        patched = store.patch_json_content("agent_001", {"change": 4, "new": [1]}, ["drop"])
+        assert patched == {"keep": 1, "change": 4, "new": [1]}
+        artifact = store.get("agent_001")
+        assert artifact is not None
+        assert json.loads(artifact.content) == patched
+
+    def test_patch_result_is_cached(self) -> None:
+        """The next read after a patch does not parse the new content."""
+        store = _store_with_config({"a": 1})
+        patched = store.patch_json_content("agent_001", {"b": 2})
+        assert store.get_json_content("agent_001") is patched
+
+    def test_non_object_content_starts_empty(self) -> None:
+        """Invalid or non-object content is replaced by the patched fields."""
+        store = ArtifactStore()
+        store.write("doc", "document", "[1, 2]", "agent_001")
+        assert store.patch_json_content("doc", {"a": 1}) == {"a": 1}
+
+    def test_preserves_other_artifact_fields(self) -> None:
+        """Policy, metadata and state are untouched by a content patch."""
+        store = ArtifactStore()
+        store.write(
+            "agent_001", "agent", "{}", "agent_001",
+            policy={"read_price": 3}, metadata={"tag": "x"},
+        )
+        store.patch_json_content("agent_001", {"a": 1})
+        artifact = store.get("agent_001")
+        assert artifact is not None
+        assert artifact.policy["read_price"] == 3
+        assert artifact.metadata == {"tag": "x"}
+        assert artifact.state == {"writer": "agent_001"}
+
+    def test_kernel_protected_rejected(self) -> None:
+        """kernel_protected artifacts cannot be patched."""
+        store = _store_with_config({})
+        artifact = store.get("agent_001")
+        assert artifact is not None
+        artifact.kernel_protected = True
+        with pytest.raises(PermissionError):
+            store.patch_json_content("agent_001", {"a": 1})
+
+    def test_missing_artifact_raises(self) -> None:
+        """Patching a missing artifact raises KeyError."""
+        with pytest.raises(KeyError):
+            ArtifactStore().patch_json_content("missing", {"a": 1})
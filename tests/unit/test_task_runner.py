@@ -0,0 +1,172 @@
+"""Unit tests for mint task test execution (Plan #269).
+
+Tests:
+- TaskTestRunner runs cases in parallel worker processes, in case order
+- CPU limits, worker crashes and short-circuiting
+- MintTaskManager compiles once, short-circuits hidden tests and memoizes
+  evaluations per (code, task)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.world.executor import SafeExecutor
+from src.world.mint_tasks import MintTaskManager
+from src.world.task_runner import TaskTestRunner
+
+pytest.importorskip("resource")
+
+ADD_CODE = "def run(a, b):\n    return a + b\n"
+
+
+@pytest.fixture(scope="module")
+def runner() -> Iterator[TaskTestRunner]:
+    """A two-worker runner shared by the module (spawning workers is slow)."""
+    task_runner = TaskTestRunner(num_workers=2, timeout=10, cpu_seconds=1, memory_limit_mb=64)
+    yield task_runner
+    task_runner.shutdown()
+
+
+def _compile(code: str) -> Any:
+    return compile(code, "<test>", "exec")
+
+
+class TestTaskTestRunner:
+    """Tests for TaskTestRunner.run()."""
+
+    def test_rejects_non_positive_workers(self) -> None:
+        """num_workers must be positive."""
+        with pytest.raises(ValueError, match="num_workers"):
+            TaskTestRunner(num_workers=0, timeout=1)
+
+    def test_from_config_disabled(self) -> None:
+        """use_subprocesses=False runs tests in-process."""
+        config = MagicMock()
+        config.mint_tasks.evaluation.use_subprocesses = False
+        with patch("src.world.task_runner.get_validated_config", return_value=config):
+            assert TaskTestRunner.from_config() is None
+
+    def test_results_in_case_order(self, runner: TaskTestRunner) -> None:
+        """Results line up with the cases regardless of completion order."""
+        results = runner.run(_compile(ADD_CODE), [[1, 2], [3, 4], [5, 6]])
+        assert [r["result"] for r in results if r is not None] == [3, 7, 11]
+        assert runner.live_workers <= 2
+
+    def test_cpu_limit(self, runner: TaskTestRunner) -> None:
+        """A busy loop is stopped by the per-case CPU limit."""
+        code = _compile("def run():\n    while True:\n        pass\n")
+        [result] = runner.run(code, [[]])
+        assert result is not None
+        assert result["success"] is False
+        assert "CPU limit" in result["error"]
+
+    def test_crashed_worker_replaced(self, runner: TaskTestRunner) -> None:
+        """A worker that dies is reported as a failed case and replaced."""
+        replaced = runner.workers_replaced
+        code = _compile("import os\ndef run():\n    os._exit(3)\n")
+        [result] = runner.run(code, [[]])
+        assert result is not None
+        assert "crashed" in result["error"]
+        assert runner.workers_replaced == replaced + 1
+
+        assert runner.run(_compile(ADD_CODE), [[2, 2]])[0]["result"] == 4  # type: ignore[index]
+
+    def test_stop_halts_dispatch(self) -> None:
+        """Cases after a stop are not run."""
+        task_runner = TaskTestRunner(num_workers=1, timeout=10)
+        try:
+            results = task_runner.run(
+                _compile(ADD_CODE),
+                [[1, "x"], [1, 2], [3, 4]],
+                stop=lambda index, result: not result["success"],
+            )
+        finally:
+            task_runner.shutdown()
+        assert results[0] is not None and results[0]["success"] is False
+        assert results[1:] == [None, None]
+
+    def test_worker_imports_stay_light(self) -> None:
+        """A spawned worker's imports do not pull in World or litellm."""
+        import subprocess
+        import sys
+
+        check = (
+            "import sys, src.world.task_runner, src.world.executor; "
+            "print('litellm' in sys.modules, 'src.world.world' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", check], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.split() == ["False", "False"]
+
+
+def _manager(executor: Any, test_runner: TaskTestRunner | None = None) -> MintTaskManager:
+    artifact = MagicMock(code=ADD_CODE, state={"writer": "alice"})
+    artifacts = MagicMock()
+    artifacts.get.return_value = artifact
+    manager = MintTaskManager(
+        ledger=MagicMock(),
+        artifacts=artifacts,
+        executor=executor,
+        logger=MagicMock(),
+        test_runner=test_runner,
+    )
+    manager.seed_from_config([{
+        "task_id": "add",
+        "description": "Add two numbers",
+        "reward": 10,
+        "public_tests": [{"args": [1, 2], "expected": 3}, {"args": [2, 2], "expected": 4}],
+        "hidden_tests": [
+            {"args": [0, 0], "expected": 1},  # Unsatisfiable: fails first
+            {"args": [5, 5], "expected": 10},
+            {"args": [7, 1], "expected": 8},
+        ],
+    }])
+    return manager
+
+
+class TestMintTaskEvaluation:
+    """Tests for MintTaskManager submission testing."""
+
+    def test_hidden_tests_short_circuit_in_process(self) -> None:
+        """Without a runner, hidden tests stop at the first failure."""
+        executor = SafeExecutor(timeout=5, use_contracts=False)
+        with patch.object(executor, "execute_compiled", wraps=executor.execute_compiled) as spy:
+            result = _manager(executor).submit_solution("alice", "adder", "add")
+
+        assert result.success is False
+        assert result.hidden_passed is False
+        assert [r.passed for r in result.public_results] == [True, True]
+        assert spy.call_count == 3  # Two public tests, one hidden test
+
+    def test_runs_on_test_runner(self, runner: TaskTestRunner) -> None:
+        """With a runner, tests run in workers with the same results."""
+        executor = SafeExecutor(timeout=5, use_contracts=False)
+        result = _manager(executor, runner).submit_solution("alice", "adder", "add")
+        assert [r.actual for r in result.public_results] == [3, 4]
+        assert result.hidden_passed is False
+
+    def test_unchanged_resubmission_not_retested(self) -> None:
+        """Evaluations are memoized per (code hash, task id)."""
+        executor = SafeExecutor(timeout=5, use_contracts=False)
+        manager = _manager(executor)
+        first = manager.submit_solution("alice", "adder", "add")
+        with patch.object(executor, "execute_compiled") as spy:
+            second = manager.submit_solution("alice", "adder", "add")
+        spy.assert_not_called()
+        assert second.public_results == first.public_results
+        assert second.hidden_passed is first.hidden_passed
+
+    def test_compile_error_fails_every_public_test(self) -> None:
+        """Code that does not compile fails each public test with the error."""
+        executor = SafeExecutor(timeout=5, use_contracts=False)
+        manager = _manager(executor)
+        manager._artifacts.get.return_value.code = "def run(:\n"
+        result = manager.submit_solution("alice", "adder", "add")
+        assert len(result.public_results) == 2
+        assert all(not r.passed and r.error for r in result.public_results)
+        assert result.hidden_passed is None
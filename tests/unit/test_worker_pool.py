@@ -0,0 +1,227 @@
+"""Unit tests for the process-isolated worker pool (Plan #53).
+
+Tests:
+- Turns execute in a separate process with per-action resource accounting
+- Kernel calls from the worker are served against the parent's World
+- Timeouts, crashes and worker replacement
+- Config-driven construction
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.world.executor import SafeExecutor
+from src.world.world import World
+from src.world.worker_pool import WorkerPool
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[WorkerPool]:
+    """A single-worker pool shared by the module (spawning workers is slow)."""
+    worker_pool = WorkerPool(num_workers=1, timeout=2)
+    yield worker_pool
+    worker_pool.shutdown()
+
+
+def _write_executable(world: World, artifact_id: str, code: str) -> None:
+    world.artifacts.write(
+        artifact_id=artifact_id,
+        type="executable",
+        content="test artifact",
+        created_by="alice",
+        executable=True,
+        code=code,
+    )
+
+
+class TestWorkerPoolInit:
+    """Tests for WorkerPool construction."""
+
+    def test_rejects_non_positive_workers(self) -> None:
+        """num_workers must be positive."""
+        with pytest.raises(ValueError, match="num_workers"):
+            WorkerPool(num_workers=0, timeout=1)
+
+    def test_from_config_disabled_by_default(self) -> None:
+        """Default config does not use the worker pool."""
+        assert WorkerPool.from_config() is None
+
+    def test_from_config_enabled(self) -> None:
+        """use_worker_pool builds a pool sized by worker_pool.num_workers."""
+        config = MagicMock()
+        config.execution.use_worker_pool = True
+        config.execution.worker_pool.num_workers = 3
+        config.executor.timeout_seconds = 7
+        with patch("src.world.worker_pool.get_validated_config", return_value=config):
+            worker_pool = WorkerPool.from_config()
+        assert worker_pool is not None
+        assert worker_pool.num_workers == 3
+        assert worker_pool.timeout == 7
+
+    def test_no_processes_until_used(self) -> None:
+        """Workers are spawned lazily."""
+        worker_pool = WorkerPool(num_workers=2, timeout=1)
+        assert worker_pool.live_workers == 0
+
+
+class TestWorkerPoolExecute:
+    """Tests for WorkerPool.execute() against a real World."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_separate_process(
+        self, test_world: World, pool: WorkerPool
+    ) -> None:
+        """The turn runs in a worker process, not the simulation process."""
+        code = "import os\ndef run(x):\n    return {'pid': os.getpid(), 'x': x}"
+        _write_executable(test_world, "pid_tool", code)
+        result = await pool.execute(
+            SafeExecutor(), test_world, code=code,
+            caller_id="alice", artifact_id="pid_tool", args=[3],
+        )
+        assert result["success"] is True
+        assert result["result"]["x"] == 3
+        assert result["result"]["pid"] != os.getpid()
+        assert "cpu_seconds" in result["resources_consumed"]
+        assert "peak_memory_bytes" in result["resources_consumed"]
+
+    @pytest.mark.asyncio
+    async def test_kernel_calls_served_by_parent(
+        self, test_world: World, pool: WorkerPool
+    ) -> None:
+        """Worker reads and writes go through the parent's kernel."""
+        test_world.ledger.create_principal("alice", starting_scrip=50)
+        code = (
+            "def run():\n"
+            "    kernel_actions.write_artifact(\n"
+            "        caller_id, 'alice_note', 'hello',\n"
+            "        access_contract_id='kernel_contract_freeware',\n"
+            "    )\n"
+            "    return kernel_state.get_balance(caller_id)\n"
+        )
+        _write_executable(test_world, "writer", code)
+        result = await pool.execute(
+            SafeExecutor(), test_world, code=code,
+            caller_id="alice", artifact_id="writer",
+        )
+        assert result["success"] is True, result
+        assert result["result"] == 50
+        note = test_world.artifacts.get("alice_note")
+        assert note is not None
+        assert note.content == "hello"
+
+    @pytest.mark.asyncio
+    async def test_kernel_errors_reraised_in_worker(
+        self, test_world: World, pool: WorkerPool
+    ) -> None:
+        """Private attributes of kernel services are not reachable."""
+        code = (
+            "def run():\n"
+            "    try:\n"
+            "        kernel_state._world\n"
+            "    except AttributeError:\n"
+            "        return 'blocked'\n"
+        )
+        _write_executable(test_world, "snoop", code)
+        result = await pool.execute(
+            SafeExecutor(), test_world, code=code,
+            caller_id="alice", artifact_id="snoop",
+        )
+        assert result["result"] == "blocked"
+
+    @pytest.mark.asyncio
+    async def test_worker_reused_between_turns(
+        self, test_world: World, pool: WorkerPool
+    ) -> None:
+        """Consecutive turns reuse the same worker process."""
+        code = "import os\ndef run():\n    return os.getpid()"
+        _write_executable(test_world, "pid_only", code)
+        completed = pool.turns_completed
+        first = await pool.execute(SafeExecutor(), test_world, code=code, caller_id="alice")
+        second = await pool.execute(SafeExecutor(), test_world, code=code, caller_id="alice")
+        assert first["result"] == second["result"]
+        assert pool.turns_completed == completed + 2
+        assert pool.live_workers == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_enforced_in_worker(
+        self, test_world: World, pool: WorkerPool
+    ) -> None:
+        """executor timeout applies inside the worker process."""
+        code = "def run():\n    while True:\n        pass"
+        result = await pool.execute(SafeExecutor(), test_world, code=code, caller_id="alice")
+        assert result["success"] is False
+        assert "timed out" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_crashed_worker_replaced(
+        self, test_world: World, pool: WorkerPool
+    ) -> None:
+        """A worker that dies mid-turn is replaced on the next turn."""
+        replaced = pool.workers_replaced
+        crash = "import os\ndef run():\n    os._exit(1)"
+        result = await pool.execute(SafeExecutor(), test_world, code=crash, caller_id="alice")
+        assert result["success"] is False
+        assert pool.workers_replaced == replaced + 1
+        assert pool.live_workers == 0
+
+        ok = "def run():\n    return 'ok'"
+        result = await pool.execute(SafeExecutor(), test_world, code=ok, caller_id="alice")
+        assert result["result"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_job_keeps_worker(
+        self, test_world: World, pool: WorkerPool
+    ) -> None:
+        """A job that cannot be pickled fails the turn; the worker stays idle."""
+        code = "def run(x):\n    return x"
+        replaced = pool.workers_replaced
+        result = await pool.execute(
+            SafeExecutor(), test_world, code=code, caller_id="alice", args=[lambda: None]
+        )
+        assert result["success"] is False
+        assert "cannot be sent" in result["error"]
+        assert pool.workers_replaced == replaced
+
+        result = await pool.execute(SafeExecutor(), test_world, code=code, caller_id="alice", args=[7])
+        assert result["result"] == 7
+        assert pool.live_workers == 1
+
+    @pytest.mark.asyncio
+    async def test_send_to_dead_worker_replaced(self, test_world: World) -> None:
+        """A broken pipe on the first send replaces the worker and frees its slot."""
+        worker_pool = WorkerPool(num_workers=1, timeout=2)
+        code = "def run():\n    return 'ok'"
+        try:
+            assert (await worker_pool.execute(
+                SafeExecutor(), test_world, code=code, caller_id="alice"
+            ))["result"] == "ok"
+            worker = worker_pool._idle[0]
+            with patch.object(worker.conn, "send", side_effect=BrokenPipeError("gone")):
+                result = await worker_pool.execute(
+                    SafeExecutor(), test_world, code=code, caller_id="alice"
+                )
+            assert result["success"] is False
+            assert worker_pool.workers_replaced == 1
+            assert worker_pool.live_workers == 0
+
+            result = await worker_pool.execute(
+                SafeExecutor(), test_world, code=code, caller_id="alice"
+            )
+            assert result["result"] == "ok"
+        finally:
+            worker_pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_invalid_code_rejected_without_worker(self, test_world: World) -> None:
+        """Validation happens in the parent before dispatch."""
+        worker_pool = WorkerPool(num_workers=1, timeout=1)
+        result = await worker_pool.execute(
+            SafeExecutor(), test_world, code="x = 1", caller_id="alice"
+        )
+        assert result["success"] is False
+        assert worker_pool.live_workers == 0